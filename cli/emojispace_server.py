@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+emojispace-server: JSON-lines session server for headless EmojiSpace engines.
+Usage: python cli/emojispace_server.py [--host H] [--port P | --unix PATH] [--workers N]
+See src/session_server.py for the wire protocol.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_root = Path(__file__).resolve().parent.parent
+_src = _root / "src"
+if _src.exists() and str(_src) not in sys.path:
+    sys.path.insert(0, str(_src))
+
+from session_server import main
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,17 @@ from dataclasses import dataclass, field
 import hashlib
 import random
 import secrets
-from typing import Any, Callable, Literal, Optional
+from typing import Any, Callable, Literal, Mapping, Optional
 
 try:
     from crew_modifiers import CrewModifiers, compute_crew_modifiers
-    from data_loader import load_hulls, load_modules
+    from data_bundle import get_data_bundle
     from pursuit_resolver import resolve_pursuit
     from salvage_resolver import resolve_salvage_modules
     from ship_assembler import assemble_ship, compute_hull_max_from_ship_state
 except ModuleNotFoundError:
     from src.crew_modifiers import CrewModifiers, compute_crew_modifiers
-    from src.data_loader import load_hulls, load_modules
+    from src.data_bundle import get_data_bundle
     from src.pursuit_resolver import resolve_pursuit
     from src.salvage_resolver import resolve_salvage_modules
     from src.ship_assembler import assemble_ship, compute_hull_max_from_ship_state
@@ -124,12 +124,12 @@ class CombatRng:
         return value
 
 
-def _hulls_by_id() -> dict[str, dict[str, Any]]:
-    return {entry["hull_id"]: entry for entry in load_hulls()["hulls"]}
+def _hulls_by_id() -> Mapping[str, dict[str, Any]]:
+    return get_data_bundle().hulls_by_id
 
 
-def _modules_by_id() -> dict[str, dict[str, Any]]:
-    return {entry["module_id"]: entry for entry in load_modules()["modules"]}
+def _modules_by_id() -> Mapping[str, dict[str, Any]]:
+    return get_data_bundle().modules_by_id
 
 
 def _crew_modifiers_for_ship_state(ship_state: dict[str, Any]) -> CrewModifiers:
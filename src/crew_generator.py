@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import random
 from pathlib import Path
 from typing import Any
 
+try:
+    from deterministic_rng import sha256_prefix_int
+except ModuleNotFoundError:
+    from src.deterministic_rng import sha256_prefix_int
+
 
 def generate_hireable_crew(
     *,
@@ -180,5 +184,4 @@ def _role_tags(role: dict[str, Any]) -> list[str]:
 
 def _seed_from_parts(world_seed: int, system_id: str, stream: str) -> int:
     token = repr((world_seed, system_id, stream))
-    digest = hashlib.sha256(token.encode("ascii")).hexdigest()
-    return int(digest[:16], 16)
+    return sha256_prefix_int(token)
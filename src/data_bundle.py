@@ -0,0 +1,265 @@
+"""Compiled, content-hashed view of every data/*.json file.
+
+The bundle parses and validates the data directory once per process and serves
+shared read-only indexes to every loader. Validated payloads are pickled to an
+on-disk cache keyed by the SHA-256 of the raw file contents and of the source of
+the modules that compile them, so a later process with unchanged data and code
+skips JSON parsing and validation entirely.
+
+Entries inside the indexes are the validated dicts themselves, shared by every
+engine in the process; callers must treat them as read-only.
+data_loader.load_hulls() and load_modules() hand out deep copies instead, so
+their callers may keep editing the dicts they get back.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+import hashlib
+import json
+import os
+import pickle
+
+try:
+    from data_catalog import DataCatalog, Good, build_data_catalog
+except ModuleNotFoundError:
+    from src.data_catalog import DataCatalog, Good, build_data_catalog
+
+
+BUNDLE_FORMAT_VERSION = 1
+CACHE_DIR_ENV = "EMOJISPACE_CACHE_DIR"
+# Modules whose code shapes the pickled payload: validators, the catalog builder and its classes.
+COMPILER_SOURCES = ("data_bundle.py", "data_catalog.py", "data_loader.py", "encounter_generator.py")
+
+_ACTIVE_BUNDLE: "DataBundle | None" = None
+
+
+@dataclass(frozen=True)
+class DataBundle:
+    content_hash: str
+    documents: Mapping[str, Any]
+    hulls_version: str
+    hulls: tuple[dict[str, Any], ...]
+    modules_version: str
+    modules: tuple[dict[str, Any], ...]
+    encounter_types: tuple[dict[str, Any], ...]
+    governments_by_id: Mapping[str, dict[str, Any]]
+    catalog: DataCatalog
+    hulls_by_id: Mapping[str, dict[str, Any]]
+    modules_by_id: Mapping[str, dict[str, Any]]
+    modules_by_slot_type: Mapping[str, tuple[dict[str, Any], ...]]
+    hulls_by_frame_tier: Mapping[tuple[str, int], tuple[dict[str, Any], ...]]
+    goods_by_sku: Mapping[str, Good]
+
+    def document(self, file_name: str) -> Any:
+        if file_name not in self.documents:
+            raise KeyError(f"Unknown data document: {file_name}")
+        return self.documents[file_name]
+
+
+def get_data_bundle() -> DataBundle:
+    """Return the process-wide bundle, compiling (or loading from cache) on first use."""
+    global _ACTIVE_BUNDLE
+    if _ACTIVE_BUNDLE is None:
+        _ACTIVE_BUNDLE = load_data_bundle()
+    return _ACTIVE_BUNDLE
+
+
+def reload_data_bundle() -> DataBundle:
+    """Drop the process-wide bundle and rebuild it from the data directory."""
+    global _ACTIVE_BUNDLE
+    _ACTIVE_BUNDLE = None
+    return get_data_bundle()
+
+
+def load_data_bundle(
+    data_root: Path | None = None,
+    *,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+) -> DataBundle:
+    root = Path(data_root) if data_root is not None else _default_data_root()
+    raw_by_name = _read_raw_documents(root)
+    content_hash = _content_hash(raw_by_name)
+
+    compiled = None
+    cache_path = None
+    if use_cache:
+        cache_path = _cache_path(cache_dir, content_hash)
+        compiled = _read_cache(cache_path, content_hash)
+    if compiled is None:
+        compiled = _compile(raw_by_name)
+        if cache_path is not None:
+            _write_cache(cache_path, content_hash, compiled)
+    return _index(content_hash, compiled)
+
+
+def _default_data_root() -> Path:
+    return Path(__file__).resolve().parents[1] / "data"
+
+
+def default_cache_dir() -> Path:
+    """Directory shared by every on-disk cache (override with $EMOJISPACE_CACHE_DIR)."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path(__file__).resolve().parents[1] / ".cache"
+
+
+def _read_raw_documents(root: Path) -> dict[str, bytes]:
+    paths = sorted(root.glob("*.json"), key=lambda path: path.name)
+    if not paths:
+        raise ValueError(f"No data files found under {root}.")
+    return {path.name: path.read_bytes() for path in paths}
+
+
+def _content_hash(raw_by_name: Mapping[str, bytes]) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"bundle-format:{BUNDLE_FORMAT_VERSION}".encode("ascii"))
+    for name in sorted(raw_by_name):
+        payload = raw_by_name[name]
+        digest.update(name.encode("utf-8"))
+        digest.update(len(payload).to_bytes(8, "big"))
+        digest.update(payload)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(names: tuple[str, ...]) -> str:
+    """SHA-256 of the source files ``names`` next to this module; on-disk caches key on it."""
+    digest = hashlib.sha256()
+    source_root = Path(__file__).resolve().parent
+    for name in names:
+        try:
+            source = (source_root / name).read_bytes()
+        except OSError:
+            source = b""
+        digest.update(name.encode("utf-8"))
+        digest.update(len(source).to_bytes(8, "big"))
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def _compiler_fingerprint() -> str:
+    return source_fingerprint(COMPILER_SOURCES)
+
+
+def _parse_document(name: str, raw: bytes) -> Any:
+    try:
+        return json.loads(raw.decode("utf-8", errors="replace"), strict=False)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{name}: invalid JSON.") from error
+
+
+def _require_document(documents: Mapping[str, Any], name: str) -> Any:
+    if name not in documents:
+        raise ValueError(f"{name}: file not found.")
+    return documents[name]
+
+
+def _compile(raw_by_name: Mapping[str, bytes]) -> dict[str, Any]:
+    try:
+        from data_loader import validate_hulls_payload, validate_modules_payload
+        from encounter_generator import validate_encounter_types_payload, validate_governments_payload
+    except ModuleNotFoundError:
+        from src.data_loader import validate_hulls_payload, validate_modules_payload
+        from src.encounter_generator import validate_encounter_types_payload, validate_governments_payload
+
+    documents = {name: _parse_document(name, raw) for name, raw in raw_by_name.items()}
+    hulls = validate_hulls_payload(_require_document(documents, "hulls.json"))
+    modules = validate_modules_payload(_require_document(documents, "modules.json"))
+    encounter_types = validate_encounter_types_payload(_require_document(documents, "encounter_types.json"))
+    governments_by_id = validate_governments_payload(_require_document(documents, "governments.json"))
+    for name in ("categories.json", "tags.json", "goods.json", "economies.json"):
+        _require_document(documents, name)
+    catalog = build_data_catalog(documents)
+    return {
+        "documents": documents,
+        "hulls": hulls,
+        "modules": modules,
+        "encounter_types": encounter_types,
+        "governments_by_id": governments_by_id,
+        "catalog": catalog,
+    }
+
+
+def _index(content_hash: str, compiled: Mapping[str, Any]) -> DataBundle:
+    hulls = tuple(compiled["hulls"]["hulls"])
+    modules = tuple(compiled["modules"]["modules"])
+    catalog: DataCatalog = compiled["catalog"]
+
+    modules_by_slot_type: dict[str, list[dict[str, Any]]] = {}
+    for module in modules:
+        modules_by_slot_type.setdefault(str(module["slot_type"]), []).append(module)
+    hulls_by_frame_tier: dict[tuple[str, int], list[dict[str, Any]]] = {}
+    for hull in hulls:
+        hulls_by_frame_tier.setdefault((str(hull["frame"]), int(hull["tier"])), []).append(hull)
+
+    return DataBundle(
+        content_hash=content_hash,
+        documents=MappingProxyType(dict(compiled["documents"])),
+        hulls_version=str(compiled["hulls"]["version"]),
+        hulls=hulls,
+        modules_version=str(compiled["modules"]["version"]),
+        modules=modules,
+        encounter_types=tuple(compiled["encounter_types"]),
+        governments_by_id=MappingProxyType(dict(compiled["governments_by_id"])),
+        catalog=catalog,
+        hulls_by_id=MappingProxyType({hull["hull_id"]: hull for hull in hulls}),
+        modules_by_id=MappingProxyType({module["module_id"]: module for module in modules}),
+        modules_by_slot_type=MappingProxyType(
+            {slot_type: tuple(rows) for slot_type, rows in sorted(modules_by_slot_type.items())}
+        ),
+        hulls_by_frame_tier=MappingProxyType(
+            {key: tuple(rows) for key, rows in sorted(hulls_by_frame_tier.items())}
+        ),
+        goods_by_sku=MappingProxyType({good.sku: good for good in catalog.goods}),
+    )
+
+
+def _cache_path(cache_dir: Path | None, content_hash: str) -> Path:
+    root = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    return root / f"data_bundle-{content_hash[:32]}-{_compiler_fingerprint()[:16]}.pickle"
+
+
+def _read_cache(path: Path, content_hash: str) -> dict[str, Any] | None:
+    try:
+        with path.open("rb") as handle:
+            payload = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if (
+        payload.get("format") != BUNDLE_FORMAT_VERSION
+        or payload.get("compiler") != _compiler_fingerprint()
+        or payload.get("content_hash") != content_hash
+    ):
+        return None
+    compiled = payload.get("compiled")
+    return compiled if isinstance(compiled, dict) else None
+
+
+def _write_cache(path: Path, content_hash: str, compiled: Mapping[str, Any]) -> None:
+    payload = {
+        "format": BUNDLE_FORMAT_VERSION,
+        "compiler": _compiler_fingerprint(),
+        "content_hash": content_hash,
+        "compiled": dict(compiled),
+    }
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError:
+        # The cache is an optimization only; a read-only checkout still works.
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
@@ -1,9 +1,15 @@
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Dict, List
-import json
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Tuple
 
-from economy_data import CATEGORY_MAP
+try:
+    from economy_data import CATEGORY_MAP
+except ModuleNotFoundError:
+    from src.economy_data import CATEGORY_MAP
+
+# SKUs outside the precompiled ``<possible_tag>_<sku>`` table (multi-tag, suffixed, unknown)
+# resolved most recently; the catalog is shared by the whole process, so this stays bounded.
+VARIANT_MEMO_SIZE = 1024
 
 
 @dataclass(frozen=True)
@@ -47,32 +53,127 @@ class DataCatalog:
         return grouped
 
     def good_by_sku(self, sku: str) -> Good:
-        for good in self.goods:
-            if good.sku == sku:
-                return good
-        raise KeyError(f"Unknown SKU: {sku}")
+        good = self._index().goods_by_sku.get(sku)
+        if good is None:
+            raise KeyError(f"Unknown SKU: {sku}")
+        return good
+
+    def possible_variant_tags(self) -> frozenset[str]:
+        return self._index().possible_tags
+
+    def resolve_variant_sku(self, sku: str) -> Tuple[str | None, Tuple[str, ...]]:
+        """Catalog SKU ``sku`` is a variant of and the variant tags stripped from it; (None, ()) if none."""
+        index = self._index()
+        resolved = index.variants.get(sku)
+        if resolved is None:
+            resolved = index.resolve_unlisted(sku)
+        return resolved
+
+    def _index(self) -> "_CatalogIndex":
+        # Built on first lookup; goods are never edited once the catalog is loaded.
+        index = self.__dict__.get("_catalog_index")
+        if index is None:
+            index = _CatalogIndex(self.goods)
+            object.__setattr__(self, "_catalog_index", index)
+        return index
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("_catalog_index", None)
+        return state
+
+
+class _CatalogIndex:
+    """SKU lookups for a DataCatalog, with every ``<possible_tag>_<sku>`` variant resolved up front.
+
+    ``variants`` is fixed once built; any other SKU goes through ``resolve_unlisted``, an LRU
+    of VARIANT_MEMO_SIZE entries.
+    """
+
+    def __init__(self, goods: List[Good]) -> None:
+        self.goods_by_sku: Dict[str, Good] = {}
+        for good in goods:
+            self.goods_by_sku.setdefault(good.sku, good)
+        self.possible_tags = frozenset(
+            str(good.possible_tag) for good in goods if isinstance(good.possible_tag, str) and good.possible_tag
+        )
+        self.variants: Dict[str, Tuple[str | None, Tuple[str, ...]]] = {sku: (sku, ()) for sku in self.goods_by_sku}
+        for tag in sorted(self.possible_tags):
+            for sku in self.goods_by_sku:
+                variant = f"{tag}_{sku}"
+                if variant not in self.variants:
+                    self.variants[variant] = _resolve_variant_sku(variant, self.goods_by_sku, self.possible_tags)
+        self.resolve_unlisted = lru_cache(maxsize=VARIANT_MEMO_SIZE)(self._resolve)
+
+    def _resolve(self, sku: str) -> Tuple[str | None, Tuple[str, ...]]:
+        return _resolve_variant_sku(sku, self.goods_by_sku, self.possible_tags)
+
+
+def _resolve_variant_sku(
+    sku: str,
+    goods_by_sku: Mapping[str, Good],
+    known_tags: frozenset[str],
+) -> Tuple[str | None, Tuple[str, ...]]:
+    # A variant SKU is a catalog SKU with known variant tags prefixed and/or suffixed; the
+    # longest catalog SKU wins, then the fewest stripped tags, then lexical order.
+    if sku in goods_by_sku:
+        return sku, ()
+    if not known_tags:
+        return None, ()
+    parts = [part for part in sku.split("_") if part]
+    if not parts:
+        return None, ()
+    candidates: List[Tuple[str, Tuple[str, ...]]] = []
+    max_strip = len(parts) - 1
+    for prefix_count in range(0, max_strip + 1):
+        for suffix_count in range(0, max_strip - prefix_count + 1):
+            if prefix_count == 0 and suffix_count == 0:
+                continue
+            prefix_parts = parts[:prefix_count]
+            suffix_parts = parts[len(parts) - suffix_count :] if suffix_count > 0 else []
+            stripped_parts = tuple(prefix_parts + suffix_parts)
+            if not stripped_parts or any(part not in known_tags for part in stripped_parts):
+                continue
+            core = parts[prefix_count : len(parts) - suffix_count]
+            if not core:
+                continue
+            candidate_sku = "_".join(core)
+            if candidate_sku not in goods_by_sku:
+                continue
+            candidates.append((candidate_sku, stripped_parts))
+    if not candidates:
+        return None, ()
+    candidates.sort(key=lambda entry: (-len(entry[0]), len(entry[1]), entry[0], entry[1]))
+    return candidates[0]
 
 
 def load_data_catalog() -> DataCatalog:
-    root = Path(__file__).resolve().parents[1]
-    categories = _load_categories(root / "data" / "categories.json")
-    tags = _load_tags(root / "data" / "tags.json")
-    goods = _load_goods(root / "data" / "goods.json", tags, categories)
-    economies = _load_economies(root / "data" / "economies.json")
+    try:
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
+
+    return get_data_bundle().catalog
+
+
+def build_data_catalog(documents: Mapping[str, Any]) -> DataCatalog:
+    """Validate and build the catalog from parsed data/*.json documents keyed by file name."""
+    categories = _load_categories(documents["categories.json"])
+    tags = _load_tags(documents["tags.json"])
+    goods = _load_goods(documents["goods.json"], tags, categories)
+    economies = _load_economies(documents["economies.json"])
     _validate_economies(economies, categories)
     return DataCatalog(tags=tags, goods=goods, economies=economies)
 
 
-def _load_categories(path: Path) -> Dict[str, str]:
-    data = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+def _load_categories(data: Dict[str, Any]) -> Dict[str, str]:
     categories = data.get("categories", {})
     if not categories:
         raise ValueError("No categories loaded from categories.json.")
     return {category_id: details.get("description", "") for category_id, details in categories.items()}
 
 
-def _load_tags(path: Path) -> Dict[str, Tag]:
-    data = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+def _load_tags(data: Any) -> Dict[str, Tag]:
     if isinstance(data, list):
         tag_data: Dict[str, Dict[str, str]] = {}
         for index, entry in enumerate(data):
@@ -105,8 +206,7 @@ def _load_tags(path: Path) -> Dict[str, Tag]:
     return tags
 
 
-def _load_goods(path: Path, tags: Dict[str, Tag], categories: Dict[str, str]) -> List[Good]:
-    data = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+def _load_goods(data: Dict[str, Any], tags: Dict[str, Tag], categories: Dict[str, str]) -> List[Good]:
     goods_data = data.get("goods", [])
     goods: List[Good] = []
     allowed_possible_tags = {
@@ -151,8 +251,7 @@ def _load_goods(path: Path, tags: Dict[str, Tag], categories: Dict[str, str]) ->
     return goods
 
 
-def _load_economies(path: Path) -> Dict[str, Economy]:
-    data = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+def _load_economies(data: Any) -> Dict[str, Economy]:
     economies_data = data.get("economies", [])
     economies: Dict[str, Economy] = {}
     for entry in economies_data:
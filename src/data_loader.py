@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from copy import deepcopy
 from typing import Any
 
 
@@ -54,12 +53,30 @@ _MODULE_OPTIONAL_KEYS = {"numeric_bonus", "tags"}
 _MODULE_ALLOWED_KEYS = _MODULE_REQUIRED_KEYS | _MODULE_OPTIONAL_KEYS
 
 
-def _data_root() -> Path:
-    return Path(__file__).resolve().parents[1] / "data"
+def load_hulls() -> dict[str, Any]:
+    try:
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
 
+    bundle = get_data_bundle()
+    # Fresh dicts per call, as before the bundle; its own entries are shared by every engine.
+    return {"version": bundle.hulls_version, "hulls": deepcopy(list(bundle.hulls))}
 
-def load_hulls() -> dict[str, Any]:
-    payload = _load_json(_data_root() / "hulls.json")
+
+def load_modules() -> dict[str, Any]:
+    try:
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
+
+    bundle = get_data_bundle()
+    return {"version": bundle.modules_version, "modules": deepcopy(list(bundle.modules))}
+
+
+def validate_hulls_payload(payload: Any) -> dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise ValueError("hulls.json root: must be an object.")
     version = payload.get("version")
     if not isinstance(version, str) or not version:
         raise ValueError("hulls.json root: 'version' must exist and be a non-empty string.")
@@ -76,8 +93,9 @@ def load_hulls() -> dict[str, Any]:
     return {"version": version, "hulls": validated}
 
 
-def load_modules() -> dict[str, Any]:
-    payload = _load_json(_data_root() / "modules.json")
+def validate_modules_payload(payload: Any) -> dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise ValueError("modules.json root: must be an object.")
     version = payload.get("version")
     if not isinstance(version, str) or not version:
         raise ValueError("modules.json root: 'version' must exist and be a non-empty string.")
@@ -94,15 +112,6 @@ def load_modules() -> dict[str, Any]:
     return {"version": version, "modules": validated}
 
 
-def _load_json(path: Path) -> dict[str, Any]:
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError as error:
-        raise ValueError(f"{path.name}: file not found.") from error
-    except json.JSONDecodeError as error:
-        raise ValueError(f"{path.name}: invalid JSON.") from error
-
-
 def _validate_hull(hull: dict[str, Any], index: int) -> None:
     missing = sorted(_HULL_REQUIRED_KEYS - set(hull.keys()))
     if missing:
@@ -0,0 +1,240 @@
+"""Keyed deterministic rolls shared by the simulation modules.
+
+Two modes:
+
+- ``compat`` reproduces the streams the game has always used: SHA-256 of the
+  joined key parts seeds a fresh ``random.Random``. Existing seeds keep their
+  worlds, and key derivation is memoized so repeated keys skip the hash.
+- ``fast`` derives a 64-bit key once per key tuple (BLAKE2b, memoized) and reads
+  values from a SplitMix64 counter stream. A roll is a few integer operations
+  instead of seeding a Mersenne Twister, but the numbers differ from compat, so
+  a world simulated in fast mode is a different (still reproducible) world.
+  Daily rolls (``day_key``) use the day as the counter of a per-system key, so
+  galaxy-wide passes derive each system's key once.
+
+The legacy derivations used by individual modules (``sha256_prefix_int``,
+``sha256_u01``, ``polynomial_seed``) live here as well so every caller shares
+one memoized implementation.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, NamedTuple
+import hashlib
+import random
+
+
+RNG_MODE_COMPAT = "compat"
+RNG_MODE_FAST = "fast"
+RNG_MODES = (RNG_MODE_COMPAT, RNG_MODE_FAST)
+
+KEY_MEMO_SIZE = 1 << 16
+
+_MASK64 = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_DOUBLE_UNIT = 1.0 / (1 << 53)
+
+
+def require_rng_mode(mode: Any) -> str:
+    if mode not in RNG_MODES:
+        raise ValueError(f"rng_mode must be one of {', '.join(RNG_MODES)}.")
+    return str(mode)
+
+
+# --- compat derivations ---------------------------------------------------------------------
+
+
+# typed=True: 1, 1.0 and True hash alike but stringify differently.
+@lru_cache(maxsize=KEY_MEMO_SIZE, typed=True)
+def sha256_seed(*parts: Any) -> int:
+    """Full SHA-256 of the "|"-joined parts as an integer (world-state seeds)."""
+    packed = "|".join(str(part) for part in parts).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(packed).digest(), "big")
+
+
+@lru_cache(maxsize=KEY_MEMO_SIZE)
+def sha256_prefix_int(token: str) -> int:
+    """First 64 bits of SHA-256(token); equals ``int(hexdigest[:16], 16)``."""
+    return int.from_bytes(hashlib.sha256(token.encode("utf-8")).digest()[:8], "big")
+
+
+def sha256_u01(token: str) -> float:
+    """First 64 bits of SHA-256(token) scaled into [0, 1)."""
+    return sha256_prefix_int(token) / (2**64)
+
+
+@lru_cache(maxsize=KEY_MEMO_SIZE)
+def _polynomial_part(part: str) -> tuple[int, int]:
+    # (hash of part from zero, 31 ** len(part)) modulo 2**32, so folding a part is one step.
+    value = 0
+    for char in part:
+        value = (value * 31 + ord(char)) & _MASK32
+    return value, pow(31, len(part), 1 << 32)
+
+
+def polynomial_seed(base: int, *parts: Any) -> int:
+    """``value = (value * 31 + ord(char)) % 2**32`` over every character of ``parts``, starting from ``base``."""
+    value = base
+    for part in parts:
+        text = str(part)
+        if not text:
+            # No characters, no step: the legacy loop leaves the value (even an unreduced base) as is.
+            continue
+        contribution, scale = _polynomial_part(text)
+        value = (value * scale + contribution) & _MASK32
+    return value
+
+
+def compat_u01(seed: int) -> float:
+    """First ``random()`` of ``random.Random(seed)``."""
+    return random.Random(seed).random()
+
+
+@lru_cache(maxsize=KEY_MEMO_SIZE, typed=True)
+def _compat_roll(*parts: Any) -> float:
+    # Seeding the Mersenne Twister dominates a compat roll, so repeated keys keep the value itself.
+    return compat_u01(sha256_seed(*parts))
+
+
+# --- fast counter-based stream --------------------------------------------------------------
+
+
+@lru_cache(maxsize=KEY_MEMO_SIZE, typed=True)
+def key64(*parts: Any) -> int:
+    packed = "|".join(str(part) for part in parts).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), "big")
+
+
+def splitmix64(key: int, counter: int = 0) -> int:
+    """Output ``counter`` of the SplitMix64 sequence started at ``key``."""
+    z = (key + (counter + 1) * _GOLDEN_GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def splitmix_u01(key: int, counter: int = 0) -> float:
+    return (splitmix64(key, counter) >> 11) * _DOUBLE_UNIT
+
+
+class KeyedRandom(random.Random):
+    """``random.Random`` whose values come from a SplitMix64 counter stream instead of a Mersenne Twister.
+
+    Seeding just stores the key, so creating one per roll is cheap. All derived methods
+    (randint, choice, shuffle, choices, uniform, ...) work through random()/getrandbits().
+    """
+
+    def seed(self, a: Any = None, version: int = 2) -> None:  # type: ignore[override]
+        self._key = int(a or 0) & _MASK64
+        self._counter = 0
+
+    def random(self) -> float:
+        value = splitmix64(self._key, self._counter)
+        self._counter += 1
+        return (value >> 11) * _DOUBLE_UNIT
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits = 0
+        filled = 0
+        while filled < k:
+            bits |= splitmix64(self._key, self._counter) << filled
+            self._counter += 1
+            filled += 64
+        return bits & ((1 << k) - 1)
+
+    def getstate(self) -> tuple[int, int]:  # type: ignore[override]
+        return self._key, self._counter
+
+    def setstate(self, state: tuple[int, int]) -> None:  # type: ignore[override]
+        self._key, self._counter = state
+
+
+def clear_key_memos() -> None:
+    """Drop every memoized key and compat roll (benchmarks, long-running tools)."""
+    for memo in (sha256_seed, sha256_prefix_int, _polynomial_part, _compat_roll, key64):
+        memo.cache_clear()
+
+
+def splitmix_u01_many(keys: list[int], counter: int) -> list[float]:
+    """``[splitmix_u01(key, counter) for key in keys]`` without a call per key."""
+    step = ((counter + 1) * _GOLDEN_GAMMA) & _MASK64
+    values = []
+    for key in keys:
+        z = (key + step) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        values.append(((z ^ (z >> 31)) >> 11) * _DOUBLE_UNIT)
+    return values
+
+
+class RollKey(NamedTuple):
+    """A key tuple bound to a mode; lets callers pass one roll around before drawing it.
+
+    ``counter_at`` marks an integer part (a day) that fast mode uses as the SplitMix
+    counter instead of hashing it, so one memoized key serves every day. Compat mode
+    hashes all parts either way.
+    """
+
+    mode: str
+    parts: tuple[Any, ...]
+    counter_at: int = -1
+
+    def u01(self) -> float:
+        if self.mode == RNG_MODE_FAST:
+            if self.counter_at >= 0:
+                at = self.counter_at
+                return splitmix_u01(key64(*self.parts[:at], *self.parts[at + 1 :]), self.parts[at])
+            return splitmix_u01(key64(*self.parts))
+        return _compat_roll(*self.parts)
+
+    def stream(self) -> random.Random:
+        if self.mode == RNG_MODE_FAST:
+            return KeyedRandom(key64(*self.parts))
+        return random.Random(sha256_seed(*self.parts))
+
+
+class DeterministicRng:
+    """Rolls keyed by a tuple of parts, in compat or fast mode."""
+
+    def __init__(self, mode: str = RNG_MODE_COMPAT) -> None:
+        self.mode = require_rng_mode(mode)
+
+    def __repr__(self) -> str:
+        return f"DeterministicRng(mode={self.mode!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DeterministicRng) and other.mode == self.mode
+
+    def __hash__(self) -> int:
+        return hash(self.mode)
+
+    def key(self, *parts: Any) -> RollKey:
+        return RollKey(self.mode, parts)
+
+    def day_key(self, world_seed: int, scope_id: str, day: int, channel: str) -> RollKey:
+        """Key for a daily roll; compat parts are ``(world_seed, scope_id, day, channel)``."""
+        return RollKey(self.mode, (world_seed, scope_id, day, channel), 2)
+
+    def day_u01(self, world_seed: int, scope_id: str, day: int, channel: str) -> float:
+        """One daily roll in [0, 1): ``self.day_key(world_seed, scope_id, day, channel).u01()``."""
+        return self.day_key(world_seed, scope_id, day, channel).u01()
+
+    def u01(self, *parts: Any) -> float:
+        """One roll in [0, 1) for the key ``parts``."""
+        return RollKey(self.mode, parts).u01()
+
+    def day_u01_many(self, world_seed: int, scope_ids: list[str], day: int, channel: str) -> list[float]:
+        """``[self.day_key(world_seed, scope_id, day, channel).u01() for scope_id in scope_ids]``, batched."""
+        if self.mode == RNG_MODE_FAST:
+            return splitmix_u01_many([key64(world_seed, scope_id, channel) for scope_id in scope_ids], day)
+        # Every key is new each day, so skip the memos rather than churn them.
+        seed = sha256_seed.__wrapped__
+        return [compat_u01(seed(world_seed, scope_id, day, channel)) for scope_id in scope_ids]
+
+    def stream(self, *parts: Any) -> random.Random:
+        """A fresh generator for the key ``parts``; same key, same sequence."""
+        return RollKey(self.mode, parts).stream()
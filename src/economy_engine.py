@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-from economy_data import CATEGORIES, RESOURCE_PROFILES
+from economy_data import CATEGORIES, CATEGORY_MAP, RESOURCE_PROFILES
 from logger import Logger
 from world_generator import Sector
 
@@ -15,6 +15,12 @@ AVAILABILITY_MODIFIERS: Dict[str, float] = {
     "SURPLUS": 0.65,
 }
 
+_STATE_INDEX: Dict[str, int] = {state: index for index, state in enumerate(AVAILABILITY_STATES)}
+
+ECONOMY_TICK = "economy"
+# After the stage ticks and the world-state lifecycle.
+ECONOMY_TICK_PRIORITY = 200
+
 
 @dataclass(frozen=True)
 class TradeAction:
@@ -25,42 +31,92 @@ class TradeAction:
 
 
 class EconomyEngine:
+    """Availability and price per (system, category) cell, moved by production pressure each tick.
+
+    Cells live in flat row-major arrays (system rows, category columns). A cell's pressure
+    moves by the same amount every tick, so it is stored as an anchor value plus that rate,
+    and each cell is booked for the tick its availability next changes. A tick only visits
+    the cells booked for it and the traded cell; everything else is unchanged by construction.
+    """
+
     def __init__(self, sector: Sector, logger: Logger) -> None:
         self._sector = sector
         self._logger = logger
-        self._availability: Dict[str, Dict[str, str]] = {}
-        self._prices: Dict[str, Dict[str, float]] = {}
-        self._last_cause: Dict[str, Dict[str, str]] = {}
-        self._pressure: Dict[str, Dict[str, float]] = {}
+        self._system_ids: List[str] = []
+        self._category_ids: List[str] = [category.category_id for category in CATEGORIES]
+        self._row_by_system: Dict[str, int] = {}
+        self._column_by_category: Dict[str, int] = {
+            category_id: column for column, category_id in enumerate(self._category_ids)
+        }
+        # price_table[column][state] for every availability state.
+        self._price_table: List[List[float]] = [
+            [self._price_for(availability=state, category_id=category_id) for state in AVAILABILITY_STATES]
+            for category_id in self._category_ids
+        ]
+        self._rate: List[int] = []
+        self._threshold: List[int] = []
+        self._anchor_pressure: List[int] = []
+        self._anchor_tick: List[int] = []
+        self._state: bytearray = bytearray()
+        self._last_cause: List[str] = []
+        self._next_change: List[int] = []
+        self._changes_by_tick: Dict[int, List[int]] = {}
+        self._ticks = 0
+        self._pending_trade: Optional[TradeAction] = None
         self._init_state()
 
     def _init_state(self) -> None:
-        for system in self._sector.systems:
-            self._availability[system.system_id] = {}
-            self._prices[system.system_id] = {}
-            self._last_cause[system.system_id] = {}
-            self._pressure[system.system_id] = {}
-            for category in CATEGORIES:
-                self._availability[system.system_id][category.category_id] = "STABLE"
-                self._prices[system.system_id][category.category_id] = self._price_for(
-                    availability="STABLE",
-                    category_id=category.category_id,
-                )
-                self._last_cause[system.system_id][category.category_id] = "production"
-                self._pressure[system.system_id][category.category_id] = 0
+        stable = _STATE_INDEX["STABLE"]
+        for row, system in enumerate(self._sector.systems):
+            self._system_ids.append(system.system_id)
+            self._row_by_system[system.system_id] = row
+            profile = RESOURCE_PROFILES[system.attributes.get("profile_id")]
+            for category_id in self._category_ids:
+                production = profile.production[category_id]
+                consumption = profile.consumption[category_id]
+                self._rate.append(production - consumption)
+                self._threshold.append(max(production, consumption) * 2)
+        cells = len(self._rate)
+        self._anchor_pressure = [0] * cells
+        self._anchor_tick = [0] * cells
+        self._state = bytearray([stable]) * cells
+        self._last_cause = ["production"] * cells
+        self._next_change = [0] * cells
+        self._changes_by_tick = {}
+        for cell in range(cells):
+            if self._state_from_pressure(0, self._threshold[cell]) != "STABLE":
+                # Zero capacity: pressure 0 already reads SCARCE, so the first tick moves it.
+                self._next_change[cell] = 1
+                self._changes_by_tick.setdefault(1, []).append(cell)
+            else:
+                self._book_next_change(cell, 0, 0)
+
+    def _cell(self, system_id: str, category_id: str) -> int:
+        return self._row_by_system[system_id] * len(self._category_ids) + self._column_by_category[category_id]
 
     def availability(self, system_id: str, category_id: str) -> str:
-        return self._availability[system_id][category_id]
+        return AVAILABILITY_STATES[self._state[self._cell(system_id, category_id)]]
 
     def price(self, system_id: str, category_id: str) -> float:
-        return self._prices[system_id][category_id]
+        return self._price_table[self._column_by_category[category_id]][self._state[self._cell(system_id, category_id)]]
+
+    def pressure(self, system_id: str, category_id: str) -> int:
+        return self._pressure_at(self._cell(system_id, category_id), self._ticks)
 
     def scarcity_modifier(self, system_id: str, category_id: str) -> float:
-        availability = self._availability[system_id][category_id]
-        return AVAILABILITY_MODIFIERS[availability]
+        return AVAILABILITY_MODIFIERS[self.availability(system_id, category_id)]
 
     def all_prices(self) -> Dict[str, Dict[str, float]]:
-        return self._prices
+        """A snapshot of every price, by system then category."""
+        width = len(self._category_ids)
+        prices: Dict[str, Dict[str, float]] = {}
+        for row, system_id in enumerate(self._system_ids):
+            states = self._state[row * width : (row + 1) * width]
+            prices[system_id] = {
+                category_id: self._price_table[column][states[column]]
+                for column, category_id in enumerate(self._category_ids)
+            }
+        return prices
 
     def category_summary(self, system_id: str) -> Dict[str, Dict[str, float]]:
         profile_id = self._profile_id(system_id)
@@ -77,79 +133,99 @@ class EconomyEngine:
             }
         return values
 
+    def queue_trade(self, trade_action: TradeAction) -> None:
+        """Apply ``trade_action`` with the next daily tick."""
+        self._pending_trade = trade_action
+
+    def run_tick(self, day: int, context: object = None) -> None:
+        """Tick handler: advance one day with any queued trade (see TimeEngine.register_tick)."""
+        trade_action, self._pending_trade = self._pending_trade, None
+        self.advance_turn(turn=day, trade_action=trade_action)
+
     def advance_turn(self, turn: int, trade_action: Optional[TradeAction] = None) -> None:
-        trade_delta: Dict[Tuple[str, str], TradeAction] = {}
-        if trade_action is not None:
-            trade_delta[(trade_action.system_id, trade_action.category_id)] = trade_action
+        self._ticks += 1
+        tick = self._ticks
+        due = self._changes_by_tick.pop(tick, [])
+        traded_cell = None
+        if (
+            trade_action is not None
+            and trade_action.system_id in self._row_by_system
+            and trade_action.category_id in self._column_by_category
+        ):
+            traded_cell = self._cell(trade_action.system_id, trade_action.category_id)
+            # Re-anchor so the trade delta becomes part of the cell's pressure from this tick on.
+            self._anchor_pressure[traded_cell] = self._pressure_at(traded_cell, tick) + trade_action.delta
+            self._anchor_tick[traded_cell] = tick
+            due.append(traded_cell)
+        if not due:
+            return
 
-        old_availability = {
-            system_id: dict(goods)
-            for system_id, goods in self._availability.items()
-        }
-        old_prices = {system_id: dict(goods) for system_id, goods in self._prices.items()}
-
-        for system in self._sector.systems:
-            profile_id = system.attributes.get("profile_id")
-            profile = RESOURCE_PROFILES[profile_id]
-            for category in CATEGORIES:
-                key = (system.system_id, category.category_id)
-                trade = trade_delta.get(key)
-                production = profile.production[category.category_id]
-                consumption = profile.consumption[category.category_id]
-                capacity = max(production, consumption)
-                pressure_change = production - consumption
-                if trade is not None:
-                    pressure_change += trade.delta
-
-                self._pressure[system.system_id][category.category_id] += pressure_change
-                pressure = self._pressure[system.system_id][category.category_id]
-                threshold = capacity * 2
-                new_state = self._state_from_pressure(pressure, threshold)
-                if new_state != old_availability[system.system_id][category.category_id]:
-                    if trade is not None:
-                        cause = trade.cause
-                    else:
-                        cause = "net_positive" if pressure_change > 0 else "net_negative"
-                    self._availability[system.system_id][category.category_id] = new_state
-                    self._last_cause[system.system_id][category.category_id] = cause
-
-        for system in self._sector.systems:
-            for category in CATEGORIES:
-                system_id = system.system_id
-                category_id = category.category_id
-                availability = self._availability[system_id][category_id]
-                if availability == old_availability[system_id][category_id]:
-                    self._prices[system_id][category_id] = old_prices[system_id][category_id]
-                    continue
-                new_price = self._price_for(availability=availability, category_id=category_id)
-                self._prices[system_id][category_id] = new_price
-
-        for system in self._sector.systems:
-            for category in CATEGORIES:
-                system_id = system.system_id
-                category_id = category.category_id
-                old_state = old_availability[system_id][category_id]
-                new_state = self._availability[system_id][category_id]
-                old_price = old_prices[system_id][category_id]
-                new_price = self._prices[system_id][category_id]
-                if old_state == new_state and old_price == new_price:
-                    continue
-
-                cause = self._last_cause[system_id][category_id]
-                self._logger.log(
-                    turn=turn,
-                    action="economy_update",
-                    state_change=(
-                        f"system_id={system_id} category_id={category_id} "
-                        f"availability {old_state}->{new_state} "
-                        f"price {old_price:.2f}->{new_price:.2f} "
-                        f"cause={cause}"
-                    ),
-                )
+        changed: List[Tuple[int, int]] = []
+        for cell in sorted(set(due)) if len(due) > 1 else due:
+            if cell != traded_cell and self._next_change[cell] != tick:
+                # Booked for a tick a later trade moved; the cell was rebooked then.
+                continue
+            pressure = self._pressure_at(cell, tick)
+            threshold = self._threshold[cell]
+            old_state = self._state[cell]
+            new_state = _STATE_INDEX[self._state_from_pressure(pressure, threshold)]
+            if new_state != old_state:
+                pressure_change = self._rate[cell]
+                if cell == traded_cell:
+                    self._last_cause[cell] = trade_action.cause
+                else:
+                    self._last_cause[cell] = "net_positive" if pressure_change > 0 else "net_negative"
+                self._state[cell] = new_state
+                changed.append((cell, old_state))
+            self._book_next_change(cell, tick, pressure)
+
+        width = len(self._category_ids)
+        for cell, old_state in changed:
+            row, column = divmod(cell, width)
+            new_state = self._state[cell]
+            old_price = self._price_table[column][old_state]
+            new_price = self._price_table[column][new_state]
+            self._logger.log(
+                turn=turn,
+                action="economy_update",
+                state_change=(
+                    f"system_id={self._system_ids[row]} category_id={self._category_ids[column]} "
+                    f"availability {AVAILABILITY_STATES[old_state]}->{AVAILABILITY_STATES[new_state]} "
+                    f"price {old_price:.2f}->{new_price:.2f} "
+                    f"cause={self._last_cause[cell]}"
+                ),
+            )
+
+    def _pressure_at(self, cell: int, tick: int) -> int:
+        return self._anchor_pressure[cell] + self._rate[cell] * (tick - self._anchor_tick[cell])
+
+    def _book_next_change(self, cell: int, tick: int, pressure: int) -> None:
+        """Book ``cell`` for the first tick after ``tick`` at which its pressure leaves the current band."""
+        rate = self._rate[cell]
+        threshold = self._threshold[cell]
+        # Thresholds are twice an integer capacity, so every band edge is an integer.
+        half = threshold // 2
+        state = AVAILABILITY_STATES[self._state[cell]]
+        # First pressure outside the current band (see _state_from_pressure) in the direction of travel.
+        steps = None
+        if rate > 0:
+            target = {"SCARCE": 1 - threshold, "LOW": 1 - half, "STABLE": half, "ABUNDANT": threshold}.get(state)
+            if target is not None:
+                steps = -((pressure - target) // rate)
+        elif rate < 0:
+            target = {"SURPLUS": threshold - 1, "ABUNDANT": half - 1, "STABLE": -half, "LOW": -threshold}.get(state)
+            if target is not None:
+                steps = -((target - pressure) // -rate)
+        if steps is None:
+            self._next_change[cell] = 0
+            return
+        next_tick = tick + max(1, steps)
+        self._next_change[cell] = next_tick
+        self._changes_by_tick.setdefault(next_tick, []).append(cell)
 
     def _price_for(self, availability: str, category_id: str) -> float:
         modifier = AVAILABILITY_MODIFIERS[availability]
-        base_price = next(c for c in CATEGORIES if c.category_id == category_id).base_price
+        base_price = CATEGORY_MAP[category_id].base_price
         return base_price * modifier
 
     @staticmethod
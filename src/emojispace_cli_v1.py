@@ -9,7 +9,6 @@ import argparse
 import contextlib
 import io
 import json
-import math
 import re
 import sys
 from datetime import datetime
@@ -53,7 +52,7 @@ def _format_result(result: Dict[str, Any], action_type: str = "action") -> None:
     
     # Record action for Markdown
     if playtest_logger:
-        turn = get_current_turn()
+        turn = int(result.get("turn_after", 0) or 0)
         playtest_logger.record_action(turn, action_type, result)
     
     if verbose:
@@ -1794,13 +1793,13 @@ def _show_system_info(engine: GameEngine) -> None:
         system_obj = engine.sector.get_system(system_id_reachable) if system_id_reachable else None
         if system_obj is not None:
             # Upgrade in-range systems to scanned_local based on authoritative reachability.
-            mark_system_scanned_local(engine.player_state, system_obj, current_turn=get_current_turn())
+            mark_system_scanned_local(engine.player_state, system_obj, current_turn=get_current_turn(engine.time_context))
         view = get_system_view(
             engine.player_state,
             engine.sector,
             system_id=system_id_reachable,
             current_system_id=engine.player_state.current_system_id,
-            current_turn=get_current_turn(),
+            current_turn=get_current_turn(engine.time_context),
         )
         # Render from knowledge view only: [primary] NAME [government]; no population unless visited.
         entity = SimpleNamespace(
@@ -2534,7 +2533,7 @@ def _travel_menu(engine: GameEngine) -> None:
                 destination_id=engine.player_state.current_destination_id,
                 current_system_id=engine.player_state.current_system_id,
                 current_destination_id=engine.player_state.current_destination_id,
-                current_turn=get_current_turn(),
+                current_turn=get_current_turn(engine.time_context),
             )
             dest_obj = _get_destination_object(engine, engine.player_state.current_destination_id)
             dest_entity = _destination_display_entity(dest_obj) if dest_obj else SimpleNamespace(emoji_id=dest_view.primary_emoji_id, tier=None, tags=[])
@@ -2548,7 +2547,7 @@ def _travel_menu(engine: GameEngine) -> None:
             engine.sector,
             system_id=current_system.system_id,
             current_system_id=current_system.system_id,
-            current_turn=get_current_turn(),
+            current_turn=get_current_turn(engine.time_context),
         )
         sys_entity = current_system
         sys_name = sys_view.name or _get_system_name(engine, current_system.system_id)
@@ -2579,13 +2578,13 @@ def _travel_menu(engine: GameEngine) -> None:
                 system = row["system"]
                 system_id = str(row.get("system_id", ""))
                 # Mark in-range systems as scanned_local
-                mark_system_scanned_local(engine.player_state, system, current_turn=get_current_turn())
+                mark_system_scanned_local(engine.player_state, system, current_turn=get_current_turn(engine.time_context))
                 view = get_system_view(
                     engine.player_state,
                     engine.sector,
                     system_id=system_id,
                     current_system_id=engine.player_state.current_system_id,
-                    current_turn=get_current_turn(),
+                    current_turn=get_current_turn(engine.time_context),
                 )
                 base_name = view.name or _get_system_name(engine, system_id)
                 # Entity shape for emoji profile: primary + government emoji (no tier unless visited)
@@ -2810,7 +2809,7 @@ def _travel_menu(engine: GameEngine) -> None:
                     destination_id=dest_id,
                     current_system_id=engine.player_state.current_system_id,
                     current_destination_id=engine.player_state.current_destination_id,
-                    current_turn=get_current_turn(),
+                    current_turn=get_current_turn(engine.time_context),
                 )
                 # [type] NAME [population/tier] [economy] [economy...] via emoji profile; no situations for list.
                 dest_ent = SimpleNamespace(
@@ -4030,13 +4029,11 @@ def main() -> None:
 
 def _reachable_systems(*, engine: GameEngine, current_system, fuel_limit: int) -> list[dict[str, object]]:
     rows: list[dict[str, object]] = []
-    for system in sorted(engine.sector.systems, key=lambda entry: entry.system_id):
-        if system.system_id == current_system.system_id:
+    for system_id, distance in engine.route_planner().distances_from(current_system.system_id).items():
+        if system_id == current_system.system_id:
             continue
-        dx = float(system.x) - float(current_system.x)
-        dy = float(system.y) - float(current_system.y)
-        distance = math.sqrt((dx * dx) + (dy * dy))
         if distance <= float(fuel_limit):
+            system = engine.sector.get_system(system_id)
             rows.append(
                 {
                     "system": system,
@@ -4194,7 +4191,7 @@ def _print_current_system_destinations(engine: GameEngine) -> None:
             destination_id=dest_id,
             current_system_id=engine.player_state.current_system_id,
             current_destination_id=engine.player_state.current_destination_id,
-            current_turn=get_current_turn(),
+            current_turn=get_current_turn(engine.time_context),
         )
         # Same local_visible format as travel menu: [type] NAME [population/tier] [economy] [economy...]
         dest_ent = SimpleNamespace(
@@ -1,7 +1,4 @@
-from pathlib import Path
 from typing import Any
-import hashlib
-import json
 
 try:
     from playtest_telemetry import log_debug_event
@@ -9,6 +6,11 @@ except Exception:
     def log_debug_event(_event_type: str, _data: dict[str, Any]) -> None:
         pass
 
+try:
+    from deterministic_rng import sha256_u01
+except ModuleNotFoundError:
+    from src.deterministic_rng import sha256_u01
+
 
 ALLOWED_POSTURES = {"neutral", "authority", "hostile", "opportunity"}
 ALLOWED_INITIATIVES = {"player", "npc"}
@@ -70,13 +72,9 @@ class EncounterSpec:
 
 
 def deterministic_float(seed_string):
-    try:
-        encoded = seed_string.encode("ascii")
-    except UnicodeEncodeError as error:
-        raise ValueError("Seed string must be ASCII for deterministic hashing.") from error
-    digest = hashlib.sha256(encoded).digest()
-    value = int.from_bytes(digest[:8], byteorder="big", signed=False)
-    return value / (2**64)
+    if not seed_string.isascii():
+        raise ValueError("Seed string must be ASCII for deterministic hashing.")
+    return sha256_u01(seed_string)
 
 
 def deterministic_weighted_choice(items, weights, seed_string):
@@ -97,28 +95,16 @@ def deterministic_weighted_choice(items, weights, seed_string):
     return items[-1]
 
 
-def _load_encounter_types_file() -> dict[str, Any]:
-    path = Path(__file__).resolve().parents[1] / "data" / "encounter_types.json"
+def load_governments():
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError as error:
-        raise ValueError("encounter_types.json not found at data/encounter_types.json.") from error
-    except json.JSONDecodeError as error:
-        raise ValueError("encounter_types.json is not valid JSON.") from error
-
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
 
-def _load_governments_file() -> dict[str, Any]:
-    path = Path(__file__).resolve().parents[1] / "data" / "governments.json"
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError as error:
-        raise ValueError("governments.json not found at data/governments.json.") from error
-    except json.JSONDecodeError as error:
-        raise ValueError("governments.json is not valid JSON.") from error
+    return get_data_bundle().governments_by_id
 
 
-def load_governments():
-    payload = _load_governments_file()
+def validate_governments_payload(payload):
     governments = payload.get("governments")
     if not isinstance(governments, list):
         raise ValueError("governments.json missing or invalid governments list.")
@@ -219,7 +205,17 @@ def _validate_optional_bias_map(subtype_id: str, field_name: str, value: Any) ->
 
 
 def load_encounter_types():
-    payload = _load_encounter_types_file()
+    try:
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
+
+    return get_data_bundle().encounter_types
+
+
+def validate_encounter_types_payload(payload):
+    if not isinstance(payload, dict):
+        raise ValueError("encounter_types.json root must be an object.")
     if "version" not in payload:
         raise ValueError("encounter_types.json missing required top-level field: version.")
     encounter_types = payload.get("encounter_types")
@@ -43,8 +43,9 @@ def evaluate_end_game(
     *,
     player: PlayerState,
     missions: List[MissionEntity],
+    current_turn: int | None = None,
 ) -> EndGameResult:
-    failures = _failure_reasons(player)
+    failures = _failure_reasons(player, current_turn=current_turn)
     if failures:
         return EndGameResult(status="lose", failure_reasons=failures)
 
@@ -120,13 +121,13 @@ def _eligible_track(tracks: Dict[str, int], primary: str, opposing: str) -> bool
     return tracks.get(primary, 0) >= 100 and tracks.get(opposing, 0) <= 50
 
 
-def _failure_reasons(player: PlayerState) -> List[str]:
+def _failure_reasons(player: PlayerState, current_turn: int | None = None) -> List[str]:
     failures: List[str] = []
     if player.arrest_state == "detained_tier_2":
         failures.append("tier2_arrest")
     if _death_detected(player):
         failures.append("death")
-    if _bankruptcy_detected(player):
+    if _bankruptcy_detected(player, current_turn=current_turn):
         failures.append("bankruptcy")
     return failures
 
@@ -139,15 +140,16 @@ def _death_detected(player: PlayerState) -> bool:
     return False
 
 
-def _bankruptcy_detected(player: PlayerState) -> bool:
+def _bankruptcy_detected(player: PlayerState, current_turn: int | None = None) -> bool:
     # Liquidity-based bankruptcy: credits must be 0 AND warning turn must be set AND current turn must exceed warning turn
     if player.credits > 0:
         return False
     if player.bankruptcy_warning_turn is None:
         return False
-    # Import here to avoid circular dependency
-    from time_engine import get_current_turn
-    current_turn = int(get_current_turn())
+    if current_turn is None:
+        # Import here to avoid circular dependency
+        from time_engine import get_current_turn
+        current_turn = int(get_current_turn())
     if current_turn <= player.bankruptcy_warning_turn:
         return False
     return True
@@ -0,0 +1,110 @@
+"""Binary snapshots and in-process forks of GameEngine state.
+
+A snapshot is a small header (magic + format version) followed by a
+zlib-compressed pickle of the engine's attributes. The shared DataBundle and
+DataCatalog are written as references to the bundle content hash rather than
+copied, and are resolved against the process-wide bundle on restore, so
+restoring against different game data fails loudly.
+
+Forks never leave the process, so they skip compression and also share every
+object that is immutable by contract: the data bundle, government registry,
+world-state catalogs and the frozen System records of the sector. Systems are
+only ever replaced in ``sector.systems`` (see world_state_engine), never edited,
+which makes copying the list enough to isolate the fork. Unexpanded systems of a
+lazy sector do change in place when first read, but into the same deterministic
+record for every holder, so sharing them is still safe.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+import copyreg
+import io
+import pickle
+import struct
+import zlib
+
+try:
+    from data_bundle import DataBundle, get_data_bundle
+    from data_catalog import DataCatalog
+except ModuleNotFoundError:
+    from src.data_bundle import DataBundle, get_data_bundle
+    from src.data_catalog import DataCatalog
+
+
+SNAPSHOT_MAGIC = b"ESNP"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_COMPRESSION_LEVEL = 6
+
+_HEADER = struct.Struct(">4sH")
+
+
+def encode_snapshot(state: dict[str, Any], *, bundle: DataBundle) -> bytes:
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    # A per-type dispatch table keeps the pickler in C for everything else, which is
+    # several times faster than a persistent_id hook called for every object.
+    dispatch = dict(copyreg.dispatch_table)
+    dispatch[DataBundle] = lambda obj: _reduce_shared(obj, bundle, "data_bundle")
+    dispatch[DataCatalog] = lambda obj: _reduce_shared(obj, bundle, "data_catalog")
+    pickler.dispatch_table = dispatch
+    pickler.dump(state)
+    payload = zlib.compress(buffer.getvalue(), SNAPSHOT_COMPRESSION_LEVEL)
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION) + payload
+
+
+def decode_snapshot(blob: bytes) -> dict[str, Any]:
+    if not isinstance(blob, (bytes, bytearray, memoryview)):
+        raise ValueError("Snapshot must be bytes.")
+    blob = bytes(blob)
+    if len(blob) < _HEADER.size:
+        raise ValueError("Snapshot is truncated.")
+    magic, version = _HEADER.unpack_from(blob)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not an engine snapshot.")
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version: {version}")
+    try:
+        raw = zlib.decompress(blob[_HEADER.size :])
+    except zlib.error as error:
+        raise ValueError("Snapshot payload is corrupt.") from error
+    try:
+        state = pickle.loads(raw)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+        raise ValueError("Snapshot payload is corrupt.") from error
+    if not isinstance(state, dict):
+        raise ValueError("Snapshot payload is corrupt.")
+    return state
+
+
+def _reduce_shared(obj: Any, bundle: DataBundle, kind: str) -> Any:
+    shared = bundle if kind == "data_bundle" else bundle.catalog
+    if obj is not shared:
+        if kind == "data_bundle":
+            raise ValueError("Only the engine's own data bundle can be snapshotted.")
+        return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    return (_load_shared, (kind, bundle.content_hash))
+
+
+def _load_shared(kind: str, content_hash: str) -> Any:
+    bundle = get_data_bundle()
+    if content_hash != bundle.content_hash:
+        raise ValueError("Snapshot was taken against different game data.")
+    if kind == "data_bundle":
+        return bundle
+    if kind == "data_catalog":
+        return bundle.catalog
+    raise ValueError(f"Unknown snapshot reference: {kind}")
+
+
+def clone_state(state: dict[str, Any], *, shared: Iterable[Any]) -> dict[str, Any]:
+    """Deep-copy ``state`` while keeping references to every object in ``shared``."""
+    shared_by_id = {id(obj): obj for obj in shared}
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = lambda obj: id(obj) if id(obj) in shared_by_id else None
+    pickler.dump(state)
+    buffer.seek(0)
+    unpickler = pickle.Unpickler(buffer)
+    unpickler.persistent_load = shared_by_id.__getitem__
+    return unpickler.load()
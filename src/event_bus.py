@@ -0,0 +1,214 @@
+"""Typed diagnostic events delivered to subscribed sinks.
+
+Producers guard every publish with ``bus.accepts(level)``, so a level nobody
+subscribed to costs one integer comparison at the call site: no event object is
+built and nothing is formatted. Sinks receive event objects and only the ones
+that need text (stdout, JSONL) render them.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Iterable
+import json
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+
+_LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning"}
+# Above every real level, so accepts() is False while nothing is subscribed.
+_SILENT = 1 << 30
+
+DEFAULT_RING_CAPACITY = 1024
+
+
+def level_name(level: int) -> str:
+    return _LEVEL_NAMES.get(level, str(level))
+
+
+def parse_level(value: int | str) -> int:
+    if isinstance(value, int):
+        return value
+    for level, name in _LEVEL_NAMES.items():
+        if name == str(value).lower():
+            return level
+    raise ValueError(f"Unknown event level: {value}")
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    """Base event. Subclasses set ``kind`` and ``level`` and render their legacy text."""
+
+    kind: ClassVar[str] = "event"
+    # Left unannotated so subclasses may redeclare it as a ClassVar or as a per-instance field.
+    level = INFO
+
+    def render(self) -> str:
+        return self.kind
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"kind": self.kind}
+        for field in fields(self):
+            payload[field.name] = _json_value(getattr(self, field.name))
+        payload["level"] = level_name(self.level)
+        return payload
+
+
+@dataclass(frozen=True)
+class TraceEvent(BusEvent):
+    """A "Topic: key=value ..." line, kept field by field so sinks can filter or serialize it."""
+
+    kind: ClassVar[str] = "trace"
+
+    topic: str
+    values: tuple[tuple[str, Any], ...] = ()
+    level: int = DEBUG
+
+    @classmethod
+    def of(cls, level: int, topic: str, **values: Any) -> "TraceEvent":
+        return cls(topic, tuple(values.items()), level)
+
+    def render(self) -> str:
+        return f"{self.topic}: " + " ".join(f"{key}={value}" for key, value in self.values)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "level": level_name(self.level),
+            "topic": self.topic,
+            "values": {key: _json_value(value) for key, value in self.values},
+        }
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    sink: Callable[[BusEvent], None]
+    level: int
+    kinds: frozenset[type] | None
+
+
+class EventBus:
+    def __init__(self) -> None:
+        self._subscriptions: list[_Subscription] = []
+        self._min_level = _SILENT
+
+    def subscribe(
+        self,
+        sink: Callable[[BusEvent], None],
+        *,
+        level: int | str = DEBUG,
+        kinds: Iterable[type] | None = None,
+    ) -> Callable[[], None]:
+        """Deliver events at ``level`` or above (optionally only of ``kinds``) to ``sink``; returns an unsubscribe."""
+        subscription = _Subscription(sink, parse_level(level), None if kinds is None else frozenset(kinds))
+        self._subscriptions.append(subscription)
+        self._refresh()
+
+        def unsubscribe() -> None:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+                self._refresh()
+
+        return unsubscribe
+
+    def clear(self) -> None:
+        self._subscriptions.clear()
+        self._refresh()
+
+    @property
+    def enabled(self) -> bool:
+        return self._min_level != _SILENT
+
+    def accepts(self, level: int) -> bool:
+        return level >= self._min_level
+
+    def publish(self, event: BusEvent) -> None:
+        level = event.level
+        for subscription in self._subscriptions:
+            if level < subscription.level:
+                continue
+            if subscription.kinds is not None and type(event) not in subscription.kinds:
+                continue
+            subscription.sink(event)
+
+    def _refresh(self) -> None:
+        self._min_level = min((row.level for row in self._subscriptions), default=_SILENT)
+
+
+class NullSink:
+    """Accepts and drops everything; subscribing it still makes producers build events."""
+
+    def __call__(self, event: BusEvent) -> None:
+        return None
+
+
+class StdoutSink:
+    def __call__(self, event: BusEvent) -> None:
+        print(event.render())
+
+
+class RingBufferSink:
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY) -> None:
+        if int(capacity) <= 0:
+            raise ValueError("RingBufferSink capacity must be positive.")
+        self._events: deque[BusEvent] = deque(maxlen=int(capacity))
+
+    def __call__(self, event: BusEvent) -> None:
+        self._events.append(event)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def events(self) -> list[BusEvent]:
+        return list(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+
+class JsonlFileSink:
+    """Appends one JSON object per event. The file opens on the first event and is reopened after pickling."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._handle = None
+
+    def __call__(self, event: BusEvent) -> None:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        self._handle.write(json.dumps(event.to_dict(), sort_keys=True) + "\n")
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path, "_handle": None}
+
+
+def stdout_event_bus() -> EventBus:
+    """A bus that prints every event, matching the print() diagnostics it replaced."""
+    bus = EventBus()
+    bus.subscribe(StdoutSink(), level=DEBUG)
+    return bus
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        rows = [_json_value(item) for item in value]
+        return sorted(rows, key=str) if isinstance(value, (set, frozenset)) else rows
+    return str(value)
@@ -1,10 +1,14 @@
 """Exploration resolution (Phase 7.12). Deterministic, consumes 1 day and 1 fuel."""
 from __future__ import annotations
 
-import hashlib
 from dataclasses import dataclass
 from typing import Any
 
+try:
+    from deterministic_rng import sha256_u01
+except ModuleNotFoundError:
+    from src.deterministic_rng import sha256_u01
+
 
 @dataclass(frozen=True)
 class ExplorationResult:
@@ -15,9 +19,7 @@ class ExplorationResult:
 
 
 def _deterministic_float(seed_string: str) -> float:
-    digest = hashlib.sha256(seed_string.encode("ascii")).digest()
-    value = int.from_bytes(digest[:8], byteorder="big", signed=False)
-    return value / (2**64)
+    return sha256_u01(seed_string)
 
 
 def resolve_exploration(
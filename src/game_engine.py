@@ -2,18 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 import hashlib
 import json
 import math
 import random
 import traceback
-from typing import Any, Literal, Optional, Union
+from typing import Any, Iterable, Literal, Mapping, Optional, Union
 
 from combat_resolver import resolve_combat
-from data_catalog import load_data_catalog
+from data_bundle import get_data_bundle
 from encounter_generator import generate_travel_encounters
 from end_game_evaluator import evaluate_end_game
-from government_law_engine import Commodity, GovernmentLawEngine
+from deterministic_rng import RNG_MODE_COMPAT, polynomial_seed, require_rng_mode, sha256_prefix_int
+from engine_snapshot import clone_state, decode_snapshot, encode_snapshot
+from event_bus import EventBus, stdout_event_bus
+from government_law_engine import Commodity, GovernmentLawEngine, LegalityStatus, RiskTier
 from government_registry import GovernmentRegistry
 from interaction_layer import (
     ACTION_IGNORE,
@@ -45,10 +49,16 @@ from law_enforcement import (
     enforcement_checkpoint,
 )
 from market_pricing import price_transaction
+from market_quote_table import MarketQuoteKey, MarketQuoteTable
 from mission_factory import create_mission, create_delivery_mission, CREATOR_BY_TYPE
 from mission_generator import select_weighted_mission_type
 from mission_registry import mission_type_candidates_for_source
-from mission_manager import MissionManager, evaluate_active_missions
+from mission_manager import (
+    MissionManager,
+    count_down_mission_deadlines,
+    evaluate_active_missions,
+    turn_ticks_until_mission_deadline,
+)
 from mission_service import on_arrival, on_cargo_change, on_combat_resolved
 from reward_service import preview as reward_preview
 from mission_entity import MissionState, MissionOutcome
@@ -68,6 +78,8 @@ from pursuit_resolver import resolve_pursuit
 from reaction_engine import get_npc_outcome
 from reward_applicator import apply_materialized_reward
 from reward_materializer import materialize_reward
+from route_planner import RoutePlanner
+from trade_routes import DEFAULT_MAX_LEGS, DEFAULT_TOP_K, TradeRouteFinder
 try:
     from playtest_telemetry import log_debug_event, log_event, set_telemetry_context
 except Exception:
@@ -81,6 +93,7 @@ try:
     from encounter_generator import deterministic_float
 except ModuleNotFoundError:
     from src.encounter_generator import deterministic_float
+from sector_cache import load_or_generate_sector
 from ship_assembler import (
     assemble_ship,
     compute_hull_max_from_ship_state,
@@ -92,19 +105,40 @@ from ship_assembler import (
 )
 from ship_entity import ShipEntity
 from time_engine import (
+    TimeContext,
     TimeEngine,
-    _reset_time_state_for_test,
     _set_hard_stop_state,
     _set_player_action_context,
     advance_time,
     get_current_turn,
+    skip_time,
 )
-from world_generator import Destination, System, WorldGenerator, normalize_destination_type
+from world_generator import Destination, Location, System, normalize_destination_type
+from world_state_engine import WORLD_STATE_SCOPE_LOCAL, require_world_state_scope
 from logger import Logger
 
 
 ENGINE_STREAM_NAME = "engine_orchestration"
 WAREHOUSE_CAPACITY_COST_PER_TURN = 2
+SKIP_TIME_MAX_DAYS = 100_000
+
+# Step result verbosity. "full" is the historical result with the event list.
+# "standard" drops the event list; "minimal" keeps only status, hard-stop fields and
+# the player block. Below "full", events are recorded unconverted and only turned
+# into JSON-safe dicts when last_events() asks for them (or file logging is on).
+RESULT_LEVEL_MINIMAL = "minimal"
+RESULT_LEVEL_STANDARD = "standard"
+RESULT_LEVEL_FULL = "full"
+RESULT_LEVELS = (RESULT_LEVEL_MINIMAL, RESULT_LEVEL_STANDARD, RESULT_LEVEL_FULL)
+
+# "stdout" prints time and world-state diagnostics as before; "off" leaves the bus without
+# subscribers so those call sites build nothing. Sinks can be added via engine.event_bus.
+WORLD_STATE_EVENTS_STDOUT = "stdout"
+WORLD_STATE_EVENTS_OFF = "off"
+WORLD_STATE_EVENT_MODES = (WORLD_STATE_EVENTS_STDOUT, WORLD_STATE_EVENTS_OFF)
+
+# Derived caches rebuilt on demand; snapshot() leaves them out of the blob.
+_SNAPSHOT_TRANSIENT_ATTRIBUTES = frozenset({"_route_planner"})
 
 
 def _scale_mining_quantity_for_modules(base_quantity: int, mining_module_count: int) -> int:
@@ -164,6 +198,36 @@ class EngineContext:
     game_over_reason: str | None = None
     pending_loot: dict[str, Any] | None = None
     claim_mission_error: str | None = None  # Phase 7.11.1: Store claim error for CLI
+    result_level: str = RESULT_LEVEL_FULL
+
+
+@dataclass(frozen=True)
+class _DeferredEvent:
+    stage: str
+    subsystem: str
+    turn: int
+    command_type: str
+    detail: dict[str, Any]
+
+
+@dataclass
+class _CommandOutcome:
+    context: EngineContext
+    ok: bool
+    error: str | None
+    # Commands that raised are reported via COMMAND_ERROR telemetry instead of COMMAND_END.
+    raised: bool = False
+
+
+@dataclass
+class _BatchLookups:
+    """Read-side lookups reused across one execute_batch call."""
+
+    current_system_key: tuple[Any, ...] | None = None
+    current_system: System | None = None
+    current_destination_key: tuple[Any, ...] | None = None
+    current_destination: Destination | None = None
+    assembled_ships: dict[tuple[Any, ...], Mapping[str, Any]] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -182,17 +246,20 @@ class GameEngine:
         self.world_seed = int(world_seed)
         self.config = dict(config or {})
         self._version = self.config.get("version", _read_version())
+        self.result_level = _require_result_level(self.config.get("result_level", RESULT_LEVEL_FULL))
         self._silent_logger = _SilentLogger()
         self._logger = Logger(version=self._version)
         self._logging_enabled = False
         self._log_path: str | None = None
 
-        _reset_time_state_for_test()
-
-        self.catalog = load_data_catalog()
-        self.government_registry = GovernmentRegistry.from_file(
-            Path(__file__).resolve().parents[1] / "data" / "governments.json"
+        # Each engine owns its clock so multiple sessions can share one process.
+        self.time_context = TimeContext(
+            event_bus=_world_state_event_bus(self.config.get("world_state_events", WORLD_STATE_EVENTS_STDOUT))
         )
+
+        self.data_bundle = get_data_bundle()
+        self.catalog = self.data_bundle.catalog
+        self.government_registry = GovernmentRegistry.from_payload(self.data_bundle.document("governments.json"))
         self._law_engine = GovernmentLawEngine(
             registry=self.government_registry,
             logger=self._silent_logger,
@@ -200,13 +267,17 @@ class GameEngine:
         )
 
         system_count = int(self.config.get("system_count", 5))
-        self.sector = WorldGenerator(
+        # Generation is deterministic, so the sector is reloaded from disk when one was already built.
+        self.sector = load_or_generate_sector(
             seed=self.world_seed,
             system_count=system_count,
             government_ids=self.government_registry.government_ids(),
-            catalog=self.catalog,
-            logger=None,
-        ).generate()
+            bundle=self.data_bundle,
+            use_cache=bool(self.config.get("sector_cache", True)),
+            # Large galaxies: generate each system's destinations and markets on first use.
+            lazy=bool(self.config.get("lazy_sector", False)),
+            workers=int(self.config.get("generation_workers", 1)),
+        )
         if not self.sector.systems:
             raise ValueError("Generated sector has no systems.")
 
@@ -251,6 +322,13 @@ class GameEngine:
             sector=self.sector,
             player_state=self.player_state,
             event_frequency_percent=int(self.config.get("event_frequency_percent", 8)),
+            context=self.time_context,
+            # "fast" trades the historical world-state roll streams for counter-based rolls.
+            rng_mode=require_rng_mode(self.config.get("rng_mode", RNG_MODE_COMPAT)),
+            # "galaxy" rolls spawn gates for every system each day instead of only the player's.
+            world_state_scope=require_world_state_scope(
+                self.config.get("world_state_scope", WORLD_STATE_SCOPE_LOCAL)
+            ),
         )
         self._active_encounters: list[Any] = []
         self._mission_manager = MissionManager()
@@ -267,9 +345,69 @@ class GameEngine:
         self._pending_travel: dict[str, Any] | None = None
         self._pending_combat: dict[str, Any] | None = None
         self._pending_loot: dict[str, Any] | None = None
+        self._batch_lookups: _BatchLookups | None = None
+        self._last_events: list[Any] = []
+        # (sector, planner) built on first use; see route_planner().
+        self._route_planner: tuple[Any, RoutePlanner] | None = None
+        # (destination_id, action) -> quotes for the current pricing context; see _market_quote_table().
+        self._market_quote_tables: dict[tuple[str, str], MarketQuoteTable] = {}
 
     def execute(self, command: dict) -> dict:
-        turn_before = int(get_current_turn())
+        outcome = self._run_command(command, default_result_level=self.result_level)
+        self._last_events = outcome.context.events
+        result = self._build_step_result(context=outcome.context, ok=outcome.ok, error=outcome.error)
+        if not outcome.raised:
+            log_event("COMMAND_END", {"command_type": outcome.context.command_type, "response": result}, "engine")
+        return result
+
+    def execute_batch(self, commands: Iterable[dict], stop_on_hard_stop: bool = True) -> list[dict[str, Any]]:
+        """
+        Execute a command sequence and return one compact result per executed command.
+        Events are deferred as under result_level "minimal".
+
+        Current system/destination and active ship assembly are resolved once and
+        reused until the state they depend on changes. Compact results omit events
+        and the player block; use execute() when those are needed.
+        With stop_on_hard_stop, the batch ends after the first command that hard-stops
+        (pending encounter/combat/loot, death, game over).
+        """
+        results: list[dict[str, Any]] = []
+        self._batch_lookups = _BatchLookups()
+        try:
+            for command in commands:
+                outcome = self._run_command(command, default_result_level=RESULT_LEVEL_MINIMAL)
+                self._last_events = outcome.context.events
+                result = self._build_compact_step_result(outcome)
+                if not outcome.raised:
+                    log_event("COMMAND_END", {"command_type": outcome.context.command_type, "response": result}, "engine")
+                results.append(result)
+                if stop_on_hard_stop and (result["hard_stop"] or result["error"] == "game_over"):
+                    break
+        finally:
+            self._batch_lookups = None
+        return results
+
+    def last_events(self) -> list[dict[str, Any]]:
+        """Events of the most recent command, materialized on demand below result_level "full"."""
+        return [self._materialize_event(event) for event in self._last_events]
+
+    def _run_command(self, command: dict, *, default_result_level: str) -> _CommandOutcome:
+        turn_before = int(get_current_turn(self.time_context))
+        result_level = default_result_level
+        if isinstance(command, dict) and "result_level" in command:
+            result_level = command.get("result_level")
+            if result_level not in RESULT_LEVELS:
+                command_type, _, _ = self._parse_command(command)
+                return _CommandOutcome(
+                    context=EngineContext(
+                        command=command,
+                        command_type=command_type or "unknown",
+                        turn_before=turn_before,
+                        turn_after=turn_before,
+                    ),
+                    ok=False,
+                    error=f"invalid_result_level:{result_level}",
+                )
         
         # Enforce run-end gating (Option 3 model)
         # Check if run has ended before processing any command
@@ -279,36 +417,34 @@ class GameEngine:
             if command_type != "quit":
                 set_telemetry_context(turn=turn_before, system_id=self.player_state.current_system_id)
                 log_event("COMMAND_START", {"command_type": command_type or "unknown", "request": command if isinstance(command, dict) else {}}, "engine")
-                result = self._build_step_result(
+                return _CommandOutcome(
                     context=EngineContext(
                         command=command if isinstance(command, dict) else {},
                         command_type=command_type or "unknown",
                         turn_before=turn_before,
-                        turn_after=int(get_current_turn()),
+                        turn_after=int(get_current_turn(self.time_context)),
                         game_over_reason=self.player_state.run_end_reason,
+                        result_level=result_level,
                     ),
                     ok=False,
                     error="game_over",
                 )
-                log_event("COMMAND_END", {"command_type": command_type or "unknown", "response": result}, "engine")
-                return result
 
         command_type, payload, error = self._parse_command(command)
         set_telemetry_context(turn=turn_before, system_id=self.player_state.current_system_id)
         log_event("COMMAND_START", {"command_type": command_type, "request": command if isinstance(command, dict) else {}}, "engine")
         if error is not None:
-            result = self._build_step_result(
+            return _CommandOutcome(
                 context=EngineContext(
                     command=command if isinstance(command, dict) else {},
                     command_type=command_type,
                     turn_before=turn_before,
-                    turn_after=int(get_current_turn()),
+                    turn_after=int(get_current_turn(self.time_context)),
+                    result_level=result_level,
                 ),
                 ok=False,
                 error=error,
             )
-            log_event("COMMAND_END", {"command_type": command_type, "response": result}, "engine")
-            return result
 
         context = EngineContext(
             command=payload,
@@ -316,6 +452,7 @@ class GameEngine:
             turn_before=turn_before,
             turn_after=turn_before,
             active_encounters=list(self._active_encounters),
+            result_level=result_level,
         )
         set_telemetry_context(turn=context.turn_before, system_id=self.player_state.current_system_id)
         self._event(context, stage="start", subsystem="engine", detail={"command_type": command_type})
@@ -325,6 +462,8 @@ class GameEngine:
                 self._execute_travel_to_destination(context, payload)
             elif command_type == "wait":
                 self._execute_wait(context, payload)
+            elif command_type == "skip_time":
+                self._execute_skip_time(context, payload)
             elif command_type == "location_action":
                 self._execute_location_action(context, payload)
             elif command_type == "list_location_actions":
@@ -349,7 +488,7 @@ class GameEngine:
                 # DIAGNOSTIC: Log mission_manager instance ID during mission_discuss
                 if self._logging_enabled and self._logger is not None:
                     self._logger.log(
-                        turn=int(get_current_turn()),
+                        turn=int(get_current_turn(self.time_context)),
                         action="mission_discuss_instance_check",
                         state_change=f"mission_manager_id={id(self._mission_manager)} mission_id={mission_id}"
                     )
@@ -373,7 +512,7 @@ class GameEngine:
                 # DIAGNOSTIC: Log mission_manager instance ID during mission_accept
                 if self._logging_enabled and self._logger is not None:
                     self._logger.log(
-                        turn=int(get_current_turn()),
+                        turn=int(get_current_turn(self.time_context)),
                         action="mission_accept_instance_check",
                         state_change=f"mission_manager_id={id(self._mission_manager)} mission_id={mission_id} location_id={location_id}"
                     )
@@ -389,7 +528,7 @@ class GameEngine:
                     location_type=location_type,
                     ship=self._active_ship(),
                     logger=self._logger if self._logging_enabled else None,
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                     create_contact_npc_callback=self._create_mission_contact_npc,
                 )
                 if not accepted:
@@ -435,6 +574,10 @@ class GameEngine:
                 self._execute_get_player_profile(context)
             elif command_type == "get_system_profile":
                 self._execute_get_system_profile(context)
+            elif command_type == "plan_route":
+                self._execute_plan_route(context, payload)
+            elif command_type == "find_trade_routes":
+                self._execute_find_trade_routes(context, payload)
             elif command_type == "get_destination_profile":
                 self._execute_get_destination_profile(context)
             elif command_type == "encounter_action":
@@ -458,37 +601,86 @@ class GameEngine:
             elif command_type == "quit":
                 self._event(context, stage="command", subsystem="engine", detail={"quit": True})
             else:
-                result = self._build_step_result(
-                    context=context,
-                    ok=False,
-                    error=f"unsupported_command_type:{command_type}",
-                )
-                log_event("COMMAND_END", {"command_type": command_type, "response": result}, "engine")
-                return result
+                return _CommandOutcome(context=context, ok=False, error=f"unsupported_command_type:{command_type}")
         except Exception as exc:  # noqa: BLE001
-            context.turn_after = int(get_current_turn())
+            context.turn_after = int(get_current_turn(self.time_context))
             self._active_encounters = list(context.active_encounters)
             log_event("COMMAND_ERROR", {
                 "command_type": context.command_type,
                 "error": str(exc),
                 "traceback": traceback.format_exc(),
             }, "engine")
-            return self._build_step_result(context=context, ok=False, error=str(exc))
+            return _CommandOutcome(context=context, ok=False, error=str(exc), raised=True)
 
         self._evaluate_hard_stop(context)
-        context.turn_after = int(get_current_turn())
+        context.turn_after = int(get_current_turn(self.time_context))
         self._active_encounters = list(context.active_encounters)
 
         # Check for claim_mission error (Phase 7.11.1)
         claim_error = context.claim_mission_error
         if claim_error:
-            result = self._build_step_result(context=context, ok=False, error=claim_error)
-            log_event("COMMAND_END", {"command_type": command_type, "response": result}, "engine")
-            return result
+            return _CommandOutcome(context=context, ok=False, error=claim_error)
+        return _CommandOutcome(context=context, ok=True, error=None)
+
+    def snapshot(self) -> bytes:
+        """Serialize the full engine state (sector, world state, fleet, encounters, clock) to bytes."""
+        state = {key: value for key, value in self.__dict__.items() if key not in _SNAPSHOT_TRANSIENT_ATTRIBUTES}
+        return encode_snapshot(state, bundle=self.data_bundle)
+
+    def restore(self, blob: bytes) -> None:
+        """Replace this engine's state with a blob produced by snapshot()."""
+        state = decode_snapshot(blob)
+        self.__dict__.clear()
+        self.__dict__.update(state)
+
+    @classmethod
+    def from_snapshot(cls, blob: bytes) -> GameEngine:
+        """Build an engine directly from a snapshot without generating a new sector first."""
+        engine = cls.__new__(cls)
+        engine.restore(blob)
+        return engine
+
+    def fork(self) -> GameEngine:
+        """
+        Return an independent in-process copy for lookahead and what-if planning.
 
-        result = self._build_step_result(context=context, ok=True, error=None)
-        log_event("COMMAND_END", {"command_type": command_type, "response": result}, "engine")
-        return result
+        Immutable data is shared with this engine; file logging is disabled on the copy
+        so exploratory commands never write to the player's log.
+        """
+        world_state_engine = self.time_context.world_state_engine
+        shared: list[Any] = [self.data_bundle, self.catalog, self.government_registry, *self.sector.systems]
+        if world_state_engine is not None:
+            shared.extend(world_state_engine.shared_catalog_objects())
+        cached_planner = self.__dict__.get("_route_planner")
+        if cached_planner is not None:
+            # Starlanes and datanet services never change, so the copy can keep the warm tables.
+            shared.append(cached_planner[1])
+        clone = GameEngine.__new__(GameEngine)
+        clone.__dict__.update(clone_state(self.__dict__, shared=shared))
+        clone._logging_enabled = False
+        clone._log_path = None
+        # Diagnostics from a lookahead copy would interleave with the player's own.
+        clone.time_engine.set_event_bus(EventBus())
+        clone._batch_lookups = None
+        clone._last_events = []
+        return clone
+
+    @property
+    def event_bus(self) -> EventBus:
+        """Bus carrying time and world-state diagnostics; subscribe sinks here."""
+        return self.time_context.event_bus
+
+    def route_planner(self) -> RoutePlanner:
+        """Route planner for the current sector, built on first use and reused until the sector is replaced."""
+        cached = self.__dict__.get("_route_planner")
+        if cached is None or cached[0] is not self.sector:
+            ship = self.fleet_by_id.get(self.player_state.active_ship_id)
+            # Landmark tables for the active ship's tank are built with the planner; other
+            # capacities get theirs on first query.
+            capacities = () if ship is None else (int(ship.fuel_capacity),)
+            cached = (self.sector, RoutePlanner(self.sector.systems, fuel_capacities=capacities))
+            self._route_planner = cached
+        return cached[1]
 
     def has_pending_encounter(self) -> bool:
         """Check if there is a pending encounter requiring player input."""
@@ -523,8 +715,8 @@ class GameEngine:
         _ctx = EngineContext(
             command={"type": "resolve_pending_loot"},
             command_type="resolve_pending_loot",
-            turn_before=int(get_current_turn()),
-            turn_after=int(get_current_turn()),
+            turn_before=int(get_current_turn(self.time_context)),
+            turn_after=int(get_current_turn(self.time_context)),
         )
         
         if take_all:
@@ -671,8 +863,8 @@ class GameEngine:
                 temp_context = EngineContext(
                     command={"type": "resolve_pending_loot"},
                     command_type="resolve_pending_loot",
-                    turn_before=int(get_current_turn()),
-                    turn_after=int(get_current_turn()),
+                    turn_before=int(get_current_turn(self.time_context)),
+                    turn_after=int(get_current_turn(self.time_context)),
                 )
                 
                 has_more = self._resume_travel_encounters_if_any(temp_context)
@@ -707,7 +899,7 @@ class GameEngine:
                 # Generate NPC ship info for display (deterministic, same as combat will use)
                 try:
                     from npc_ship_generator import generate_npc_ship
-                    system = self.sector.get_system(self.player_state.current_system_id)
+                    system = self._current_system()
                     if system is not None:
                         encounter_id = str(getattr(current_encounter, "encounter_id", ""))
                         enemy_ship_dict = generate_npc_ship(
@@ -809,7 +1001,7 @@ class GameEngine:
             context.hard_stop_reason = "pending_combat_action"
             return
         
-        current_system = self.sector.get_system(self.player_state.current_system_id)
+        current_system = self._current_system()
         if current_system is None:
             raise ValueError("Current system not found.")
         target_system_id = payload.get("target_system_id")
@@ -1083,7 +1275,7 @@ class GameEngine:
 
         # Travel safety: Set bankruptcy warning only after arrival if credits reached 0 during travel
         if self.player_state.credits == 0 and self.player_state.bankruptcy_warning_turn is None:
-            current_turn = int(get_current_turn())
+            current_turn = int(get_current_turn(self.time_context))
             self.player_state.bankruptcy_warning_turn = current_turn
 
     def _execute_wait(self, context: EngineContext, payload: dict[str, Any]) -> None:
@@ -1104,6 +1296,20 @@ class GameEngine:
             },
         )
 
+    def _execute_skip_time(self, context: EngineContext, payload: dict[str, Any]) -> None:
+        days_raw = payload.get("days")
+        if not isinstance(days_raw, int):
+            raise ValueError("skip_time requires integer days.")
+        if days_raw < 1 or days_raw > SKIP_TIME_MAX_DAYS:
+            raise ValueError(f"skip_time.days must be in range 1..{SKIP_TIME_MAX_DAYS}.")
+        result = self._skip_time(days=days_raw, reason="skip_time")
+        self._event(
+            context,
+            stage="time_advance",
+            subsystem="time_engine",
+            detail=result,
+        )
+
     def _execute_warehouse_cancel(self, context: EngineContext, payload: dict[str, Any]) -> None:
         destination_id = payload.get("destination_id")
         if not isinstance(destination_id, str) or not destination_id:
@@ -1292,7 +1498,7 @@ class GameEngine:
             player=self.player_state,
             reason="player_abandoned",
             logger=self._logger if self._logging_enabled else None,
-            turn=int(get_current_turn()),
+            turn=int(get_current_turn(self.time_context)),
         )
         
         self._event(
@@ -1705,14 +1911,14 @@ class GameEngine:
         # DIAGNOSTIC: Log mission_manager instance ID when logging is enabled
         if enabled and self._logger is not None:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="engine_init",
                 state_change=f"mission_manager_id={id(self._mission_manager)}"
             )
         if self._logging_enabled and isinstance(getattr(self, "_pending_initialization_event", None), dict):
             try:
                 self._logger.log(
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                     action="engine:initialization",
                     state_change=json.dumps(
                         {
@@ -1836,13 +2042,9 @@ class GameEngine:
 
     def _mission_rng_for_location(self, *, location_id: str, turn: int | None = None) -> random.Random:
         # Deterministic RNG for mission generation (turn parameter kept for backward compatibility but not used)
-        seed_value = self.world_seed
         parts = [self.player_state.current_system_id, self.player_state.current_destination_id or "", location_id]
         # Note: turn is no longer used for mission generation to ensure persistence
-        for part in parts:
-            for char in str(part):
-                seed_value = (seed_value * 31 + ord(char)) % (2**32)
-        return random.Random(seed_value)
+        return random.Random(polynomial_seed(self.world_seed, *parts))
 
     def _select_mission_tier(self, source_type: str, rng: random.Random) -> int:
         """Select mission tier deterministically using weighted selection per source_type.
@@ -1880,7 +2082,7 @@ class GameEngine:
         # Structured logging for tier selection
         if self._logging_enabled and self._logger:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="mission_generation:tier",
                 state_change=(
                     f"source_type={source_type} selected_tier={selected_tier}"
@@ -1962,7 +2164,7 @@ class GameEngine:
                 # Log datanet gate decision
                 # final_count will be logged below once determined
                 self._logger.log(
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                     action="mission_generation:datanet_gate",
                     state_change=(
                         f"source_type={source_type} population={population} "
@@ -1977,7 +2179,7 @@ class GameEngine:
         # Structured logging for mission counts
         if self._logging_enabled and self._logger:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="mission_generation:count",
                 state_change=(
                     f"source_type={source_type} population={population} "
@@ -2012,7 +2214,7 @@ class GameEngine:
                         # Deterministic log for registry entries without creators
                         if self._logging_enabled and self._logger:
                             self._logger.log(
-                                turn=int(get_current_turn()),
+                                turn=int(get_current_turn(self.time_context)),
                                 action="mission_generation:skipped_unimplemented_type",
                                 state_change=(
                                     f"location_id={location_id} source_type={source_type} "
@@ -2072,7 +2274,7 @@ class GameEngine:
                     catalog=self.catalog,
                     rng=rng,
                     logger=self._logger if self._logging_enabled else None,
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                 )
             else:
                 raise ValueError(
@@ -2154,7 +2356,7 @@ class GameEngine:
                 catalog=self.catalog,
                 rng=rng,
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
         elif mission_type == "retrieval":
             mission = create_retrieval_mission(
@@ -2168,7 +2370,7 @@ class GameEngine:
                 catalog=self.catalog,
                 rng=rng,
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
         else:
             # Fallback to delivery
@@ -2183,7 +2385,7 @@ class GameEngine:
                 catalog=self.catalog,
                 rng=rng,
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
         
         # Override mission_id and add alien-specific fields
@@ -2226,7 +2428,7 @@ class GameEngine:
         # DIAGNOSTIC: Log mission_manager instance ID during mission_list
         if self._logging_enabled and self._logger is not None:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="mission_list_instance_check",
                 state_change=f"mission_manager_id={id(self._mission_manager)} location_id={location_id}"
             )
@@ -2242,7 +2444,7 @@ class GameEngine:
             row_ids = [row.get("mission_id") for row in rows if row.get("mission_id")]
             if set(row_ids) != set(persisted_ids):
                 self._logger.log(
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                     action="mission_list_consistency_check",
                     state_change=f"location_id={location_id} persisted_count={len(persisted_ids)} row_count={len(row_ids)}"
                 )
@@ -2272,7 +2474,7 @@ class GameEngine:
             role_tags=["mission_giver"],
         )
         logger = self._logger if self._logging_enabled else None
-        turn = int(get_current_turn())
+        turn = int(get_current_turn(self.time_context))
         self._npc_registry.add(npc, logger=logger, turn=turn)
         mission.mission_giver_npc_id = npc_id
         if logger is not None:
@@ -2301,7 +2503,7 @@ class GameEngine:
             location_type=location_type,
             ship=self._active_ship(),
             logger=self._logger if self._logging_enabled else None,
-            turn=int(get_current_turn()),
+            turn=int(get_current_turn(self.time_context)),
             create_contact_npc_callback=self._create_mission_contact_npc,
         )
         if not accepted:
@@ -2419,7 +2621,7 @@ class GameEngine:
         crew_npc.current_ship_id = active_ship.ship_id
         
         # Update registry
-        self._npc_registry.update(crew_npc, logger=self._logger if self._logging_enabled else None, turn=int(get_current_turn()))
+        self._npc_registry.update(crew_npc, logger=self._logger if self._logging_enabled else None, turn=int(get_current_turn(self.time_context)))
         
         # Add to ship
         active_ship.add_crew(crew_npc)
@@ -2775,7 +2977,7 @@ class GameEngine:
         self._npc_registry.update(
             crew_npc,
             logger=self._logger if self._logging_enabled else None,
-            turn=int(get_current_turn()),
+            turn=int(get_current_turn(self.time_context)),
         )
         
         self._event(
@@ -2903,7 +3105,7 @@ class GameEngine:
                 attempt_after = int(getattr(self.player_state, "mining_attempts", {}).get(destination_id, 0))
                 attempt_before = attempt_after - (1 if mining_attempts_increment_on_failure else 0)
                 self._logger.log(
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                     action="mining_attempt",
                     state_change=f"destination_id={destination_id} attempt_index_before={attempt_before} attempt_index_after={attempt_after} failure_reason={reason} setting={mining_attempts_increment_on_failure}",
                 )
@@ -2928,7 +3130,7 @@ class GameEngine:
         from combat_resolver import map_rcp_to_tr
         hull_id = active_ship.model_id
         module_instances = list(active_ship.persistent_state.get("module_instances", []))
-        assembled = assemble_ship(hull_id, module_instances, {"weapon": 0, "defense": 0, "engine": 0})
+        assembled = self._assemble_ship(hull_id, module_instances, {"weapon": 0, "defense": 0, "engine": 0})
         bands = assembled.get("bands", {}).get("pre_degradation", {})
         rcp = (
             int(bands.get("weapon", 0)) + int(bands.get("defense", 0))
@@ -2968,7 +3170,7 @@ class GameEngine:
         final_quantity = scaled_quantity
         if self._logging_enabled and self._logger is not None:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="mining_attempt",
                 state_change=(
                     f"destination_id={destination_id} "
@@ -3008,10 +3210,10 @@ class GameEngine:
 
     def _trigger_local_activity_encounter(self, context: EngineContext, *, destination_id: str) -> None:
         """Phase 7.12: One encounter roll with mode=local_activity; no chaining."""
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             return
-        turn = get_current_turn()
+        turn = get_current_turn(self.time_context)
         travel_id = f"local_activity_{destination_id}_{turn}"
         active_situation_ids = self._active_situation_ids_for_current_system()
         encounters = generate_travel_encounters(
@@ -3108,10 +3310,7 @@ class GameEngine:
         location_index = payload.get("location_index")
         selected_location = None
         if isinstance(location_id, str) and location_id:
-            for location in locations:
-                if getattr(location, "location_id", None) == location_id:
-                    selected_location = location
-                    break
+            selected_location = self._location_in_destination(destination, location_id)
             if selected_location is None:
                 raise ValueError("location_not_found")
         elif isinstance(location_index, int):
@@ -3148,7 +3347,7 @@ class GameEngine:
             system_id=self.player_state.current_system_id,
             registry=self._npc_registry,
             logger=self._logger if self._logging_enabled else None,
-            turn=int(get_current_turn()),
+            turn=int(get_current_turn(self.time_context)),
         )
         self._location_npc_ids[selected_location_id] = sorted(
             {
@@ -3217,6 +3416,12 @@ class GameEngine:
     def _execute_market_buy_list(self, context: EngineContext) -> None:
         self._require_market_location()
         rows = self._market_price_rows(action="buy")
+        self.player_state.market_observations.record(
+            self.player_state.current_destination_id,
+            "buy",
+            rows,
+            turn=int(get_current_turn(self.time_context)),
+        )
         self._event(
             context,
             stage="market_buy_list",
@@ -3227,6 +3432,12 @@ class GameEngine:
     def _execute_market_sell_list(self, context: EngineContext) -> None:
         self._require_market_location()
         rows = self._market_price_rows(action="sell")
+        self.player_state.market_observations.record(
+            self.player_state.current_destination_id,
+            "sell",
+            rows,
+            turn=int(get_current_turn(self.time_context)),
+        )
         self._event(
             context,
             stage="market_sell_list",
@@ -3243,7 +3454,7 @@ class GameEngine:
         if not destination_has_shipdock_service(destination):
             raise ValueError("Current location does not have shipdock service.")
         
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("No current system for shipdock_hull_list.")
         
@@ -3255,10 +3466,8 @@ class GameEngine:
             world_state_engine=self._world_state_engine(),
         )
         
-        from data_loader import load_hulls
         from hull_utils import is_shipdock_sellable_hull
-        hulls_data = load_hulls()
-        hulls_by_id = {hull["hull_id"]: hull for hull in hulls_data.get("hulls", [])}
+        hulls_by_id = get_data_bundle().hulls_by_id
         
         rows = []
         for hull_entry in inventory.get("hulls", []):
@@ -3282,7 +3491,7 @@ class GameEngine:
                 transaction_type="buy",
                 world_state_engine=self._world_state_engine(),
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             
             # C) Apply shipdock price variance multiplier (locked per market)
@@ -3314,7 +3523,7 @@ class GameEngine:
         if not destination_has_shipdock_service(destination):
             raise ValueError("Current location does not have shipdock service.")
         
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("No current system for shipdock_module_list.")
         
@@ -3326,9 +3535,7 @@ class GameEngine:
             world_state_engine=self._world_state_engine(),
         )
         
-        from data_loader import load_modules
-        modules_data = load_modules()
-        modules_by_id = {module["module_id"]: module for module in modules_data.get("modules", [])}
+        modules_by_id = get_data_bundle().modules_by_id
         
         rows = []
         for module_entry in inventory.get("modules", []):
@@ -3349,7 +3556,7 @@ class GameEngine:
                 secondary_tags=[],
                 world_state_engine=self._world_state_engine(),
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             
             # C) Apply shipdock price variance multiplier (locked per market)
@@ -3390,19 +3597,13 @@ class GameEngine:
             if not _ship_present_at_destination(ship, self.player_state):
                 continue
             
-            from data_loader import load_hulls
-            hulls_data = load_hulls()
-            hull_data = None
-            for hull in hulls_data.get("hulls", []):
-                if hull.get("hull_id") == ship.model_id:
-                    hull_data = hull
-                    break
+            hull_data = get_data_bundle().hulls_by_id.get(ship.model_id)
             
             if hull_data is None:
                 continue
             
             # Calculate sell price
-            system = self.sector.get_system(self.player_state.current_system_id)
+            system = self._current_system()
             if system is None:
                 continue
             
@@ -3414,7 +3615,7 @@ class GameEngine:
                 transaction_type="sell",
                 world_state_engine=self._world_state_engine(),
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             
             rows.append({
@@ -3450,9 +3651,7 @@ class GameEngine:
         if not isinstance(module_instances, list):
             module_instances = []
         
-        from data_loader import load_modules
-        modules_data = load_modules()
-        modules_by_id = {module["module_id"]: module for module in modules_data.get("modules", [])}
+        modules_by_id = get_data_bundle().modules_by_id
         
         rows = []
         for instance in module_instances:
@@ -3469,7 +3668,7 @@ class GameEngine:
             destination = self._current_destination()
             if destination is None:
                 continue
-            system = self.sector.get_system(self.player_state.current_system_id)
+            system = self._current_system()
             if system is None:
                 continue
             
@@ -3483,7 +3682,7 @@ class GameEngine:
                 secondary_tags=secondary_tags,
                 world_state_engine=self._world_state_engine(),
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             
             rows.append({
@@ -3517,31 +3716,11 @@ class GameEngine:
             if bool(outcome.get("arrested")) or bool(outcome.get("dead")):
                 raise ValueError("market_trade_blocked_by_enforcement")
 
-        row = self._market_row_by_sku(action="buy", sku_id=sku_id)
+        # Listed goods and unlisted variants resolve through the same quote, so one lookup covers both.
+        table, destination, government = self._market_quote_table(action="buy")
+        row = self._market_quote_row(table, destination=destination, government=government, sku=sku_id)
         if row is None:
-            destination = self._current_destination()
-            if destination is None:
-                raise ValueError("no_current_destination")
-            system = self.sector.get_system(self.player_state.current_system_id)
-            if system is None:
-                raise ValueError("current_system_not_found")
-            government = self.government_registry.get_government(system.government_id)
-            quote = self._market_price_quote(
-                destination=destination,
-                government=government,
-                sku=str(sku_id),
-                action="buy",
-            )
-            if quote is None:
-                raise ValueError("sku_not_available_for_buy")
-            row = {
-                "sku_id": sku_id,
-                "display_name": self._display_name_for_sku(destination=destination, sku=sku_id),
-                "legality": quote["legality"],
-                "risk_tier": quote["risk_tier"],
-                "unit_price": int(quote["unit_price"]),
-                "available_units": None,
-            }
+            raise ValueError("sku_not_available_for_buy")
         unit_price = int(row["unit_price"])
         total_cost = int(unit_price * quantity)
         credits_before = int(self.player_state.credits)
@@ -3649,16 +3828,10 @@ class GameEngine:
         hull_id = ship.model_id
         module_instances = list(ship.persistent_state.get("module_instances", []))
         degradation_state = ship.persistent_state.get("degradation_state", {"weapon": 0, "defense": 0, "engine": 0})
-        assembled = assemble_ship(hull_id, module_instances, degradation_state)
+        assembled = self._assemble_ship(hull_id, module_instances, degradation_state)
         
         # Load hull data for tier, crew_capacity, and cargo base
-        from data_loader import load_hulls
-        hulls_data = load_hulls()
-        hull_data = None
-        for hull in hulls_data.get("hulls", []):
-            if hull.get("hull_id") == hull_id:
-                hull_data = hull
-                break
+        hull_data = get_data_bundle().hulls_by_id.get(hull_id)
         
         # Compute cargo capacities: base from hull + module bonuses from assembler
         cargo_base = hull_data.get("cargo", {}) if hull_data else {}
@@ -3729,7 +3902,7 @@ class GameEngine:
                 "system_id": system_id,
                 "destination_id": self.player_state.current_destination_id,
                 "location_id": self.player_state.current_location_id,
-                "turn": int(get_current_turn()),
+                "turn": int(get_current_turn(self.time_context)),
                 "insurance_cost_per_turn": insurance_cost,
                 "crew_wages_per_turn": crew_wages,
                 "warehouse_cost_per_turn": warehouse_cost,
@@ -3740,19 +3913,19 @@ class GameEngine:
         )
 
     def _execute_get_system_profile(self, context: EngineContext) -> None:
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("current_system_not_found")
         ship = self._active_ship()
         fuel_limit = int(ship.current_fuel)
         reachable: list[dict[str, Any]] = []
-        for target in sorted(self.sector.systems, key=lambda entry: entry.system_id):
-            if target.system_id == system.system_id:
+        for target_id, distance_ly in self.route_planner().distances_from(system.system_id).items():
+            if target_id == system.system_id:
                 continue
-            distance_ly = float(self._warp_distance_ly(origin=system, target=target))
+            target = self.sector.get_system(target_id)
             reachable.append(
                 {
-                    "system_id": target.system_id,
+                    "system_id": target_id,
                     "name": target.name,
                     "distance_ly": distance_ly,
                     "in_range": bool(distance_ly <= float(fuel_limit)),
@@ -3777,6 +3950,228 @@ class GameEngine:
             },
         )
 
+    def _execute_plan_route(self, context: EngineContext, payload: dict[str, Any]) -> None:
+        system = self._current_system()
+        if system is None:
+            raise ValueError("current_system_not_found")
+        target_system_id = payload.get("target_system_id")
+        if not isinstance(target_system_id, str) or not target_system_id:
+            raise ValueError("plan_route requires target_system_id.")
+        if self.sector.get_system(target_system_id) is None:
+            raise ValueError(f"Unknown target_system_id: {target_system_id}")
+        allow_refuel = payload.get("allow_refuel", True)
+        if not isinstance(allow_refuel, bool):
+            raise ValueError("plan_route allow_refuel must be a boolean.")
+        ship = self._active_ship()
+        # Same fuel reading as travel_to_destination, so planned legs are flyable as-is.
+        fuel_capacity = int(getattr(ship, "fuel_capacity", 0) or 5)
+        current_fuel = int(getattr(ship, "current_fuel", 0) or 0)
+        plan = self.route_planner().plan(
+            system.system_id,
+            target_system_id,
+            fuel=current_fuel,
+            fuel_capacity=fuel_capacity,
+            allow_refuel=allow_refuel,
+        )
+        detail: dict[str, Any] = {
+            "origin_system_id": system.system_id,
+            "target_system_id": target_system_id,
+            "allow_refuel": allow_refuel,
+            "fuel_current": current_fuel,
+            "fuel_capacity": fuel_capacity,
+            "reachable": plan is not None,
+        }
+        if plan is not None:
+            detail.update(
+                {
+                    "total_days": plan.total_days,
+                    "total_fuel": plan.total_fuel,
+                    "refuel_stops": plan.refuel_stops,
+                    "fuel_remaining": plan.fuel_remaining,
+                    "legs": [
+                        {
+                            "from_system_id": leg.from_system_id,
+                            "to_system_id": leg.to_system_id,
+                            "distance_ly": leg.distance_ly,
+                            "days": leg.days,
+                            "fuel_cost": leg.fuel_cost,
+                            "refuel_destination_id": leg.refuel_destination_id,
+                        }
+                        for leg in plan.legs
+                    ],
+                }
+            )
+        self._event(context, stage="route_plan", subsystem="route_planner", detail=detail)
+
+    def _execute_find_trade_routes(self, context: EngineContext, payload: dict[str, Any]) -> None:
+        destination = self._current_destination()
+        if destination is None:
+            raise ValueError("no_current_destination")
+        turn = int(get_current_turn(self.time_context))
+        # Without explicit observations, plan over the fresh prices the player has seen in market lists.
+        observation_source = "payload" if "observations" in payload else "player"
+        if observation_source == "player":
+            observations = self.player_state.market_observations.observations(current_turn=turn)
+        else:
+            observations = payload["observations"]
+        if not isinstance(observations, dict) or not all(
+            isinstance(destination_id, str) and isinstance(rows, dict) and all(isinstance(row, dict) for row in rows.values())
+            for destination_id, rows in observations.items()
+        ):
+            raise ValueError("find_trade_routes observations must map destination_id -> sku -> {buy, sell}.")
+        top_k = payload.get("top_k", DEFAULT_TOP_K)
+        if not isinstance(top_k, int) or isinstance(top_k, bool) or not 1 <= top_k <= 50:
+            raise ValueError("find_trade_routes top_k must be an integer in range 1..50.")
+        max_legs = payload.get("max_legs", DEFAULT_MAX_LEGS)
+        if not isinstance(max_legs, int) or isinstance(max_legs, bool) or not 1 <= max_legs <= 6:
+            raise ValueError("find_trade_routes max_legs must be an integer in range 1..6.")
+        allow_refuel = payload.get("allow_refuel", True)
+        allow_illegal = payload.get("allow_illegal", False)
+        if not isinstance(allow_refuel, bool) or not isinstance(allow_illegal, bool):
+            raise ValueError("find_trade_routes allow_refuel and allow_illegal must be booleans.")
+        risk_order = [tier.value for tier in RiskTier]
+        max_risk_tier = payload.get("max_risk_tier", risk_order[-1])
+        if max_risk_tier not in risk_order:
+            raise ValueError(f"find_trade_routes max_risk_tier must be one of {', '.join(risk_order)}.")
+        risk_cap = risk_order.index(max_risk_tier)
+
+        ship = self._active_ship()
+        # Same fuel reading as travel_to_destination, so planned legs are flyable as-is.
+        fuel_capacity = int(getattr(ship, "fuel_capacity", 0) or 5)
+        current_fuel = int(getattr(ship, "current_fuel", 0) or 0)
+        capacity = int(ship.get_effective_physical_capacity())
+        holdings = self.player_state.cargo_by_ship.get("active", {})
+        # A ship without a physical capacity is not limited by it; see _ensure_cargo_capacity_for_add().
+        cargo_space = None if capacity <= 0 else max(0, capacity - sum(int(units) for units in holdings.values()))
+        credits = int(self.player_state.credits)
+
+        def system_of(destination_id: str) -> str | None:
+            system = self.sector.system_for_destination(destination_id)
+            return None if system is None else system.system_id
+
+        def allowed(legality: str, risk_tier: str) -> bool:
+            if legality == LegalityStatus.ILLEGAL.value and not allow_illegal:
+                return False
+            return risk_order.index(risk_tier) <= risk_cap
+
+        policies: dict[tuple[Any, ...], tuple[str, str]] = {}
+
+        def policy(destination_id: str, sku: str, action: str) -> tuple[str, str]:
+            return self._trade_route_policy(destination_id, sku, action, turn=turn, memo=policies)
+
+        finder = TradeRouteFinder(
+            observations,
+            system_of=system_of,
+            planner=self.route_planner(),
+            policy=policy,
+            allowed=allowed,
+            risk_order=risk_order,
+        )
+        routes = finder.find(
+            origin_destination_id=destination.destination_id,
+            fuel=current_fuel,
+            fuel_capacity=fuel_capacity,
+            credits=credits,
+            cargo_space=cargo_space,
+            allow_refuel=allow_refuel,
+            top_k=top_k,
+            max_legs=max_legs,
+        )
+        self._event(
+            context,
+            stage="trade_routes",
+            subsystem="trade_routes",
+            detail={
+                "origin_destination_id": destination.destination_id,
+                "credits": credits,
+                "cargo_space": cargo_space,
+                "fuel_current": current_fuel,
+                "fuel_capacity": fuel_capacity,
+                "observation_source": observation_source,
+                "observed_destinations": len(observations),
+                "routes": [
+                    {
+                        "start_destination_id": route.start_destination_id,
+                        "positioning_days": route.positioning_days,
+                        "positioning_refuel_stops": route.positioning_refuel_stops,
+                        "positioning_refuel_cost": route.positioning_refuel_cost,
+                        "total_profit": route.total_profit,
+                        "total_days": route.total_days,
+                        "profit_per_day": round(route.profit_per_day, 2),
+                        "loop": route.loop,
+                        "fuel_remaining": route.fuel_remaining,
+                        "credits_after": route.credits_after,
+                        "legs": [
+                            {
+                                "buy_destination_id": leg.buy_destination_id,
+                                "sell_destination_id": leg.sell_destination_id,
+                                "sku_id": leg.sku_id,
+                                "quantity": leg.quantity,
+                                "buy_price": leg.buy_price,
+                                "sell_price": leg.sell_price,
+                                "profit": leg.profit,
+                                "travel_days": leg.travel_days,
+                                "fuel_cost": leg.fuel_cost,
+                                "refuel_stops": leg.refuel_stops,
+                                "refuel_cost": leg.refuel_cost,
+                                "legality": leg.legality,
+                                "risk_tier": leg.risk_tier,
+                            }
+                            for leg in route.legs
+                        ],
+                    }
+                    for route in routes
+                ],
+            },
+        )
+
+    def _trade_route_policy(
+        self,
+        destination_id: str,
+        sku: str,
+        action: str,
+        *,
+        turn: int,
+        memo: dict[tuple[Any, ...], Any],
+    ) -> tuple[str, str]:
+        """(legality, risk tier) of trading ``sku`` at ``destination_id``, with the tags it is sold under there."""
+        place = memo.get(destination_id)
+        if place is None:
+            system = self.sector.system_for_destination(destination_id)
+            destination = self.sector.get_destination(destination_id)
+            place = memo[destination_id] = (
+                system.government_id if system is not None else None,
+                getattr(destination, "market", None),
+            )
+        government_id, market = place
+        if government_id is None:
+            return LegalityStatus.LEGAL.value, RiskTier.NONE.value
+        entry = market.good_entry(sku) if market is not None else None
+        listed_tags = tuple(entry[0].tags) if entry is not None else None
+        # Legality depends only on the government and the commodity, so markets sharing both share the answer.
+        key = (government_id, sku, listed_tags, action)
+        cached = memo.get(key)
+        if cached is None:
+            if listed_tags is not None:
+                tags = frozenset(listed_tags)
+            else:
+                base_sku, variant_tags = self.catalog.resolve_variant_sku(sku)
+                tags = frozenset(variant_tags)
+                if base_sku is not None:
+                    tags |= frozenset(self.catalog.good_by_sku(base_sku).tags)
+            commodity_key = (government_id, sku, tags, action)
+            cached = memo.get(commodity_key)
+            if cached is None:
+                policy = self._law_engine.evaluate_policy(
+                    government_id=government_id,
+                    commodity=Commodity(commodity_id=sku, tags=set(tags)),
+                    action=action,
+                    turn=turn,
+                )
+                cached = memo[commodity_key] = (policy.legality_state.value, policy.risk_tier.value)
+            memo[key] = cached
+        return cached
+
     def _execute_get_destination_profile(self, context: EngineContext) -> None:
         destination = self._current_destination()
         if destination is None:
@@ -3839,7 +4234,7 @@ class GameEngine:
         # Log DataNet gate decision
         if self._logging_enabled and self._logger:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="mission_generation:datanet_gate",
                 state_change=(
                     f"source_type=datanet population=NA gate_roll={gate_roll}"
@@ -3864,7 +4259,7 @@ class GameEngine:
                     catalog=self.catalog,
                     rng=rng,
                     logger=self._logger if self._logging_enabled else None,
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                 )
                 mission.location_id = key
                 mission.mission_contact_seed = f"{self.world_seed}|{self.player_state.current_system_id}|{key}|{mission.mission_id}|contact"
@@ -3877,7 +4272,7 @@ class GameEngine:
         # Structured logging for count
         if self._logging_enabled and self._logger:
             self._logger.log(
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
                 action="mission_generation:count",
                 state_change=(
                     f"source_type=datanet population=NA final_count={len(mission_ids)}"
@@ -4347,7 +4742,7 @@ class GameEngine:
         })
         reward_payload = materialize_reward(
             spec,
-            self._system_market_payloads(self.sector.get_system(self.player_state.current_system_id)),
+            self._system_market_payloads(self._current_system()),
             str(self.world_seed),
         )
         if reward_payload is not None:
@@ -4721,7 +5116,7 @@ class GameEngine:
 
         # Wormhole-specific reveal (no teleport, no rewards)
         if subtype_id == "wormhole_anomaly":
-            current_system = self.sector.get_system(self.player_state.current_system_id)
+            current_system = self._current_system()
             if success and current_system is not None:
                 # Choose deterministic target system != current
                 candidates = [s for s in self.sector.systems if s.system_id != current_system.system_id]
@@ -4795,7 +5190,7 @@ class GameEngine:
         return {"resolver": "exploration", "outcome": "fail"}
 
     def _resolve_encounter_combat(self, spec: Any) -> Any:
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("Current system not found for combat resolution.")
         enemy_ship = generate_npc_ship(
@@ -4849,7 +5244,7 @@ class GameEngine:
         )
         from npc_ship_generator import generate_npc_ship
         
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("Current system not found for combat initialization.")
         
@@ -5485,7 +5880,7 @@ class GameEngine:
                 encounter_id=pending["encounter_id"],
                 world_seed=self.world_seed,
                 logger=self._silent_logger,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             
             # Clear pending combat
@@ -5605,7 +6000,7 @@ class GameEngine:
                 encounter_id=pending["encounter_id"],
                 world_seed=self.world_seed,
                 logger=self._silent_logger,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
 
             # Decide whether post-combat rewards handler should run (engine layer only)
@@ -5695,11 +6090,11 @@ class GameEngine:
         trigger_type: TriggerType,
         option_name: str | None = None,
     ) -> dict[str, Any] | None:
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             return None
         government = self.government_registry.get_government(system.government_id)
-        policies = self._cargo_policy(system_id=system.system_id, turn=get_current_turn())
+        policies = self._cargo_policy(system_id=system.system_id, turn=get_current_turn(self.time_context))
         illegal_present = any(policy.legality_state.value == "ILLEGAL" for _, policy in policies)
         restricted_unlicensed = any(policy.legality_state.value == "RESTRICTED" for _, policy in policies)
         if not illegal_present and not restricted_unlicensed:
@@ -5719,7 +6114,7 @@ class GameEngine:
             policy_results=policies,
             player=self.player_state,
             world_seed=self.world_seed,
-            turn=int(get_current_turn()),
+            turn=int(get_current_turn(self.time_context)),
             cargo_snapshot=CargoSnapshot(
                 illegal_present=illegal_present,
                 restricted_unlicensed_present=restricted_unlicensed,
@@ -5848,7 +6243,7 @@ class GameEngine:
         # Only materialize if encounter has a reward profile (for cargo/credits amount)
         reward_profile_id = getattr(spec, "reward_profile_id", None)
         from reward_materializer import materialize_reward
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             return
         
@@ -6070,20 +6465,24 @@ class GameEngine:
     def _evaluate_hard_stop(self, context: EngineContext) -> None:
         if context.hard_stop:
             return
-        end_state = evaluate_end_game(player=self.player_state, missions=[])
+        end_state = evaluate_end_game(
+            player=self.player_state,
+            missions=[],
+            current_turn=int(get_current_turn(self.time_context)),
+        )
         if end_state.status != "lose":
-            _set_hard_stop_state(player_dead=False, tier2_detention=False)
+            _set_hard_stop_state(player_dead=False, tier2_detention=False, context=self.time_context)
             return
         reason = "end_game_lose"
         failures = list(end_state.failure_reasons)
         if "tier2_arrest" in failures:
             reason = "tier2_detention"
-            _set_hard_stop_state(player_dead=False, tier2_detention=True)
+            _set_hard_stop_state(player_dead=False, tier2_detention=True, context=self.time_context)
         elif "death" in failures:
             reason = "player_death"
-            _set_hard_stop_state(player_dead=True, tier2_detention=False)
+            _set_hard_stop_state(player_dead=True, tier2_detention=False, context=self.time_context)
         else:
-            _set_hard_stop_state(player_dead=False, tier2_detention=False)
+            _set_hard_stop_state(player_dead=False, tier2_detention=False, context=self.time_context)
         context.hard_stop = True
         context.hard_stop_reason = reason
         self._event(context, stage="hard_stop", subsystem="end_game_evaluator", detail={"reason": reason})
@@ -6096,7 +6495,7 @@ class GameEngine:
             payload = command.get("payload")
         else:
             command_type = command.get("type")
-            payload = {k: v for k, v in command.items() if k != "type"}
+            payload = {k: v for k, v in command.items() if k not in ("type", "result_level")}
         if not isinstance(command_type, str):
             return "", {}, "command type must be a string."
         if not isinstance(payload, dict):
@@ -6121,6 +6520,8 @@ class GameEngine:
         allowed.add("shipdock_installed_modules_list")
         allowed.add("get_player_profile")
         allowed.add("get_system_profile")
+        allowed.add("plan_route")
+        allowed.add("find_trade_routes")
         allowed.add("get_destination_profile")
         allowed.add("warehouse_cancel")
         allowed.add("set_logging")
@@ -6130,12 +6531,13 @@ class GameEngine:
         allowed.add("claim_mission")
         allowed.add("dismiss_crew")
         allowed.add("combat_action")
+        allowed.add("skip_time")
         if command_type not in allowed:
             return command_type, payload, f"unsupported command type: {command_type}"
         return command_type, payload, None
 
     def _build_step_result(self, *, context: EngineContext, ok: bool, error: str | None) -> dict[str, Any]:
-        result = {
+        result: dict[str, Any] = {
             "ok": bool(ok),
             "error": error,
             "command_type": context.command_type,
@@ -6143,16 +6545,15 @@ class GameEngine:
             "turn_after": int(context.turn_after),
             "hard_stop": bool(context.hard_stop),
             "hard_stop_reason": context.hard_stop_reason,
-            "events": list(context.events),
-            "player": {
-                "system_id": self.player_state.current_system_id,
-                "destination_id": self.player_state.current_destination_id,
-                "location_id": self.player_state.current_location_id,
-                "credits": int(self.player_state.credits),
-                "arrest_state": self.player_state.arrest_state,
-            },
-            "active_encounter_count": len(context.active_encounters),
-            "version": self._version,
+        }
+        if context.result_level == RESULT_LEVEL_FULL:
+            result["events"] = [self._materialize_event(event) for event in context.events]
+        result["player"] = {
+            "system_id": self.player_state.current_system_id,
+            "destination_id": self.player_state.current_destination_id,
+            "location_id": self.player_state.current_location_id,
+            "credits": int(self.player_state.credits),
+            "arrest_state": self.player_state.arrest_state,
         }
         
         # Add game_over_reason if present
@@ -6160,6 +6561,10 @@ class GameEngine:
             result["game_over_reason"] = context.game_over_reason
         elif error == "game_over" and self.player_state.run_end_reason:
             result["game_over_reason"] = self.player_state.run_end_reason
+        if context.result_level == RESULT_LEVEL_MINIMAL:
+            return result
+        result["active_encounter_count"] = len(context.active_encounters)
+        result["version"] = self._version
         
         # Add pending_combat payload if hard_stop is due to pending combat action
         if context.hard_stop and context.hard_stop_reason == "pending_combat_action" and self._pending_combat:
@@ -6219,11 +6624,41 @@ class GameEngine:
             }
         return result
 
+    def _build_compact_step_result(self, outcome: _CommandOutcome) -> dict[str, Any]:
+        context = outcome.context
+        result = {
+            "ok": bool(outcome.ok),
+            "error": outcome.error,
+            "command_type": context.command_type,
+            "turn_before": int(context.turn_before),
+            "turn_after": int(context.turn_after),
+            "hard_stop": bool(context.hard_stop),
+            "hard_stop_reason": context.hard_stop_reason,
+            "event_count": len(context.events),
+        }
+        game_over_reason = context.game_over_reason
+        if game_over_reason is None and outcome.error == "game_over":
+            game_over_reason = self.player_state.run_end_reason
+        if game_over_reason is not None:
+            result["game_over_reason"] = game_over_reason
+        return result
+
     def _event(self, context: EngineContext, *, stage: str, subsystem: str, detail: dict[str, Any]) -> None:
+        if context.result_level != RESULT_LEVEL_FULL and not self._logging_enabled:
+            context.events.append(
+                _DeferredEvent(
+                    stage=stage,
+                    subsystem=subsystem,
+                    turn=int(get_current_turn(self.time_context)),
+                    command_type=context.command_type,
+                    detail=detail,
+                )
+            )
+            return
         event_payload = {
             "stage": stage,
             "world_seed": int(self.world_seed),
-            "turn": int(get_current_turn()),
+            "turn": int(get_current_turn(self.time_context)),
             "command_type": context.command_type,
             "subsystem": subsystem,
             "detail": _jsonable(detail),
@@ -6232,19 +6667,31 @@ class GameEngine:
         if self._logging_enabled:
             try:
                 self._logger.log(
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                     action=f"{subsystem}:{stage}",
                     state_change=json.dumps(event_payload, sort_keys=True, ensure_ascii=True),
                 )
             except Exception:  # noqa: BLE001
                 return
 
+    def _materialize_event(self, event: Any) -> dict[str, Any]:
+        if not isinstance(event, _DeferredEvent):
+            return event
+        return {
+            "stage": event.stage,
+            "world_seed": int(self.world_seed),
+            "turn": event.turn,
+            "command_type": event.command_type,
+            "subsystem": event.subsystem,
+            "detail": _jsonable(event.detail),
+        }
+
     def _advance_time(self, *, days: int, reason: str) -> Any:
-        _set_player_action_context(True)
+        _set_player_action_context(True, self.time_context)
         try:
-            result = advance_time(days=int(days), reason=reason)
+            result = advance_time(days=int(days), reason=reason, context=self.time_context)
         finally:
-            _set_player_action_context(False)
+            _set_player_action_context(False, self.time_context)
         self._apply_recurring_costs(days_completed=int(result.days_completed))
         # Update bankruptcy warning after time advance completes
         self._update_bankruptcy_warning()
@@ -6253,7 +6700,7 @@ class GameEngine:
         if int(result.days_completed) > 0:
             self._evaluate_active_missions_on_turn_tick(
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             # Clear all DataNet mission offers on turn advance (Phase 7.x)
             self._mission_manager.clear_datanet_offers(location_id=None)
@@ -6276,6 +6723,70 @@ class GameEngine:
                 break
         return {"days_requested": int(days), "days_completed": int(completed), "hard_stop_reason": hard_stop_reason}
 
+    def _skip_time(self, *, days: int, reason: str) -> dict[str, Any]:
+        """
+        Advance ``days`` days with the same outcome as ``days`` one-day waits.
+
+        The first day and each mission deadline day run as a normal one-day advance. Between
+        them missions only count down and recurring costs are linear, so those stretches are
+        settled in closed form while time_engine.skip_time jumps over quiet world-state days.
+        With file logging on, every day runs normally so the log matches day-by-day play.
+        """
+        completed = 0
+        hard_stop_reason = None
+        while completed < days:
+            remaining = days - completed
+            span = 1
+            if completed and not self._logging_enabled:
+                deadline = turn_ticks_until_mission_deadline(
+                    mission_manager=self._mission_manager, player_state=self.player_state
+                )
+                span = remaining if deadline is None else min(remaining, deadline - 1)
+            if span <= 1:
+                result = self._advance_time(days=1, reason=reason)
+                span = 1
+            else:
+                result = self._skip_quiet_turns(days=span, reason=reason)
+            completed += int(result.days_completed)
+            if result.hard_stop_reason is not None:
+                hard_stop_reason = str(result.hard_stop_reason)
+                break
+            if int(result.days_completed) < span:
+                break
+        return {"days_requested": int(days), "days_completed": int(completed), "hard_stop_reason": hard_stop_reason}
+
+    def _skip_quiet_turns(self, *, days: int, reason: str) -> Any:
+        start_turn = int(get_current_turn(self.time_context))
+        _set_player_action_context(True, self.time_context)
+        try:
+            result = skip_time(days=int(days), reason=reason, context=self.time_context)
+        finally:
+            _set_player_action_context(False, self.time_context)
+        days_completed = int(result.days_completed)
+        if days_completed > 0:
+            self._apply_recurring_costs_by_day(days_completed=days_completed, start_turn=start_turn)
+            count_down_mission_deadlines(
+                mission_manager=self._mission_manager, player_state=self.player_state, ticks=days_completed
+            )
+            self._mission_manager.clear_datanet_offers(location_id=None)
+        return result
+
+    def _apply_recurring_costs_by_day(self, *, days_completed: int, start_turn: int) -> None:
+        """Same credits and bankruptcy warning as _apply_recurring_costs(1) plus _update_bankruptcy_warning() per day."""
+        per_turn = int(self._recurring_cost_per_turn())
+        credits = int(self.player_state.credits)
+        if per_turn > 0:
+            self.player_state.credits = max(0, credits - per_turn * int(days_completed))
+        if self.player_state.credits > 0:
+            self.player_state.bankruptcy_warning_turn = None
+            return
+        if self.player_state.credits < 0:
+            return
+        # First day of the stretch that ended with zero credits; the warning is set then unless already set.
+        zero_day = 1 if credits <= 0 else -(-credits // per_turn)
+        if zero_day > 1 or self.player_state.bankruptcy_warning_turn is None:
+            self.player_state.bankruptcy_warning_turn = int(start_turn) + zero_day
+
     def _apply_default_start_location(self) -> None:
         system = self.sector.systems[0]
         destination_id = None
@@ -6295,7 +6806,7 @@ class GameEngine:
         - hull_id: str
         - modules: list[dict] where each dict has module_id: str
         """
-        from data_loader import load_hulls, load_modules
+        from data_loader import load_hulls
         
         # Handle admin override
         if starting_ship_override is not None:
@@ -6407,8 +6918,6 @@ class GameEngine:
         
         Raises ValueError on any validation failure.
         """
-        from data_loader import load_hulls, load_modules
-        
         # Validate override structure
         if not isinstance(override, dict):
             raise ValueError("starting_ship_override must be a dict")
@@ -6421,15 +6930,9 @@ class GameEngine:
         if not isinstance(modules_override, list):
             raise ValueError("starting_ship_override.modules must be a list")
         
-        # Load catalogs
-        hulls_data = load_hulls()
-        hulls_list = hulls_data.get("hulls", [])
-        modules_data = load_modules()
-        modules_list = modules_data.get("modules", [])
-        
-        # Build lookup dictionaries
-        hulls_by_id = {hull.get("hull_id"): hull for hull in hulls_list}
-        modules_by_id = {module.get("module_id"): module for module in modules_list}
+        bundle = get_data_bundle()
+        hulls_by_id = bundle.hulls_by_id
+        modules_by_id = bundle.modules_by_id
         
         # Validate hull_id exists
         if hull_id not in hulls_by_id:
@@ -6609,22 +7112,16 @@ class GameEngine:
 
     def _format_ship_info_frame_only(self, ship_dict: dict[str, Any]) -> dict[str, Any]:
         """Format ship information for encounter display - only frame, no modules/stats."""
-        from data_loader import load_hulls
-        
         hull_id = ship_dict.get("hull_id", "unknown")
-        hulls_data = load_hulls()
-        hulls_list = hulls_data.get("hulls", [])
-        
         hull_name = "Unknown Ship"
         frame = "UNKNOWN"
         tier = 0
         
-        for hull in hulls_list:
-            if hull.get("hull_id") == hull_id:
-                hull_name = hull.get("name", hull_id)
-                frame = hull.get("frame", "UNKNOWN")
-                tier = hull.get("tier", 0)
-                break
+        hull = get_data_bundle().hulls_by_id.get(hull_id)
+        if hull is not None:
+            hull_name = hull.get("name", hull_id)
+            frame = hull.get("frame", "UNKNOWN")
+            tier = hull.get("tier", 0)
         
         return {
             "hull_id": hull_id,
@@ -6635,23 +7132,16 @@ class GameEngine:
 
     def _format_ship_info(self, ship_dict: dict[str, Any]) -> dict[str, Any]:
         """Format ship information for combat display - includes modules/stats."""
-        from data_loader import load_hulls, load_modules
-        
+        bundle = get_data_bundle()
         hull_id = ship_dict.get("hull_id", "unknown")
-        hulls_data = load_hulls()
-        hulls_list = hulls_data.get("hulls", [])
-        
         hull_name = "Unknown Ship"
-        for hull in hulls_list:
-            if hull.get("hull_id") == hull_id:
-                hull_name = hull.get("name", hull_id)
-                break
+        hull = bundle.hulls_by_id.get(hull_id)
+        if hull is not None:
+            hull_name = hull.get("name", hull_id)
         
         # Count modules by type using module catalog
         module_instances = ship_dict.get("module_instances", [])
-        modules_data = load_modules()
-        modules_list = modules_data.get("modules", [])
-        modules_by_id = {m.get("module_id"): m for m in modules_list}
+        modules_by_id = bundle.modules_by_id
         
         weapon_count = 0
         defense_count = 0
@@ -6793,15 +7283,12 @@ class GameEngine:
         return claimable
 
     def _world_state_engine(self) -> Any | None:
-        import time_engine as time_engine_module
-
-        return getattr(time_engine_module, "_world_state_engine", None)
+        return self.time_context.world_state_engine
 
     def _resolve_destination_id(self, system: System, destination_id: Any) -> str | None:
         if isinstance(destination_id, str) and destination_id:
-            for destination in system.destinations:
-                if destination.destination_id == destination_id:
-                    return destination_id
+            if self._destination_in_system(system, destination_id) is not None:
+                return destination_id
             raise ValueError(f"Unknown destination_id for target system: {destination_id}")
         if system.destinations:
             return system.destinations[0].destination_id
@@ -6879,7 +7366,7 @@ class GameEngine:
                 "active_situations": [],
             }
         
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         emoji_id = getattr(destination, "emoji_id", "") or ""
         if system is None:
             dest_type = normalize_destination_type(destination.destination_type, getattr(self, "logger", None))
@@ -6998,7 +7485,7 @@ class GameEngine:
             reward_summary_lines = []
             if mission.reward_status == "ungranted" and mission.reward_profile_id:
                 system_markets = self._system_market_payloads(
-                    self.sector.get_system(self.player_state.current_system_id)
+                    self._current_system()
                 ) if hasattr(self, "sector") else []
                 bundle = reward_preview(mission, system_markets=system_markets, world_seed=str(self.world_seed))
                 reward_summary_lines = bundle.to_reward_summary_lines()
@@ -7022,19 +7509,64 @@ class GameEngine:
             )
         return rows
 
+    def _current_system(self) -> System | None:
+        system_id = self.player_state.current_system_id
+        lookups = self._batch_lookups
+        if lookups is None:
+            return self.sector.get_system(system_id)
+        # World-state mutations only replace systems while time advances, so the turn
+        # is enough to detect a stale entry.
+        key = (system_id, int(get_current_turn(self.time_context)), id(self.sector))
+        if lookups.current_system_key != key:
+            lookups.current_system = self.sector.get_system(system_id)
+            lookups.current_system_key = key
+        return lookups.current_system
+
     def _current_destination(self) -> Destination | None:
-        system = self.sector.get_system(self.player_state.current_system_id)
+        lookups = self._batch_lookups
+        if lookups is None:
+            return self._resolve_current_destination()
+        key = (
+            self.player_state.current_system_id,
+            self.player_state.current_destination_id,
+            int(get_current_turn(self.time_context)),
+            id(self.sector),
+        )
+        if lookups.current_destination_key != key:
+            lookups.current_destination = self._resolve_current_destination()
+            lookups.current_destination_key = key
+        return lookups.current_destination
+
+    def _resolve_current_destination(self) -> Destination | None:
+        system = self._current_system()
         if system is None:
             return None
         target_destination_id = self.player_state.current_destination_id
         if isinstance(target_destination_id, str):
-            for destination in system.destinations:
-                if destination.destination_id == target_destination_id:
-                    return destination
+            destination = self._destination_in_system(system, target_destination_id)
+            if destination is not None:
+                return destination
         if system.destinations:
             return system.destinations[0]
         return None
 
+    def _assemble_ship(
+        self,
+        hull_id: str,
+        module_instances: list[dict[str, Any]],
+        degradation_state: dict[str, int],
+    ) -> Mapping[str, Any]:
+        lookups = self._batch_lookups
+        key = None if lookups is None else _assembly_key(hull_id, module_instances, degradation_state)
+        if key is None:
+            return assemble_ship(hull_id, module_instances, degradation_state)
+        assembled = lookups.assembled_ships.get(key)
+        if assembled is None:
+            # Shared by every command in the batch, so callers get a read-only copy.
+            assembled = _read_only(assemble_ship(hull_id, module_instances, degradation_state))
+            lookups.assembled_ships[key] = assembled
+        return assembled
+
     def _current_location(self) -> Any | None:
         destination = self._current_destination()
         if destination is None:
@@ -7045,10 +7577,19 @@ class GameEngine:
             return None
         if location_id == destination_id:
             return None
-        for location in list(getattr(destination, "locations", []) or []):
-            if getattr(location, "location_id", None) == location_id:
-                return location
-        return None
+        return self._location_in_destination(destination, location_id)
+
+    def _destination_in_system(self, system: System, destination_id: str) -> Destination | None:
+        owner = self.sector.system_for_destination(destination_id)
+        if owner is None or owner.system_id != system.system_id:
+            return None
+        return self.sector.get_destination(destination_id)
+
+    def _location_in_destination(self, destination: Destination, location_id: str) -> Location | None:
+        owner = self.sector.destination_for_location(location_id)
+        if owner is None or owner.destination_id != destination.destination_id:
+            return None
+        return self.sector.get_location(location_id)
 
     # PHASE 7.6 AUDIT NOTES
     # - BAR support pre-pass: location type may be generated, but action catalog was empty.
@@ -7338,7 +7879,7 @@ class GameEngine:
                 system_id=self.player_state.current_system_id,
                 registry=self._npc_registry,
                 logger=self._logger if self._logging_enabled else None,
-                turn=int(get_current_turn()),
+                turn=int(get_current_turn(self.time_context)),
             )
             resolved_ids = sorted(
                 {
@@ -7407,11 +7948,11 @@ class GameEngine:
                 self._npc_registry.add(
                     required_npc,
                     logger=self._logger if self._logging_enabled else None,
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                 )
                 if self._logging_enabled and self._logger:
                     self._logger.log(
-                        turn=int(get_current_turn()),
+                        turn=int(get_current_turn(self.time_context)),
                         action="npc_enforcement",
                         state_change=f"created_required_npc role={structural_role} location_id={location_id} npc_id={required_npc_id}",
                     )
@@ -7568,7 +8109,7 @@ class GameEngine:
         # Deterministic spawn roll: 20% chance
         # Use hash for deterministic seed (same as other deterministic RNG streams)
         spawn_seed_token = repr((self.world_seed, location_id, "bar_spawn"))
-        spawn_seed = int(hashlib.sha256(spawn_seed_token.encode("ascii")).hexdigest()[:16], 16)
+        spawn_seed = sha256_prefix_int(spawn_seed_token)
         spawn_rng = random.Random(spawn_seed)
         spawn_roll = spawn_rng.random()
         
@@ -7644,7 +8185,7 @@ class GameEngine:
                     # No explicit validate() method needed - contract enforced by construction
             
             # Add to registry
-            self._npc_registry.add(crew_npc, logger=self._logger if self._logging_enabled else None, turn=int(get_current_turn()))
+            self._npc_registry.add(crew_npc, logger=self._logger if self._logging_enabled else None, turn=int(get_current_turn(self.time_context)))
             
             spawned_crew.append(crew_npc)
         
@@ -7821,7 +8362,7 @@ class GameEngine:
     def _build_bartender_rumor_payload(self, *, npc_id: str) -> dict[str, Any]:
         destination_id = str(self.player_state.current_destination_id or "")
         location_id = str(self.player_state.current_location_id or "")
-        turn_value = int(get_current_turn())
+        turn_value = int(get_current_turn(self.time_context))
         rng = random.Random(
             self._stable_seed(
                 self.world_seed,
@@ -7849,7 +8390,7 @@ class GameEngine:
             }
 
         hint_choices: list[dict[str, str | None]] = []
-        current_system = self.sector.get_system(self.player_state.current_system_id)
+        current_system = self._current_system()
         if current_system is not None:
             for destination in sorted(list(current_system.destinations), key=lambda row: row.destination_id):
                 hint_choices.append(
@@ -7896,11 +8437,7 @@ class GameEngine:
         return payload
 
     def _stable_seed(self, *parts: Any) -> int:
-        value = 0
-        for part in parts:
-            for char in str(part):
-                value = (value * 31 + ord(char)) % (2**32)
-        return value
+        return polynomial_seed(0, *parts)
 
     def _current_destination_id_required(self) -> str:
         destination_id = self.player_state.current_destination_id
@@ -7990,7 +8527,7 @@ class GameEngine:
 
     def _update_bankruptcy_warning(self) -> None:
         """Update bankruptcy warning turn based on current credits state."""
-        current_turn = int(get_current_turn())
+        current_turn = int(get_current_turn(self.time_context))
         if self.player_state.credits > 0:
             self.player_state.bankruptcy_warning_turn = None
         elif self.player_state.credits == 0:
@@ -8025,7 +8562,7 @@ class GameEngine:
         destination: Destination,
         kwargs: dict[str, Any],
     ) -> dict[str, Any]:
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("No current system for destination action.")
         action_kwargs: dict[str, Any] = {}
@@ -8061,7 +8598,7 @@ class GameEngine:
             action_kwargs.setdefault("system_id", system.system_id)
             action_kwargs.setdefault("world_state_engine", self._world_state_engine())
             action_kwargs.setdefault("logger", self._logger if self._logging_enabled else None)
-            action_kwargs.setdefault("turn", int(get_current_turn()))
+            action_kwargs.setdefault("turn", int(get_current_turn(self.time_context)))
         
         return action_kwargs
 
@@ -8087,7 +8624,7 @@ class GameEngine:
         option_name: Any = None,
     ) -> dict[str, Any]:
         destination_id = self.player_state.current_destination_id
-        turn = int(get_current_turn())
+        turn = int(get_current_turn(self.time_context))
         same_turn_same_destination = (
             self.player_state.last_customs_turn == turn
             and self.player_state.last_customs_destination_id == destination_id
@@ -8116,112 +8653,113 @@ class GameEngine:
         self.player_state.last_customs_kind = kind
         return {"blocked": False, "kind": kind, "outcome": outcome}
 
-    def _market_price_rows(self, *, action: str) -> list[dict[str, Any]]:
+    def _market_quote_table(self, *, action: str) -> tuple[MarketQuoteTable, Destination, Any]:
+        """Quote table for the current destination and ``action``, rebuilt only when its key changes."""
         destination = self._current_destination()
         if destination is None:
             raise ValueError("no_current_destination")
-        market = getattr(destination, "market", None)
-        if market is None:
+        if getattr(destination, "market", None) is None:
             raise ValueError("market_not_available")
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             raise ValueError("current_system_not_found")
         government = self.government_registry.get_government(system.government_id)
-        holdings = self.player_state.cargo_by_ship.get("active", {})
+        world_state_engine = self._world_state_engine()
+        ship = self.fleet_by_id.get(self.player_state.active_ship_id)
+        key = MarketQuoteKey(
+            destination_id=str(destination.destination_id),
+            action=action,
+            government_id=str(government.id),
+            turn=int(get_current_turn(self.time_context)),
+            modifier_version=None if world_state_engine is None else int(world_state_engine.modifier_version),
+            ship_id=None if ship is None else str(ship.ship_id),
+            crew_version=None if ship is None else int(ship.crew_version),
+        )
+        tables = self.__dict__.get("_market_quote_tables")
+        if tables is None:
+            tables = self._market_quote_tables = {}
+        table = tables.get((key.destination_id, action))
+        if table is None or table.key != key:
+            # Tables quoted on an earlier turn can never be read again.
+            for stale_key in [entry for entry, cached in tables.items() if cached.key.turn != key.turn]:
+                del tables[stale_key]
+            table = tables[(key.destination_id, action)] = MarketQuoteTable(key)
+        return table, destination, government
+
+    def _market_quote_row(
+        self,
+        table: MarketQuoteTable,
+        *,
+        destination: Destination,
+        government: Any,
+        sku: str,
+    ) -> dict[str, Any] | None:
+        quote = table.quote(
+            sku,
+            lambda entry: self._market_price_quote(
+                destination=destination,
+                government=government,
+                sku=entry,
+                action=table.key.action,
+            ),
+        )
+        if quote is None:
+            return None
+        return {
+            "sku_id": sku,
+            "display_name": table.display_name(
+                sku, lambda entry: self._display_name_for_sku(destination=destination, sku=entry)
+            ),
+            "legality": quote["legality"],
+            "risk_tier": quote["risk_tier"],
+            "unit_price": int(quote["unit_price"]),
+            "available_units": None,
+        }
 
-        rows: list[dict[str, Any]] = []
-        candidates: set[str] = set()
+    def _market_price_rows(self, *, action: str) -> list[dict[str, Any]]:
+        table, destination, government = self._market_quote_table(action=action)
         if action == "buy":
-            for category in market.categories.values():
-                for good in list(category.produced) + list(category.consumed) + list(category.neutral):
-                    candidates.add(good.sku)
-        else:
-            for sku in sorted(holdings):
-                if int(holdings.get(sku, 0)) > 0:
-                    candidates.add(sku)
+            if table.market_rows is None:
+                candidates: set[str] = set()
+                for category in destination.market.categories.values():
+                    for good in list(category.produced) + list(category.consumed) + list(category.neutral):
+                        candidates.add(good.sku)
+                table.market_rows = [
+                    row
+                    for row in (
+                        self._market_quote_row(table, destination=destination, government=government, sku=sku)
+                        for sku in sorted(candidates)
+                    )
+                    if row is not None
+                ]
+            return [dict(row) for row in table.market_rows]
 
-        for sku in sorted(candidates):
-            quote = self._market_price_quote(
-                destination=destination,
-                government=government,
-                sku=sku,
-                action=action,
-            )
-            if quote is None:
+        holdings = self.player_state.cargo_by_ship.get("active", {})
+        rows: list[dict[str, Any]] = []
+        for sku in sorted(holdings):
+            units = int(holdings.get(sku, 0))
+            if units <= 0:
                 continue
-            row = {
-                "sku_id": sku,
-                "display_name": self._display_name_for_sku(destination=destination, sku=sku),
-                "legality": quote["legality"],
-                "risk_tier": quote["risk_tier"],
-                "unit_price": int(quote["unit_price"]),
-                "available_units": None,
-            }
-            if action == "sell":
-                row["player_has_units"] = int(holdings.get(sku, 0))
+            row = self._market_quote_row(table, destination=destination, government=government, sku=sku)
+            if row is None:
+                continue
+            row["player_has_units"] = units
             rows.append(row)
         return rows
 
     def _market_row_by_sku(self, *, action: str, sku_id: str) -> dict[str, Any] | None:
-        for row in self._market_price_rows(action=action):
-            if row.get("sku_id") == sku_id:
-                return row
-        return None
-
-    def _possible_variant_tags(self) -> set[str]:
-        return {
-            str(good.possible_tag)
-            for good in self.catalog.goods
-            if isinstance(good.possible_tag, str) and good.possible_tag
-        }
-
-    def _resolve_base_sku_and_variant_tags(self, *, sku: str) -> tuple[str | None, list[str]]:
-        try:
-            self.catalog.good_by_sku(sku)
-            return sku, []
-        except KeyError:
-            pass
-        known_tags = self._possible_variant_tags()
-        if not known_tags:
-            return None, []
-        parts = [part for part in sku.split("_") if part]
-        if not parts:
-            return None, []
-        candidates: list[tuple[str, list[str]]] = []
-        max_strip = len(parts) - 1
-        for prefix_count in range(0, max_strip + 1):
-            for suffix_count in range(0, max_strip - prefix_count + 1):
-                if prefix_count == 0 and suffix_count == 0:
-                    continue
-                prefix_parts = parts[:prefix_count]
-                suffix_parts = parts[len(parts) - suffix_count :] if suffix_count > 0 else []
-                stripped_parts = prefix_parts + suffix_parts
-                if not stripped_parts or any(part not in known_tags for part in stripped_parts):
-                    continue
-                core = parts[prefix_count : len(parts) - suffix_count]
-                if not core:
-                    continue
-                candidate_sku = "_".join(core)
-                try:
-                    self.catalog.good_by_sku(candidate_sku)
-                except KeyError:
-                    continue
-                candidates.append((candidate_sku, stripped_parts))
-        if not candidates:
-            return None, []
-        candidates.sort(key=lambda entry: (-len(entry[0]), len(entry[1]), entry[0], tuple(entry[1])))
-        return candidates[0]
-
-    def _market_goods_with_roles(self, market: Any) -> list[tuple[Any, str]]:
-        rows: list[tuple[Any, str]] = []
-        for category in market.categories.values():
-            for good in category.produced:
-                rows.append((good, "produced"))
-            for good in category.neutral:
-                rows.append((good, "neutral"))
-            for good in category.consumed:
-                rows.append((good, "consumed"))
-        return rows
+        table, destination, government = self._market_quote_table(action=action)
+        if action == "buy":
+            if destination.market.good_entry(sku_id) is None:
+                return None
+            return self._market_quote_row(table, destination=destination, government=government, sku=sku_id)
+        units = int(self.player_state.cargo_by_ship.get("active", {}).get(sku_id, 0))
+        if units <= 0:
+            return None
+        row = self._market_quote_row(table, destination=destination, government=government, sku=sku_id)
+        if row is not None:
+            row["player_has_units"] = units
+        return row
 
     def _market_price_quote(
         self,
@@ -8234,10 +8772,9 @@ class GameEngine:
         market = destination.market
         if market is None:
             return None
-        market_entries = self._market_goods_with_roles(market)
-        exact_entry = next((entry for entry in market_entries if str(entry[0].sku) == sku), None)
+        exact_entry = market.good_entry(sku)
 
-        base_sku, inferred_variant_tags = self._resolve_base_sku_and_variant_tags(sku=sku)
+        base_sku, inferred_variant_tags = self.catalog.resolve_variant_sku(sku)
         if base_sku is None and exact_entry is None:
             return None
         catalog_good = None
@@ -8251,10 +8788,6 @@ class GameEngine:
             exact_good = exact_entry[0]
             category = str(getattr(exact_good, "category", ""))
             sold_tags = list(getattr(exact_good, "tags", ()) or [])
-            sold_base_sku = base_sku if isinstance(base_sku, str) else None
-            if sold_base_sku is None:
-                resolved_base, _ = self._resolve_base_sku_and_variant_tags(sku=str(exact_good.sku))
-                sold_base_sku = resolved_base
         else:
             if catalog_good is None:
                 return None
@@ -8263,33 +8796,24 @@ class GameEngine:
             for tag in inferred_variant_tags:
                 if tag not in sold_tags:
                     sold_tags.append(tag)
-            sold_base_sku = base_sku
 
         if category not in market.categories:
             return None
 
-        near_match_entry = None
-        if exact_entry is None and isinstance(sold_base_sku, str):
-            base_matches: list[tuple[Any, str]] = []
-            for entry in market_entries:
-                market_good = entry[0]
-                if str(getattr(market_good, "category", "")) != category:
-                    continue
-                market_base, _ = self._resolve_base_sku_and_variant_tags(sku=str(market_good.sku))
-                if market_base == sold_base_sku:
-                    base_matches.append(entry)
+        near_match_sku = None
+        if exact_entry is None:
+            base_matches = market.base_sku_index(self.catalog).get((category, base_sku))
             if base_matches:
-                base_matches.sort(key=lambda entry: str(entry[0].sku))
-                near_match_entry = base_matches[0]
+                near_match_sku = base_matches[0]
 
         if exact_entry is not None:
             pricing_sku = sku
             substitute_override = None
-        elif near_match_entry is not None:
-            pricing_sku = str(near_match_entry[0].sku)
+        elif near_match_sku is not None:
+            pricing_sku = near_match_sku
             substitute_override = False
-        elif isinstance(sold_base_sku, str):
-            pricing_sku = sold_base_sku
+        elif isinstance(base_sku, str):
+            pricing_sku = base_sku
             substitute_override = True
         else:
             return None
@@ -8303,7 +8827,7 @@ class GameEngine:
                     government_id=government.id,
                     commodity=Commodity(commodity_id=sku, tags=set(sold_tags)),
                     action=action,
-                    turn=int(get_current_turn()),
+                    turn=int(get_current_turn(self.time_context)),
                 ),
                 sku=pricing_sku,
                 action=action,
@@ -8326,11 +8850,9 @@ class GameEngine:
 
     def _display_name_for_sku(self, *, destination: Destination, sku: str) -> str:
         market = destination.market
-        if market is not None:
-            for category in market.categories.values():
-                for good in list(category.produced) + list(category.consumed) + list(category.neutral):
-                    if good.sku == sku:
-                        return str(good.name)
+        entry = market.good_entry(sku) if market is not None else None
+        if entry is not None:
+            return str(entry[0].name)
         try:
             return str(self.catalog.good_by_sku(sku).name)
         except KeyError:
@@ -8385,7 +8907,7 @@ class GameEngine:
             if "interdict" in module_id:
                 player_state["interdiction_device"] = True
 
-        system = self.sector.get_system(self.player_state.current_system_id)
+        system = self._current_system()
         if system is None:
             return player_state, player_state
         npc_state = generate_npc_ship(
@@ -8456,6 +8978,52 @@ def _jsonable(value: Any) -> Any:
     return str(value)
 
 
+def _assembly_key(
+    hull_id: str,
+    module_instances: list[dict[str, Any]],
+    degradation_state: dict[str, int],
+) -> tuple[Any, ...] | None:
+    """What assemble_ship() reads from its inputs, or None when they are malformed and must reach its validation."""
+    if not isinstance(module_instances, list) or not isinstance(degradation_state, dict):
+        return None
+    modules = []
+    for instance in module_instances:
+        if not isinstance(instance, dict) or not isinstance(instance.get("module_id"), str):
+            return None
+        tags = instance.get("secondary_tags")
+        if tags is not None and not (isinstance(tags, list) and all(isinstance(tag, str) for tag in tags)):
+            return None
+        modules.append((instance["module_id"], tuple(tags or ())))
+    try:
+        degradation = tuple(sorted(degradation_state.items()))
+        hash(degradation)
+    except TypeError:
+        return None
+    return hull_id, tuple(modules), degradation
+
+
+def _read_only(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(entry) for key, entry in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(entry) for entry in value)
+    return value
+
+
+def _require_result_level(result_level: Any) -> str:
+    if result_level not in RESULT_LEVELS:
+        raise ValueError(f"result_level must be one of {', '.join(RESULT_LEVELS)}.")
+    return str(result_level)
+
+
+def _world_state_event_bus(mode: Any) -> EventBus:
+    if mode == WORLD_STATE_EVENTS_STDOUT:
+        return stdout_event_bus()
+    if mode == WORLD_STATE_EVENTS_OFF:
+        return EventBus()
+    raise ValueError(f"world_state_events must be one of {', '.join(WORLD_STATE_EVENT_MODES)}.")
+
+
 def _read_version() -> str:
     version_path = Path(__file__).resolve().parents[1] / "VERSION"
     if not version_path.exists():
@@ -8469,13 +9037,10 @@ def _read_version() -> str:
 
 def _is_data_cargo_sku(sku_id: str) -> bool:
     """Helper to determine if SKU is data cargo (simplified check)."""
-    from data_loader import load_goods
-    goods_data = load_goods()
-    for good in goods_data.get("goods", []):
-        if good.get("sku_id") == sku_id:
-            tags = good.get("tags", [])
-            return "data" in tags
-    return False
+    good = get_data_bundle().goods_by_sku.get(sku_id)
+    if good is None:
+        return False
+    return "data" in good.tags
 
 
 def run_step_as_json(engine: GameEngine, command: dict[str, Any]) -> str:
@@ -3,6 +3,7 @@ from enum import Enum
 from typing import List, Set
 import random
 
+from deterministic_rng import polynomial_seed
 from government_registry import GovernmentRegistry
 from logger import Logger
 from tag_policy_engine import interpret_tags as interpret_policy_tags
@@ -231,11 +232,7 @@ class GovernmentLawEngine:
 
     @staticmethod
     def _stable_seed(base: int, *parts: str) -> int:
-        value = base
-        for part in parts:
-            for char in part:
-                value = (value * 31 + ord(char)) % (2**32)
-        return value
+        return polynomial_seed(base, *parts)
 
     @staticmethod
     def _government_base_risk(government: object) -> RiskTier:
@@ -1,7 +1,7 @@
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from government_type import GovernmentType
 
@@ -14,6 +14,10 @@ class GovernmentRegistry:
     @classmethod
     def from_file(cls, path: Path) -> "GovernmentRegistry":
         data = json.loads(path.read_text(encoding="utf-8"), strict=False)
+        return cls.from_payload(data)
+
+    @classmethod
+    def from_payload(cls, data: Dict[str, Any]) -> "GovernmentRegistry":
         governments = data.get("governments", [])
         registry: Dict[str, GovernmentType] = {}
         government_ids: List[str] = []
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from typing import Mapping
+
 try:
-    from data_loader import load_hulls, load_modules
+    from data_bundle import get_data_bundle
     from ship_assembler import assemble_ship, compute_hull_max_from_ship_state
     from ship_entity import ShipEntity
     from market_pricing import price_hull_transaction, price_module_transaction
 except ModuleNotFoundError:
-    from src.data_loader import load_hulls, load_modules
+    from src.data_bundle import get_data_bundle
     from src.ship_assembler import assemble_ship, compute_hull_max_from_ship_state
     from src.ship_entity import ShipEntity
     from src.market_pricing import price_hull_transaction, price_module_transaction
@@ -163,12 +165,12 @@ def _ship_present_at_destination(ship, player, destination_id: str | None = None
     return ship_destination_id == player_destination_id
 
 
-def _hull_by_id() -> dict[str, dict]:
-    return {entry["hull_id"]: entry for entry in load_hulls()["hulls"]}
+def _hull_by_id() -> Mapping[str, dict]:
+    return get_data_bundle().hulls_by_id
 
 
-def _module_by_id() -> dict[str, dict]:
-    return {entry["module_id"]: entry for entry in load_modules()["modules"]}
+def _module_by_id() -> Mapping[str, dict]:
+    return get_data_bundle().modules_by_id
 
 
 def _inventory_hull_price(inventory: dict, hull_id: str) -> int | None:
@@ -242,13 +244,7 @@ def execute_buy_hull(
     assembled = assemble_ship(hull_id, module_instances, degradation_state)
     
     # Extract hull data for crew_capacity and cargo base
-    from data_loader import load_hulls
-    hulls_data = load_hulls()
-    hull_data = None
-    for hull in hulls_data.get("hulls", []):
-        if hull.get("hull_id") == hull_id:
-            hull_data = hull
-            break
+    hull_data = _hull_by_id().get(hull_id)
     
     if hull_data is None:
         return {"ok": False, "reason": "hull_data_not_found"}
@@ -476,13 +472,7 @@ def execute_buy_module(
     ship.current_fuel = min(int(ship.current_fuel), int(ship.fuel_capacity))
     
     # Update cargo capacities: base from hull + module bonuses from assembler
-    from data_loader import load_hulls
-    hulls_data = load_hulls()
-    hull_data = None
-    for hull in hulls_data.get("hulls", []):
-        if hull.get("hull_id") == ship.model_id:
-            hull_data = hull
-            break
+    hull_data = _hull_by_id().get(ship.model_id)
     
     if hull_data:
         cargo_base = hull_data.get("cargo", {})
@@ -565,13 +555,7 @@ def execute_sell_module(
     ship.current_fuel = min(int(ship.current_fuel), int(ship.fuel_capacity))
     
     # Update cargo capacities: base from hull + module bonuses from assembler
-    from data_loader import load_hulls
-    hulls_data = load_hulls()
-    hull_data = None
-    for hull in hulls_data.get("hulls", []):
-        if hull.get("hull_id") == ship.model_id:
-            hull_data = hull
-            break
+    hull_data = _hull_by_id().get(ship.model_id)
     
     if hull_data:
         cargo_base = hull_data.get("cargo", {})
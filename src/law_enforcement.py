@@ -25,6 +25,11 @@ try:
 except ModuleNotFoundError:
     from src.crew_modifiers import compute_crew_modifiers
 
+try:
+    from deterministic_rng import polynomial_seed
+except ModuleNotFoundError:
+    from src.deterministic_rng import polynomial_seed
+
 from government_law_engine import GovernmentPolicyResult
 from government_type import GovernmentType
 from player_state import PlayerState
@@ -584,11 +589,8 @@ def _resolve_option(option: PlayerOption | None) -> PlayerOption:
 
 
 def _rng_for(world_seed: int, system_id: str, turn: int, checkpoint: str, action: str) -> random.Random:
-    token = f"{world_seed}:{system_id}:{turn}:{checkpoint}:{action}"
-    value = 0
-    for char in token:
-        value = (value * 31 + ord(char)) % (2**32)
-    return random.Random(value)
+    # Same hash as the "world_seed:system_id:turn:checkpoint:action" token, folded per part.
+    return random.Random(polynomial_seed(0, world_seed, ":", system_id, ":", turn, ":", checkpoint, ":", action))
 
 
 def _severity_index(sev: Severity) -> int:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
 
 
 @dataclass(frozen=True)
@@ -24,3 +24,41 @@ class Market:
     primary_economy: str
     secondary_economies: Tuple[str, ...]
     shipdock_price_multiplier: float = 1.0  # C) Deterministic +/-5% price variance for shipdock (locked per market)
+
+    def good_entry(self, sku: str) -> Tuple[MarketGood, str] | None:
+        """(good, role) for ``sku``; the first listing in category order, produced then consumed then neutral."""
+        return self._sku_index().get(sku)
+
+    def base_sku_index(self, catalog: Any) -> Dict[Tuple[str, str | None], Tuple[str, ...]]:
+        """Listed SKUs grouped by (good category, base SKU per ``catalog.resolve_variant_sku``), each group sorted."""
+        cached = self.__dict__.get("_base_sku_index")
+        if cached is None or cached[0] is not catalog:
+            grouped: Dict[Tuple[str, str | None], list[str]] = {}
+            for good, _ in self._sku_index().values():
+                key = (str(good.category), catalog.resolve_variant_sku(str(good.sku))[0])
+                grouped.setdefault(key, []).append(str(good.sku))
+            cached = (catalog, {key: tuple(sorted(skus)) for key, skus in grouped.items()})
+            object.__setattr__(self, "_base_sku_index", cached)
+        return cached[1]
+
+    def _sku_index(self) -> Dict[str, Tuple[MarketGood, str]]:
+        # Markets are immutable once created, so the index is built on first lookup and kept.
+        index = self.__dict__.get("_market_sku_index")
+        if index is None:
+            index = {}
+            for category in self.categories.values():
+                for role, goods in (
+                    ("produced", category.produced),
+                    ("consumed", category.consumed),
+                    ("neutral", category.neutral),
+                ):
+                    for good in goods:
+                        index.setdefault(good.sku, (good, role))
+            object.__setattr__(self, "_market_sku_index", index)
+        return index
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("_market_sku_index", None)
+        state.pop("_base_sku_index", None)
+        return state
@@ -0,0 +1,202 @@
+"""Market prices the player has seen, with best-known-price indexes per SKU.
+
+The store keeps the latest observation for each (action, destination, SKU):
+the unit price and the turn it was seen. For each (action, SKU) there is also a
+heap of (price, destination, turn) entries, min-first for buy prices and
+max-first for sell prices. Recording a new price pushes an entry and leaves the
+old one in place; a heap top that no longer matches the latest observation, or
+that is older than ``max_age_turns``, is popped on the next query. The best
+known price is therefore O(log n) amortised. Heaps that collect too many
+superseded entries are rebuilt from the observations.
+
+Heaps are derived data: they are rebuilt on demand and never serialized or
+pickled. to_dict() writes observations as
+{"max_age_turns": N, "buy": {destination_id: {sku: [price, turn]}}, "sell": {...}}.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+import heapq
+
+
+DEFAULT_MAX_AGE_TURNS = 30
+MARKET_ACTIONS = ("buy", "sell")
+# Rebuild a heap once superseded entries outnumber live ones by this much.
+_HEAP_SLACK = 16
+
+
+@dataclass(frozen=True)
+class MarketObservation:
+    sku_id: str
+    destination_id: str
+    action: str
+    unit_price: int
+    turn_observed: int
+
+
+class MarketObservationStore:
+    def __init__(self, max_age_turns: int = DEFAULT_MAX_AGE_TURNS) -> None:
+        if int(max_age_turns) < 0:
+            raise ValueError("max_age_turns must be non-negative.")
+        self.max_age_turns = int(max_age_turns)
+        # action -> destination_id -> sku -> (unit_price, turn_observed)
+        self._quotes: dict[str, dict[str, dict[str, tuple[int, int]]]] = {action: {} for action in MARKET_ACTIONS}
+        # (action, sku) -> number of destinations with a live observation
+        self._live: dict[tuple[str, str], int] = {}
+        self._heaps: dict[tuple[str, str], list[tuple[int, str, int]]] = {}
+
+    def __len__(self) -> int:
+        return sum(self._live.values())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MarketObservationStore):
+            return NotImplemented
+        return self.max_age_turns == other.max_age_turns and self._quotes == other._quotes
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_heaps"] = {}
+        return state
+
+    def record(self, destination_id: str, action: str, rows: Iterable[dict[str, Any]], *, turn: int) -> int:
+        """Record market list rows ({"sku_id", "unit_price"}) seen at ``destination_id``; returns rows kept."""
+        book = self._book(action).setdefault(str(destination_id), {})
+        recorded = 0
+        for row in rows:
+            sku_id = str(row.get("sku_id", "") or "")
+            unit_price = int(row.get("unit_price", 0) or 0)
+            if not sku_id or unit_price <= 0:
+                continue
+            key = (action, sku_id)
+            if sku_id not in book:
+                self._live[key] = self._live.get(key, 0) + 1
+            book[sku_id] = (unit_price, int(turn))
+            heap = self._heaps.get(key)
+            if heap is not None:
+                heapq.heappush(heap, (self._heap_price(action, unit_price), str(destination_id), int(turn)))
+                if len(heap) > 2 * self._live[key] + _HEAP_SLACK:
+                    del self._heaps[key]
+            recorded += 1
+        if not book:
+            del self._book(action)[str(destination_id)]
+        return recorded
+
+    def best_buy(self, sku_id: str, *, current_turn: int) -> MarketObservation | None:
+        """Cheapest fresh price seen for buying ``sku_id``."""
+        return self._best("buy", sku_id, current_turn)
+
+    def best_sell(self, sku_id: str, *, current_turn: int) -> MarketObservation | None:
+        """Highest fresh price seen for selling ``sku_id``."""
+        return self._best("sell", sku_id, current_turn)
+
+    def quote(self, destination_id: str, sku_id: str, action: str, *, current_turn: int) -> MarketObservation | None:
+        entry = self._book(action).get(destination_id, {}).get(sku_id)
+        if entry is None or self._is_stale(entry[1], current_turn):
+            return None
+        return MarketObservation(sku_id, destination_id, action, entry[0], entry[1])
+
+    def evict_stale(self, *, current_turn: int) -> int:
+        """Drop every observation older than ``max_age_turns``; returns how many were dropped."""
+        evicted = 0
+        for action, destinations in self._quotes.items():
+            for destination_id in list(destinations):
+                book = destinations[destination_id]
+                for sku_id in [sku for sku, (_, turn) in book.items() if self._is_stale(turn, current_turn)]:
+                    self._forget(action, destination_id, sku_id)
+                    evicted += 1
+        return evicted
+
+    def observations(self, *, current_turn: int) -> dict[str, dict[str, dict[str, int]]]:
+        """Fresh prices as destination_id -> sku -> {"buy", "sell"}, the find_trade_routes format."""
+        self.evict_stale(current_turn=current_turn)
+        merged: dict[str, dict[str, dict[str, int]]] = {}
+        for action in MARKET_ACTIONS:
+            for destination_id, book in self._quotes[action].items():
+                rows = merged.setdefault(destination_id, {})
+                for sku_id, (unit_price, _) in book.items():
+                    rows.setdefault(sku_id, {})[action] = unit_price
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"max_age_turns": self.max_age_turns}
+        for action in MARKET_ACTIONS:
+            payload[action] = {
+                destination_id: {sku_id: [price, turn] for sku_id, (price, turn) in sorted(book.items())}
+                for destination_id, book in sorted(self._quotes[action].items())
+            }
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "MarketObservationStore":
+        max_age_turns = payload.get("max_age_turns", DEFAULT_MAX_AGE_TURNS)
+        store = cls(int(max_age_turns) if isinstance(max_age_turns, (int, float)) else DEFAULT_MAX_AGE_TURNS)
+        for action in MARKET_ACTIONS:
+            destinations = payload.get(action)
+            if not isinstance(destinations, dict):
+                continue
+            for destination_id, book in destinations.items():
+                if not isinstance(destination_id, str) or not isinstance(book, dict):
+                    continue
+                for sku_id, entry in book.items():
+                    if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+                        continue
+                    store.record(destination_id, action, [{"sku_id": sku_id, "unit_price": entry[0]}], turn=int(entry[1]))
+        return store
+
+    def _best(self, action: str, sku_id: str, current_turn: int) -> MarketObservation | None:
+        heap = self._heap(action, sku_id)
+        book = self._quotes[action]
+        while heap:
+            heap_price, destination_id, turn = heap[0]
+            unit_price = self._heap_price(action, heap_price)
+            if book.get(destination_id, {}).get(sku_id) != (unit_price, turn):
+                heapq.heappop(heap)
+                continue
+            if self._is_stale(turn, current_turn):
+                heapq.heappop(heap)
+                self._forget(action, destination_id, sku_id)
+                continue
+            return MarketObservation(sku_id, destination_id, action, unit_price, turn)
+        return None
+
+    def _heap(self, action: str, sku_id: str) -> list[tuple[int, str, int]]:
+        key = (action, sku_id)
+        heap = self._heaps.get(key)
+        if heap is None:
+            heap = [
+                (self._heap_price(action, book[sku_id][0]), destination_id, book[sku_id][1])
+                for destination_id, book in self._book(action).items()
+                if sku_id in book
+            ]
+            heapq.heapify(heap)
+            if heap:
+                self._heaps[key] = heap
+        return heap
+
+    def _forget(self, action: str, destination_id: str, sku_id: str) -> None:
+        destinations = self._quotes[action]
+        book = destinations[destination_id]
+        del book[sku_id]
+        if not book:
+            del destinations[destination_id]
+        key = (action, sku_id)
+        self._live[key] -= 1
+        if not self._live[key]:
+            del self._live[key]
+            self._heaps.pop(key, None)
+
+    def _book(self, action: str) -> dict[str, dict[str, tuple[int, int]]]:
+        try:
+            return self._quotes[action]
+        except KeyError:
+            raise ValueError("action must be 'buy' or 'sell'.") from None
+
+    def _is_stale(self, turn: int, current_turn: int) -> bool:
+        return turn < int(current_turn) - self.max_age_turns
+
+    @staticmethod
+    def _heap_price(action: str, price: int) -> int:
+        # Sell heaps hold negated prices so the highest price is on top; negation is its own inverse.
+        return price if action == "buy" else -price
@@ -10,6 +10,11 @@ try:
 except ModuleNotFoundError:
     from src.crew_modifiers import compute_crew_modifiers
 
+try:
+    from deterministic_rng import polynomial_seed
+except ModuleNotFoundError:
+    from src.deterministic_rng import polynomial_seed
+
 from data_catalog import DataCatalog, Good
 from government_law_engine import GovernmentPolicyResult, LegalityStatus, RiskTier
 from government_type import GovernmentType
@@ -224,28 +229,24 @@ def price_transaction(
     return result
 
 
+# Both draws depend only on their arguments, so each key seeds a Mersenne Twister once per process.
+@lru_cache(maxsize=65536)
 def resolve_substitute_discount(world_seed: int, system_id: str, sku: str) -> float:
     rng = random.Random(_stable_seed(world_seed, system_id, sku))
     return rng.uniform(SUBSTITUTE_DISCOUNT_MIN, SUBSTITUTE_DISCOUNT_MAX)
 
 
+@lru_cache(maxsize=65536)
 def _resolve_market_variance(world_seed: int, system_id: str, destination_id: str) -> float:
     rng = random.Random(_stable_seed(world_seed, system_id, destination_id, "market_variance"))
     return 1.0 + rng.uniform(-0.05, 0.05)
 
 
 def _find_market_good(market: Market, sku: str) -> tuple[MarketGood | None, str]:
-    for category in market.categories.values():
-        for good in category.produced:
-            if good.sku == sku:
-                return good, "produced"
-        for good in category.consumed:
-            if good.sku == sku:
-                return good, "consumed"
-        for good in category.neutral:
-            if good.sku == sku:
-                return good, "neutral"
-    return None, ""
+    entry = market.good_entry(sku)
+    if entry is None:
+        return None, ""
+    return entry
 
 
 def _resolved_tags(good: Good, market_good: MarketGood | None) -> List[str]:
@@ -274,11 +275,7 @@ def _ideal_price_without_substitute(
 
 
 def _stable_seed(world_seed: int, *parts: str) -> int:
-    value = world_seed
-    for part in parts:
-        for char in part:
-            value = (value * 31 + ord(char)) % (2**32)
-    return value
+    return polynomial_seed(world_seed, *parts)
 
 
 def _clamp(value: float, minimum: float, maximum: float) -> float:
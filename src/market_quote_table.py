@@ -0,0 +1,55 @@
+"""Market quotes for one (destination, action), computed once per pricing context.
+
+A quote depends on the destination's market, the system's government, the turn
+(legality policies take it), the world-state goods modifiers and the active
+ship's crew. MarketQuoteKey holds exactly those, with the crew stood in for by
+the active ship id and its ShipEntity.crew_version, so a table stays valid
+until one of them changes and a cache hit never recomputes crew modifiers.
+GameEngine keeps one table per (destination, action) and replaces it when the
+key moves on.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class MarketQuoteKey:
+    destination_id: str
+    action: str
+    government_id: str
+    turn: int
+    # WorldStateEngine.modifier_version, or None without a world-state engine.
+    modifier_version: int | None
+    # Active ship id and its crew_version, or None without an active ship.
+    ship_id: str | None
+    crew_version: int | None
+
+
+class MarketQuoteTable:
+    def __init__(self, key: MarketQuoteKey) -> None:
+        self.key = key
+        self._quotes: dict[str, dict[str, Any] | None] = {}
+        self._display_names: dict[str, str] = {}
+        # Rows of the destination's own goods, sorted by SKU; built on first listing.
+        self.market_rows: list[dict[str, Any]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def quote(self, sku: str, compute: Callable[[str], dict[str, Any] | None]) -> dict[str, Any] | None:
+        """The quote for ``sku`` (None when it cannot be traded here), computing it on first request."""
+        try:
+            return self._quotes[sku]
+        except KeyError:
+            quote = self._quotes[sku] = compute(sku)
+            return quote
+
+    def display_name(self, sku: str, compute: Callable[[str], str]) -> str:
+        try:
+            return self._display_names[sku]
+        except KeyError:
+            name = self._display_names[sku] = compute(sku)
+            return name
@@ -1,11 +1,15 @@
 """Mining resolution (Phase 7.12). Deterministic, consumes 1 day and 1 fuel. Uses harvestable flag and category weighting."""
 from __future__ import annotations
 
-import hashlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    from deterministic_rng import sha256_prefix_int
+except ModuleNotFoundError:
+    from src.deterministic_rng import sha256_prefix_int
+
 
 # Category weights for mining: ORE most common, METAL least common. Only these categories are mined.
 MINING_CATEGORY_WEIGHTS = {
@@ -41,9 +45,7 @@ class MiningResult:
 def _deterministic_int_mod(seed_string: str, modulus: int) -> int:
     if modulus <= 0:
         return 0
-    digest = hashlib.sha256(seed_string.encode("ascii")).digest()
-    value = int.from_bytes(digest[:8], byteorder="big", signed=False)
-    return value % modulus
+    return sha256_prefix_int(seed_string) % modulus
 
 
 def _yield_multiplier(attempt_index: int) -> float:
@@ -533,6 +533,50 @@ def evaluate_active_missions(
     return result
 
 
+def turn_ticks_until_mission_deadline(
+    *,
+    mission_manager: "MissionManager",
+    player_state: PlayerState,
+) -> int | None:
+    """Turn ticks until the first active mission expires (1 = the next tick), or None without deadlines."""
+    ticks = None
+    for mission_id in player_state.active_missions:
+        mission = mission_manager.missions.get(mission_id)
+        if mission is None or mission.mission_state != MissionState.ACTIVE:
+            continue
+        days_remaining = mission.persistent_state.get("days_remaining")
+        if days_remaining is None:
+            continue
+        # evaluate_active_missions fails a mission on the tick that takes days_remaining to <= 0.
+        expires_in = max(1, int(days_remaining))
+        ticks = expires_in if ticks is None else min(ticks, expires_in)
+    return ticks
+
+
+def count_down_mission_deadlines(
+    *,
+    mission_manager: "MissionManager",
+    player_state: PlayerState,
+    ticks: int,
+) -> None:
+    """Apply ``ticks`` turn ticks to active mission deadlines without re-evaluating objectives.
+
+    Equivalent to that many turn_tick evaluate_active_missions calls while no deadline is reached
+    and nothing the objectives check (location, cargo) changes; time skips use it between a turn
+    tick that was evaluated in full and the next deadline.
+    """
+    deadline = turn_ticks_until_mission_deadline(mission_manager=mission_manager, player_state=player_state)
+    if deadline is not None and ticks >= deadline:
+        raise ValueError("count_down_mission_deadlines cannot pass a mission deadline.")
+    for mission_id in player_state.active_missions:
+        mission = mission_manager.missions.get(mission_id)
+        if mission is None or mission.mission_state != MissionState.ACTIVE:
+            continue
+        days_remaining = mission.persistent_state.get("days_remaining")
+        if days_remaining is not None:
+            mission.persistent_state["days_remaining"] = days_remaining - ticks
+
+
 def _calculate_mission_credit_reward(
     mission: MissionEntity,
     reward_profiles: Dict[str, Any],
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import hashlib
 import random
 from typing import Any
 
 try:
-    from data_loader import load_hulls, load_modules
+    from deterministic_rng import sha256_prefix_int
+except ModuleNotFoundError:
+    from src.deterministic_rng import sha256_prefix_int
+
+try:
+    from data_bundle import get_data_bundle
     from ship_assembler import assemble_ship, compute_hull_max_from_ship_state, get_slot_distribution
 except ModuleNotFoundError:
-    from src.data_loader import load_hulls, load_modules
+    from src.data_bundle import get_data_bundle
     from src.ship_assembler import assemble_ship, compute_hull_max_from_ship_state, get_slot_distribution
 
 
@@ -56,8 +60,7 @@ SECONDARY_DISTRIBUTION = [
 
 def _rng_for_stream(world_seed: int, system_id: str, encounter_id: str, stream_name: str) -> random.Random:
     seed_string = f"{world_seed}|{system_id}|{encounter_id}|{stream_name}"
-    digest = hashlib.sha256(seed_string.encode("ascii")).hexdigest()
-    return random.Random(int(digest[:16], 16))
+    return random.Random(sha256_prefix_int(seed_string))
 
 
 def _weighted_choice(items: list[Any], weights: list[float], rng: random.Random) -> Any:
@@ -75,12 +78,13 @@ def _weighted_choice(items: list[Any], weights: list[float], rng: random.Random)
     return items[-1]
 
 
-def _hulls() -> list[dict[str, Any]]:
-    return load_hulls()["hulls"]
+# Read-only use of the shared bundle entries; load_hulls()/load_modules() would copy them per ship.
+def _hulls() -> tuple[dict[str, Any], ...]:
+    return get_data_bundle().hulls
 
 
-def _modules() -> list[dict[str, Any]]:
-    return load_modules()["modules"]
+def _modules() -> tuple[dict[str, Any], ...]:
+    return get_data_bundle().modules
 
 
 def _frame_weights_for_subtype(encounter_subtype: str) -> dict[str, int]:
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from market_observations import MarketObservationStore
+
 
 @dataclass
 class PlayerState:
@@ -36,6 +38,8 @@ class PlayerState:
     # Knowledge-state snapshots (system/destination fog-of-war)
     known_systems: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     known_destinations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Market prices seen in buy/sell lists, indexed for best-known-price queries
+    market_observations: MarketObservationStore = field(default_factory=MarketObservationStore)
     
     # Salvage modules from combat (stored until installed via shipdock)
     salvage_modules: List[Dict[str, Any]] = field(default_factory=list)
@@ -157,6 +161,11 @@ class PlayerState:
                 continue
             normalized_known_destinations[destination_id] = dict(snapshot)
         state.known_destinations = normalized_known_destinations
+        raw_market_observations = getattr(state, "market_observations", None)
+        if isinstance(raw_market_observations, dict):
+            state.market_observations = MarketObservationStore.from_dict(raw_market_observations)
+        elif not isinstance(raw_market_observations, MarketObservationStore):
+            state.market_observations = MarketObservationStore()
         # Phase 7.12: exploration/mining dicts; normalize to dict[str, int]
         for key in ("exploration_progress", "exploration_attempts", "mining_attempts"):
             raw = getattr(state, key, None)
@@ -202,6 +211,7 @@ class PlayerState:
             "visited_destination_ids": sorted(self.visited_destination_ids),
             "known_systems": {str(k): dict(v) for k, v in self.known_systems.items()},
             "known_destinations": {str(k): dict(v) for k, v in self.known_destinations.items()},
+            "market_observations": self.market_observations.to_dict(),
             "exploration_progress": dict(self.exploration_progress) if hasattr(self, "exploration_progress") else {},
             "exploration_attempts": dict(self.exploration_attempts) if hasattr(self, "exploration_attempts") else {},
             "mining_attempts": dict(self.mining_attempts) if hasattr(self, "mining_attempts") else {},
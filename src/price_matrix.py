@@ -0,0 +1,276 @@
+"""Galaxy-wide goods prices: every destination market by every SKU in one pass.
+
+compute_price_matrix() gives the unit price GameEngine._market_price_quote would
+quote at each destination for each catalog SKU and each variant a market can
+list, as if the player stood there on the current turn with the active ship.
+Everything that does not depend on the cell's final arithmetic is resolved once
+and stored in flat row-major arrays (base price, role multiplier, substitute
+factor, tag factor, world-state factors, variance); the price loop then applies
+them in the scalar path's order, so every price matches it exactly.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any
+
+from crew_modifiers import compute_crew_modifiers
+from government_law_engine import Commodity, LegalityStatus, RiskTier
+from market_pricing import (
+    CATEGORY_ROLE_MULT,
+    _category_role,
+    _goods_pricing_modifiers,
+    _resolve_market_variance,
+    resolve_substitute_discount,
+)
+from time_engine import get_current_turn
+
+
+LEGALITY_STATES = tuple(LegalityStatus)
+RISK_TIERS = tuple(RiskTier)
+_LEGALITY_INDEX = {status: index for index, status in enumerate(LEGALITY_STATES)}
+_RISK_INDEX = {tier: index for index, tier in enumerate(RISK_TIERS)}
+
+
+@dataclass
+class PriceMatrix:
+    """Prices laid out row-major: cell ``d * len(skus) + s`` is destination ``d``, SKU ``s``.
+
+    Cells the destination cannot quote have ``tradeable`` 0 and price 0. ``legality``
+    and ``risk`` hold indexes into LEGALITY_STATES and RISK_TIERS.
+    """
+
+    action: str
+    turn: int
+    destination_ids: tuple[str, ...]
+    system_ids: tuple[str, ...]
+    skus: tuple[str, ...]
+    prices: array
+    tradeable: bytearray
+    legality: bytearray
+    risk: bytearray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.destination_ids), len(self.skus)
+
+    def index(self, destination_id: str, sku: str) -> int:
+        try:
+            row = self.destination_ids.index(destination_id)
+        except ValueError:
+            raise ValueError(f"Unknown destination_id: {destination_id}") from None
+        try:
+            column = self.skus.index(sku)
+        except ValueError:
+            raise ValueError(f"Unknown sku: {sku}") from None
+        return row * len(self.skus) + column
+
+    def price(self, destination_id: str, sku: str) -> int | None:
+        cell = self.index(destination_id, sku)
+        return int(self.prices[cell]) if self.tradeable[cell] else None
+
+    def row(self, destination_id: str) -> dict[str, int]:
+        """Tradeable SKUs at ``destination_id`` and their unit prices."""
+        start = self.index(destination_id, self.skus[0]) if self.skus else 0
+        return {
+            sku: int(self.prices[start + column])
+            for column, sku in enumerate(self.skus)
+            if self.tradeable[start + column]
+        }
+
+    def legality_mask(self, status: LegalityStatus | str) -> bytearray:
+        """1 where the cell is tradeable with legality ``status``."""
+        code = _LEGALITY_INDEX[LegalityStatus(status)]
+        return bytearray(
+            1 if tradeable and legality == code else 0 for tradeable, legality in zip(self.tradeable, self.legality)
+        )
+
+    def risk_mask(self, tier: RiskTier | str) -> bytearray:
+        """1 where the cell is tradeable at risk ``tier``."""
+        code = _RISK_INDEX[RiskTier(tier)]
+        return bytearray(1 if tradeable and risk == code else 0 for tradeable, risk in zip(self.tradeable, self.risk))
+
+
+def compute_price_matrix(engine: Any, action: str) -> PriceMatrix:
+    """Quote every SKU at every destination market for ``action`` ("buy" or "sell")."""
+    if action not in {"buy", "sell"}:
+        raise ValueError("action must be 'buy' or 'sell'.")
+    catalog_goods = {good.sku: good for good in engine.catalog.goods}
+    skus = sorted(
+        set(catalog_goods)
+        | {f"{good.possible_tag}_{good.sku}" for good in catalog_goods.values() if good.possible_tag}
+    )
+    destinations = [
+        (system, destination)
+        for system in engine.sector.systems
+        for destination in sorted(system.destinations, key=lambda entry: entry.destination_id)
+        if destination.market is not None
+    ]
+    turn = int(get_current_turn(engine.time_context))
+    world_state_engine = engine._world_state_engine()
+    ship = engine.fleet_by_id.get(engine.player_state.active_ship_id)
+    crew_multiplier = 1.0
+    if ship is not None:
+        crew_mods = compute_crew_modifiers(ship)
+        crew_multiplier = float(crew_mods.buy_multiplier if action == "buy" else crew_mods.sell_multiplier)
+
+    # What each SKU resolves to in the catalog does not depend on the market.
+    columns = []
+    for sku in skus:
+        base_sku, inferred_variant_tags = engine.catalog.resolve_variant_sku(sku)
+        catalog_good = catalog_goods.get(base_sku) if isinstance(base_sku, str) else None
+        sold_tags = None
+        if catalog_good is not None:
+            tags = list(catalog_good.tags)
+            for variant_tag in inferred_variant_tags:
+                if variant_tag not in tags:
+                    tags.append(variant_tag)
+            sold_tags = tuple(tags)
+        columns.append((sku, base_sku, catalog_good, sold_tags))
+
+    tag_factors: dict[tuple[str, ...], float] = {}
+    policies: dict[tuple[str, str, frozenset[str]], Any] = {}
+
+    cells = len(destinations) * len(skus)
+    base = array("d", bytes(8 * cells))
+    role = array("d", bytes(8 * cells))
+    substitute = array("d", bytes(8 * cells))
+    tag = array("d", bytes(8 * cells))
+    availability = array("d", bytes(8 * cells))
+    demand = array("d", bytes(8 * cells))
+    bias = array("d", bytes(8 * cells))
+    variance = array("d", bytes(8 * cells))
+    tradeable = bytearray(cells)
+    legality = bytearray(cells)
+    risk = bytearray(cells)
+
+    cell = 0
+    for system, destination in destinations:
+        market = destination.market
+        system_id = system.system_id
+        government = engine.government_registry.get_government(system.government_id)
+        destination_variance = _resolve_market_variance(engine.world_seed, system_id, destination.destination_id)
+
+        row: list[tuple[int, str, tuple[str, ...], bool | None]] = []
+        base_sku_index = market.base_sku_index(engine.catalog)
+        for column in columns:
+            inputs = _quote_inputs(market, base_sku_index, *column)
+            if inputs is not None:
+                row.append((cell, column[0]) + inputs)
+            cell += 1
+
+        pricing_goods: dict[str, Any] = {}
+        for _, _, _, pricing_sku, _ in row:
+            if pricing_sku not in pricing_goods:
+                pricing_goods[pricing_sku] = catalog_goods.get(pricing_sku) or market.good_entry(pricing_sku)[0]
+        world_state = {}
+        if world_state_engine is not None and system_id:
+            world_state = world_state_engine.resolve_modifiers_for_entities(
+                system_id=system_id,
+                domain="goods",
+                entity_views=[
+                    {"entity_id": good.sku, "category_id": good.category, "tags": list(good.tags)}
+                    for good in pricing_goods.values()
+                ],
+            ).get("resolved", {})
+
+        for index, sku, sold_tags, pricing_sku, substitute_override in row:
+            pricing_good = pricing_goods[pricing_sku]
+            market_entry = market.good_entry(pricing_sku)
+            market_good = market_entry[0] if market_entry is not None else None
+            try:
+                category_role = _category_role(market, pricing_good.category)
+            except ValueError:
+                continue
+            is_substitute = market_good is None
+            if isinstance(substitute_override, bool):
+                is_substitute = substitute_override
+
+            factor = tag_factors.get(sold_tags)
+            if factor is None:
+                modifiers = _goods_pricing_modifiers()
+                interpreted = [entry for entry in sold_tags if entry in modifiers]
+                factor = tag_factors[sold_tags] = 1.0 + sum(modifiers.get(entry, 0.0) for entry in interpreted)
+
+            policy_key = (government.id, sku, frozenset(sold_tags))
+            policy = policies.get(policy_key)
+            if policy is None:
+                policy = policies[policy_key] = engine._law_engine.evaluate_policy(
+                    government_id=government.id,
+                    commodity=Commodity(commodity_id=sku, tags=set(sold_tags)),
+                    action=action,
+                    turn=turn,
+                )
+
+            modifiers_row = world_state.get(pricing_good.sku, {})
+            base[index] = float(market_good.base_price if market_good is not None else pricing_good.base_price)
+            role[index] = CATEGORY_ROLE_MULT[category_role]
+            substitute[index] = (
+                1.0 + resolve_substitute_discount(engine.world_seed, system_id, pricing_sku) if is_substitute else 1.0
+            )
+            tag[index] = factor
+            availability[index] = 1.0 + float(int(modifiers_row.get("availability_delta", 0)))
+            demand[index] = 1.0 + (float(int(modifiers_row.get("demand_bias_percent", 0))) / 100.0)
+            bias[index] = 1.0 + float(int(modifiers_row.get("price_bias_percent", 0))) / 100.0
+            variance[index] = destination_variance
+            tradeable[index] = 1 if ship is not None else 0
+            legality[index] = _LEGALITY_INDEX[policy.legality_state]
+            risk[index] = _RISK_INDEX[policy.risk_tier]
+
+    prices = array("q", bytes(8 * cells))
+    for index in range(cells):
+        if not tradeable[index]:
+            continue
+        base_price = base[index]
+        # Same multiplication order as price_transaction; factors that are exactly 1.0
+        # there (scarcity, government bias) are left out since they cannot change the result.
+        price = base_price * role[index]
+        price *= substitute[index]
+        price *= tag[index]
+        price *= availability[index]
+        price *= demand[index]
+        price *= bias[index]
+        price *= variance[index]
+        final_multiplier = 0.0 if base_price == 0 else (price / base_price)
+        price = base_price * max(0.0, final_multiplier)
+        if crew_multiplier != 1.0:
+            price = round(price * crew_multiplier)
+        prices[index] = int(round(float(price)))
+
+    return PriceMatrix(
+        action=action,
+        turn=turn,
+        destination_ids=tuple(destination.destination_id for _, destination in destinations),
+        system_ids=tuple(system.system_id for system, _ in destinations),
+        skus=tuple(skus),
+        prices=prices,
+        tradeable=tradeable,
+        legality=legality,
+        risk=risk,
+    )
+
+
+def _quote_inputs(
+    market: Any,
+    base_sku_index: dict[tuple[str, str | None], tuple[str, ...]],
+    sku: str,
+    base_sku: str | None,
+    catalog_good: Any,
+    catalog_tags: tuple[str, ...] | None,
+) -> tuple[tuple[str, ...], str, bool | None] | None:
+    """(tags the SKU is sold with, SKU it is priced as, substitute override), as GameEngine._market_price_quote resolves them."""
+    exact = market.good_entry(sku)
+    if exact is not None:
+        if str(getattr(exact[0], "category", "")) not in market.categories:
+            return None
+        return tuple(getattr(exact[0], "tags", ()) or ()), sku, None
+    if catalog_good is None:
+        return None
+    category = str(catalog_good.category)
+    if category not in market.categories:
+        return None
+    near_matches = base_sku_index.get((category, base_sku))
+    if near_matches:
+        return catalog_tags, near_matches[0], False
+    return catalog_tags, base_sku, True
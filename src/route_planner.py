@@ -0,0 +1,474 @@
+"""Fuel-aware route planning over the starlane graph.
+
+Hops follow starlanes (System.neighbors) and are ordinary warps: a hop of d
+light-years takes max(1, ceil(d)) days, burns the same amount of fuel, and
+needs at least that much fuel on board. Systems with a datanet destination can
+refuel to capacity, which costs no days.
+
+Each usable-hop set (the hops a tank can fly) gets one landmark table, built
+up front with the planner for the capacities it is given and on first use for
+others: the connected components of that hop set plus exact fuel-free day
+counts from a few dozen far-apart landmark systems. By the triangle inequality
+|d(L, v) - d(L, target)| never overestimates the days from v to the target, so
+the landmarks give an A* bound for any target without a per-target table.
+
+A plan first runs a fuel-free A* from the target back to the origin. That gives
+the fuel-free day count and exact days-to-target for every system a shortest
+route can pass through. The plan itself is then an A* over (system, fuel) states
+ordered by (days, refuel stops), using those exact values as its bound and the
+fuel-free shortest route, if it can be flown, as a cap. Straight-line distance
+rows and whole plans are memoized. Refuel points are looked up per system on
+first need, so planning over a lazy sector only generates the systems a search
+reaches.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
+import bisect
+import heapq
+import math
+
+try:
+    from interaction_resolvers import destination_has_datanet_service
+except ModuleNotFoundError:
+    from src.interaction_resolvers import destination_has_datanet_service
+
+
+DEFAULT_PLAN_MEMO_SIZE = 4096
+DEFAULT_DISTANCE_MEMO_SIZE = 256
+DEFAULT_LANDMARK_COUNT = 32
+# Landmarks consulted per query: those giving the largest bound between origin and target.
+ACTIVE_LANDMARKS = 3
+
+_UNREACHABLE = math.inf
+
+
+@dataclass(frozen=True)
+class RouteLeg:
+    from_system_id: str
+    to_system_id: str
+    distance_ly: float
+    days: int
+    fuel_cost: int
+    # Refuel at this destination of from_system_id before departing; None when no stop is needed.
+    refuel_destination_id: str | None = None
+    # Fuel units bought there, topping the tank up to capacity.
+    refuel_units: int = 0
+
+
+@dataclass(frozen=True)
+class RoutePlan:
+    origin_system_id: str
+    target_system_id: str
+    legs: tuple[RouteLeg, ...]
+    total_days: int
+    total_fuel: int
+    refuel_stops: int
+    fuel_remaining: int
+    refuel_units: int = 0
+
+
+@dataclass(frozen=True)
+class _LandmarkTable:
+    # Per system: (neighbor slot, hop cost) for the hops in this hop set.
+    hops: list[tuple[tuple[int, int], ...]]
+    # Connected component of every system under this hop set.
+    component: list[int]
+    # Per landmark: its component and the fuel-free days from it to every system of that component.
+    landmarks: list[tuple[int, list[int]]]
+
+
+class RoutePlanner:
+    def __init__(
+        self,
+        systems: Iterable[Any],
+        *,
+        plan_memo_size: int = DEFAULT_PLAN_MEMO_SIZE,
+        distance_memo_size: int = DEFAULT_DISTANCE_MEMO_SIZE,
+        landmark_count: int = DEFAULT_LANDMARK_COUNT,
+        fuel_capacities: Iterable[int] = (),
+    ) -> None:
+        ordered = sorted(systems, key=lambda system: system.system_id)
+        self._ids = [system.system_id for system in ordered]
+        self._slot = {system_id: index for index, system_id in enumerate(self._ids)}
+        self._positions = [(float(system.x), float(system.y)) for system in ordered]
+        # Per system: (neighbor slot, distance_ly, hop cost); a hop costs the same in days and fuel.
+        self._adjacency: list[list[tuple[int, float, int]]] = []
+        for index, system in enumerate(ordered):
+            hops = []
+            for neighbor_id in sorted(set(system.neighbors)):
+                neighbor = self._slot.get(neighbor_id)
+                if neighbor is None or neighbor == index:
+                    continue
+                distance = self._distance(index, neighbor)
+                hops.append((neighbor, distance, max(1, int(math.ceil(distance)))))
+            self._adjacency.append(hops)
+        self._hop_costs = sorted({cost for hops in self._adjacency for _, _, cost in hops})
+        self._systems = ordered
+        # Filled per system on first need, so systems of a lazy sector are only generated
+        # when a search actually considers refuelling there.
+        self._refuel_destination: dict[int, str | None] = {}
+        self._landmark_count = max(0, int(landmark_count))
+        self._landmark_tables: dict[int, _LandmarkTable] = {}
+        self._distance_rows: OrderedDict[str, Mapping[str, float]] = OrderedDict()
+        self._distance_memo_size = max(0, int(distance_memo_size))
+        self._plans: OrderedDict[tuple[Any, ...], RoutePlan | None] = OrderedDict()
+        self._plan_memo_size = max(0, int(plan_memo_size))
+        for capacity in fuel_capacities:
+            self._landmarks(int(capacity))
+
+    def distance_ly(self, origin_system_id: str, target_system_id: str) -> float:
+        return self.distances_from(origin_system_id)[target_system_id]
+
+    def distances_from(self, origin_system_id: str) -> Mapping[str, float]:
+        """Straight-line distance from ``origin_system_id`` to every system, keyed in system_id order.
+
+        The returned mapping is a read-only view of a memoized row.
+        """
+        row = self._distance_rows.get(origin_system_id)
+        if row is not None:
+            self._distance_rows.move_to_end(origin_system_id)
+            return row
+        origin = self._require_slot(origin_system_id)
+        row = MappingProxyType(
+            {system_id: self._distance(origin, index) for index, system_id in enumerate(self._ids)}
+        )
+        if self._distance_memo_size:
+            self._distance_rows[origin_system_id] = row
+            if len(self._distance_rows) > self._distance_memo_size:
+                self._distance_rows.popitem(last=False)
+        return row
+
+    def refuel_destination_id(self, system_id: str) -> str | None:
+        return self._refuel_at(self._require_slot(system_id))
+
+    def reachable(self, origin_system_id: str, target_system_id: str, *, fuel_capacity: int) -> bool:
+        """Whether hops within ``fuel_capacity`` connect the two systems, refuelling as needed."""
+        component = self._landmarks(int(fuel_capacity)).component
+        return component[self._require_slot(origin_system_id)] == component[self._require_slot(target_system_id)]
+
+    def min_days(self, origin_system_id: str, target_system_id: str, *, fuel_capacity: int) -> int | None:
+        """Fewest days between two systems ignoring fuel on board, using hops within ``fuel_capacity``."""
+        origin = self._require_slot(origin_system_id)
+        target = self._require_slot(target_system_id)
+        capacity = int(fuel_capacity)
+        component = self._landmarks(capacity).component
+        if component[origin] != component[target]:
+            return None
+        days, _, _ = self._fuel_free(origin, target, capacity, self._landmark_bound(target, origin, capacity))
+        return days
+
+    def plan(
+        self,
+        origin_system_id: str,
+        target_system_id: str,
+        *,
+        fuel: int,
+        fuel_capacity: int,
+        allow_refuel: bool = True,
+    ) -> RoutePlan | None:
+        """Fastest route by days (then fewest refuel stops), or None when the target is out of reach."""
+        key = (origin_system_id, target_system_id, int(fuel), int(fuel_capacity), bool(allow_refuel))
+        if key in self._plans:
+            self._plans.move_to_end(key)
+            return self._plans[key]
+        plan = self._search(
+            self._require_slot(origin_system_id),
+            self._require_slot(target_system_id),
+            fuel=int(fuel),
+            capacity=int(fuel_capacity),
+            allow_refuel=bool(allow_refuel),
+        )
+        if self._plan_memo_size:
+            self._plans[key] = plan
+            if len(self._plans) > self._plan_memo_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def _search(self, origin: int, target: int, *, fuel: int, capacity: int, allow_refuel: bool) -> RoutePlan | None:
+        table = self._landmarks(capacity)
+        if table.component[origin] != table.component[target]:
+            return None
+        hops = table.hops
+        to_origin = self._landmark_bound(target, origin, capacity)
+        fuel_free_days, settled, toward = self._fuel_free(origin, target, capacity, to_origin, exhaust=True)
+        if fuel_free_days is None:
+            return None
+        # Any flyable route caps the answer, so states whose bound exceeds it are never queued.
+        ceiling = self._descent_days(origin, target, toward, fuel=fuel, capacity=capacity, allow_refuel=allow_refuel)
+        to_target = self._landmark_bound(origin, target, capacity)
+        bounds: dict[int, int] = dict(settled)
+
+        def bound(slot: int) -> int:
+            # Exact for every system the fuel-free search settled. It settled all systems whose
+            # landmark bound through them is within fuel_free_days, so any other system is at
+            # least one day further from the target than that bound leaves room for.
+            value = bounds[slot] = max(to_target(slot), fuel_free_days + 1 - to_origin(slot))
+            return value
+
+        # Entries: (days + bound, refuel stops, -days, slot, fuel); a state is (slot, fuel).
+        # Both keys only grow along a route, so the first pop of the target is the best plan;
+        # preferring the deepest state among ties walks one route instead of widening across all.
+        start = (origin, fuel)
+        frontier = [(bounds[origin], 0, 0, origin, fuel)]
+        parents: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+        best: dict[tuple[int, int], tuple[int, int]] = {start: (0, 0)}
+        settled_fuel: dict[int, int] = {}
+        while frontier:
+            _, stops, negative_days, slot, on_board = heapq.heappop(frontier)
+            days = -negative_days
+            if best.get((slot, on_board)) != (days, stops):
+                continue
+            if slot == target:
+                return self._build_plan(parents, (slot, on_board), total_days=days, refuel_stops=stops)
+            # States pop in (days, stops) order per system, so one already settled with at least
+            # as much fuel dominates this one.
+            if settled_fuel.get(slot, -1) >= on_board:
+                continue
+            settled_fuel[slot] = on_board
+            moves: list[tuple[int, int, int, int, int]] = []
+            if allow_refuel and on_board < capacity and self._refuel_at(slot) is not None:
+                moves.append((slot, capacity, days, stops + 1, bounds[slot]))
+            for neighbor, cost in hops[slot]:
+                if cost <= on_board:
+                    next_bound = bounds.get(neighbor)
+                    if next_bound is None:
+                        next_bound = bound(neighbor)
+                    if days + cost + next_bound <= ceiling:
+                        moves.append((neighbor, min(on_board - cost, capacity), days + cost, stops, next_bound))
+            for next_slot, next_fuel, next_days, next_stops, next_bound in moves:
+                state = (next_slot, next_fuel)
+                known = best.get(state)
+                if known is not None and known <= (next_days, next_stops):
+                    continue
+                best[state] = (next_days, next_stops)
+                parents[state] = (slot, on_board)
+                heapq.heappush(frontier, (next_days + next_bound, next_stops, -next_days, next_slot, next_fuel))
+        return None
+
+    def _fuel_free(
+        self,
+        origin: int,
+        target: int,
+        capacity: int,
+        to_origin: Callable[[int], int],
+        *,
+        exhaust: bool = False,
+    ) -> tuple[int | None, dict[int, int], dict[int, int]]:
+        """
+        Fuel-free A* from ``target`` back to ``origin``, guided by landmark bounds to the origin.
+
+        Returns the day count (None when unreachable), the exact days to the target of every
+        settled system, and each system's next hop towards the target. With ``exhaust`` the
+        search goes on to settle every system whose bound through it ties the day count.
+        """
+        hops = self._landmarks(capacity).hops
+        tentative = {target: 0}
+        settled: dict[int, int] = {}
+        toward: dict[int, int] = {}
+        found: int | None = None
+        frontier = [(to_origin(target), 0, target)]
+        while frontier:
+            estimate, days, slot = heapq.heappop(frontier)
+            if found is not None and estimate > found:
+                break
+            if slot in settled or tentative[slot] != days:
+                continue
+            settled[slot] = days
+            if slot == origin:
+                found = days
+                if not exhaust:
+                    break
+                continue
+            for neighbor, cost in hops[slot]:
+                next_days = days + cost
+                if next_days < tentative.get(neighbor, _UNREACHABLE):
+                    tentative[neighbor] = next_days
+                    toward[neighbor] = slot
+                    heapq.heappush(frontier, (next_days + to_origin(neighbor), next_days, neighbor))
+        return found, settled, toward
+
+    def _landmark_bound(self, origin: int, target: int, capacity: int) -> Callable[[int], int]:
+        """Memoized landmark lower bound on the fuel-free days from any system to ``target``."""
+        table = self._landmarks(capacity)
+        rows = [row for landmark_component, row in table.landmarks if landmark_component == table.component[target]]
+        # The landmarks that separate origin and target the most bound the systems between them best.
+        rows.sort(key=lambda row: -abs(row[origin] - row[target]))
+        active = [(row, row[target]) for row in rows[:ACTIVE_LANDMARKS]]
+        bounds: dict[int, int] = {}
+
+        def landmark_bound(slot: int) -> int:
+            value = bounds.get(slot)
+            if value is None:
+                value = 0
+                for row, target_days in active:
+                    gap = abs(row[slot] - target_days)
+                    if gap > value:
+                        value = gap
+                bounds[slot] = value
+            return value
+
+        return landmark_bound
+
+    def _descent_days(
+        self,
+        origin: int,
+        target: int,
+        toward: dict[int, int],
+        *,
+        fuel: int,
+        capacity: int,
+        allow_refuel: bool,
+    ) -> float:
+        """Days along the fuel-free shortest path in ``toward``, topping up wherever possible; inf if it runs dry."""
+        days = 0
+        slot = origin
+        on_board = fuel
+        while slot != target:
+            next_slot = toward[slot]
+            cost = max(1, int(math.ceil(self._distance(slot, next_slot))))
+            # Refuelling takes no days, so a full tank at every stop is the best chance of flying it.
+            if allow_refuel and on_board < capacity and self._refuel_at(slot) is not None:
+                on_board = capacity
+            if cost > on_board:
+                return _UNREACHABLE
+            on_board -= cost
+            days += cost
+            slot = next_slot
+        return days
+
+    def _build_plan(
+        self,
+        parents: dict[tuple[int, int], tuple[int, int] | None],
+        final: tuple[int, int],
+        *,
+        total_days: int,
+        refuel_stops: int,
+    ) -> RoutePlan:
+        states = [final]
+        while parents[states[-1]] is not None:
+            states.append(parents[states[-1]])  # type: ignore[arg-type]
+        states.reverse()
+        legs: list[RouteLeg] = []
+        refuel_at: str | None = None
+        refuel_units = 0
+        for (slot, on_board), (next_slot, next_fuel) in zip(states, states[1:]):
+            if next_slot == slot:
+                refuel_at = self._refuel_at(slot)
+                refuel_units = next_fuel - on_board
+                continue
+            distance = self._distance(slot, next_slot)
+            cost = max(1, int(math.ceil(distance)))
+            legs.append(
+                RouteLeg(
+                    from_system_id=self._ids[slot],
+                    to_system_id=self._ids[next_slot],
+                    distance_ly=distance,
+                    days=cost,
+                    fuel_cost=cost,
+                    refuel_destination_id=refuel_at,
+                    refuel_units=refuel_units,
+                )
+            )
+            refuel_at = None
+            refuel_units = 0
+        return RoutePlan(
+            origin_system_id=self._ids[states[0][0]],
+            target_system_id=self._ids[final[0]],
+            legs=tuple(legs),
+            total_days=int(total_days),
+            total_fuel=sum(leg.fuel_cost for leg in legs),
+            refuel_stops=int(refuel_stops),
+            fuel_remaining=int(final[1]),
+            refuel_units=sum(leg.refuel_units for leg in legs),
+        )
+
+    def _landmarks(self, capacity: int) -> _LandmarkTable:
+        # Tables depend only on which hops fit the tank, so capacities that admit the same hops share one.
+        usable = bisect.bisect_right(self._hop_costs, capacity)
+        key = self._hop_costs[usable - 1] if usable else 0
+        table = self._landmark_tables.get(key)
+        if table is None:
+            table = self._landmark_tables[key] = self._build_landmarks(key)
+        return table
+
+    def _build_landmarks(self, capacity: int) -> _LandmarkTable:
+        count = len(self._ids)
+        hops = [
+            tuple((neighbor, cost) for neighbor, _, cost in self._adjacency[slot] if cost <= capacity)
+            for slot in range(count)
+        ]
+        component = [-1] * count
+        for start in range(count):
+            if component[start] != -1:
+                continue
+            component[start] = start
+            stack = [start]
+            while stack:
+                slot = stack.pop()
+                for neighbor, _ in hops[slot]:
+                    if component[neighbor] == -1:
+                        component[neighbor] = start
+                        stack.append(neighbor)
+        # Farthest-point selection: each landmark is the system farthest from those already chosen,
+        # so every multi-system component gets one before any component gets a second.
+        connected = [slot for slot in range(count) if hops[slot]]
+        nearest = dict.fromkeys(connected, _UNREACHABLE)
+        rows: list[tuple[int, list[float]]] = []
+        while nearest and len(rows) < self._landmark_count:
+            landmark = max(nearest, key=lambda slot: (nearest[slot], -slot))
+            if nearest[landmark] == 0:
+                break
+            row = _days_from(landmark, hops)
+            rows.append((component[landmark], row))
+            for slot in nearest:
+                if row[slot] < nearest[slot]:
+                    nearest[slot] = row[slot]
+        landmarks = [
+            (landmark_component, [-1 if days == _UNREACHABLE else int(days) for days in row])
+            for landmark_component, row in rows
+        ]
+        return _LandmarkTable(hops=hops, component=component, landmarks=landmarks)
+
+    def _refuel_at(self, slot: int) -> str | None:
+        if slot not in self._refuel_destination:
+            destinations = sorted(self._systems[slot].destinations, key=lambda row: row.destination_id)
+            self._refuel_destination[slot] = next(
+                (row.destination_id for row in destinations if destination_has_datanet_service(row)),
+                None,
+            )
+        return self._refuel_destination[slot]
+
+    def _distance(self, origin: int, target: int) -> float:
+        # Same expression as GameEngine._warp_distance_ly so ranges and day counts agree.
+        ox, oy = self._positions[origin]
+        tx, ty = self._positions[target]
+        dx = tx - ox
+        dy = ty - oy
+        return math.sqrt((dx * dx) + (dy * dy))
+
+    def _require_slot(self, system_id: str) -> int:
+        slot = self._slot.get(system_id)
+        if slot is None:
+            raise ValueError(f"Unknown system_id: {system_id}")
+        return slot
+
+
+def _days_from(origin: int, hops: list[tuple[tuple[int, int], ...]]) -> list[float]:
+    """Dijkstra: fewest days from ``origin`` to every system over ``hops`` (inf when unreachable)."""
+    row = [_UNREACHABLE] * len(hops)
+    row[origin] = 0
+    frontier = [(0, origin)]
+    while frontier:
+        days, slot = heapq.heappop(frontier)
+        if days > row[slot]:
+            continue
+        for neighbor, cost in hops[slot]:
+            if days + cost < row[neighbor]:
+                row[neighbor] = days + cost
+                heapq.heappush(frontier, (days + cost, neighbor))
+    return row
@@ -4,7 +4,6 @@ import argparse
 import contextlib
 import io
 import json
-import math
 import re
 import sys
 from datetime import datetime
@@ -22,7 +21,6 @@ if str(_src_dir) not in sys.path:
 
 from game_engine import GameEngine
 from logger import Logger, LogEntry
-from time_engine import get_current_turn
 from emoji_profile_builder import build_emoji_profile, build_emoji_profile_parts
 from types import SimpleNamespace
 
@@ -42,7 +40,7 @@ def _format_result(result: Dict[str, Any], action_type: str = "action") -> None:
     
     # Record action for Markdown
     if playtest_logger:
-        turn = get_current_turn()
+        turn = int(result.get("turn_after", 0) or 0)
         playtest_logger.record_action(turn, action_type, result)
     
     if verbose:
@@ -3847,13 +3845,11 @@ def main() -> None:
 
 def _reachable_systems(*, engine: GameEngine, current_system, fuel_limit: int) -> list[dict[str, object]]:
     rows: list[dict[str, object]] = []
-    for system in sorted(engine.sector.systems, key=lambda entry: entry.system_id):
-        if system.system_id == current_system.system_id:
+    for system_id, distance in engine.route_planner().distances_from(current_system.system_id).items():
+        if system_id == current_system.system_id:
             continue
-        dx = float(system.x) - float(current_system.x)
-        dy = float(system.y) - float(current_system.y)
-        distance = math.sqrt((dx * dx) + (dy * dy))
         if distance <= float(fuel_limit):
+            system = engine.sector.get_system(system_id)
             rows.append(
                 {
                     "system": system,
@@ -8,14 +8,18 @@ Design (Phase 7.10): Salvaged modules occupy physical cargo space the same as go
 from __future__ import annotations
 
 import copy
-import hashlib
 import random
-from typing import Any
+from typing import Any, Mapping
 
 try:
-    from data_loader import load_modules
+    from deterministic_rng import sha256_prefix_int
 except ModuleNotFoundError:
-    from src.data_loader import load_modules
+    from src.deterministic_rng import sha256_prefix_int
+
+try:
+    from data_bundle import get_data_bundle
+except ModuleNotFoundError:
+    from src.data_bundle import get_data_bundle
 
 
 SALVAGE_COUNT_WEIGHTS = {0: 50, 1: 40, 2: 10}
@@ -24,8 +28,7 @@ RARITY_FACTOR = {"common": 1.0, "uncommon": 2.0, "rare": 4.0, "unique": 8.0}
 
 def _rng_for_stream(world_seed: int | str, system_id: str, encounter_id: str, stream_name: str) -> random.Random:
     seed_string = f"{world_seed}|{system_id}|{encounter_id}|{stream_name}"
-    digest = hashlib.sha256(seed_string.encode("ascii")).hexdigest()
-    return random.Random(int(digest[:16], 16))
+    return random.Random(sha256_prefix_int(seed_string))
 
 
 def _weighted_choice(items: list[Any], weights: list[float], rng: random.Random) -> Any:
@@ -61,8 +64,8 @@ def _weighted_sample_without_replacement(
     return picked
 
 
-def _modules_by_id() -> dict[str, dict[str, Any]]:
-    return {entry["module_id"]: entry for entry in load_modules()["modules"]}
+def _modules_by_id() -> Mapping[str, dict[str, Any]]:
+    return get_data_bundle().modules_by_id
 
 
 def _secondary_set(module_instance: dict[str, Any]) -> set[str]:
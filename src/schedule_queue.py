@@ -0,0 +1,107 @@
+"""Pending world-state schedule entries, popped by day instead of rescanned.
+
+Entries are ScheduledEvent / ScheduledSituation records (anything with
+trigger_day, system_id and insertion_index). A heap keyed by
+(trigger_day, system_id, insertion_index, sequence) yields each day's due
+entries in the order WorldStateEngine has always run them, and an
+insertion-ordered dict keeps the pending list in scheduling order for callers
+that inspect it.
+
+Entries whose day has passed without being processed stay pending forever, as
+they did in the list-based schedule, but leave the heap so they are not
+revisited every day.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+import heapq
+
+
+class ScheduleQueue:
+    def __init__(self, entries: Iterable[Any] = ()) -> None:
+        self._heap: list[tuple[int, str, int, int, Any]] = []
+        # sequence -> entry, in scheduling order; holds every pending entry, including overdue ones.
+        self._pending: dict[int, Any] = {}
+        self._discarded: set[int] = set()
+        self._sequence = 0
+        self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._pending.values()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScheduleQueue):
+            return NotImplemented
+        return list(self._pending.values()) == list(other._pending.values())
+
+    def __repr__(self) -> str:
+        return f"ScheduleQueue({list(self._pending.values())!r})"
+
+    @property
+    def mark(self) -> int:
+        """Sequence number the next entry will get; pass it to discard_since()."""
+        return self._sequence
+
+    def entries(self) -> list[Any]:
+        return list(self._pending.values())
+
+    def push(self, entry: Any) -> None:
+        heapq.heappush(self._heap, self._admit(entry))
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        rows = [self._admit(entry) for entry in entries]
+        if not rows:
+            return
+        if len(rows) * 4 < len(self._heap):
+            for row in rows:
+                heapq.heappush(self._heap, row)
+        else:
+            self._heap.extend(rows)
+            heapq.heapify(self._heap)
+
+    def pop_due(self, day: int) -> list[Any]:
+        """Remove and return entries triggering on ``day``, ordered by (system_id, insertion_index)."""
+        heap = self._heap
+        due: list[Any] = []
+        while heap and heap[0][0] <= day:
+            trigger_day, _, _, sequence, entry = heapq.heappop(heap)
+            if sequence in self._discarded:
+                self._discarded.discard(sequence)
+                continue
+            if trigger_day < day:
+                # Missed its day: it stays listed as pending but can never come due again.
+                continue
+            del self._pending[sequence]
+            due.append(entry)
+        return due
+
+    def next_trigger_day(self, day: int) -> int | None:
+        """Earliest trigger_day on or after ``day``, or None; entries that missed their day are skipped."""
+        heap = self._heap
+        while heap and (heap[0][0] < day or heap[0][3] in self._discarded):
+            # Neither can come due again; pop_due() would drop them the same way.
+            self._discarded.discard(heapq.heappop(heap)[3])
+        return heap[0][0] if heap else None
+
+    def discard_since(self, mark: int) -> None:
+        """Drop entries scheduled at or after ``mark``."""
+        for sequence in reversed(list(self._pending)):
+            if sequence < mark:
+                break
+            del self._pending[sequence]
+            self._discarded.add(sequence)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._pending.clear()
+        self._discarded.clear()
+
+    def _admit(self, entry: Any) -> tuple[int, str, int, int, Any]:
+        sequence = self._sequence
+        self._sequence += 1
+        self._pending[sequence] = entry
+        return (int(entry.trigger_day), str(entry.system_id), int(entry.insertion_index), sequence, entry)
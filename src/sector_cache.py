@@ -0,0 +1,204 @@
+"""On-disk cache of generated sectors.
+
+World generation is deterministic in (seed, system_count, government ids, game
+data, generator code), so its output can be stored once and reloaded without
+re-running the RNG. Entries are keyed by a SHA-256 over those inputs,
+WORLD_GENERATOR_VERSION and the source of the generating modules
+(GENERATOR_SOURCES), so editing the generator retires old entries. They are stored as a small header (magic + format version)
+followed by a zlib-compressed pickle of the Galaxy tree. Lazy sectors (see
+WorldGenerator.generate) are cached too, as their unexpanded skeleton; the data
+catalog their systems generate from is stored as a reference and resolved
+against the bundle on load.
+
+The cache is an optimization only. Unreadable, corrupt or stale entries are
+ignored and regenerated, and write failures are swallowed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+import gc
+import hashlib
+import io
+import json
+import os
+import pickle
+import struct
+import zlib
+
+try:
+    from data_bundle import DataBundle, default_cache_dir, source_fingerprint
+    from data_catalog import DataCatalog
+    from world_generator import WORLD_GENERATOR_VERSION, Galaxy, System, WorldGenerator
+except ModuleNotFoundError:
+    from src.data_bundle import DataBundle, default_cache_dir, source_fingerprint
+    from src.data_catalog import DataCatalog
+    from src.world_generator import WORLD_GENERATOR_VERSION, Galaxy, System, WorldGenerator
+
+
+SECTOR_CACHE_MAGIC = b"ESEC"
+SECTOR_CACHE_FORMAT_VERSION = 1
+SECTOR_CACHE_COMPRESSION_LEVEL = 6
+
+# Modules whose code shapes a generated sector: generation itself, markets, and the pickled classes.
+GENERATOR_SOURCES = (
+    "economy_data.py",
+    "interaction_resolvers.py",
+    "market.py",
+    "market_creation.py",
+    "sector_index.py",
+    "spatial_index.py",
+    "world_generator.py",
+)
+
+_HEADER = struct.Struct(">4sH")
+_CATALOG_REFERENCE = "data_catalog"
+
+
+def sector_cache_key(
+    *,
+    seed: int,
+    system_count: int,
+    government_ids: Iterable[str],
+    bundle_hash: str,
+    lazy: bool = False,
+) -> str:
+    key_payload = {
+        "format": SECTOR_CACHE_FORMAT_VERSION,
+        "generator_version": WORLD_GENERATOR_VERSION,
+        "generator_source": _generator_fingerprint(),
+        "seed": int(seed),
+        "system_count": int(system_count),
+        "government_ids": list(government_ids),
+        "bundle_hash": bundle_hash,
+        # Modules imported as "src.world_generator" define distinct classes; keep their entries apart.
+        "module": System.__module__,
+    }
+    if lazy:
+        key_payload["lazy"] = True
+    encoded = json.dumps(key_payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _generator_fingerprint() -> str:
+    return source_fingerprint(GENERATOR_SOURCES)
+
+
+def load_or_generate_sector(
+    *,
+    seed: int,
+    system_count: int,
+    government_ids: list[str],
+    bundle: DataBundle,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+    lazy: bool = False,
+    workers: int = 1,
+) -> Galaxy:
+    """
+    Return the sector for these inputs, from the on-disk cache when possible.
+
+    ``workers`` only affects how a missing entry is generated, never its contents.
+    """
+    path = None
+    if use_cache:
+        key = sector_cache_key(
+            seed=seed,
+            system_count=system_count,
+            government_ids=government_ids,
+            bundle_hash=bundle.content_hash,
+            lazy=lazy,
+        )
+        path = sector_cache_path(key, cache_dir)
+        sector = _read_entry(path, catalog=bundle.catalog)
+        if sector is not None:
+            return sector
+    sector = WorldGenerator(
+        seed=seed,
+        system_count=system_count,
+        government_ids=government_ids,
+        catalog=bundle.catalog,
+        logger=None,
+    ).generate(lazy=lazy, workers=workers)
+    if path is not None:
+        _write_entry(path, sector, catalog=bundle.catalog)
+    return sector
+
+
+def sector_cache_path(key: str, cache_dir: Path | None = None) -> Path:
+    root = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    return root / f"sector-{key[:32]}.bin"
+
+
+def encode_sector(sector: Galaxy, *, catalog: DataCatalog | None = None) -> bytes:
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    if catalog is not None:
+        pickler.persistent_id = lambda obj: _CATALOG_REFERENCE if obj is catalog else None
+    pickler.dump(sector)
+    payload = buffer.getvalue()
+    return _HEADER.pack(SECTOR_CACHE_MAGIC, SECTOR_CACHE_FORMAT_VERSION) + zlib.compress(
+        payload, SECTOR_CACHE_COMPRESSION_LEVEL
+    )
+
+
+def decode_sector(blob: bytes, *, catalog: DataCatalog | None = None) -> Galaxy:
+    if len(blob) < _HEADER.size:
+        raise ValueError("Sector cache entry is truncated.")
+    magic, version = _HEADER.unpack_from(blob)
+    if magic != SECTOR_CACHE_MAGIC:
+        raise ValueError("Not a sector cache entry.")
+    if version != SECTOR_CACHE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported sector cache format version: {version}")
+    try:
+        raw = zlib.decompress(blob[_HEADER.size :])
+    except zlib.error as error:
+        raise ValueError("Sector cache entry is corrupt.") from error
+    # Unpickling allocates tens of thousands of small objects; collector passes over
+    # the half-built tree cost more than the load itself.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    unpickler = pickle.Unpickler(io.BytesIO(raw))
+    unpickler.persistent_load = lambda reference: _resolve_reference(reference, catalog)
+    try:
+        sector = unpickler.load()
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError) as error:
+        raise ValueError("Sector cache entry is corrupt.") from error
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    if not isinstance(sector, Galaxy):
+        raise ValueError("Sector cache entry is corrupt.")
+    return sector
+
+
+def _resolve_reference(reference: object, catalog: DataCatalog | None) -> DataCatalog:
+    if reference != _CATALOG_REFERENCE or catalog is None:
+        raise pickle.UnpicklingError(f"Unresolvable sector cache reference: {reference!r}")
+    return catalog
+
+
+def _read_entry(path: Path, *, catalog: DataCatalog | None = None) -> Galaxy | None:
+    try:
+        blob = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        return decode_sector(blob, catalog=catalog)
+    except ValueError:
+        return None
+
+
+def _write_entry(path: Path, sector: Galaxy, *, catalog: DataCatalog | None = None) -> None:
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(encode_sector(sector, catalog=catalog))
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+
@@ -0,0 +1,176 @@
+"""Id lookups over a sector's systems, destinations and locations.
+
+A SectorIndex records where each id lives (list positions), not the objects
+themselves. Lookups read the live object through that position and confirm its
+id, so systems swapped in place by world-state copy-on-write are always seen
+fresh. A miss falls back to the linear scan the sector used before; if the scan
+finds the id, the structure changed without going through replace_system and
+the index is rebuilt.
+
+Systems of a lazy sector that have not been generated yet (``materialized`` is
+False) contribute only their own id; indexing never forces generation. Their
+destination and location ids cannot be listed before generation, so a lookup
+that misses reads the owning system id off the requested id (destination ids
+are ``<system_id>-DST-NN`` and location ids extend them) and, if that system is
+still unexpanded, expands it and indexes its contents before giving up.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Destination ids are "<system_id>-DST-NN"; location ids append "-LOC-<type>" to those.
+_DESTINATION_MARKER = "-DST-"
+
+
+class SectorIndex:
+    def __init__(self, systems: list[Any]) -> None:
+        self._systems = systems
+        self.rebuild()
+
+    def covers(self, systems: list[Any]) -> bool:
+        return systems is self._systems
+
+    def rebuild(self) -> None:
+        self._system_slots: dict[str, int] = {}
+        # destination_id -> (system_id, position in system.destinations)
+        self._destination_slots: dict[str, tuple[str, int]] = {}
+        # location_id -> (destination_id, position in destination.locations)
+        self._location_slots: dict[str, tuple[str, int]] = {}
+        for slot, system in enumerate(self._systems):
+            self._index_system(slot, system)
+
+    def system(self, system_id: str) -> Any | None:
+        system = self._indexed_system(system_id)
+        if system is not None:
+            return system
+        for system in self._systems:
+            if getattr(system, "system_id", None) == system_id:
+                self.rebuild()
+                return system
+        return None
+
+    def destination(self, destination_id: str) -> Any | None:
+        destination = self._indexed_destination(destination_id)
+        if destination is not None:
+            return destination
+        for system in self._systems:
+            for destination in _destinations(system):
+                if getattr(destination, "destination_id", None) == destination_id:
+                    self.rebuild()
+                    return destination
+        if self._expand_owner(destination_id):
+            return self._indexed_destination(destination_id)
+        return None
+
+    def location(self, location_id: str) -> Any | None:
+        location = self._indexed_location(location_id)
+        if location is not None:
+            return location
+        for system in self._systems:
+            for destination in _destinations(system):
+                for location in _locations(destination):
+                    if getattr(location, "location_id", None) == location_id:
+                        self.rebuild()
+                        return location
+        if self._expand_owner(location_id):
+            return self._indexed_location(location_id)
+        return None
+
+    def system_for_destination(self, destination_id: str) -> Any | None:
+        if self.destination(destination_id) is None:
+            return None
+        return self.system(self._destination_slots[destination_id][0])
+
+    def destination_for_location(self, location_id: str) -> Any | None:
+        if self.location(location_id) is None:
+            return None
+        return self.destination(self._location_slots[location_id][0])
+
+    def replace_system(self, updated_system: Any) -> bool:
+        """Swap ``updated_system`` into the sector in place of the system with its id."""
+        system_id = getattr(updated_system, "system_id", None)
+        previous = self._indexed_system(system_id) if isinstance(system_id, str) else None
+        if previous is None:
+            slot = next(
+                (index for index, row in enumerate(self._systems) if getattr(row, "system_id", None) == system_id),
+                None,
+            )
+            if slot is None:
+                return False
+            self._systems[slot] = updated_system
+            self.rebuild()
+            return True
+        slot = self._system_slots[system_id]
+        self._systems[slot] = updated_system
+        for destination in _destinations(previous):
+            destination_id = getattr(destination, "destination_id", None)
+            if self._destination_slots.get(destination_id, ("",))[0] == system_id:
+                del self._destination_slots[destination_id]
+                for location in _locations(destination):
+                    location_id = getattr(location, "location_id", None)
+                    if self._location_slots.get(location_id, ("",))[0] == destination_id:
+                        del self._location_slots[location_id]
+        self._index_system(slot, updated_system)
+        return True
+
+    def _index_system(self, slot: int, system: Any) -> None:
+        system_id = getattr(system, "system_id", None)
+        # First occurrence wins, matching the linear scans this index replaces.
+        self._system_slots.setdefault(system_id, slot)
+        for destination_slot, destination in enumerate(_destinations(system)):
+            destination_id = getattr(destination, "destination_id", None)
+            self._destination_slots.setdefault(destination_id, (system_id, destination_slot))
+            for location_slot, location in enumerate(_locations(destination)):
+                self._location_slots.setdefault(
+                    getattr(location, "location_id", None), (destination_id, location_slot)
+                )
+
+    def _expand_owner(self, child_id: str) -> bool:
+        """Expand the unexpanded lazy system that ``child_id`` names, indexing its contents."""
+        system_id, marker, _ = str(child_id).partition(_DESTINATION_MARKER)
+        if not marker:
+            return False
+        system = self._indexed_system(system_id)
+        if system is None or getattr(system, "materialized", True):
+            return False
+        system.materialize()
+        self._index_system(self._system_slots[system_id], system)
+        return True
+
+    def _indexed_system(self, system_id: str) -> Any | None:
+        slot = self._system_slots.get(system_id)
+        if slot is None or slot >= len(self._systems):
+            return None
+        system = self._systems[slot]
+        return system if getattr(system, "system_id", None) == system_id else None
+
+    def _indexed_destination(self, destination_id: str) -> Any | None:
+        entry = self._destination_slots.get(destination_id)
+        if entry is None:
+            return None
+        destinations = _destinations(self._indexed_system(entry[0]))
+        if entry[1] >= len(destinations):
+            return None
+        destination = destinations[entry[1]]
+        return destination if getattr(destination, "destination_id", None) == destination_id else None
+
+    def _indexed_location(self, location_id: str) -> Any | None:
+        entry = self._location_slots.get(location_id)
+        if entry is None:
+            return None
+        locations = _locations(self._indexed_destination(entry[0]))
+        if entry[1] >= len(locations):
+            return None
+        location = locations[entry[1]]
+        return location if getattr(location, "location_id", None) == location_id else None
+
+
+def _destinations(system: Any) -> list[Any]:
+    if not getattr(system, "materialized", True):
+        return []
+    return getattr(system, "destinations", None) or []
+
+
+def _locations(destination: Any) -> list[Any]:
+    return getattr(destination, "locations", None) or []
@@ -81,6 +81,8 @@ class ShipEntity:
     condition_state: str = "operational"
     condition_emoji: str = "OP"
     crew: List[NPCEntity] = field(default_factory=list)
+    # Bumped by add_crew/remove_crew so callers can cache values derived from the crew.
+    crew_version: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.current_fuel is None:
@@ -148,9 +150,11 @@ class ShipEntity:
         if len(self.crew) >= self.crew_capacity:
             raise ValueError("Crew capacity exceeded.")
         self.crew.append(npc)
+        self.crew_version += 1
 
     def remove_crew(self, npc_id: str) -> None:
         self.crew = [member for member in self.crew if getattr(member, "npc_id", None) != npc_id]
+        self.crew_version += 1
 
     def get_total_daily_wages(self) -> int:
         return sum(int(member.daily_wage) for member in self.crew if isinstance(member, NPCEntity))
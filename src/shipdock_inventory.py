@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import hashlib
 import random
 from typing import Any
 
+try:
+    from deterministic_rng import sha256_prefix_int
+except ModuleNotFoundError:
+    from src.deterministic_rng import sha256_prefix_int
+
 try:
     from data_loader import load_hulls, load_modules
 except ModuleNotFoundError:
@@ -19,8 +23,7 @@ MODULE_RARE_CAP = {1: 0, 2: 0, 3: 1, 4: 2, 5: 3}
 
 def _seed_from_parts(world_seed: int, system_id: str, stream: str) -> int:
     token = repr((world_seed, system_id, stream))
-    digest = hashlib.sha256(token.encode("ascii")).hexdigest()
-    return int(digest[:16], 16)
+    return sha256_prefix_int(token)
 
 
 def _weighted_pick_index(weights: list[float], rng: random.Random) -> int:
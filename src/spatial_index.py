@@ -0,0 +1,212 @@
+"""Uniform grid over 2D points for nearest-first neighbor queries.
+
+Points are bucketed into square cells sized for a few points per cell. Queries
+scan cells ring by ring around a point's own cell; every point in ring r lies at
+least (r - 1) * cell_size away, so results can be emitted in exact
+(distance, id) order without visiting the rest of the grid.
+
+Distances use the same expression as the original all-pairs starlane builder,
+sqrt(dx * dx + dy * dy) with dx = b.x - a.x, so orderings (including ties
+broken by id) match it bit for bit.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Mapping
+import heapq
+import math
+
+
+DEFAULT_POINTS_PER_CELL = 2.0
+
+# Cell assignment rounds; shave ring bounds so a point never lands inside a bound it should exceed.
+_BOUND_MARGIN = 1e-9
+_CONE_COUNT = 6
+_CONE_SCALE = _CONE_COUNT / (2.0 * math.pi)
+# Relative gap required before cone pruning; keeps the triangle argument valid under float rounding.
+_CONE_SLACK = 1e-3
+
+_Entry = tuple[str, float, float]
+
+
+class PointGrid:
+    def __init__(
+        self,
+        points: Mapping[str, tuple[float, float]],
+        *,
+        points_per_cell: float = DEFAULT_POINTS_PER_CELL,
+    ) -> None:
+        if points_per_cell <= 0:
+            raise ValueError("points_per_cell must be positive.")
+        self._points = {point_id: (float(x), float(y)) for point_id, (x, y) in points.items()}
+        xs = [x for x, _ in self._points.values()] or [0.0]
+        ys = [y for _, y in self._points.values()] or [0.0]
+        self._min_x = min(xs)
+        self._min_y = min(ys)
+        width = max(xs) - self._min_x
+        height = max(ys) - self._min_y
+        area = width * height
+        if area <= 0.0:
+            area = max(width, height, 1.0) ** 2
+        self.cell_size = math.sqrt(area * points_per_cell / max(1, len(self._points)))
+        self._cells: dict[tuple[int, int], list[_Entry]] = {}
+        self._cell_by_id: dict[str, tuple[int, int]] = {}
+        for point_id in sorted(self._points):
+            x, y = self._points[point_id]
+            cell = self.cell_of(x, y)
+            self._cells.setdefault(cell, []).append((point_id, x, y))
+            self._cell_by_id[point_id] = cell
+        columns = [cell[0] for cell in self._cells] or [0]
+        rows = [cell[1] for cell in self._cells] or [0]
+        # Rings beyond the grid's widest extent contain no cells from any starting cell.
+        self.ring_limit = max(max(columns) - min(columns), max(rows) - min(rows))
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def position(self, point_id: str) -> tuple[float, float]:
+        return self._points[point_id]
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return int((x - self._min_x) // self.cell_size), int((y - self._min_y) // self.cell_size)
+
+    def rings(self, point_id: str) -> Iterator[tuple[int, list[_Entry]]]:
+        """Yield ``(radius, entries)`` for each non-empty ring of cells around ``point_id``.
+
+        Entries are ``(id, x, y)`` tuples; ``radius`` is the Chebyshev distance in cells.
+        """
+        cx, cy = self._cell_by_id[point_id]
+        cells = self._cells
+        radius = 0
+        # Walk ring perimeters while they are cheaper than one pass over the occupied cells.
+        while radius <= self.ring_limit and 8 * radius <= len(cells):
+            entries = self._ring_entries(cx, cy, radius)
+            if entries:
+                yield radius, entries
+            radius += 1
+        if radius > self.ring_limit:
+            return
+        # Sparse outskirts (clustered layouts): bucket the remaining cells by ring instead.
+        by_radius: dict[int, list[_Entry]] = {}
+        for (x, y), members in cells.items():
+            ring_radius = max(abs(x - cx), abs(y - cy))
+            if ring_radius >= radius:
+                by_radius.setdefault(ring_radius, []).extend(members)
+        for ring_radius in sorted(by_radius):
+            yield ring_radius, by_radius[ring_radius]
+
+    def _ring_entries(self, cx: int, cy: int, radius: int) -> list[_Entry]:
+        cells = self._cells
+        if radius == 0:
+            return list(cells.get((cx, cy), ()))
+        entries: list[_Entry] = []
+        for dx in range(-radius, radius + 1):
+            entries.extend(cells.get((cx + dx, cy - radius), ()))
+            entries.extend(cells.get((cx + dx, cy + radius), ()))
+        for dy in range(-radius + 1, radius):
+            entries.extend(cells.get((cx - radius, cy + dy), ()))
+            entries.extend(cells.get((cx + radius, cy + dy), ()))
+        return entries
+
+    def ring_lower_bound(self, radius: int) -> float:
+        """Distance no point in ring ``radius`` can be closer than."""
+        return (radius - 1) * self.cell_size * (1.0 - _BOUND_MARGIN)
+
+    def distance(self, a_id: str, b_id: str) -> float:
+        ax, ay = self._points[a_id]
+        bx, by = self._points[b_id]
+        dx = bx - ax
+        dy = by - ay
+        return math.sqrt(dx * dx + dy * dy)
+
+    def nearest(self, point_id: str) -> Iterator[tuple[float, str]]:
+        """Yield ``(distance, other_id)`` for every other point, ordered by (distance, other_id)."""
+        ax, ay = self._points[point_id]
+        pending: list[tuple[float, str]] = []
+        for radius, entries in self.rings(point_id):
+            bound = self.ring_lower_bound(radius)
+            while pending and pending[0][0] < bound:
+                yield heapq.heappop(pending)
+            for other_id, bx, by in entries:
+                if other_id != point_id:
+                    dx = bx - ax
+                    dy = by - ay
+                    heapq.heappush(pending, (math.sqrt(dx * dx + dy * dy), other_id))
+        while pending:
+            yield heapq.heappop(pending)
+
+    def minimum_spanning_edges(self) -> list[tuple[float, str, str]]:
+        """Kruskal's minimum spanning tree over all point pairs, in (distance, a_id, b_id) order.
+
+        Candidate edges are generated lazily: each point scans its next ring only when
+        the global heap reaches that ring's lower bound. Around each point, only the
+        nearest point of each 60-degree cone can be a tree neighbor: a farther point q
+        in the same cone is closer to that nearest point than to this one, so the edge
+        to q is the longest side of a triangle. Dominated edges are never queued, and a
+        point stops scanning once every cone holds a point nearer than its next ring.
+        With the strict (distance, a_id, b_id) order the tree is unique, so it equals
+        the all-pairs result exactly.
+        """
+        point_ids = sorted(self._points)
+        if len(point_ids) <= 1:
+            return []
+        slot = {point_id: index for index, point_id in enumerate(point_ids)}
+        parent = list(range(len(point_ids)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        streams: dict[str, Iterator[tuple[int, list[_Entry]]]] = {}
+        waiting: dict[str, list[_Entry]] = {}
+        cone_reach: dict[str, list[float]] = {}
+        # Entries are (key, 1, a_id, b_id) for edges (a_id < b_id) and (key, 0, owner_id, radius)
+        # for ring scans; a ring is scanned before any edge at or beyond its bound.
+        heap: list[tuple[float, int, str, Any]] = []
+        for point_id in point_ids:
+            streams[point_id] = self.rings(point_id)
+            radius, waiting[point_id] = next(streams[point_id])
+            cone_reach[point_id] = [math.inf] * _CONE_COUNT
+            heap.append((self.ring_lower_bound(radius), 0, point_id, radius))
+        heapq.heapify(heap)
+
+        edges: list[tuple[float, str, str]] = []
+        target = len(point_ids) - 1
+        while heap and len(edges) < target:
+            key, kind, a_id, payload = heapq.heappop(heap)
+            if kind == 1:
+                root_a = find(slot[a_id])
+                root_b = find(slot[payload])
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+                    edges.append((key, a_id, payload))
+                continue
+            ax, ay = self._points[a_id]
+            reach = cone_reach[a_id]
+            scanned: list[tuple[float, int, str]] = []
+            for other_id, bx, by in waiting.pop(a_id):
+                if other_id == a_id:
+                    continue
+                dx = bx - ax
+                dy = by - ay
+                distance = math.sqrt(dx * dx + dy * dy)
+                cone = int((math.atan2(dy, dx) + math.pi) * _CONE_SCALE) % _CONE_COUNT
+                if 0.0 < distance < reach[cone]:
+                    reach[cone] = distance
+                scanned.append((distance, cone, other_id))
+            for distance, cone, other_id in scanned:
+                if other_id > a_id and distance <= reach[cone] * (1.0 + _CONE_SLACK):
+                    heapq.heappush(heap, (distance, 1, a_id, other_id))
+            following = next(streams[a_id], None)
+            if following is not None:
+                radius, entries = following
+                bound = self.ring_lower_bound(radius)
+                if max(reach) * (1.0 + _CONE_SLACK) >= bound:
+                    waiting[a_id] = entries
+                    heapq.heappush(heap, (bound, 0, a_id, radius))
+                    continue
+            del streams[a_id]
+            del cone_reach[a_id]
+        return edges
@@ -0,0 +1,202 @@
+"""Per-day handlers run by the time engine, ordered by priority and timed.
+
+Subsystems register a handler under a name with a cadence (every day, every
+week, or only when requested) and a priority; lower priorities run first and
+ties keep registration order. A handler may also name a ``has_work`` check: on
+a day it returns False the handler is skipped and counted as such.
+
+Handlers are called as ``run(day, context)`` and checks as
+``has_work(context)``, where ``context`` is whatever the caller of
+``run_day`` passes (the time engine passes its TimeContext). Keep both
+picklable (module-level functions or bound methods): the scheduler lives on
+the TimeContext, which is snapshotted and forked with the engine.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+import time
+
+
+CADENCE_DAILY = "daily"
+CADENCE_WEEKLY = "weekly"
+CADENCE_ON_DEMAND = "on_demand"
+CADENCES = (CADENCE_DAILY, CADENCE_WEEKLY, CADENCE_ON_DEMAND)
+
+DAYS_PER_WEEK = 7
+
+
+@dataclass
+class TickHandler:
+    name: str
+    run: Callable[[int, Any], Any]
+    cadence: str = CADENCE_DAILY
+    priority: int = 0
+    has_work: Callable[[Any], bool] | None = None
+    calls: int = 0
+    skips: int = 0
+    seconds: float = 0.0
+
+    def due(self, day: int) -> bool:
+        """Whether the cadence alone puts ``day`` on this handler's calendar (on-demand never is)."""
+        if self.cadence == CADENCE_DAILY:
+            return True
+        if self.cadence == CADENCE_WEEKLY:
+            return day % DAYS_PER_WEEK == 0
+        return False
+
+    def next_due_day(self, day: int) -> int | None:
+        if self.cadence == CADENCE_DAILY:
+            return day
+        if self.cadence == CADENCE_WEEKLY:
+            return day + (-day % DAYS_PER_WEEK)
+        return None
+
+
+@dataclass(frozen=True)
+class HandlerTiming:
+    name: str
+    cadence: str
+    priority: int
+    calls: int
+    skips: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class DayTiming:
+    """Wall time of each handler that ran on ``day``, in run order."""
+
+    day: int
+    handlers: tuple[tuple[str, float], ...]
+
+    @property
+    def seconds(self) -> float:
+        return sum(seconds for _, seconds in self.handlers)
+
+
+class TickScheduler:
+    def __init__(self) -> None:
+        self._handlers: dict[str, TickHandler] = {}
+        self._order: list[TickHandler] = []
+        self._requested: set[str] = set()
+        self.last_day: DayTiming | None = None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._handlers
+
+    def register(
+        self,
+        name: str,
+        run: Callable[[int, Any], Any],
+        *,
+        cadence: str = CADENCE_DAILY,
+        priority: int = 0,
+        has_work: Callable[[Any], bool] | None = None,
+    ) -> None:
+        """Add a handler; registering a name again replaces its handler and resets its stats."""
+        if not isinstance(name, str) or not name:
+            raise ValueError("Tick handler name must be a non-empty string.")
+        if cadence not in CADENCES:
+            raise ValueError(f"Tick cadence must be one of {', '.join(CADENCES)}.")
+        if not isinstance(priority, int):
+            raise ValueError("Tick priority must be an integer.")
+        self._handlers.pop(name, None)
+        self._handlers[name] = TickHandler(name, run, cadence, priority, has_work)
+        self._reorder()
+
+    def unregister(self, name: str) -> None:
+        if self._handlers.pop(name, None) is not None:
+            self._requested.discard(name)
+            self._reorder()
+
+    def request(self, name: str) -> None:
+        """Run ``name`` on the next day processed, whatever its cadence."""
+        if name not in self._handlers:
+            raise ValueError(f"Unknown tick handler: {name}")
+        self._requested.add(name)
+
+    def handlers(self) -> list[TickHandler]:
+        return list(self._order)
+
+    def run_day(
+        self,
+        day: int,
+        context: Any = None,
+        *,
+        stop: Callable[[Any], Any] | None = None,
+        commit: Callable[[int, Any], Any] | None = None,
+        commit_priority: int | None = None,
+    ) -> bool:
+        """Run the handlers due on ``day``; returns False, leaving the rest unrun, once ``stop(context)`` is truthy.
+
+        With ``commit_priority`` set, ``stop`` is only checked after handlers below it. Before the
+        first handler at or above it (or at the end of the day) ``commit(day, context)`` is called,
+        and the day then always runs to completion.
+        """
+        requested = self._requested
+        timings: list[tuple[str, float]] = []
+        completed = True
+        committed = False
+        clock = time.perf_counter
+        for handler in self._order:
+            if not committed and commit_priority is not None and handler.priority >= commit_priority:
+                committed = True
+                if commit is not None:
+                    commit(day, context)
+            if not (handler.due(day) or handler.name in requested):
+                continue
+            if handler.has_work is not None and not handler.has_work(context):
+                handler.skips += 1
+                requested.discard(handler.name)
+                continue
+            requested.discard(handler.name)
+            start = clock()
+            handler.run(day, context)
+            seconds = clock() - start
+            handler.calls += 1
+            handler.seconds += seconds
+            timings.append((handler.name, seconds))
+            if not committed and stop is not None and stop(context):
+                completed = False
+                break
+        if completed and not committed and commit is not None:
+            commit(day, context)
+        self.last_day = DayTiming(day, tuple(timings))
+        return completed
+
+    def next_due_day(self, first_day: int, last_day: int, context: Any = None, *, exclude: tuple[str, ...] = ()) -> int:
+        """First day in ``first_day..last_day`` a handler not in ``exclude`` would run, else ``last_day + 1``.
+
+        A handler whose ``has_work`` check is False now counts as idle for the whole range.
+        """
+        earliest = last_day + 1
+        for handler in self._order:
+            if handler.name in exclude:
+                continue
+            day = first_day if handler.name in self._requested else handler.next_due_day(first_day)
+            if day is None or day >= earliest:
+                continue
+            if handler.has_work is not None and not handler.has_work(context):
+                continue
+            earliest = day
+        return earliest
+
+    def timings(self) -> list[HandlerTiming]:
+        """Call counts, skips and total wall time per handler, in run order."""
+        return [
+            HandlerTiming(handler.name, handler.cadence, handler.priority, handler.calls, handler.skips, handler.seconds)
+            for handler in self._order
+        ]
+
+    def reset_timings(self) -> None:
+        for handler in self._order:
+            handler.calls = 0
+            handler.skips = 0
+            handler.seconds = 0.0
+        self.last_day = None
+
+    def _reorder(self) -> None:
+        # sorted() is stable, so equal priorities keep registration order.
+        self._order = sorted(self._handlers.values(), key=lambda handler: handler.priority)
@@ -1,21 +1,138 @@
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Callable, Any
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Callable, Any, ClassVar
 
+from data_bundle import get_data_bundle
+from deterministic_rng import RNG_MODE_COMPAT, DeterministicRng
+from event_bus import DEBUG, INFO, WARNING, BusEvent, EventBus, stdout_event_bus
 from logger import Logger
-from world_state_engine import WorldStateEngine
+from tick_scheduler import CADENCE_DAILY, DayTiming, HandlerTiming, TickScheduler
+from world_state_engine import WORLD_STATE_SCOPE_GALAXY, WORLD_STATE_SCOPE_LOCAL, WorldStateEngine
+
+
+@dataclass
+class TimeContext:
+    """Clock, hard-stop flags and world-state wiring for one simulation.
+
+    Each GameEngine owns its own context so several engines can share a process.
+    Module-level functions fall back to a process-wide default context when no
+    context is passed, which keeps legacy callers (TimeEngine(), tests) working.
+    """
+
+    current_turn: int = 0
+    player_action_context: bool = False
+    hard_stop_player_dead: bool = False
+    hard_stop_tier2_detention: bool = False
+    logger: Logger | None = None
+    # Receives time and world-state diagnostics when no logger is set; a bus without
+    # subscribers makes those call sites free.
+    event_bus: EventBus = field(default_factory=stdout_event_bus, repr=False)
+    world_state_engine: WorldStateEngine | None = None
+    world_state_seed: int | None = None
+    world_state_sector: Any = None
+    world_state_player: Any = None
+    world_state_event_frequency_percent: int = 8
+    world_state_scope: str = WORLD_STATE_SCOPE_LOCAL
+    # Per-day handlers: the stage ticks, the world-state lifecycle and whatever subsystems register.
+    tick_scheduler: TickScheduler = field(default_factory=lambda: default_tick_scheduler(), repr=False)
+
+    def reset(self) -> None:
+        self.current_turn = 0
+        self.player_action_context = False
+        self.hard_stop_player_dead = False
+        self.hard_stop_tier2_detention = False
+        self.world_state_engine = None
+        self.world_state_seed = None
+        self.world_state_sector = None
+        self.world_state_player = None
+        self.world_state_event_frequency_percent = 8
+        self.world_state_scope = WORLD_STATE_SCOPE_LOCAL
+        self.tick_scheduler = default_tick_scheduler()
 
 
-_current_turn = 0
-_player_action_context = False
-_hard_stop_player_dead = False
-_hard_stop_tier2_detention = False
-_shared_logger: Logger | None = None
-_world_state_engine: WorldStateEngine | None = None
-_world_state_seed: int | None = None
-_world_state_sector: Any = None
-_world_state_player: Any = None
-_world_state_event_frequency_percent: int = 8
+@dataclass(frozen=True)
+class TimeEngineEvent(BusEvent):
+    kind: ClassVar[str] = "time_engine"
+
+    action: str
+    values: tuple[tuple[str, Any], ...] = ()
+    level: int = DEBUG
+
+    @property
+    def state_change(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.values)
+
+    def render(self) -> str:
+        return f"[time_engine] action={self.action} change={self.state_change}"
+
+
+STAGE_TICKS = ("galaxy_tick", "system_tick", "planet_station_tick", "location_tick", "npc_tick", "end_of_day_log")
+STAGE_TICK_PRIORITY_STEP = 10
+WORLD_STATE_TICK = "world_state"
+WORLD_STATE_TICK_PRIORITY = 100
+
+
+@dataclass(frozen=True)
+class _StageTick:
+    """Runs the module-level stage function ``name``, looked up per call so reassigning it takes effect."""
+
+    name: str
+
+    def __call__(self, day: int, context: TimeContext) -> None:
+        globals()[self.name](day)
+
+    def has_work(self, context: TimeContext) -> bool:
+        # The stock stage ticks only log, so they have nothing to do while nobody listens.
+        if globals()[self.name] is not _STOCK_STAGE_TICKS[self.name]:
+            return True
+        return context.logger is not None or context.event_bus.accepts(DEBUG)
+
+
+def _world_state_tick(day: int, context: TimeContext) -> None:
+    _run_world_state_lifecycle(day, context)
+
+
+def _world_state_configured(context: TimeContext) -> bool:
+    return not (
+        context.world_state_engine is None
+        or context.world_state_seed is None
+        or context.world_state_sector is None
+        or context.world_state_player is None
+    )
+
+
+def default_tick_scheduler() -> TickScheduler:
+    """A scheduler with the six stage ticks followed by the world-state lifecycle."""
+    scheduler = TickScheduler()
+    for index, name in enumerate(STAGE_TICKS):
+        stage = _StageTick(name)
+        scheduler.register(name, stage, priority=index * STAGE_TICK_PRIORITY_STEP, has_work=stage.has_work)
+    scheduler.register(
+        WORLD_STATE_TICK,
+        _world_state_tick,
+        priority=WORLD_STATE_TICK_PRIORITY,
+        has_work=_world_state_configured,
+    )
+    return scheduler
+
+
+_default_context = TimeContext()
+# Context currently being advanced; lets tick functions (called with day only) log
+# and raise hard stops against the right clock.
+_bound_context: ContextVar[TimeContext | None] = ContextVar("time_engine_bound_context", default=None)
+
+
+def default_time_context() -> TimeContext:
+    return _default_context
+
+
+def _resolve_context(context: TimeContext | None) -> TimeContext:
+    if context is not None:
+        return context
+    bound = _bound_context.get()
+    if bound is not None:
+        return bound
+    return _default_context
 
 
 @dataclass(frozen=True)
@@ -27,95 +144,178 @@ class TimeAdvanceResult:
     hard_stop_reason: str | None
 
 
-def get_current_turn() -> int:
-    return _current_turn
+def get_current_turn(context: TimeContext | None = None) -> int:
+    return _resolve_context(context).current_turn
 
 
-def get_current_date() -> str:
-    year_offset = _current_turn // 100
-    day_of_year = _current_turn % 100
+def get_current_date(context: TimeContext | None = None) -> str:
+    current_turn = _resolve_context(context).current_turn
+    year_offset = current_turn // 100
+    day_of_year = current_turn % 100
     month = day_of_year // 10
     day = day_of_year % 10
     return f"{2200 + year_offset}.{month}.{day}"
 
 
-def advance_time(days: int, reason: str) -> TimeAdvanceResult:
+def advance_time(days: int, reason: str, context: TimeContext | None = None) -> TimeAdvanceResult:
+    context = _resolve_context(context)
     _validate_advance_request(days)
-    _require_player_action_context()
-    starting_turn = _current_turn
-    _log_time_event(
-        "time_advance_requested",
-        f"start_turn={starting_turn} days={days} reason={reason}",
-    )
-    days_completed = 0
-    hard_stop_reason = None
-    for _ in range(days):
-        hard_stop_reason = _check_hard_stop()
-        if hard_stop_reason is not None:
-            _log_time_event("time_advance_hard_stop", f"turn={_current_turn} reason={hard_stop_reason}")
-            break
-        completed = _process_single_day()
-        if not completed:
-            hard_stop_reason = _check_hard_stop()
-            _log_time_event("time_advance_hard_stop", f"turn={_current_turn} reason={hard_stop_reason}")
-            break
-        days_completed += 1
+    _require_player_action_context(context)
+    return _advance_days(days, reason, context, action="time_advance_requested", coalesce=False)
+
+
+def skip_time(days: int, reason: str, context: TimeContext | None = None) -> TimeAdvanceResult:
+    """Advance any number of days with the same outcome as advancing them one at a time.
+
+    Stretches of days on which no tick handler has work and the world-state lifecycle would
+    only count durations down are applied in one step; every other day runs the normal daily
+    pipeline. The stock stage ticks only log, so they do not end a stretch. Bus subscribers get
+    one "time_skip_days_coalesced" event per stretch in place of that stretch's per-day
+    diagnostics. With a logger set every day runs normally, so the log matches day-by-day play.
+    """
+    context = _resolve_context(context)
+    _validate_skip_request(days)
+    _require_player_action_context(context)
+    coalesce = context.logger is None
+    return _advance_days(days, reason, context, action="time_skip_requested", coalesce=coalesce)
+
+
+def _advance_days(days: int, reason: str, context: TimeContext, *, action: str, coalesce: bool) -> TimeAdvanceResult:
+    token = _bound_context.set(context)
+    try:
+        starting_turn = context.current_turn
+        _log_time_event(
+            action,
+            context,
+            INFO,
+            start_turn=starting_turn,
+            days=days,
+            reason=reason,
+        )
+        days_completed = 0
+        hard_stop_reason = None
+        while days_completed < days:
+            hard_stop_reason = _check_hard_stop(context)
+            if hard_stop_reason is not None:
+                _log_time_event(
+                    "time_advance_hard_stop", context, WARNING, turn=context.current_turn, reason=hard_stop_reason
+                )
+                break
+            # The first day always runs in full: it registers the systems the lifecycle touches.
+            quiet_days = _quiet_days(days - days_completed, context) if coalesce and days_completed else 0
+            if quiet_days:
+                _skip_quiet_days(quiet_days, context)
+                days_completed += quiet_days
+                continue
+            completed = _process_single_day(context)
+            if not completed:
+                hard_stop_reason = _check_hard_stop(context)
+                _log_time_event(
+                    "time_advance_hard_stop", context, WARNING, turn=context.current_turn, reason=hard_stop_reason
+                )
+                break
+            days_completed += 1
+    finally:
+        _bound_context.reset(token)
     return TimeAdvanceResult(
         starting_turn=starting_turn,
         days_requested=days,
         days_completed=days_completed,
-        current_turn=_current_turn,
+        current_turn=context.current_turn,
         hard_stop_reason=hard_stop_reason,
     )
 
 
+def _quiet_days(max_days: int, context: TimeContext) -> int:
+    """Leading days of the next ``max_days`` on which no tick handler has anything to do but count down."""
+    first_day = context.current_turn + 1
+    # Other handlers end the stretch on their next due day; the world-state lifecycle is checked day by day.
+    last_day = context.tick_scheduler.next_due_day(
+        first_day, first_day + max_days - 1, context, exclude=(WORLD_STATE_TICK, *_log_only_ticks(context))
+    ) - 1
+    gate_system_ids = _world_state_gate_systems(context) if WORLD_STATE_TICK in context.tick_scheduler else None
+    if gate_system_ids is None or last_day < first_day:
+        return max(0, last_day - first_day + 1)
+    world_state_engine = context.world_state_engine
+    next_active_day = world_state_engine.next_active_day(
+        context.world_state_seed,
+        gate_system_ids,
+        first_day,
+        last_day,
+        context.world_state_event_frequency_percent,
+    )
+    return next_active_day - first_day
+
+
+def _log_only_ticks(context: TimeContext) -> tuple[str, ...]:
+    """Registered stage ticks still running their stock, log-only function."""
+    return tuple(
+        handler.name
+        for handler in context.tick_scheduler.handlers()
+        if isinstance(handler.run, _StageTick) and globals()[handler.run.name] is _STOCK_STAGE_TICKS[handler.run.name]
+    )
+
+
+def _skip_quiet_days(days: int, context: TimeContext) -> None:
+    scheduler = context.tick_scheduler
+    if WORLD_STATE_TICK in scheduler and _world_state_gate_systems(context) is not None:
+        context.world_state_engine.decrement_durations(days)
+    start_turn = context.current_turn
+    _set_current_turn(start_turn + days, context)
+    _log_time_event(
+        "time_skip_days_coalesced", context, INFO, start_turn=start_turn, days=days, turn=context.current_turn
+    )
+
+
 def galaxy_tick(day: int) -> None:
-    _log_time_event("galaxy_tick", f"day={day}")
+    _log_time_event("galaxy_tick", day=day)
 
 
 def system_tick(day: int) -> None:
-    _log_time_event("system_tick", f"day={day}")
+    _log_time_event("system_tick", day=day)
 
 
 def planet_station_tick(day: int) -> None:
-    _log_time_event("planet_station_tick", f"day={day}")
+    _log_time_event("planet_station_tick", day=day)
 
 
 def location_tick(day: int) -> None:
-    _log_time_event("location_tick", f"day={day}")
+    _log_time_event("location_tick", day=day)
 
 
 def npc_tick(day: int) -> None:
-    _log_time_event("npc_tick", f"day={day}")
+    _log_time_event("npc_tick", day=day)
 
 
 def end_of_day_log(day: int) -> None:
-    _log_time_event("end_of_day_log", f"day={day}")
-
-
-def _process_single_day() -> bool:
-    next_turn = _current_turn + 1
-    for tick in (
-        galaxy_tick,
-        system_tick,
-        planet_station_tick,
-        location_tick,
-        npc_tick,
-        end_of_day_log,
+    _log_time_event("end_of_day_log", day=day)
+
+
+_STOCK_STAGE_TICKS = {name: globals()[name] for name in STAGE_TICKS}
+
+
+def _process_single_day(context: TimeContext | None = None) -> bool:
+    context = _resolve_context(context)
+    next_turn = context.current_turn + 1
+    # A hard stop raised by a stage tick aborts the day; the turn is committed before the
+    # world-state lifecycle, which with everything after it always runs to the end of the day.
+    if not context.tick_scheduler.run_day(
+        next_turn,
+        context,
+        stop=_check_hard_stop,
+        commit=_set_current_turn,
+        commit_priority=WORLD_STATE_TICK_PRIORITY,
     ):
-        tick(next_turn)
-        if _check_hard_stop() is not None:
-            return False
-    _set_current_turn(next_turn)
-    _run_world_state_lifecycle(next_turn)
-    _log_time_event("time_advance_day_completed", f"turn={_current_turn} hard_stop=None")
+        return False
+    _log_time_event("time_advance_day_completed", context, INFO, turn=context.current_turn, hard_stop=None)
     return True
 
 
-def _check_hard_stop() -> str | None:
-    if _hard_stop_player_dead:
+def _check_hard_stop(context: TimeContext | None = None) -> str | None:
+    context = _resolve_context(context)
+    if context.hard_stop_player_dead:
         return "player_death"
-    if _hard_stop_tier2_detention:
+    if context.hard_stop_tier2_detention:
         return "tier2_detention"
     return None
 
@@ -127,46 +327,50 @@ def _validate_advance_request(days: int) -> None:
         raise ValueError("Time advance days must be between 1 and 10.")
 
 
-def _require_player_action_context() -> None:
-    if not _player_action_context:
+def _validate_skip_request(days: int) -> None:
+    if not isinstance(days, int):
+        raise ValueError("Time skip days must be an integer.")
+    if days < 1:
+        raise ValueError("Time skip days must be at least 1.")
+
+
+def _require_player_action_context(context: TimeContext | None = None) -> None:
+    if not _resolve_context(context).player_action_context:
         raise RuntimeError("Time advancement must be called from player action resolution.")
 
 
-def _log_time_event(action: str, state_change: str) -> None:
-    if _shared_logger is not None:
-        _shared_logger.log(turn=_current_turn, action=action, state_change=state_change)
+def _log_time_event(action: str, context: TimeContext | None = None, level: int = DEBUG, **values: Any) -> None:
+    context = _resolve_context(context)
+    if context.logger is None and not context.event_bus.accepts(level):
         return
-    print(f"[time_engine] action={action} change={state_change}")
+    event = TimeEngineEvent(action, tuple(values.items()), level)
+    if context.logger is not None:
+        context.logger.log(turn=context.current_turn, action=action, state_change=event.state_change)
+        return
+    context.event_bus.publish(event)
 
 
-def _set_current_turn(turn: int) -> None:
-    global _current_turn
-    _current_turn = turn
+def _set_current_turn(turn: int, context: TimeContext | None = None) -> None:
+    _resolve_context(context).current_turn = turn
 
 
-def _set_player_action_context(active: bool) -> None:
-    global _player_action_context
-    _player_action_context = active
+def _set_player_action_context(active: bool, context: TimeContext | None = None) -> None:
+    _resolve_context(context).player_action_context = active
 
 
-def _set_hard_stop_state(*, player_dead: bool = False, tier2_detention: bool = False) -> None:
-    global _hard_stop_player_dead, _hard_stop_tier2_detention
-    _hard_stop_player_dead = player_dead
-    _hard_stop_tier2_detention = tier2_detention
+def _set_hard_stop_state(
+    *,
+    player_dead: bool = False,
+    tier2_detention: bool = False,
+    context: TimeContext | None = None,
+) -> None:
+    context = _resolve_context(context)
+    context.hard_stop_player_dead = player_dead
+    context.hard_stop_tier2_detention = tier2_detention
 
 
 def _reset_time_state_for_test() -> None:
-    global _current_turn, _player_action_context, _hard_stop_player_dead, _hard_stop_tier2_detention
-    global _world_state_engine, _world_state_seed, _world_state_sector, _world_state_player, _world_state_event_frequency_percent
-    _current_turn = 0
-    _player_action_context = False
-    _hard_stop_player_dead = False
-    _hard_stop_tier2_detention = False
-    _world_state_engine = None
-    _world_state_seed = None
-    _world_state_sector = None
-    _world_state_player = None
-    _world_state_event_frequency_percent = 8
+    _default_context.reset()
 
 
 class TimeEngine:
@@ -177,7 +381,11 @@ class TimeEngine:
         sector: Any | None = None,
         player_state: Any | None = None,
         event_frequency_percent: int = 8,
+        context: TimeContext | None = None,
+        rng_mode: str = RNG_MODE_COMPAT,
+        world_state_scope: str = WORLD_STATE_SCOPE_LOCAL,
     ) -> None:
+        self.context = context if context is not None else _default_context
         if logger is not None:
             self.set_logger(logger)
         if world_seed is not None and sector is not None and player_state is not None:
@@ -186,24 +394,59 @@ class TimeEngine:
                 sector=sector,
                 player_state=player_state,
                 event_frequency_percent=event_frequency_percent,
+                rng_mode=rng_mode,
+                world_state_scope=world_state_scope,
             )
 
     @property
     def current_turn(self) -> int:
-        return get_current_turn()
+        return get_current_turn(self.context)
 
     def advance(self) -> int:
-        _set_player_action_context(True)
+        _set_player_action_context(True, self.context)
         try:
-            result = advance_time(days=1, reason="legacy_action")
+            result = advance_time(days=1, reason="legacy_action", context=self.context)
         finally:
-            _set_player_action_context(False)
+            _set_player_action_context(False, self.context)
         return result.current_turn
 
-    @staticmethod
-    def set_logger(logger: Logger | None) -> None:
-        global _shared_logger
-        _shared_logger = logger
+    def set_logger(self, logger: Logger | None) -> None:
+        self.context.logger = logger
+
+    def own_context(self) -> TimeContext:
+        """Move an engine on the process-wide default context onto a private copy of it.
+
+        The copy keeps the clock, logger and world-state wiring but starts from the default
+        handlers, so ticks registered afterwards end with this engine instead of lingering on
+        the shared clock. Engines with their own context are left alone.
+        """
+        if self.context is _default_context:
+            self.context = replace(_default_context, tick_scheduler=default_tick_scheduler())
+        return self.context
+
+    def register_tick(
+        self,
+        name: str,
+        run: Callable[[int, TimeContext], Any],
+        *,
+        cadence: str = CADENCE_DAILY,
+        priority: int = 0,
+        has_work: Callable[[TimeContext], bool] | None = None,
+    ) -> None:
+        """Run ``run(day, context)`` on each day due under ``cadence``; see TickScheduler.register."""
+        self.context.tick_scheduler.register(name, run, cadence=cadence, priority=priority, has_work=has_work)
+
+    def tick_timings(self) -> list[HandlerTiming]:
+        return self.context.tick_scheduler.timings()
+
+    def last_day_timings(self) -> DayTiming | None:
+        """Per-handler wall time of the most recent day the scheduler ran."""
+        return self.context.tick_scheduler.last_day
+
+    def set_event_bus(self, event_bus: EventBus) -> None:
+        self.context.event_bus = event_bus
+        if self.context.world_state_engine is not None:
+            self.context.world_state_engine.event_bus = event_bus
 
     def configure_world_state(
         self,
@@ -212,56 +455,75 @@ class TimeEngine:
         sector: Any,
         player_state: Any,
         event_frequency_percent: int = 8,
+        rng_mode: str = RNG_MODE_COMPAT,
+        world_state_scope: str = WORLD_STATE_SCOPE_LOCAL,
     ) -> None:
-        global _world_state_engine, _world_state_seed, _world_state_sector, _world_state_player, _world_state_event_frequency_percent
-        engine = WorldStateEngine()
-        data_root = Path(__file__).resolve().parents[1] / "data"
-        engine.load_situation_catalog(data_root / "situations.json")
-        engine.load_event_catalog(data_root / "events.json")
+        bundle = get_data_bundle()
+        engine = WorldStateEngine(event_bus=self.context.event_bus, rng=DeterministicRng(rng_mode))
+        engine.load_situation_catalog(payload=bundle.document("situations.json"))
+        engine.load_event_catalog(payload=bundle.document("events.json"))
         engine.configure_runtime_context(
             sector=sector,
             npc_registry=getattr(player_state, "npc_registry", None),
         )
-        _world_state_engine = engine
-        _world_state_seed = int(world_seed)
-        _world_state_sector = sector
-        _world_state_player = player_state
-        _world_state_event_frequency_percent = int(event_frequency_percent)
+        self.context.world_state_engine = engine
+        self.context.world_state_seed = int(world_seed)
+        self.context.world_state_sector = sector
+        self.context.world_state_player = player_state
+        self.context.world_state_event_frequency_percent = int(event_frequency_percent)
+        self.context.world_state_scope = world_state_scope
+
+
+def _world_state_gate_systems(context: TimeContext) -> list[str] | None:
+    """Systems whose spawn gates the daily lifecycle rolls, or None when the lifecycle does not run."""
+    if not _world_state_configured(context):
+        return None
+    if context.world_state_scope == WORLD_STATE_SCOPE_GALAXY:
+        return context.world_state_sector.system_ids()
+    current_system_id = getattr(context.world_state_player, "current_system_id", None)
+    if not isinstance(current_system_id, str) or not current_system_id:
+        return None
+    return [current_system_id]
 
 
-def _run_world_state_lifecycle(current_day: int) -> None:
-    if _world_state_engine is None or _world_state_seed is None or _world_state_sector is None or _world_state_player is None:
-        return
-    current_system_id = getattr(_world_state_player, "current_system_id", None)
-    if not isinstance(current_system_id, str) or not current_system_id:
+def _run_world_state_lifecycle(current_day: int, context: TimeContext | None = None) -> None:
+    context = _resolve_context(context)
+    gate_system_ids = _world_state_gate_systems(context)
+    if gate_system_ids is None:
         return
-
-    current_system = _world_state_sector.get_system(current_system_id)
-    neighbor_system_ids: list[str] = []
-    if current_system is not None:
-        neighbor_system_ids = list(getattr(current_system, "neighbors", []))
+    world_state_engine = context.world_state_engine
+    world_state_seed = context.world_state_seed
+    sector = context.world_state_sector
 
     def get_neighbors_fn(system_id: str) -> list[str]:
-        system = _world_state_sector.get_system(system_id)
+        system = sector.get_system(system_id)
         if system is None:
             return []
         return list(getattr(system, "neighbors", []))
 
-    _world_state_engine.process_scheduled_events(
-        _world_state_seed,
+    world_state_engine.process_scheduled_events(
+        world_state_seed,
         current_day,
     )
-    _world_state_engine.evaluate_spawn_gate(
-        _world_state_seed,
-        current_system_id,
-        neighbor_system_ids,
-        current_day,
-        _world_state_event_frequency_percent,
-    )
-    _world_state_engine.process_propagation(
-        _world_state_seed,
+    if context.world_state_scope == WORLD_STATE_SCOPE_GALAXY:
+        world_state_engine.evaluate_spawn_gates(
+            world_state_seed,
+            gate_system_ids,
+            current_day,
+            context.world_state_event_frequency_percent,
+        )
+    else:
+        world_state_engine.evaluate_spawn_gate(
+            world_state_seed,
+            gate_system_ids[0],
+            get_neighbors_fn(gate_system_ids[0]),
+            current_day,
+            context.world_state_event_frequency_percent,
+        )
+    world_state_engine.process_propagation(
+        world_state_seed,
         current_day,
         get_neighbors_fn,
     )
-    _world_state_engine.decrement_durations()
-    _world_state_engine.resolve_expired()
+    world_state_engine.decrement_durations()
+    world_state_engine.resolve_expired()
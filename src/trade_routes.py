@@ -0,0 +1,443 @@
+"""Buy -> travel -> sell plans over observed market prices.
+
+Observations map destination_id -> sku -> {"buy": price to buy there, "sell":
+price paid when selling there} (either side may be missing). They are indexed
+once per search: each destination's buy offers, and per SKU every sell offer
+sorted best first. The best edges out of a destination are then drawn from
+those sorted lists with a heap, highest estimated leg profit first, stopping
+as soon as a SKU's next buyer would not pay more than its purchase price.
+
+A plan optionally opens with an empty positioning trip to its first market and
+then chains legs (buy at one stop, travel, sell everything at the next). A plan
+that ends where its first leg started is a loop. Plans are ranked by profit per
+day; depth-first extension stops early once even best-case legs could not lift
+a partial plan into the current top K.
+
+Travel follows the game's rules: moving between destinations of one system is a
+1-day, fuel-free hop, and inter-system legs use RoutePlanner plans (fuel on
+board, optional datanet refuels). Buying and selling take no time. Refuel stops
+are paid at FUEL_PRICE_PER_UNIT for the units the plan tops up; a leg sets that
+money aside before sizing its purchase, and the cost comes out of its profit.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+import heapq
+
+try:
+    from interaction_resolvers import FUEL_PRICE_PER_UNIT
+except ModuleNotFoundError:
+    from src.interaction_resolvers import FUEL_PRICE_PER_UNIT
+
+
+DEFAULT_TOP_K = 5
+DEFAULT_MAX_LEGS = 3
+# Edges explored per stop, and markets (besides the current one) tried as first stops.
+DEFAULT_BRANCHING = 6
+DEFAULT_START_CANDIDATES = 6
+INTRA_SYSTEM_TRAVEL_DAYS = 1
+_LEGALITY_SEVERITY = {"LEGAL": 0, "RESTRICTED": 1, "ILLEGAL": 2}
+
+
+@dataclass(frozen=True)
+class TradeLeg:
+    buy_destination_id: str
+    sell_destination_id: str
+    sku_id: str
+    quantity: int
+    buy_price: int
+    sell_price: int
+    # Sale proceeds less purchase and refuel_cost.
+    profit: int
+    travel_days: int
+    fuel_cost: int
+    refuel_stops: int
+    # Credits spent on fuel at refuel stops along the way.
+    refuel_cost: int
+    legality: str
+    risk_tier: str
+
+
+@dataclass(frozen=True)
+class TradeRoute:
+    start_destination_id: str
+    # Days, refuel stops and fuel spend reaching the first market; 0 when the plan starts where the player is.
+    positioning_days: int
+    positioning_refuel_stops: int
+    positioning_refuel_cost: int
+    legs: tuple[TradeLeg, ...]
+    # Leg profits less positioning_refuel_cost.
+    total_profit: int
+    total_days: int
+    loop: bool
+    fuel_remaining: int
+    credits_after: int
+
+    @property
+    def profit_per_day(self) -> float:
+        return self.total_profit / max(1, self.total_days)
+
+
+@dataclass(frozen=True)
+class _Edge:
+    estimate: int
+    target: str
+    sku: str
+    buy_price: int
+    sell_price: int
+
+
+class TradeRouteFinder:
+    """Search over one set of observations; build a new finder when observations change.
+
+    ``system_of`` maps each destination to its system. ``policy(destination_id, sku, action)``
+    returns (legality, risk_tier) as LegalityStatus/RiskTier values, and ``allowed(legality, risk_tier)``
+    says whether that buy or sell may be planned. Policies are only looked up for offers the search reaches.
+    A leg reports the worse legality and risk of its two sides.
+    """
+
+    def __init__(
+        self,
+        observations: dict[str, dict[str, dict[str, Any]]],
+        *,
+        system_of: Callable[[str], str | None],
+        planner: Any,
+        policy: Callable[[str, str, str], tuple[str, str]],
+        allowed: Callable[[str, str], bool],
+        risk_order: Iterable[str],
+    ) -> None:
+        self._planner = planner
+        self._system_of = system_of
+        self._policy = policy
+        self._allowed = allowed
+        self._verdicts: dict[tuple[str, str], bool] = {}
+        self._risk_rank = {tier: index for index, tier in enumerate(risk_order)}
+        self._policies: dict[tuple[str, str, str], tuple[str, str]] = {}
+        self._systems: dict[str, str] = {}
+        self._buy_offers: dict[str, list[tuple[str, int]]] = {}
+        self._sell_by_system: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        cheapest: dict[str, int] = {}
+        best_sell: dict[str, int] = {}
+        for destination_id in sorted(observations):
+            system_id = system_of(destination_id)
+            if system_id is None:
+                continue
+            self._systems[destination_id] = system_id
+            offers = []
+            for sku, prices in sorted(observations[destination_id].items()):
+                buy = int(prices.get("buy", 0) or 0)
+                sell = int(prices.get("sell", 0) or 0)
+                if buy > 0:
+                    offers.append((sku, buy))
+                    cheapest[sku] = min(buy, cheapest.get(sku, buy))
+                if sell > 0:
+                    # Sell offers by system, then SKU; lists for the systems a stop can reach are merged on demand.
+                    by_sku = self._sell_by_system.setdefault(system_id, {})
+                    by_sku.setdefault(sku, []).append((sell, destination_id))
+                    best_sell[sku] = max(sell, best_sell.get(sku, 0))
+            if offers:
+                self._buy_offers[destination_id] = offers
+        # Widest spread any SKU shows anywhere; bounds what one unit can earn on a leg.
+        self._max_margin = max(
+            (best_sell[sku] - buy for sku, buy in cheapest.items() if sku in best_sell),
+            default=0,
+        )
+        self._edges: dict[str, list[_Edge]] = {}
+        self._reachable_index: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        self._indexes_by_reach: dict[frozenset[str], dict[str, list[tuple[int, str]]]] = {}
+        self._travel: dict[tuple[str, str, int], tuple[int, int, int, int, int] | None] = {}
+
+    def find(
+        self,
+        *,
+        origin_destination_id: str,
+        fuel: int,
+        fuel_capacity: int,
+        credits: int,
+        cargo_space: int | None,
+        allow_refuel: bool = True,
+        top_k: int = DEFAULT_TOP_K,
+        max_legs: int = DEFAULT_MAX_LEGS,
+        branching: int = DEFAULT_BRANCHING,
+        start_candidates: int = DEFAULT_START_CANDIDATES,
+    ) -> list[TradeRoute]:
+        """Best plans by profit per day, at most ``top_k``; ``cargo_space`` None means unlimited."""
+        self._fuel_capacity = int(fuel_capacity)
+        self._allow_refuel = bool(allow_refuel)
+        self._credits = int(credits)
+        self._cargo_space = cargo_space
+        self._branching = int(branching)
+        # Edges depend on credits and cargo, reach and travel on the fuel rules; none of them carry over.
+        self._edges.clear()
+        self._reachable_index.clear()
+        self._travel.clear()
+        if origin_destination_id not in self._systems:
+            origin_system_id = self._system_of(origin_destination_id)
+            if origin_system_id is None:
+                return []
+            self._systems[origin_destination_id] = origin_system_id
+        if cargo_space is not None and cargo_space <= 0:
+            return []
+
+        starts = [origin_destination_id]
+        ranked_sources = sorted(
+            (
+                (-edges[0].estimate, destination_id)
+                for destination_id in self._buy_offers
+                if destination_id != origin_destination_id
+                for edges in (self._edges_from(destination_id),)
+                if edges
+            )
+        )
+        starts.extend(destination_id for _, destination_id in ranked_sources[: max(0, int(start_candidates))])
+
+        # Upper bound on one leg's profit, used to prune; unknowable without a cargo limit.
+        best_leg = None if cargo_space is None else max(0, self._max_margin) * cargo_space
+
+        self._top_k = max(1, int(top_k))
+        self._best: list[tuple[float, int, TradeRoute]] = []
+        self._serial = 0
+        for start in starts:
+            if start == origin_destination_id:
+                positioning = (0, 0, 0, int(fuel), 0)
+            else:
+                travel = self._travel_between(origin_destination_id, start, int(fuel))
+                if travel is None or travel[4] > self._credits:
+                    continue
+                positioning = travel
+            self._extend(
+                start=start,
+                positioning=positioning,
+                at=start,
+                legs=[],
+                visited={start},
+                days=positioning[0],
+                fuel=positioning[3],
+                credits=self._credits - positioning[4],
+                profit=-positioning[4],
+                remaining=int(max_legs),
+                best_leg=best_leg,
+            )
+        ordered = sorted(self._best, key=lambda entry: (-entry[0], -entry[1]))
+        return [entry[2] for entry in ordered]
+
+    def _extend(
+        self,
+        *,
+        start: str,
+        positioning: tuple[int, int, int, int, int],
+        at: str,
+        legs: list[TradeLeg],
+        visited: set[str],
+        days: int,
+        fuel: int,
+        credits: int,
+        profit: int,
+        remaining: int,
+        best_leg: int | None,
+    ) -> None:
+        if remaining <= 0:
+            return
+        if best_leg is not None and len(self._best) >= self._top_k:
+            # Every further leg takes at least a day and earns at most best_leg.
+            bound = (profit + remaining * best_leg) / max(1, days + 1)
+            if bound <= self._best[0][0]:
+                return
+        for edge in self._edges_from(at):
+            closes_loop = edge.target == start and bool(legs)
+            if edge.target in visited and not closes_loop:
+                continue
+            travel = self._travel_between(at, edge.target, fuel)
+            if travel is None:
+                continue
+            travel_days, fuel_cost, refuel_stops, fuel_after, refuel_cost = travel
+            # Fuel is bought on the way, after the cargo, so its price is set aside first.
+            quantity = (credits - refuel_cost) // edge.buy_price
+            if self._cargo_space is not None:
+                quantity = min(quantity, self._cargo_space)
+            if quantity <= 0:
+                continue
+            legality, risk_tier = self._leg_policy(at, edge.target, edge.sku)
+            leg_profit = quantity * (edge.sell_price - edge.buy_price) - refuel_cost
+            leg = TradeLeg(
+                buy_destination_id=at,
+                sell_destination_id=edge.target,
+                sku_id=edge.sku,
+                quantity=quantity,
+                buy_price=edge.buy_price,
+                sell_price=edge.sell_price,
+                profit=leg_profit,
+                travel_days=travel_days,
+                fuel_cost=fuel_cost,
+                refuel_stops=refuel_stops,
+                refuel_cost=refuel_cost,
+                legality=legality,
+                risk_tier=risk_tier,
+            )
+            route_legs = legs + [leg]
+            route_days = days + travel_days
+            route_profit = profit + leg_profit
+            route_credits = credits + leg_profit
+            self._offer(
+                TradeRoute(
+                    start_destination_id=start,
+                    positioning_days=positioning[0],
+                    positioning_refuel_stops=positioning[2],
+                    positioning_refuel_cost=positioning[4],
+                    legs=tuple(route_legs),
+                    total_profit=route_profit,
+                    total_days=route_days,
+                    loop=closes_loop,
+                    fuel_remaining=fuel_after,
+                    credits_after=route_credits,
+                )
+            )
+            if closes_loop:
+                continue
+            visited.add(edge.target)
+            self._extend(
+                start=start,
+                positioning=positioning,
+                at=edge.target,
+                legs=route_legs,
+                visited=visited,
+                days=route_days,
+                fuel=fuel_after,
+                credits=route_credits,
+                profit=route_profit,
+                remaining=remaining - 1,
+                best_leg=best_leg,
+            )
+            visited.discard(edge.target)
+
+    def _offer(self, route: TradeRoute) -> None:
+        # Min-heap of the best K by (profit per day, then earlier discovery). Fuel can eat a plan's
+        # margin; such a plan is still extended but never offered.
+        if route.total_profit <= 0:
+            return
+        self._serial += 1
+        entry = (route.profit_per_day, -self._serial, route)
+        if len(self._best) < self._top_k:
+            heapq.heappush(self._best, entry)
+        elif entry[:2] > self._best[0][:2]:
+            heapq.heapreplace(self._best, entry)
+
+    def _edges_from(self, source: str) -> list[_Edge]:
+        """Up to ``branching`` best trades out of ``source``, one per target, by estimated leg profit."""
+        cached = self._edges.get(source)
+        if cached is not None:
+            return cached
+        sell_index = self._sell_index_within_reach(self._systems[source])
+        # One cursor per SKU on sale here, each walking that SKU's buyers best first.
+        heap: list[tuple[int, str, int, int, int]] = []
+        for sku, buy_price in self._buy_offers.get(source, ()):
+            buyers = sell_index.get(sku)
+            if not buyers or buyers[0][0] <= buy_price or not self._permitted(source, sku, "buy"):
+                continue
+            quantity = self._credits // buy_price
+            if self._cargo_space is not None:
+                quantity = min(quantity, self._cargo_space)
+            if quantity <= 0:
+                continue
+            self._push_buyer(heap, sku, buy_price, quantity, buyers, 0, source)
+        edges: list[_Edge] = []
+        seen: set[str] = set()
+        while heap and len(edges) < self._branching:
+            negative_estimate, sku, index, buy_price, quantity = heapq.heappop(heap)
+            buyers = sell_index[sku]
+            sell_price, target = buyers[index]
+            self._push_buyer(heap, sku, buy_price, quantity, buyers, index + 1, source)
+            if target in seen:
+                continue
+            seen.add(target)
+            edges.append(_Edge(-negative_estimate, target, sku, buy_price, sell_price))
+        self._edges[source] = edges
+        return edges
+
+    def _sell_index_within_reach(self, system_id: str) -> dict[str, list[tuple[int, str]]]:
+        """Per SKU, buyers in systems ``system_id`` can reach at full tanks, best-paying first."""
+        index = self._reachable_index.get(system_id)
+        if index is not None:
+            return index
+        reach = frozenset(
+            target
+            for target in set(self._systems.values())
+            if self._planner.reachable(system_id, target, fuel_capacity=self._fuel_capacity)
+        )
+        # Systems that reach the same set share one filtered copy.
+        index = self._indexes_by_reach.get(reach)
+        if index is None:
+            merged: dict[str, list[tuple[int, str]]] = {}
+            for target in reach:
+                for sku, offers in self._sell_by_system.get(target, {}).items():
+                    merged.setdefault(sku, []).extend(offers)
+            # Ties by destination_id keep plans deterministic.
+            index = {sku: sorted(offers, key=lambda entry: (-entry[0], entry[1])) for sku, offers in merged.items()}
+            self._indexes_by_reach[reach] = index
+        self._reachable_index[system_id] = index
+        return index
+
+    def _push_buyer(
+        self,
+        heap: list[tuple[int, str, int, int, int]],
+        sku: str,
+        buy_price: int,
+        quantity: int,
+        buyers: list[tuple[int, str]],
+        index: int,
+        source: str,
+    ) -> None:
+        # Buyers are sorted by price, so the first one not above cost ends this SKU.
+        while index < len(buyers) and buyers[index][0] > buy_price:
+            target = buyers[index][1]
+            if target != source and self._permitted(target, sku, "sell"):
+                heapq.heappush(heap, (-(buyers[index][0] - buy_price) * quantity, sku, index, buy_price, quantity))
+                return
+            index += 1
+
+    def _permitted(self, destination_id: str, sku: str, action: str) -> bool:
+        """Whether ``allowed`` accepts this trade; policies are looked up the first time an offer is considered."""
+        key = (destination_id, sku, action)
+        trade_policy = self._policies.get(key)
+        if trade_policy is None:
+            trade_policy = self._policies[key] = self._policy(destination_id, sku, action)
+        verdict = self._verdicts.get(trade_policy)
+        if verdict is None:
+            verdict = self._verdicts[trade_policy] = bool(self._allowed(*trade_policy))
+        return verdict
+
+    def _leg_policy(self, source: str, target: str, sku: str) -> tuple[str, str]:
+        buy_legality, buy_risk = self._policies[(source, sku, "buy")]
+        sell_legality, sell_risk = self._policies[(target, sku, "sell")]
+        legality = max(buy_legality, sell_legality, key=_LEGALITY_SEVERITY.get)
+        risk_tier = max(buy_risk, sell_risk, key=lambda tier: self._risk_rank.get(tier, 0))
+        return legality, risk_tier
+
+    def _travel_between(self, source: str, target: str, fuel: int) -> tuple[int, int, int, int, int] | None:
+        """(days, fuel burned, refuel stops, fuel left, refuel cost) to ``target``, or None if out of reach."""
+        key = (source, target, fuel)
+        if key in self._travel:
+            return self._travel[key]
+        source_system, target_system = self._systems[source], self._systems[target]
+        if source_system == target_system:
+            travel = (INTRA_SYSTEM_TRAVEL_DAYS, 0, 0, fuel, 0)
+        else:
+            plan = self._planner.plan(
+                source_system,
+                target_system,
+                fuel=fuel,
+                fuel_capacity=self._fuel_capacity,
+                allow_refuel=self._allow_refuel,
+            )
+            travel = None if plan is None else (
+                plan.total_days,
+                plan.total_fuel,
+                plan.refuel_stops,
+                plan.fuel_remaining,
+                plan.refuel_units * FUEL_PRICE_PER_UNIT,
+            )
+        self._travel[key] = travel
+        return travel
+
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from data_catalog import DataCatalog
-from economy_engine import EconomyEngine, TradeAction
+from economy_engine import ECONOMY_TICK, ECONOMY_TICK_PRIORITY, EconomyEngine, TradeAction
 from government_law_engine import (
     Commodity,
     GovernmentLawEngine,
@@ -48,6 +48,8 @@ class TurnLoop:
         world_seed: int,
     ) -> None:
         self._time_engine = time_engine
+        # The economy tick is this loop's; a context-less TimeEngine would leave it on the shared default clock.
+        self._time_engine.own_context()
         self._sector = sector
         self._player_state = player_state
         self._logger = logger
@@ -56,11 +58,12 @@ class TurnLoop:
         self._catalog = catalog
         self._government_registry = government_registry
         self._world_seed = world_seed
+        # The economy moves with the clock: every day advanced runs it once, after the world-state lifecycle.
+        self._time_engine.register_tick(ECONOMY_TICK, self._economy.run_tick, priority=ECONOMY_TICK_PRIORITY)
 
     def execute_move(self, action: MoveAction) -> None:
         if self._sector.get_system(action.target_system_id) is None:
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(action.target_system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -72,7 +75,6 @@ class TurnLoop:
         previous = self._player_state.current_system_id
         self._player_state.current_system_id = action.target_system_id
         turn = self._time_engine.advance()
-        self._economy.advance_turn(turn=turn)
         self._apply_heat_decay(action.target_system_id, turn)
         self._border_checkpoint(action.target_system_id, turn)
         self._logger.log(
@@ -86,7 +88,6 @@ class TurnLoop:
         market_good = self._market_good(system_id, action.sku)
         if market_good is None:
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -97,7 +98,6 @@ class TurnLoop:
         turn = self._time_engine.current_turn
         if self._customs_checkpoint(system_id, turn) is False:
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -110,16 +110,15 @@ class TurnLoop:
         self._player_state.cargo_by_ship["active"][action.sku] = (
             self._player_state.cargo_by_ship["active"].get(action.sku, 0) + 1
         )
-        turn = self._time_engine.advance()
-        self._economy.advance_turn(
-            turn=turn,
-            trade_action=TradeAction(
+        self._economy.queue_trade(
+            TradeAction(
                 system_id=system_id,
                 category_id=category_id,
                 delta=-1,
                 cause="player_buy",
-            ),
+            )
         )
+        turn = self._time_engine.advance()
         self._apply_heat_decay(system_id, turn)
         pricing = self._price_quote(system_id, action.sku, "buy", turn)
         self._logger.log(
@@ -135,7 +134,6 @@ class TurnLoop:
         current = self._player_state.cargo_by_ship.get("active", {}).get(action.sku, 0)
         if current <= 0:
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -148,7 +146,6 @@ class TurnLoop:
         category_id = self._sku_category(action.sku)
         if category_id is None:
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -158,7 +155,6 @@ class TurnLoop:
             return
         if not self._category_present(system_id, category_id):
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -169,7 +165,6 @@ class TurnLoop:
         turn = self._time_engine.current_turn
         if self._customs_checkpoint(system_id, turn) is False:
             turn = self._time_engine.advance()
-            self._economy.advance_turn(turn=turn)
             self._apply_heat_decay(system_id, turn)
             self._logger.log(
                 turn=turn,
@@ -177,16 +172,15 @@ class TurnLoop:
                 state_change=f"system_id={system_id} sku={action.sku}",
             )
             return
-        turn = self._time_engine.advance()
-        self._economy.advance_turn(
-            turn=turn,
-            trade_action=TradeAction(
+        self._economy.queue_trade(
+            TradeAction(
                 system_id=system_id,
                 category_id=category_id,
                 delta=1,
                 cause="player_sell",
-            ),
+            )
         )
+        turn = self._time_engine.advance()
         self._apply_heat_decay(system_id, turn)
         pricing = self._price_quote(system_id, action.sku, "sell", turn)
         self._logger.log(
@@ -366,11 +360,8 @@ class TurnLoop:
         market = system.attributes.get("market")
         if market is None:
             return None
-        for category in market.categories.values():
-            for good in category.produced + category.consumed + category.neutral:
-                if good.sku == sku:
-                    return good
-        return None
+        entry = market.good_entry(sku)
+        return entry[0] if entry is not None else None
 
     def _sku_category(self, sku: str) -> str | None:
         market_good = self._market_good(self._player_state.current_system_id, sku)
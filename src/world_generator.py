@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import hashlib
@@ -11,6 +12,13 @@ from data_catalog import DataCatalog, load_data_catalog
 from logger import Logger
 from market import Market
 from market_creation import MarketCreator
+from sector_index import SectorIndex
+from spatial_index import PointGrid
+
+
+# On-disk sector caches key on this and on the generator's source; bump it when output changes
+# through something the source hash does not cover.
+WORLD_GENERATOR_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -66,20 +74,186 @@ class System:
 class Galaxy:
     systems: List[System]
 
+    @property
+    def index(self) -> SectorIndex:
+        """Id lookups for systems, destinations and locations; built on first use."""
+        index = self.__dict__.get("_index")
+        if index is None or not index.covers(self.systems):
+            index = SectorIndex(self.systems)
+            object.__setattr__(self, "_index", index)
+        return index
+
+    def __getstate__(self) -> dict:
+        # The index is derived; snapshots, forks and the sector cache rebuild it on demand.
+        state = dict(self.__dict__)
+        state.pop("_index", None)
+        return state
+
     def system_ids(self) -> List[str]:
         return [system.system_id for system in self.systems]
 
     def get_system(self, system_id: str) -> Optional[System]:
-        for system in self.systems:
-            if system.system_id == system_id:
-                return system
-        return None
+        return self.index.system(system_id)
+
+    def get_destination(self, destination_id: str) -> Optional[Destination]:
+        return self.index.destination(destination_id)
+
+    def get_location(self, location_id: str) -> Optional[Location]:
+        return self.index.location(location_id)
+
+    def system_for_destination(self, destination_id: str) -> Optional[System]:
+        return self.index.system_for_destination(destination_id)
+
+    def destination_for_location(self, location_id: str) -> Optional[Destination]:
+        return self.index.destination_for_location(location_id)
 
 
 class Sector(Galaxy):
     pass
 
 
+class LazySystem(System):
+    """
+    A System whose destinations and attributes are generated on first read.
+
+    Destination generation is seeded per system, so the expanded record is the one
+    generate() builds eagerly. Expanding turns the instance into a plain System in
+    place, so every holder of the reference sees the generated contents and
+    snapshots of an expanded system store it like any other.
+    """
+
+    # Read by SectorIndex, which must not trigger generation while indexing.
+    materialized = False
+
+    def __init__(self, system: System, *, profile_id: str, source: "_SystemSource") -> None:
+        for system_field in fields(System):
+            if system_field.name not in {"destinations", "attributes"}:
+                object.__setattr__(self, system_field.name, getattr(system, system_field.name))
+        object.__setattr__(self, "_profile_id", profile_id)
+        object.__setattr__(self, "_source", source)
+
+    @property
+    def destinations(self) -> List[Destination]:
+        return self.materialize().destinations
+
+    @property
+    def attributes(self) -> dict:
+        return self.materialize().attributes
+
+    def materialize(self) -> System:
+        destinations, attributes = self._source.contents(
+            system_id=self.system_id,
+            name=self.name,
+            population=self.population,
+            government_id=self.government_id,
+            profile_id=self._profile_id,
+        )
+        state = self.__dict__
+        del state["_profile_id"]
+        del state["_source"]
+        state["destinations"] = destinations
+        state["attributes"] = attributes
+        object.__setattr__(self, "__class__", System)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        return self.materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazySystem(system_id={self.system_id!r}, name={self.name!r})"
+
+
+class _SystemSource:
+    """Generation inputs shared by every system of one sector."""
+
+    def __init__(
+        self,
+        *,
+        seed: int,
+        catalog: DataCatalog,
+        availability_rules: Dict[str, dict] | None = None,
+        names_data: Dict[str, List[str]] | None = None,
+        logger: Logger | None = None,
+    ) -> None:
+        self.seed = seed
+        self.catalog = catalog
+        self.availability_rules = availability_rules if availability_rules is not None else _load_location_availability()
+        self.names_data = names_data if names_data is not None else _load_names()
+        self.logger = logger
+
+    def __reduce__(self):
+        # Rules and names are reloaded from game data; generation logging does not survive a copy.
+        return (_restore_system_source, (self.seed, self.catalog))
+
+    def contents(
+        self,
+        *,
+        system_id: str,
+        name: str,
+        population: int,
+        government_id: str,
+        profile_id: str,
+    ) -> tuple[List[Destination], dict]:
+        destinations = _generate_destinations(
+            seed=self.seed,
+            system_id=system_id,
+            system_name=name,
+            system_population=population,
+            government_id=government_id,
+            catalog=self.catalog,
+            availability_rules=self.availability_rules,
+            logger=self.logger,
+            names_data=self.names_data,
+        )
+        primary_market = _first_destination_market(destinations)
+        primary_economy, secondary_economies = _first_destination_economies(destinations)
+        attributes = {
+            "profile_id": profile_id,
+            "population_level": population,
+            "government_id": government_id,
+            "destinations": destinations,
+            # Deprecated compatibility shim. Do not use for new logic.
+            # Derived fields only. Not authoritative.
+            # TODO(Phase 3.x): Remove once all callers are destination-scoped.
+            "market": primary_market,
+            "primary_economy": primary_economy,
+            "secondary_economies": secondary_economies,
+        }
+        return destinations, attributes
+
+
+def _restore_system_source(seed: int, catalog: DataCatalog) -> _SystemSource:
+    return _SystemSource(seed=seed, catalog=catalog)
+
+
+# Set in each pool worker by _init_worker_source, so the catalog crosses once per worker.
+_WORKER_SOURCE: _SystemSource | None = None
+
+
+def _init_worker_source(source: _SystemSource) -> None:
+    global _WORKER_SOURCE
+    _WORKER_SOURCE = source
+
+
+def _worker_contents(spec: dict) -> tuple[List[Destination], dict]:
+    assert _WORKER_SOURCE is not None
+    return _WORKER_SOURCE.contents(**spec)
+
+
+def _parallel_contents(source: _SystemSource, specs: List[dict], workers: int) -> List[tuple[List[Destination], dict]]:
+    workers = min(int(workers), len(specs))
+    # A few chunks per worker balances uneven systems without paying per-system IPC.
+    chunksize = max(1, len(specs) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker_source,
+        initargs=(source,),
+    ) as pool:
+        return list(pool.map(_worker_contents, specs, chunksize=chunksize))
+
+
 class WorldGenerator:
     def __init__(
         self,
@@ -101,9 +275,27 @@ class WorldGenerator:
         """Compute galaxy radius deterministically: R = 10.0 * sqrt(system_count)"""
         return 10.0 * math.sqrt(float(self._system_count))
 
-    def generate(self) -> Galaxy:
+    def generate(self, *, lazy: bool = False, workers: int = 1) -> Galaxy:
+        """
+        Build the sector.
+
+        With lazy=True each system is a LazySystem that holds only its name, population,
+        government, coordinates and starlanes; destinations, locations and markets are
+        generated the first time they are read, identical to the eager result.
+
+        With workers > 1 the per-system destination and market generation of an eager
+        sector runs in a process pool of that size. Results are reassembled in system
+        order, so the sector is identical to the serial one. A generator with a logger
+        always runs serially to keep its log in order.
+        """
         rng = random.Random(self._seed)
-        availability_rules = _load_location_availability()
+        source = _SystemSource(
+            seed=self._seed,
+            catalog=self._catalog,
+            availability_rules=_load_location_availability(),
+            names_data=self._names_data,
+            logger=self._logger,
+        )
         # Use names loaded during initialization
         system_names = list(self._names_data["systems"])
         rng.shuffle(system_names)
@@ -111,59 +303,52 @@ class WorldGenerator:
         profiles = list(PROFILE_IDS)
         rng.shuffle(profiles)
 
-        systems: List[System] = []
+        # Per-system generation inputs; everything after this loop is seeded per system.
+        specs: List[dict] = []
         for index in range(self._system_count):
-            system_id = f"SYS-{index + 1:03d}"
-            name = system_names[index % len(system_names)]
-            profile_id = profiles[index % len(profiles)]
-            # Population changes require explicit Situation Engine handling.
-            population_level = self._weighted_population_level(rng)
-            government_id = self._choose_government_id(rng)
-            position = (index, 0)
-            destinations = _generate_destinations(
-                seed=self._seed,
-                system_id=system_id,
-                system_name=name,
-                system_population=population_level,
-                government_id=government_id,
-                catalog=self._catalog,
-                availability_rules=availability_rules,
-                logger=self._logger,
-                names_data=self._names_data,
+            specs.append(
+                {
+                    "system_id": f"SYS-{index + 1:03d}",
+                    "name": system_names[index % len(system_names)],
+                    # Population changes require explicit Situation Engine handling.
+                    "population": self._weighted_population_level(rng),
+                    "government_id": self._choose_government_id(rng),
+                    "profile_id": profiles[index % len(profiles)],
+                }
             )
-            primary_market = _first_destination_market(destinations)
-            primary_economy, secondary_economies = _first_destination_economies(destinations)
-            attributes = {
-                "profile_id": profile_id,
-                "population_level": population_level,
-                "government_id": government_id,
-                "destinations": destinations,
-                # Deprecated compatibility shim. Do not use for new logic.
-                # Derived fields only. Not authoritative.
-                # TODO(Phase 3.x): Remove once all callers are destination-scoped.
-                "market": primary_market,
-                "primary_economy": primary_economy,
-                "secondary_economies": secondary_economies,
-            }
-            systems.append(
-                System(
-                    system_id=system_id,
-                    name=name,
-                    position=position,
-                    population=population_level,
-                    government_id=government_id,
-                    destinations=destinations,
-                    attributes=attributes,
-                    neighbors=[],
-                )
+
+        if lazy:
+            contents: List[tuple[List[Destination], dict]] = [([], {}) for _ in specs]
+        elif workers > 1 and self._logger is None and len(specs) > 1:
+            contents = _parallel_contents(source, specs, workers)
+        else:
+            contents = [source.contents(**spec) for spec in specs]
+
+        systems: List[System] = [
+            System(
+                system_id=spec["system_id"],
+                name=spec["name"],
+                position=(index, 0),
+                population=spec["population"],
+                government_id=spec["government_id"],
+                destinations=destinations,
+                attributes=attributes,
+                neighbors=[],
             )
+            for index, (spec, (destinations, attributes)) in enumerate(zip(specs, contents))
+        ]
 
         # Assign spatial coordinates first (needed for graph construction)
         systems = self._assign_spatial_coordinates(systems)
         
         # Build starlane graph (MST + k-NN)
         systems = self._build_starlane_graph(systems)
-        
+
+        if lazy:
+            systems = [
+                LazySystem(system, profile_id=spec["profile_id"], source=source)
+                for system, spec in zip(systems, specs)
+            ]
         return Galaxy(systems=systems)
 
     def _choose_government_id(self, rng: random.Random) -> str:
@@ -274,83 +459,31 @@ class WorldGenerator:
             # Single system or empty: no neighbors needed
             return systems
         
-        # Build edge list: all pairs (i < j) with distance
-        edges: List[tuple[float, str, str]] = []  # (distance, a_id, b_id) where a_id < b_id
-        system_by_id = {s.system_id: s for s in systems}
-        
+        # Exact nearest-first queries on a uniform grid replace the all-pairs edge list;
+        # edge order, tie-breaks and therefore the resulting graph are unchanged.
+        grid = PointGrid({s.system_id: (s.x, s.y) for s in systems})
         system_ids = sorted([s.system_id for s in systems])
-        for i, a_id in enumerate(system_ids):
-            a = system_by_id[a_id]
-            for b_id in system_ids[i + 1:]:
-                b = system_by_id[b_id]
-                dx = b.x - a.x
-                dy = b.y - a.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                edges.append((distance, a_id, b_id))
-        
-        # Sort edges by (distance, a_id, b_id) for deterministic tie-break
-        edges.sort(key=lambda e: (e[0], e[1], e[2]))
-        
-        # Build MST using Kruskal's algorithm with union-find
-        parent: Dict[str, str] = {sid: sid for sid in system_ids}
-        
-        def find(x: str) -> str:
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-        
-        def union(x: str, y: str) -> bool:
-            px, py = find(x), find(y)
-            if px == py:
-                return False
-            # Deterministic tie-break: always use lexicographically smaller as parent
-            if px < py:
-                parent[py] = px
-            else:
-                parent[px] = py
-            return True
-        
-        mst_edges: set[tuple[str, str]] = set()
-        for distance, a_id, b_id in edges:
-            if union(a_id, b_id):
-                # Add edge in both directions for undirected graph
-                mst_edges.add((a_id, b_id))
-                mst_edges.add((b_id, a_id))
-        
-        # Build neighbor lists from MST
+
+        # Minimum spanning tree by Kruskal in (distance, a_id, b_id) order
         neighbors_by_id: Dict[str, set[str]] = {sid: set() for sid in system_ids}
-        for a_id, b_id in mst_edges:
+        for distance, a_id, b_id in grid.minimum_spanning_edges():
             neighbors_by_id[a_id].add(b_id)
-        
+            neighbors_by_id[b_id].add(a_id)
+
         # Add k-NN edges (k=2 additional edges per node)
         k = 2
         for a_id in system_ids:
-            a = system_by_id[a_id]
-            # Find nearest neighbors sorted by (distance, neighbor_id)
-            candidates: List[tuple[float, str]] = []
-            for b_id in system_ids:
-                if b_id == a_id:
-                    continue
-                if b_id in neighbors_by_id[a_id]:
-                    continue  # Already connected
-                b = system_by_id[b_id]
-                dx = b.x - a.x
-                dy = b.y - a.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                candidates.append((distance, b_id))
-            
-            # Sort by (distance, neighbor_id) for deterministic selection
-            candidates.sort(key=lambda c: (c[0], c[1]))
-            
-            # Add up to k nearest non-existing edges
+            # Nearest neighbors arrive sorted by (distance, neighbor_id)
             added = 0
-            for distance, b_id in candidates:
+            for distance, b_id in grid.nearest(a_id):
                 if added >= k:
                     break
+                if b_id in neighbors_by_id[a_id]:
+                    continue  # Already connected
                 neighbors_by_id[a_id].add(b_id)
                 neighbors_by_id[b_id].add(a_id)  # Undirected symmetry
                 added += 1
-        
+
         # Update systems with sorted neighbor lists
         updated: List[System] = []
         for system in systems:
@@ -390,9 +523,12 @@ def normalize_destination_type(destination_type: str, logger: Logger | None = No
 
 
 def _load_location_availability() -> Dict[str, dict]:
-    path = Path(__file__).resolve().parents[1] / "data" / "location_availability.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return data
+    try:
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
+
+    return get_data_bundle().document("location_availability.json")
 
 
 def _load_names() -> Dict[str, List[str]]:
@@ -1,11 +1,27 @@
-import hashlib
 import json
 import random
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, is_dataclass, replace
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Optional
+from typing import Any, Callable, ClassVar, Iterable, Optional
 
+from deterministic_rng import DeterministicRng
+from event_bus import DEBUG, INFO, WARNING, BusEvent, EventBus, TraceEvent, stdout_event_bus
 from npc_entity import NPCPersistenceTier
+from schedule_queue import ScheduleQueue
+from sector_index import SectorIndex
+
+
+# Systems whose spawn gates roll each day: "local" is the player's system (the default),
+# "galaxy" is every system in the sector.
+WORLD_STATE_SCOPE_LOCAL = "local"
+WORLD_STATE_SCOPE_GALAXY = "galaxy"
+WORLD_STATE_SCOPES = (WORLD_STATE_SCOPE_LOCAL, WORLD_STATE_SCOPE_GALAXY)
+
+
+def require_world_state_scope(scope: Any) -> str:
+    if scope not in WORLD_STATE_SCOPES:
+        raise ValueError(f"world_state_scope must be one of {', '.join(WORLD_STATE_SCOPES)}.")
+    return str(scope)
 
 
 @dataclass
@@ -42,6 +58,188 @@ class ScheduledSituation:
     insertion_index: int = -1
 
 
+@dataclass(frozen=True)
+class SituationAdded(BusEvent):
+    kind: ClassVar[str] = "situation_added"
+    level: ClassVar[int] = INFO
+
+    situation_id: str
+    system_id: str
+    scope: str
+
+    def render(self) -> str:
+        return f"Situation added: {self.situation_id} system={self.system_id} scope={self.scope}"
+
+
+@dataclass(frozen=True)
+class EventAdded(BusEvent):
+    kind: ClassVar[str] = "event_added"
+    level: ClassVar[int] = INFO
+
+    event_id: str
+    system_id: str
+
+    def render(self) -> str:
+        return f"Event added: {self.event_id} system={self.system_id}"
+
+
+@dataclass(frozen=True)
+class SituationExpired(BusEvent):
+    kind: ClassVar[str] = "situation_expired"
+    level: ClassVar[int] = INFO
+
+    situation_id: str
+    system_id: str
+
+    def render(self) -> str:
+        return f"Situation expired: {self.situation_id} system={self.system_id}"
+
+
+@dataclass(frozen=True)
+class EventExpired(BusEvent):
+    kind: ClassVar[str] = "event_expired"
+    level: ClassVar[int] = INFO
+
+    event_id: str
+    system_id: str
+
+    def render(self) -> str:
+        return f"Event expired: {self.event_id} system={self.system_id}"
+
+
+@dataclass(frozen=True)
+class SpawnGateChecked(BusEvent):
+    kind: ClassVar[str] = "spawn_gate_checked"
+    level: ClassVar[int] = DEBUG
+
+    system_id: str
+    current_day: int
+    cooldown_until: Optional[int]
+    skipped: bool
+
+    def render(self) -> str:
+        reason = "cooldown_active" if self.skipped else "cooldown_clear"
+        return (
+            f"Spawn gate cooldown check: system_id={self.system_id} current_day={self.current_day} "
+            f"cooldown_until={self.cooldown_until} skipped={str(self.skipped).lower()} reason={reason}"
+        )
+
+
+@dataclass(frozen=True)
+class SpawnGateClosed(BusEvent):
+    kind: ClassVar[str] = "spawn_gate_closed"
+    level: ClassVar[int] = DEBUG
+
+    system_id: str
+    current_day: int
+    cooldown_until: Optional[int]
+    spawn_gate_roll: float
+
+    def render(self) -> str:
+        return (
+            f"Spawn gate cooldown not set: system_id={self.system_id} current_day={self.current_day} "
+            f"cooldown_until={self.cooldown_until} reason=spawn_gate_roll_failed spawn_gate_roll={self.spawn_gate_roll}"
+        )
+
+
+@dataclass(frozen=True)
+class SpawnSelected(BusEvent):
+    kind: ClassVar[str] = "spawn_selected"
+    level: ClassVar[int] = DEBUG
+
+    system_id: str
+    current_day: int
+    selected_type: str
+    selected_tier: int
+    spawn_type_roll: float
+    severity_roll: float
+
+    def render(self) -> str:
+        return (
+            f"Spawn gate type+tier selected: system_id={self.system_id} current_day={self.current_day} "
+            f"selected_type={self.selected_type} selected_tier={self.selected_tier} "
+            f"spawn_type_roll={self.spawn_type_roll} severity_roll={self.severity_roll}"
+        )
+
+
+@dataclass(frozen=True)
+class SpawnCandidatesFiltered(BusEvent):
+    kind: ClassVar[str] = "spawn_candidates_filtered"
+    level: ClassVar[int] = DEBUG
+
+    system_id: str
+    selected_type: str
+    selected_tier: Optional[int]
+    candidates_found: int
+
+    def render(self) -> str:
+        return (
+            f"Spawn gate candidate filter: system_id={self.system_id} selected_type={self.selected_type} "
+            f"selected_tier={self.selected_tier} candidates_found={self.candidates_found}"
+        )
+
+
+@dataclass(frozen=True)
+class SpawnCooldownSet(BusEvent):
+    kind: ClassVar[str] = "spawn_cooldown_set"
+    level: ClassVar[int] = DEBUG
+
+    system_id: str
+    current_day: int
+    cooldown_until: int
+
+    def render(self) -> str:
+        return (
+            f"Spawn gate cooldown set: system_id={self.system_id} current_day={self.current_day} "
+            f"cooldown_until={self.cooldown_until} generated_any=true reason=spawn_gate_generation"
+        )
+
+
+@dataclass(frozen=True)
+class SpawnNotGenerated(BusEvent):
+    kind: ClassVar[str] = "spawn_not_generated"
+    level: ClassVar[int] = DEBUG
+
+    system_id: str
+    current_day: int
+    cooldown_until: Optional[int]
+    selected_type: str
+    selected_tier: int
+
+    def render(self) -> str:
+        return (
+            f"Spawn gate cooldown not set: system_id={self.system_id} current_day={self.current_day} "
+            f"cooldown_until={self.cooldown_until} reason=no_generation_created "
+            f"selected_type={self.selected_type} selected_tier={self.selected_tier} candidates_found=0"
+        )
+
+
+@dataclass(frozen=True)
+class PropagationEvaluated(BusEvent):
+    kind: ClassVar[str] = "propagation_evaluated"
+    level: ClassVar[int] = DEBUG
+
+    origin_system_id: str
+    event_id: str
+    trigger_day: int
+    propagation_index: int
+    candidate_neighbors: tuple[str, ...]
+    selected_neighbors: tuple[str, ...]
+    situation_id: str
+    delay_days: int
+    systems_affected: int
+    scheduled_day: int
+
+    def render(self) -> str:
+        return (
+            f"Propagation evaluated: origin_system_id={self.origin_system_id} event_id={self.event_id} "
+            f"trigger_day={self.trigger_day} propagation_index={self.propagation_index} "
+            f"candidate_neighbors={list(self.candidate_neighbors)} selected_neighbors={list(self.selected_neighbors)} "
+            f"situation_id={self.situation_id} delay_days={self.delay_days} "
+            f"systems_affected={self.systems_affected} scheduled_day={self.scheduled_day}"
+        )
+
+
 @dataclass
 class WorldStateEngine:
     _MODIFIER_CAPS: ClassVar[dict[tuple[str, str], tuple[int | None, int | None]]] = {
@@ -63,8 +261,10 @@ class WorldStateEngine:
 
     active_situations: dict[str, list[ActiveSituation]] = field(default_factory=dict)
     active_events: dict[str, list[ActiveEvent]] = field(default_factory=dict)
-    scheduled_events: list[ScheduledEvent] = field(default_factory=list)
-    scheduled_situations: list[ScheduledSituation] = field(default_factory=list)
+    # Pending schedules, heap-ordered by (trigger_day, system_id, insertion_index); see the
+    # scheduled_events / scheduled_situations properties for the list views.
+    _event_schedule: ScheduleQueue = field(default_factory=ScheduleQueue)
+    _situation_schedule: ScheduleQueue = field(default_factory=ScheduleQueue)
     situation_catalog: list[dict[str, Any]] = field(default_factory=list)
     event_catalog: list[dict[str, Any]] = field(default_factory=list)
     system_flags: dict[str, set[str]] = field(default_factory=dict)
@@ -80,6 +280,19 @@ class WorldStateEngine:
     _situation_catalog_by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
     _event_catalog_by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
     _scheduled_insertion_counter: int = 0
+    # Aggregated modifier maps and their target buckets per (system_id, domain); rebuilt lazily
+    # after _add/_remove_modifier_entries drop them.
+    _modifier_index: dict[tuple[str, str], "_ModifierIndex"] = field(default_factory=dict, repr=False, compare=False)
+    _modifier_version: int = 0
+    _spawn_gates: Optional["_SpawnGateArrays"] = field(default=None, repr=False, compare=False)
+    _spawn_candidate_cache: dict[tuple[str, Optional[int]], tuple[list[dict[str, Any]], list[dict[str, Any]]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # Diagnostics go through the bus. Hot per-day paths publish typed events behind an explicit
+    # accepts() check; the rest use _trace(), which does the check before building a TraceEvent.
+    event_bus: EventBus = field(default_factory=stdout_event_bus, repr=False, compare=False)
+    # Spawn, propagation and duration rolls; compat mode keeps the historical streams.
+    rng: DeterministicRng = field(default_factory=DeterministicRng, repr=False, compare=False)
 
     def register_system(self, system_id: str) -> None:
         if system_id not in self.active_situations:
@@ -95,6 +308,10 @@ class WorldStateEngine:
         if system_id not in self.cooldown_until_day_by_system:
             self.cooldown_until_day_by_system[system_id] = None
 
+    def _trace(self, level: int, topic: str, **values: Any) -> None:
+        if self.event_bus.accepts(level):
+            self.event_bus.publish(TraceEvent.of(level, topic, **values))
+
     def configure_runtime_context(
         self,
         *,
@@ -121,38 +338,63 @@ class WorldStateEngine:
         if len(current) >= 3:
             raise ValueError("Maximum 3 active situations per system exceeded.")
         current.append(active_situation)
-        print(
-            f"Situation added: {active_situation.situation_id} "
-            f"system={active_situation.system_id} scope={active_situation.scope}"
-        )
+        if self.event_bus.accepts(SituationAdded.level):
+            self.event_bus.publish(
+                SituationAdded(active_situation.situation_id, active_situation.system_id, active_situation.scope)
+            )
         self._add_situation_modifiers(active_situation)
 
     def add_event(self, active_event: ActiveEvent) -> None:
         self.register_system(active_event.system_id)
         self.active_events[active_event.system_id].append(active_event)
-        print(
-            f"Event added: {active_event.event_id} "
-            f"system={active_event.system_id}"
-        )
+        if self.event_bus.accepts(EventAdded.level):
+            self.event_bus.publish(EventAdded(active_event.event_id, active_event.system_id))
+
+    @property
+    def scheduled_events(self) -> list[ScheduledEvent]:
+        """Pending scheduled events in scheduling order (a copy)."""
+        return self._event_schedule.entries()
+
+    @property
+    def scheduled_situations(self) -> list[ScheduledSituation]:
+        """Pending scheduled situations in scheduling order (a copy)."""
+        return self._situation_schedule.entries()
 
     def schedule_event(self, scheduled_event: ScheduledEvent) -> None:
-        self.register_system(scheduled_event.system_id)
-        if scheduled_event.insertion_index < 0:
-            scheduled_event.insertion_index = self._scheduled_insertion_counter
-            self._scheduled_insertion_counter += 1
-        self.scheduled_events.append(scheduled_event)
+        self._event_schedule.push(self._prepare_scheduled(scheduled_event))
 
     def schedule_situation(self, scheduled_situation: ScheduledSituation) -> None:
-        self.register_system(scheduled_situation.system_id)
-        if scheduled_situation.insertion_index < 0:
-            scheduled_situation.insertion_index = self._scheduled_insertion_counter
+        self._situation_schedule.push(self._prepare_scheduled(scheduled_situation))
+
+    def schedule_many(self, rows: Iterable[ScheduledEvent | ScheduledSituation]) -> None:
+        """Schedule a batch of events and situations with one heapify per queue.
+
+        Equivalent to calling schedule_event / schedule_situation for each row in order.
+        """
+        events: list[ScheduledEvent] = []
+        situations: list[ScheduledSituation] = []
+        for row in rows:
+            if isinstance(row, ScheduledEvent):
+                events.append(self._prepare_scheduled(row))
+            elif isinstance(row, ScheduledSituation):
+                situations.append(self._prepare_scheduled(row))
+            else:
+                raise ValueError(f"Cannot schedule {type(row).__name__}; expected ScheduledEvent or ScheduledSituation.")
+        self._event_schedule.extend(events)
+        self._situation_schedule.extend(situations)
+
+    def _prepare_scheduled(self, row: Any) -> Any:
+        self.register_system(row.system_id)
+        if row.insertion_index < 0:
+            row.insertion_index = self._scheduled_insertion_counter
             self._scheduled_insertion_counter += 1
-        self.scheduled_situations.append(scheduled_situation)
+        return row
 
-    def load_situation_catalog(self, catalog_path: str | Path | None = None) -> None:
-        path = Path(catalog_path) if catalog_path is not None else Path(__file__).resolve().parents[1] / "data" / "situations.json"
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+    def load_situation_catalog(self, catalog_path: str | Path | None = None, *, payload: Any = None) -> None:
+        if payload is None:
+            path = Path(catalog_path) if catalog_path is not None else Path(__file__).resolve().parents[1] / "data" / "situations.json"
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
 
         entries = payload.get("situations", []) if isinstance(payload, dict) else payload
         loaded: list[dict[str, Any]] = []
@@ -179,10 +421,11 @@ class WorldStateEngine:
             if item.get("situation_id")
         }
 
-    def load_event_catalog(self, catalog_path: str | Path | None = None) -> None:
-        path = Path(catalog_path) if catalog_path is not None else Path(__file__).resolve().parents[1] / "data" / "events.json"
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+    def load_event_catalog(self, catalog_path: str | Path | None = None, *, payload: Any = None) -> None:
+        if payload is None:
+            path = Path(catalog_path) if catalog_path is not None else Path(__file__).resolve().parents[1] / "data" / "events.json"
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
 
         entries = payload.get("events", []) if isinstance(payload, dict) else payload
         loaded: list[dict[str, Any]] = []
@@ -199,6 +442,16 @@ class WorldStateEngine:
         if not self._valid_government_ids:
             self._valid_government_ids = _load_valid_government_ids()
 
+    def shared_catalog_objects(self) -> list[Any]:
+        """Containers that are read-only once loaded, safe to share between engine forks."""
+        return [
+            self.situation_catalog,
+            self.event_catalog,
+            self._situation_catalog_by_id,
+            self._event_catalog_by_id,
+            self._valid_government_ids,
+        ]
+
     def evaluate_spawn_gate(
         self,
         world_seed: int,
@@ -206,7 +459,7 @@ class WorldStateEngine:
         neighbor_system_ids: list[str],
         current_day: int,
         event_frequency_percent: int,
-    ) -> None:
+    ) -> bool:
         # Evaluate only R=0,1 systems: current + direct neighbors provided by caller.
         eligible_systems: list[str] = []
         seen: set[str] = set()
@@ -220,72 +473,140 @@ class WorldStateEngine:
 
         cooldown_until = self.cooldown_until_day_by_system.get(current_system_id)
         if cooldown_until is not None and current_day <= cooldown_until:
-            print(
-                "Spawn gate cooldown check: "
-                f"system_id={current_system_id} current_day={current_day} "
-                f"cooldown_until={cooldown_until} skipped=true reason=cooldown_active"
-            )
-            return
-        print(
-            "Spawn gate cooldown check: "
-            f"system_id={current_system_id} current_day={current_day} "
-            f"cooldown_until={cooldown_until} skipped=false reason=cooldown_clear"
-        )
+            if self.event_bus.accepts(SpawnGateChecked.level):
+                self.event_bus.publish(SpawnGateChecked(current_system_id, current_day, cooldown_until, True))
+            return False
+        if self.event_bus.accepts(SpawnGateChecked.level):
+            self.event_bus.publish(SpawnGateChecked(current_system_id, current_day, cooldown_until, False))
 
         spawn_probability = max(0.0, min(1.0, float(event_frequency_percent) / 100.0))
-        spawn_gate_roll = _rng_u01(
-            _deterministic_seed_with_parts(
-                world_seed,
-                current_system_id,
-                current_day,
-                "spawn_gate",
-            )
-        )
+        spawn_gate_roll = self.rng.day_u01(world_seed, current_system_id, current_day, "spawn_gate")
         if spawn_gate_roll >= spawn_probability:
-            print(
-                "Spawn gate cooldown not set: "
-                f"system_id={current_system_id} current_day={current_day} "
-                f"cooldown_until={self.cooldown_until_day_by_system.get(current_system_id)} "
-                f"reason=spawn_gate_roll_failed spawn_gate_roll={spawn_gate_roll}"
-            )
-            return
+            if self.event_bus.accepts(SpawnGateClosed.level):
+                self.event_bus.publish(
+                    SpawnGateClosed(current_system_id, current_day, cooldown_until, spawn_gate_roll)
+                )
+            return False
+        self._resolve_spawn(world_seed, current_system_id, current_day)
+        return True
 
-        spawn_type_roll = _rng_u01(
-            _deterministic_seed_with_parts(
-                world_seed,
-                current_system_id,
-                current_day,
-                "spawn_type",
+    def evaluate_spawn_gates(
+        self,
+        world_seed: int,
+        system_ids: list[str],
+        current_day: int,
+        event_frequency_percent: int,
+    ) -> int:
+        """Spawn gate for every system in ``system_ids`` (the galaxy world-state scope).
+
+        Same outcome as evaluate_spawn_gate(world_seed, system_id, [], ...) for each system in
+        sorted order, but cooldowns live in arrays and gate rolls are drawn in one batch; only
+        systems whose gate opens take the per-system path. Returns the number of gates opened.
+        """
+        gates = self._spawn_gate_arrays(system_ids)
+        if self.event_bus.accepts(SpawnGateChecked.level):
+            # Per-system traces need the per-system path.
+            return sum(
+                self.evaluate_spawn_gate(world_seed, system_id, [], current_day, event_frequency_percent)
+                for system_id in gates.system_ids
             )
-        )
+        spawn_probability = max(0.0, min(1.0, float(event_frequency_percent) / 100.0))
+        ready = [slot for slot, day in enumerate(gates.ready_day) if day <= current_day]
+        ready_ids = [gates.system_ids[slot] for slot in ready]
+        opened = 0
+        rolls = self.rng.day_u01_many(world_seed, ready_ids, current_day, "spawn_gate")
+        for system_id, roll in zip(ready_ids, rolls):
+            if roll < spawn_probability:
+                opened += 1
+                self._resolve_spawn(world_seed, system_id, current_day)
+        return opened
+
+    def next_active_day(
+        self,
+        world_seed: int,
+        gate_system_ids: list[str],
+        first_day: int,
+        last_day: int,
+        event_frequency_percent: int,
+    ) -> int:
+        """First day in [first_day, last_day] whose lifecycle does more than count durations down.
+
+        A day is active when a scheduled row triggers, an active situation or event expires, an
+        active event propagates, or the spawn gate of one of ``gate_system_ids`` opens. Returns
+        last_day + 1 if every day is quiet; quiet days can be applied with decrement_durations(days).
+        """
+        stop = last_day + 1
+        for queue in (self._situation_schedule, self._event_schedule):
+            trigger_day = queue.next_trigger_day(first_day)
+            if trigger_day is not None:
+                stop = min(stop, trigger_day)
+        for entries in (*self.active_situations.values(), *self.active_events.values()):
+            for entry in entries:
+                # remaining_days r expires on the r-th decrement (the first one for r <= 1).
+                stop = min(stop, first_day + max(entry.remaining_days, 1) - 1)
+        for event_entries in self.active_events.values():
+            for entry in event_entries:
+                # process_propagation treats trigger_day <= 0 as today, every day.
+                trigger_day = int(getattr(entry, "trigger_day", 0))
+                if trigger_day <= 0:
+                    return first_day
+                if trigger_day >= first_day:
+                    stop = min(stop, trigger_day)
+
+        spawn_probability = max(0.0, min(1.0, float(event_frequency_percent) / 100.0))
+        if spawn_probability <= 0.0:
+            return stop
+        cooldowns = self.cooldown_until_day_by_system
+        for day in range(first_day, stop):
+            ready_ids = [
+                system_id
+                for system_id in gate_system_ids
+                if cooldowns.get(system_id) is None or day > cooldowns[system_id]
+            ]
+            rolls = self.rng.day_u01_many(world_seed, ready_ids, day, "spawn_gate")
+            if any(roll < spawn_probability for roll in rolls):
+                return day
+        return stop
+
+    def _spawn_gate_arrays(self, system_ids: list[str]) -> "_SpawnGateArrays":
+        gates = self._spawn_gates
+        # Callers build a fresh list each day (Galaxy.system_ids()); an equal one reuses the arrays unsorted.
+        if gates is None or gates.source != system_ids:
+            ordered = tuple(sorted(set(system_ids)))
+            if gates is None or gates.system_ids != ordered:
+                for system_id in ordered:
+                    self.register_system(system_id)
+                gates = _SpawnGateArrays.build(ordered, self.cooldown_until_day_by_system)
+            gates.source = list(system_ids)
+            self._spawn_gates = gates
+        return gates
+
+    def _set_spawn_cooldown(self, system_id: str, cooldown_until: int) -> None:
+        self.cooldown_until_day_by_system[system_id] = cooldown_until
+        if self._spawn_gates is not None:
+            self._spawn_gates.set_cooldown(system_id, cooldown_until)
+
+    def _resolve_spawn(self, world_seed: int, current_system_id: str, current_day: int) -> None:
+        spawn_type_roll = self.rng.day_u01(world_seed, current_system_id, current_day, "spawn_type")
         selected_type = "situation" if spawn_type_roll < 0.70 else "event"
-        severity_roll = _rng_u01(
-            _deterministic_seed_with_parts(
-                world_seed,
-                current_system_id,
-                current_day,
-                "spawn_severity",
-            )
-        )
+        severity_roll = self.rng.day_u01(world_seed, current_system_id, current_day, "spawn_severity")
         selected_tier = _select_spawn_severity_tier(severity_roll)
-        print(
-            "Spawn gate type+tier selected: "
-            f"system_id={current_system_id} current_day={current_day} "
-            f"selected_type={selected_type} selected_tier={selected_tier} "
-            f"spawn_type_roll={spawn_type_roll} severity_roll={severity_roll}"
-        )
+        if self.event_bus.accepts(SpawnSelected.level):
+            self.event_bus.publish(
+                SpawnSelected(
+                    current_system_id, current_day, selected_type, selected_tier, spawn_type_roll, severity_roll
+                )
+            )
 
         generated_any = False
         if selected_type == "situation":
-            situation_rng = random.Random(
-                _deterministic_seed_with_parts(
-                    world_seed,
-                    current_system_id,
-                    current_day,
-                    "spawn_select",
-                    "situation",
-                    selected_tier,
-                )
+            situation_rng = self.rng.stream(
+                world_seed,
+                current_system_id,
+                current_day,
+                "spawn_select",
+                "situation",
+                selected_tier,
             )
             generated_any = bool(
                 self._spawn_random_situation_for_tier(
@@ -295,15 +616,13 @@ class WorldStateEngine:
                 )
             )
         else:
-            event_rng = random.Random(
-                _deterministic_seed_with_parts(
-                    world_seed,
-                    current_system_id,
-                    current_day,
-                    "spawn_select",
-                    "event",
-                    selected_tier,
-                )
+            event_rng = self.rng.stream(
+                world_seed,
+                current_system_id,
+                current_day,
+                "spawn_select",
+                "event",
+                selected_tier,
             )
             active_event = self._spawn_random_event_for_tier(
                 current_system_id,
@@ -329,21 +648,21 @@ class WorldStateEngine:
 
         if generated_any:
             cooldown_until = current_day + 5
-            self.cooldown_until_day_by_system[current_system_id] = cooldown_until
-            print(
-                "Spawn gate cooldown set: "
-                f"system_id={current_system_id} current_day={current_day} "
-                f"cooldown_until={cooldown_until} generated_any=true reason=spawn_gate_generation"
-            )
+            self._set_spawn_cooldown(current_system_id, cooldown_until)
+            if self.event_bus.accepts(SpawnCooldownSet.level):
+                self.event_bus.publish(SpawnCooldownSet(current_system_id, current_day, cooldown_until))
             return
 
-        print(
-            "Spawn gate cooldown not set: "
-            f"system_id={current_system_id} current_day={current_day} "
-            f"cooldown_until={self.cooldown_until_day_by_system.get(current_system_id)} "
-            f"reason=no_generation_created selected_type={selected_type} "
-            f"selected_tier={selected_tier} candidates_found=0"
-        )
+        if self.event_bus.accepts(SpawnNotGenerated.level):
+            self.event_bus.publish(
+                SpawnNotGenerated(
+                    current_system_id,
+                    current_day,
+                    self.cooldown_until_day_by_system.get(current_system_id),
+                    selected_type,
+                    selected_tier,
+                )
+            )
 
     def apply_event_effects(
         self,
@@ -364,10 +683,13 @@ class WorldStateEngine:
             effects = {}
 
         is_structural = _is_structural_event_effects(effects)
-        print(
-            "Structural detection: "
-            f"origin_system_id={target_system_id} event_id={event_id} "
-            f"current_day={current_day} is_structural={is_structural}"
+        self._trace(
+            DEBUG,
+            "Structural detection",
+            origin_system_id=target_system_id,
+            event_id=event_id,
+            current_day=current_day,
+            is_structural=is_structural,
         )
         if is_structural:
             last_day = self.last_structural_mutation_day_by_system.get(target_system_id)
@@ -386,19 +708,24 @@ class WorldStateEngine:
                         trigger_day=deferred_day,
                     )
                 )
-                print(
-                    "Structural rate-limiter defer: "
-                    f"origin_system_id={target_system_id} event_id={event_id} "
-                    f"original_day={current_day} deferred_day={deferred_day} "
-                    f"last_structural_mutation_day={last_day}"
+                self._trace(
+                    DEBUG,
+                    "Structural rate-limiter defer",
+                    origin_system_id=target_system_id,
+                    event_id=event_id,
+                    original_day=current_day,
+                    deferred_day=deferred_day,
+                    last_structural_mutation_day=last_day,
                 )
                 return False
             self.last_structural_mutation_day_by_system[target_system_id] = current_day
-            print(
-                "Structural rate-limiter allow: "
-                f"origin_system_id={target_system_id} event_id={event_id} "
-                f"current_day={current_day} "
-                f"last_structural_mutation_day={current_day}"
+            self._trace(
+                DEBUG,
+                "Structural rate-limiter allow",
+                origin_system_id=target_system_id,
+                event_id=event_id,
+                current_day=current_day,
+                last_structural_mutation_day=current_day,
             )
 
         created = effects.get("create_situations", [])
@@ -438,10 +765,13 @@ class WorldStateEngine:
                 if isinstance(value, str):
                     already_present = value in self.system_flags[target_system_id]
                     self.system_flags[target_system_id].add(value)
-                    print(
-                        "System flag add: "
-                        f"system_id={target_system_id} event_id={event_id} "
-                        f"flag={value} already_present={already_present}"
+                    self._trace(
+                        INFO,
+                        "System flag add",
+                        system_id=target_system_id,
+                        event_id=event_id,
+                        flag=value,
+                        already_present=already_present,
                     )
 
         flags_remove = effects.get("system_flag_remove", [])
@@ -450,10 +780,13 @@ class WorldStateEngine:
                 if isinstance(value, str):
                     was_present = value in self.system_flags[target_system_id]
                     self.system_flags[target_system_id].discard(value)
-                    print(
-                        "System flag remove: "
-                        f"system_id={target_system_id} event_id={event_id} "
-                        f"flag={value} was_present={was_present}"
+                    self._trace(
+                        INFO,
+                        "System flag remove",
+                        system_id=target_system_id,
+                        event_id=event_id,
+                        flag=value,
+                        was_present=was_present,
                     )
 
         npc_mutations = effects.get("npc_mutations", [])
@@ -532,63 +865,50 @@ class WorldStateEngine:
         return True
 
     def process_scheduled_events(self, world_seed: int, current_day: int) -> int:
-        due_situations: list[ScheduledSituation] = []
-        pending_situations: list[ScheduledSituation] = []
-        for row in self.scheduled_situations:
-            if row.trigger_day == current_day:
-                due_situations.append(row)
-            else:
-                pending_situations.append(row)
+        # Rows scheduled while today's rows run are dropped at the end, as the list-based
+        # schedule did: situations from the whole pass, events from the event phase.
+        situation_mark = self._situation_schedule.mark
+        due_situations = self._situation_schedule.pop_due(current_day)
 
         situation_executed = 0
-        due_situations_sorted = sorted(
-            due_situations, key=lambda row: (row.system_id, row.insertion_index)
-        )
-        for row in due_situations_sorted:
+        for row in due_situations:
             situation_def = self._situation_catalog_by_id.get(row.situation_id)
             if situation_def is None:
-                print(
-                    "Propagation schedule ignored: "
-                    f"system_id={row.system_id} situation_id={row.situation_id} "
-                    f"trigger_day={current_day} reason=unknown_situation_id"
+                self._trace(
+                    WARNING,
+                    "Propagation schedule ignored",
+                    system_id=row.system_id,
+                    situation_id=row.situation_id,
+                    trigger_day=current_day,
+                    reason="unknown_situation_id",
                 )
                 continue
-            rng = random.Random(
-                _deterministic_seed_with_parts(
-                    world_seed,
-                    current_day,
-                    "scheduled_situation",
-                    row.system_id,
-                    row.situation_id,
-                    row.insertion_index,
-                )
+            rng = self.rng.stream(
+                world_seed,
+                current_day,
+                "scheduled_situation",
+                row.system_id,
+                row.situation_id,
+                row.insertion_index,
             )
             if self._create_propagated_situation(row.system_id, row.situation_id, rng):
                 situation_executed += 1
 
-        due: list[ScheduledEvent] = []
-        pending: list[ScheduledEvent] = []
-        for row in self.scheduled_events:
-            if row.trigger_day == current_day:
-                due.append(row)
-            else:
-                pending.append(row)
+        event_mark = self._event_schedule.mark
+        due = self._event_schedule.pop_due(current_day)
 
         executed = 0
-        due_sorted = sorted(due, key=lambda row: (row.system_id, row.insertion_index))
-        for row in due_sorted:
+        for row in due:
             event_def = self._event_catalog_by_id.get(row.event_id)
             if event_def is None:
                 raise ValueError(f"Event definition not found for event_id={row.event_id}")
-            rng = random.Random(
-                _deterministic_seed_with_parts(
-                    world_seed,
-                    current_day,
-                    "scheduled_event",
-                    row.system_id,
-                    row.event_id,
-                    row.insertion_index,
-                )
+            rng = self.rng.stream(
+                world_seed,
+                current_day,
+                "scheduled_event",
+                row.system_id,
+                row.event_id,
+                row.insertion_index,
             )
             remaining_days = _roll_duration_days(event_def.get("duration_days"), rng, default_days=1)
             self.add_event(
@@ -616,8 +936,8 @@ class WorldStateEngine:
                     trigger_day=current_day,
                 )
 
-        self.scheduled_situations = pending_situations
-        self.scheduled_events = pending
+        self._situation_schedule.discard_since(situation_mark)
+        self._event_schedule.discard_since(event_mark)
         return executed + situation_executed
 
     def process_propagation(
@@ -628,6 +948,8 @@ class WorldStateEngine:
     ) -> int:
         executed = 0
         for origin_system_id in sorted(self.active_events.keys()):
+            if not self.active_events[origin_system_id]:
+                continue
             rows_sorted = sorted(
                 self.active_events[origin_system_id],
                 key=lambda row: (
@@ -645,10 +967,13 @@ class WorldStateEngine:
                 event_id = row.event_id
                 event_def = self._event_catalog_by_id.get(event_id)
                 if event_def is None:
-                    print(
-                        "Propagation ignored: "
-                        f"origin_system_id={origin_system_id} event_id={event_id} "
-                        f"trigger_day={trigger_day} reason=unknown_event_id"
+                    self._trace(
+                        WARNING,
+                        "Propagation ignored",
+                        origin_system_id=origin_system_id,
+                        event_id=event_id,
+                        trigger_day=trigger_day,
+                        reason="unknown_event_id",
                     )
                     continue
                 propagation = event_def.get("propagation", [])
@@ -656,28 +981,38 @@ class WorldStateEngine:
                     continue
                 for propagation_index, entry in enumerate(propagation):
                     if not isinstance(entry, dict):
-                        print(
-                            "Propagation ignored: "
-                            f"origin_system_id={origin_system_id} event_id={event_id} "
-                            f"trigger_day={trigger_day} propagation_index={propagation_index} "
-                            "reason=invalid_entry"
+                        self._trace(
+                            WARNING,
+                            "Propagation ignored",
+                            origin_system_id=origin_system_id,
+                            event_id=event_id,
+                            trigger_day=trigger_day,
+                            propagation_index=propagation_index,
+                            reason="invalid_entry",
                         )
                         continue
                     situation_id = entry.get("situation_id")
                     if not isinstance(situation_id, str) or not situation_id:
-                        print(
-                            "Propagation ignored: "
-                            f"origin_system_id={origin_system_id} event_id={event_id} "
-                            f"trigger_day={trigger_day} propagation_index={propagation_index} "
-                            "reason=missing_situation_id"
+                        self._trace(
+                            WARNING,
+                            "Propagation ignored",
+                            origin_system_id=origin_system_id,
+                            event_id=event_id,
+                            trigger_day=trigger_day,
+                            propagation_index=propagation_index,
+                            reason="missing_situation_id",
                         )
                         continue
                     if situation_id not in self._situation_catalog_by_id:
-                        print(
-                            "Propagation ignored: "
-                            f"origin_system_id={origin_system_id} event_id={event_id} "
-                            f"trigger_day={trigger_day} propagation_index={propagation_index} "
-                            f"situation_id={situation_id} reason=unknown_situation_id"
+                        self._trace(
+                            WARNING,
+                            "Propagation ignored",
+                            origin_system_id=origin_system_id,
+                            event_id=event_id,
+                            trigger_day=trigger_day,
+                            propagation_index=propagation_index,
+                            situation_id=situation_id,
+                            reason="unknown_situation_id",
                         )
                         continue
 
@@ -693,7 +1028,7 @@ class WorldStateEngine:
                         }
                     )
 
-                    select_seed = _deterministic_seed_with_parts(
+                    select_rng = self.rng.stream(
                         world_seed,
                         origin_system_id,
                         event_id,
@@ -701,32 +1036,35 @@ class WorldStateEngine:
                         propagation_index,
                         "propagation_select",
                     )
-                    select_rng = random.Random(select_seed)
                     shuffled = list(candidate_neighbors)
                     select_rng.shuffle(shuffled)
                     selected_neighbors = shuffled[:systems_affected]
                     scheduled_day = trigger_day + delay_days
-                    print(
-                        "Propagation evaluated: "
-                        f"origin_system_id={origin_system_id} event_id={event_id} "
-                        f"trigger_day={trigger_day} propagation_index={propagation_index} "
-                        f"candidate_neighbors={candidate_neighbors} "
-                        f"selected_neighbors={selected_neighbors} "
-                        f"situation_id={situation_id} delay_days={delay_days} "
-                        f"systems_affected={systems_affected} scheduled_day={scheduled_day}"
-                    )
+                    if self.event_bus.accepts(PropagationEvaluated.level):
+                        self.event_bus.publish(
+                            PropagationEvaluated(
+                                origin_system_id,
+                                event_id,
+                                trigger_day,
+                                propagation_index,
+                                tuple(candidate_neighbors),
+                                tuple(selected_neighbors),
+                                situation_id,
+                                delay_days,
+                                systems_affected,
+                                scheduled_day,
+                            )
+                        )
                     for target_system_id in selected_neighbors:
                         if delay_days == 0:
-                            duration_rng = random.Random(
-                                _deterministic_seed_with_parts(
-                                    world_seed,
-                                    origin_system_id,
-                                    event_id,
-                                    trigger_day,
-                                    propagation_index,
-                                    target_system_id,
-                                    "propagation_duration",
-                                )
+                            duration_rng = self.rng.stream(
+                                world_seed,
+                                origin_system_id,
+                                event_id,
+                                trigger_day,
+                                propagation_index,
+                                target_system_id,
+                                "propagation_duration",
                             )
                             if self._create_propagated_situation(
                                 target_system_id, situation_id, duration_rng
@@ -779,37 +1117,29 @@ class WorldStateEngine:
             ),
         )
 
+    @property
+    def modifier_version(self) -> int:
+        """Bumped whenever modifier entries are added or removed; downstream caches key on it."""
+        return self._modifier_version
+
+    def invalidate_modifier_cache(self) -> None:
+        """Call after editing active_modifiers_by_system rows in place."""
+        self._modifier_version += 1
+        self._modifier_index.clear()
+
     def get_aggregated_modifier_map(self, system_id: str, domain: str) -> dict[tuple[str, str | None, str], int]:
+        return dict(self._modifier_index_for(system_id, domain).aggregated)
+
+    def _modifier_index_for(self, system_id: str, domain: str) -> "_ModifierIndex":
         self.register_system(system_id)
-        aggregated: dict[tuple[str, str | None, str], int] = {}
-        rows = [
-            row
-            for row in self.active_modifiers_by_system[system_id]
-            if str(row.get("domain", "")) == domain
-        ]
-        rows_sorted = sorted(
-            rows,
-            key=lambda row: (
-                str(row.get("source_type", "")),
-                str(row.get("source_id", "")),
-                str(row.get("domain", "")),
-                str(row.get("target_type", "")),
-                "" if row.get("target_id") is None else str(row.get("target_id")),
-                str(row.get("modifier_type", "")),
-                int(row.get("modifier_value", 0)),
-            ),
-        )
-        for row in rows_sorted:
-            modifier_type = str(row.get("modifier_type", ""))
-            if not modifier_type:
-                continue
-            canonical_target_type = _canonical_target_type(str(row.get("target_type", "")))
-            target_id = row.get("target_id")
-            if target_id is not None:
-                target_id = str(target_id)
-            key = (canonical_target_type, target_id, modifier_type)
-            aggregated[key] = aggregated.get(key, 0) + int(row.get("modifier_value", 0))
-        return aggregated
+        rows = self.active_modifiers_by_system[system_id]
+        index = self._modifier_index.get((system_id, domain))
+        # Rows are normally changed through _add/_remove_modifier_entries, which drop the entry;
+        # the identity and length check also catches a list that was replaced or appended to.
+        if index is None or index.rows is not rows or index.row_count != len(rows):
+            index = _ModifierIndex.build(rows, domain)
+            self._modifier_index[(system_id, domain)] = index
+        return index
 
     def resolve_modifiers_for_entities(
         self,
@@ -817,37 +1147,31 @@ class WorldStateEngine:
         domain: str,
         entity_views: list[dict[str, Any]],
     ) -> dict[str, Any]:
-        aggregated = self.get_aggregated_modifier_map(system_id=system_id, domain=domain)
+        index = self._modifier_index_for(system_id, domain)
         resolved: dict[str, dict[str, int]] = {}
+        # Entities hitting the same buckets resolve identically, so each combination is summed
+        # and capped once per call.
+        by_match: dict[tuple[Any, ...], dict[str, int]] = {}
         for entity in sorted(entity_views, key=lambda row: str(row.get("entity_id", ""))):
             entity_id = str(entity.get("entity_id", ""))
             if not entity_id:
                 continue
+            if index.empty:
+                resolved[entity_id] = {}
+                continue
             category_id = entity.get("category_id")
             category_id = str(category_id) if category_id is not None else None
             tags_raw = entity.get("tags", [])
-            tags = {str(tag) for tag in tags_raw if isinstance(tag, str)}
-            totals: dict[str, int] = {}
-            for (target_type, target_id, modifier_type), value in aggregated.items():
-                applies = False
-                if target_type == "ALL":
-                    applies = True
-                elif target_type == "category" and category_id is not None and target_id == category_id:
-                    applies = True
-                elif target_type == "tag" and target_id in tags:
-                    applies = True
-                elif target_type == "id" and target_id == entity_id:
-                    applies = True
-                elif target_type == "destination_id" and target_id == entity_id:
-                    applies = True
-                if applies:
-                    totals[modifier_type] = totals.get(modifier_type, 0) + int(value)
-            capped: dict[str, int] = {}
-            for modifier_type, value in sorted(totals.items(), key=lambda row: row[0]):
-                clamped = _apply_modifier_cap(domain, modifier_type, value, self._MODIFIER_CAPS)
-                if clamped != 0:
-                    capped[modifier_type] = clamped
-            resolved[entity_id] = capped
+            match = (
+                entity_id if entity_id in index.by_id else None,
+                category_id if category_id in index.by_category else None,
+                tuple(sorted({str(tag) for tag in tags_raw if isinstance(tag, str) and tag in index.by_tag})),
+            )
+            capped = by_match.get(match)
+            if capped is None:
+                capped = self._capped_modifier_totals(index, domain, match)
+                by_match[match] = capped
+            resolved[entity_id] = dict(capped)
 
         ordered_resolved = {
             entity_id: {
@@ -862,24 +1186,46 @@ class WorldStateEngine:
             "resolved": ordered_resolved,
         }
 
-    def decrement_durations(self) -> None:
-        for system_id in sorted(self.active_situations.keys()):
-            for entry in self.active_situations[system_id]:
-                entry.remaining_days = max(0, entry.remaining_days - 1)
-
-        for system_id in sorted(self.active_events.keys()):
-            for entry in self.active_events[system_id]:
-                entry.remaining_days = max(0, entry.remaining_days - 1)
+    def _capped_modifier_totals(
+        self,
+        index: "_ModifierIndex",
+        domain: str,
+        match: tuple[Any, ...],
+    ) -> dict[str, int]:
+        entity_id, category_id, tags = match
+        totals = dict(index.all_targets)
+        buckets = [index.by_id.get(entity_id), index.by_category.get(category_id)]
+        buckets.extend(index.by_tag[tag] for tag in tags)
+        for bucket in buckets:
+            if bucket:
+                for modifier_type, value in bucket.items():
+                    totals[modifier_type] = totals.get(modifier_type, 0) + value
+        capped: dict[str, int] = {}
+        for modifier_type, value in sorted(totals.items(), key=lambda row: row[0]):
+            clamped = _apply_modifier_cap(domain, modifier_type, value, self._MODIFIER_CAPS)
+            if clamped != 0:
+                capped[modifier_type] = clamped
+        return capped
+
+    def decrement_durations(self, days: int = 1) -> None:
+        # Order-independent, so no per-day sort of every registered system.
+        for entries in self.active_situations.values():
+            for entry in entries:
+                entry.remaining_days = max(0, entry.remaining_days - days)
+
+        for event_entries in self.active_events.values():
+            for entry in event_entries:
+                entry.remaining_days = max(0, entry.remaining_days - days)
 
     def resolve_expired(self) -> None:
         for system_id in sorted(self.active_situations.keys()):
+            if not self.active_situations[system_id]:
+                continue
             kept: list[ActiveSituation] = []
             for entry in self.active_situations[system_id]:
                 if entry.remaining_days <= 0:
-                    print(
-                        f"Situation expired: {entry.situation_id} "
-                        f"system={entry.system_id}"
-                    )
+                    if self.event_bus.accepts(SituationExpired.level):
+                        self.event_bus.publish(SituationExpired(entry.situation_id, entry.system_id))
                     definition = self._situation_catalog_by_id.get(entry.situation_id, {})
                     count = len(definition.get("modifiers", [])) if isinstance(definition.get("modifiers", []), list) else 0
                     self._remove_modifier_entries(
@@ -893,13 +1239,13 @@ class WorldStateEngine:
             self.active_situations[system_id] = kept
 
         for system_id in sorted(self.active_events.keys()):
+            if not self.active_events[system_id]:
+                continue
             kept_events: list[ActiveEvent] = []
             for entry in self.active_events[system_id]:
                 if entry.remaining_days <= 0:
-                    print(
-                        f"Event expired: {entry.event_id} "
-                        f"system={entry.system_id}"
-                    )
+                    if self.event_bus.accepts(EventExpired.level):
+                        self.event_bus.publish(EventExpired(entry.event_id, entry.system_id))
                     definition = self._event_catalog_by_id.get(entry.event_id, {})
                     effects = definition.get("effects", {}) if isinstance(definition, dict) else {}
                     modifiers = effects.get("modifiers", []) if isinstance(effects, dict) else []
@@ -925,29 +1271,11 @@ class WorldStateEngine:
     ) -> bool:
         if len(self.active_situations[system_id]) >= 3:
             return False
-        spawnable = [
-            item
-            for item in self.situation_catalog
-            if bool(item.get("random_allowed"))
-            and not bool(item.get("event_only"))
-            and not bool(item.get("recovery_only"))
-            and (
-                selected_tier is None
-                or _int_or_default(item.get("severity_tier"), 0) == int(selected_tier)
-            )
-        ]
+        spawnable = self._spawn_candidates("situation", selected_tier)
+        if self.event_bus.accepts(SpawnCandidatesFiltered.level):
+            self.event_bus.publish(SpawnCandidatesFiltered(system_id, "situation", selected_tier, len(spawnable)))
         if not spawnable:
-            print(
-                "Spawn gate candidate filter: "
-                f"system_id={system_id} selected_type=situation "
-                f"selected_tier={selected_tier} candidates_found=0"
-            )
             return False
-        print(
-            "Spawn gate candidate filter: "
-            f"system_id={system_id} selected_type=situation "
-            f"selected_tier={selected_tier} candidates_found={len(spawnable)}"
-        )
         selected = _weighted_pick_by_spawn_weight(spawnable, rng)
         remaining_days = _roll_duration_days(selected.get("duration_days"), rng, default_days=3)
         active = ActiveSituation(
@@ -960,6 +1288,27 @@ class WorldStateEngine:
         self.add_situation(active)
         return True
 
+    def _spawn_candidates(self, kind: str, selected_tier: Optional[int]) -> list[dict[str, Any]]:
+        """Randomly spawnable catalog rows of ``kind`` and tier, kept until the catalog list is replaced."""
+        catalog = self.situation_catalog if kind == "situation" else self.event_catalog
+        cached = self._spawn_candidate_cache.get((kind, selected_tier))
+        if cached is not None and cached[0] is catalog:
+            return cached[1]
+        if kind == "situation":
+            rows = [
+                item
+                for item in catalog
+                if bool(item.get("random_allowed"))
+                and not bool(item.get("event_only"))
+                and not bool(item.get("recovery_only"))
+            ]
+        else:
+            rows = [item for item in catalog if bool(item.get("random_allowed"))]
+        if selected_tier is not None:
+            rows = [item for item in rows if _int_or_default(item.get("severity_tier"), 0) == int(selected_tier)]
+        self._spawn_candidate_cache[(kind, selected_tier)] = (catalog, rows)
+        return rows
+
     def _spawn_random_event(
         self, system_id: str, rng: random.Random, current_day: int
     ) -> Optional[ActiveEvent]:
@@ -972,27 +1321,13 @@ class WorldStateEngine:
         rng: random.Random,
         current_day: int,
     ) -> Optional[ActiveEvent]:
-        candidates = [item for item in self.event_catalog if bool(item.get("random_allowed"))]
-        if not candidates:
+        if not self._spawn_candidates("event", None):
             return None
-        tier_events = [
-            item
-            for item in candidates
-            if selected_tier is None
-            or _int_or_default(item.get("severity_tier"), 0) == int(selected_tier)
-        ]
+        tier_events = self._spawn_candidates("event", selected_tier)
+        if self.event_bus.accepts(SpawnCandidatesFiltered.level):
+            self.event_bus.publish(SpawnCandidatesFiltered(system_id, "event", selected_tier, len(tier_events)))
         if not tier_events:
-            print(
-                "Spawn gate candidate filter: "
-                f"system_id={system_id} selected_type=event "
-                f"selected_tier={selected_tier} candidates_found=0"
-            )
             return None
-        print(
-            "Spawn gate candidate filter: "
-            f"system_id={system_id} selected_type=event "
-            f"selected_tier={selected_tier} candidates_found={len(tier_events)}"
-        )
         selected = _weighted_pick_by_spawn_weight(tier_events, rng)
         remaining_days = _roll_duration_days(selected.get("duration_days"), rng, default_days=1)
         active = ActiveEvent(
@@ -1040,10 +1375,13 @@ class WorldStateEngine:
     ) -> None:
         if self._sector_ref is None:
             for destination_id in destroy_destination_ids:
-                print(
-                    "Destination destruction skipped: "
-                    f"system_id={target_system_id} event_id={event_id} "
-                    f"destination_id={destination_id} reason=missing_sector_context"
+                self._trace(
+                    WARNING,
+                    "Destination destruction skipped",
+                    system_id=target_system_id,
+                    event_id=event_id,
+                    destination_id=destination_id,
+                    reason="missing_sector_context",
                 )
             return
         system = self._sector_ref.get_system(target_system_id)
@@ -1052,30 +1390,40 @@ class WorldStateEngine:
         for destination_id in destroy_destination_ids:
             if not isinstance(destination_id, str) or not destination_id:
                 continue
-            destination = next(
-                (
-                    row
-                    for row in getattr(system, "destinations", [])
-                    if getattr(row, "destination_id", None) == destination_id
-                ),
-                None,
-            )
+            destination = _destination_in_system(self._sector_ref, system, destination_id)
             if destination is None:
-                print(
-                    "Destination destruction ignored: "
-                    f"system_id={target_system_id} event_id={event_id} "
-                    f"destination_id={destination_id} reason=missing_destination"
+                self._trace(
+                    WARNING,
+                    "Destination destruction ignored",
+                    system_id=target_system_id,
+                    event_id=event_id,
+                    destination_id=destination_id,
+                    reason="missing_destination",
                 )
                 continue
-            tags = _ensure_destination_tags(destination)
-            already_destroyed = "destroyed" in tags
+            already_destroyed = "destroyed" in _destination_tags(destination)
             if not already_destroyed:
-                tags.append("destroyed")
-            print(
-                "Destination destroyed tag update: "
-                f"system_id={target_system_id} event_id={event_id} "
-                f"destination_id={destination_id} tag_added={not already_destroyed} "
-                f"already_destroyed={already_destroyed}"
+                if is_dataclass(destination) and is_dataclass(system):
+                    # Copy-on-write so sector objects can be shared between engine forks.
+                    tagged = replace(destination, tags=[*_destination_tags(destination), "destroyed"])
+                    system = replace(
+                        system,
+                        destinations=[
+                            tagged if row is destination else row
+                            for row in getattr(system, "destinations", [])
+                        ],
+                    )
+                    _replace_system_in_sector(self._sector_ref, system)
+                else:
+                    _ensure_destination_tags(destination).append("destroyed")
+            self._trace(
+                INFO,
+                "Destination destroyed tag update",
+                system_id=target_system_id,
+                event_id=event_id,
+                destination_id=destination_id,
+                tag_added=not already_destroyed,
+                already_destroyed=already_destroyed,
             )
 
     def _apply_population_delta(
@@ -1086,10 +1434,13 @@ class WorldStateEngine:
         population_delta: int,
     ) -> None:
         if self._sector_ref is None:
-            print(
-                "Population mutation skipped: "
-                f"system_id={target_system_id} event_id={event_id} "
-                f"delta={population_delta} reason=missing_sector_context"
+            self._trace(
+                WARNING,
+                "Population mutation skipped",
+                system_id=target_system_id,
+                event_id=event_id,
+                delta=population_delta,
+                reason="missing_sector_context",
             )
             return
         system = self._sector_ref.get_system(target_system_id)
@@ -1098,20 +1449,28 @@ class WorldStateEngine:
         old_pop = int(getattr(system, "population", 0))
         new_pop = max(0, old_pop + int(population_delta))
         if new_pop == old_pop:
-            print(
-                "Population mutation applied: "
-                f"system_id={target_system_id} event_id={event_id} "
-                f"old_pop={old_pop} delta={population_delta} new_pop={new_pop}"
+            self._trace(
+                INFO,
+                "Population mutation applied",
+                system_id=target_system_id,
+                event_id=event_id,
+                old_pop=old_pop,
+                delta=population_delta,
+                new_pop=new_pop,
             )
             return
         attributes = dict(getattr(system, "attributes", {}) or {})
         attributes["population_level"] = new_pop
         updated = replace(system, population=new_pop, attributes=attributes)
         _replace_system_in_sector(self._sector_ref, updated)
-        print(
-            "Population mutation applied: "
-            f"system_id={target_system_id} event_id={event_id} "
-            f"old_pop={old_pop} delta={population_delta} new_pop={new_pop}"
+        self._trace(
+            INFO,
+            "Population mutation applied",
+            system_id=target_system_id,
+            event_id=event_id,
+            old_pop=old_pop,
+            delta=population_delta,
+            new_pop=new_pop,
         )
 
     def _apply_government_change(
@@ -1124,17 +1483,23 @@ class WorldStateEngine:
         if not isinstance(government_change, str) or not government_change:
             return
         if self._valid_government_ids and government_change not in self._valid_government_ids:
-            print(
-                "Government change ignored: "
-                f"system_id={target_system_id} event_id={event_id} "
-                f"new_government_id={government_change} reason=unknown_government_id"
+            self._trace(
+                WARNING,
+                "Government change ignored",
+                system_id=target_system_id,
+                event_id=event_id,
+                new_government_id=government_change,
+                reason="unknown_government_id",
             )
             return
         if self._sector_ref is None:
-            print(
-                "Government change skipped: "
-                f"system_id={target_system_id} event_id={event_id} "
-                f"new_government_id={government_change} reason=missing_sector_context"
+            self._trace(
+                WARNING,
+                "Government change skipped",
+                system_id=target_system_id,
+                event_id=event_id,
+                new_government_id=government_change,
+                reason="missing_sector_context",
             )
             return
         system = self._sector_ref.get_system(target_system_id)
@@ -1145,10 +1510,13 @@ class WorldStateEngine:
         attributes["government_id"] = government_change
         updated = replace(system, government_id=government_change, attributes=attributes)
         _replace_system_in_sector(self._sector_ref, updated)
-        print(
-            "Government mutation applied: "
-            f"system_id={target_system_id} event_id={event_id} "
-            f"old_government_id={old_government_id} new_government_id={government_change}"
+        self._trace(
+            INFO,
+            "Government mutation applied",
+            system_id=target_system_id,
+            event_id=event_id,
+            old_government_id=old_government_id,
+            new_government_id=government_change,
         )
 
     def _apply_npc_mutations(
@@ -1162,11 +1530,15 @@ class WorldStateEngine:
         if registry is None:
             for row in npc_mutations:
                 if isinstance(row, dict):
-                    print(
-                        "NPC mutation ignored: "
-                        f"system_id={target_system_id} event_id={event_id} "
-                        f"npc_id={row.get('npc_id')} mutation_type={row.get('mutation_type')} "
-                        "applied_or_ignored=ignored reason=missing_npc_registry"
+                    self._trace(
+                        WARNING,
+                        "NPC mutation ignored",
+                        system_id=target_system_id,
+                        event_id=event_id,
+                        npc_id=row.get('npc_id'),
+                        mutation_type=row.get('mutation_type'),
+                        applied_or_ignored="ignored",
+                        reason="missing_npc_registry",
                     )
             return
         for row in npc_mutations:
@@ -1181,40 +1553,56 @@ class WorldStateEngine:
                 continue
             npc = registry.get(npc_id)
             if npc is None:
-                print(
-                    "NPC mutation ignored: "
-                    f"system_id={target_system_id} event_id={event_id} "
-                    f"npc_id={npc_id} mutation_type={mutation_type} "
-                    "applied_or_ignored=ignored reason=npc_not_found"
+                self._trace(
+                    WARNING,
+                    "NPC mutation ignored",
+                    system_id=target_system_id,
+                    event_id=event_id,
+                    npc_id=npc_id,
+                    mutation_type=mutation_type,
+                    applied_or_ignored="ignored",
+                    reason="npc_not_found",
                 )
                 continue
 
             if mutation_type == "remove":
                 if npc.persistence_tier == NPCPersistenceTier.TIER_3:
-                    print(
-                        "NPC mutation ignored: "
-                        f"system_id={target_system_id} event_id={event_id} "
-                        f"npc_id={npc_id} mutation_type={mutation_type} "
-                        "applied_or_ignored=ignored reason=persistence_tier_locked"
+                    self._trace(
+                        WARNING,
+                        "NPC mutation ignored",
+                        system_id=target_system_id,
+                        event_id=event_id,
+                        npc_id=npc_id,
+                        mutation_type=mutation_type,
+                        applied_or_ignored="ignored",
+                        reason="persistence_tier_locked",
                     )
                     continue
                 registry.remove(npc_id)
-                print(
-                    "NPC mutation applied: "
-                    f"system_id={target_system_id} event_id={event_id} "
-                    f"npc_id={npc_id} mutation_type={mutation_type} "
-                    "applied_or_ignored=applied reason=ok"
+                self._trace(
+                    INFO,
+                    "NPC mutation applied",
+                    system_id=target_system_id,
+                    event_id=event_id,
+                    npc_id=npc_id,
+                    mutation_type=mutation_type,
+                    applied_or_ignored="applied",
+                    reason="ok",
                 )
                 continue
 
             updated_npc = npc
             if mutation_type == "faction_change":
                 if not isinstance(new_value, str) or not new_value:
-                    print(
-                        "NPC mutation ignored: "
-                        f"system_id={target_system_id} event_id={event_id} "
-                        f"npc_id={npc_id} mutation_type={mutation_type} "
-                        "applied_or_ignored=ignored reason=invalid_new_value"
+                    self._trace(
+                        WARNING,
+                        "NPC mutation ignored",
+                        system_id=target_system_id,
+                        event_id=event_id,
+                        npc_id=npc_id,
+                        mutation_type=mutation_type,
+                        applied_or_ignored="ignored",
+                        reason="invalid_new_value",
                     )
                     continue
                 updated_npc = _clone_npc(npc)
@@ -1224,20 +1612,28 @@ class WorldStateEngine:
                 updated_npc.memory_flags = dict(updated_npc.memory_flags)
                 updated_npc.memory_flags["hostile"] = bool(new_value)
             else:
-                print(
-                    "NPC mutation ignored: "
-                    f"system_id={target_system_id} event_id={event_id} "
-                    f"npc_id={npc_id} mutation_type={mutation_type} "
-                    "applied_or_ignored=ignored reason=unsupported_mutation_type"
+                self._trace(
+                    WARNING,
+                    "NPC mutation ignored",
+                    system_id=target_system_id,
+                    event_id=event_id,
+                    npc_id=npc_id,
+                    mutation_type=mutation_type,
+                    applied_or_ignored="ignored",
+                    reason="unsupported_mutation_type",
                 )
                 continue
 
             registry.update(updated_npc)
-            print(
-                "NPC mutation applied: "
-                f"system_id={target_system_id} event_id={event_id} "
-                f"npc_id={npc_id} mutation_type={mutation_type} "
-                "applied_or_ignored=applied reason=ok"
+            self._trace(
+                INFO,
+                "NPC mutation applied",
+                system_id=target_system_id,
+                event_id=event_id,
+                npc_id=npc_id,
+                mutation_type=mutation_type,
+                applied_or_ignored="applied",
+                reason="ok",
             )
 
     def _remove_active_event_instance(
@@ -1285,6 +1681,9 @@ class WorldStateEngine:
             row["source_type"] = source_type
             row["source_id"] = source_id
             self.active_modifiers_by_system[system_id].append(row)
+        self._modifier_version += 1
+        for key in [key for key in self._modifier_index if key[0] == system_id]:
+            del self._modifier_index[key]
 
     def _remove_modifier_entries(
         self,
@@ -1303,20 +1702,95 @@ class WorldStateEngine:
                     continue
             kept.append(row)
         self.active_modifiers_by_system[system_id] = kept
+        self._modifier_version += 1
+        for key in [key for key in self._modifier_index if key[0] == system_id]:
+            del self._modifier_index[key]
 
 
-def _deterministic_seed(world_seed: int, current_day: int, channel: str) -> int:
-    packed = f"{world_seed}|{current_day}|{channel}".encode("utf-8")
-    return int(hashlib.sha256(packed).hexdigest(), 16)
-
+@dataclass
+class _SpawnGateArrays:
+    """Spawn-gate state of a galaxy-scope system list as parallel arrays, sorted by system id."""
+
+    system_ids: tuple[str, ...]
+    slot_by_id: dict[str, int]
+    # First day each gate may roll again: cooldown_until + 1, or 0 without a cooldown.
+    ready_day: list[int]
+    # Copy of the caller's list the arrays were built from, in the caller's order.
+    source: Optional[list[str]] = None
+
+    @classmethod
+    def build(cls, system_ids: tuple[str, ...], cooldown_until_day_by_system: dict[str, Optional[int]]) -> "_SpawnGateArrays":
+        ready_day = []
+        for system_id in system_ids:
+            cooldown_until = cooldown_until_day_by_system.get(system_id)
+            ready_day.append(0 if cooldown_until is None else cooldown_until + 1)
+        return cls(system_ids, {system_id: slot for slot, system_id in enumerate(system_ids)}, ready_day)
+
+    def set_cooldown(self, system_id: str, cooldown_until: int) -> None:
+        slot = self.slot_by_id.get(system_id)
+        if slot is not None:
+            self.ready_day[slot] = cooldown_until + 1
 
-def _rng_u01(seed: int) -> float:
-    return random.Random(seed).random()
 
+@dataclass
+class _ModifierIndex:
+    """Aggregated modifiers of one (system, domain) plus per-target buckets of modifier_type totals."""
+
+    rows: list[dict[str, Any]]
+    row_count: int
+    aggregated: dict[tuple[str, str | None, str], int]
+    all_targets: dict[str, int]
+    by_category: dict[str, dict[str, int]]
+    by_tag: dict[str, dict[str, int]]
+    # "id" and "destination_id" targets both match the entity id.
+    by_id: dict[str, dict[str, int]]
+
+    @property
+    def empty(self) -> bool:
+        return not self.aggregated
+
+    @classmethod
+    def build(cls, rows: list[dict[str, Any]], domain: str) -> "_ModifierIndex":
+        aggregated: dict[tuple[str, str | None, str], int] = {}
+        matching = [row for row in rows if str(row.get("domain", "")) == domain]
+        rows_sorted = sorted(
+            matching,
+            key=lambda row: (
+                str(row.get("source_type", "")),
+                str(row.get("source_id", "")),
+                str(row.get("domain", "")),
+                str(row.get("target_type", "")),
+                "" if row.get("target_id") is None else str(row.get("target_id")),
+                str(row.get("modifier_type", "")),
+                int(row.get("modifier_value", 0)),
+            ),
+        )
+        for row in rows_sorted:
+            modifier_type = str(row.get("modifier_type", ""))
+            if not modifier_type:
+                continue
+            canonical_target_type = _canonical_target_type(str(row.get("target_type", "")))
+            target_id = row.get("target_id")
+            if target_id is not None:
+                target_id = str(target_id)
+            key = (canonical_target_type, target_id, modifier_type)
+            aggregated[key] = aggregated.get(key, 0) + int(row.get("modifier_value", 0))
 
-def _deterministic_seed_with_parts(*parts: Any) -> int:
-    packed = "|".join(str(part) for part in parts).encode("utf-8")
-    return int(hashlib.sha256(packed).hexdigest(), 16)
+        all_targets: dict[str, int] = {}
+        by_category: dict[str, dict[str, int]] = {}
+        by_tag: dict[str, dict[str, int]] = {}
+        by_id: dict[str, dict[str, int]] = {}
+        buckets = {"category": by_category, "tag": by_tag, "id": by_id, "destination_id": by_id}
+        for (target_type, target_id, modifier_type), value in aggregated.items():
+            if target_type == "ALL":
+                bucket = all_targets
+            elif target_type in buckets and target_id is not None:
+                bucket = buckets[target_type].setdefault(target_id, {})
+            else:
+                # Target types no entity can match (e.g. "sku") only show up in the aggregated map.
+                continue
+            bucket[modifier_type] = bucket.get(modifier_type, 0) + value
+        return cls(rows, len(rows), aggregated, all_targets, by_category, by_tag, by_id)
 
 
 def _coerce_non_negative_int(value: Any, default: int) -> int:
@@ -1341,23 +1815,24 @@ def _int_or_default(value: Any, default: int) -> int:
 
 
 def _load_valid_government_ids() -> set[str]:
-    path = Path(__file__).resolve().parents[1] / "data" / "governments.json"
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-    except (OSError, json.JSONDecodeError):
+        from data_bundle import get_data_bundle
+    except ModuleNotFoundError:
+        from src.data_bundle import get_data_bundle
+
+    try:
+        governments_by_id = get_data_bundle().governments_by_id
+    except (OSError, ValueError):
         return set()
-    entries = payload.get("governments", []) if isinstance(payload, dict) else []
-    result: set[str] = set()
-    for row in entries:
-        if isinstance(row, dict):
-            government_id = row.get("id")
-            if isinstance(government_id, str) and government_id:
-                result.add(government_id)
-    return result
+    return {government_id for government_id in governments_by_id if isinstance(government_id, str) and government_id}
 
 
 def _replace_system_in_sector(sector: Any, updated_system: Any) -> None:
+    index = getattr(sector, "index", None)
+    if isinstance(index, SectorIndex):
+        # Updates the sector's id lookups for just this system instead of rescanning.
+        index.replace_system(updated_system)
+        return
     systems = getattr(sector, "systems", None)
     if not isinstance(systems, list):
         return
@@ -1367,6 +1842,31 @@ def _replace_system_in_sector(sector: Any, updated_system: Any) -> None:
             return
 
 
+def _destination_in_system(sector: Any, system: Any, destination_id: str) -> Any:
+    index = getattr(sector, "index", None)
+    if isinstance(index, SectorIndex):
+        owner = index.system_for_destination(destination_id)
+        if owner is None or getattr(owner, "system_id", None) != getattr(system, "system_id", None):
+            return None
+        return index.destination(destination_id)
+    return next(
+        (
+            row
+            for row in getattr(system, "destinations", [])
+            if getattr(row, "destination_id", None) == destination_id
+        ),
+        None,
+    )
+
+
+def _destination_tags(destination: Any) -> list[str]:
+    if isinstance(destination, dict):
+        tags = destination.get("tags")
+    else:
+        tags = getattr(destination, "tags", None)
+    return list(tags) if isinstance(tags, list) else []
+
+
 def _ensure_destination_tags(destination: Any) -> list[str]:
     if isinstance(destination, dict):
         tags = destination.get("tags")
@@ -0,0 +1,98 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+import data_bundle  # noqa: E402
+from data_bundle import get_data_bundle, load_data_bundle  # noqa: E402
+from data_loader import load_hulls, load_modules  # noqa: E402
+
+
+def test_bundle_indexes_match_loader_payloads() -> None:
+    bundle = get_data_bundle()
+    hulls = load_hulls()["hulls"]
+    modules = load_modules()["modules"]
+    assert set(bundle.hulls_by_id) == {hull["hull_id"] for hull in hulls}
+    assert set(bundle.modules_by_id) == {module["module_id"] for module in modules}
+    for slot_type, rows in bundle.modules_by_slot_type.items():
+        assert rows
+        assert all(row["slot_type"] == slot_type for row in rows)
+    for (frame, tier), rows in bundle.hulls_by_frame_tier.items():
+        assert all(row["frame"] == frame and row["tier"] == tier for row in rows)
+    assert set(bundle.goods_by_sku) == {good.sku for good in bundle.catalog.goods}
+
+
+def test_bundle_views_are_read_only() -> None:
+    bundle = get_data_bundle()
+    with pytest.raises(TypeError):
+        bundle.hulls_by_id["new_hull"] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        bundle.documents["hulls.json"] = {}  # type: ignore[index]
+
+
+def test_legacy_loaders_return_private_copies() -> None:
+    bundle = get_data_bundle()
+    hull = load_hulls()["hulls"][0]
+    module = load_modules()["modules"][0]
+    hull["traits"].append("edited")
+    module["name"] = "edited"
+    assert "edited" not in bundle.hulls_by_id[hull["hull_id"]]["traits"]
+    assert bundle.modules_by_id[module["module_id"]]["name"] != "edited"
+    assert load_hulls()["hulls"][0] == bundle.hulls[0]
+
+
+def test_bundle_round_trips_through_disk_cache(tmp_path: Path) -> None:
+    cold = load_data_bundle(cache_dir=tmp_path)
+    cache_files = list(tmp_path.glob("data_bundle-*.pickle"))
+    assert len(cache_files) == 1
+    warm = load_data_bundle(cache_dir=tmp_path)
+    assert warm.content_hash == cold.content_hash
+    assert list(warm.hulls_by_id) == list(cold.hulls_by_id)
+    assert list(warm.modules_by_id) == list(cold.modules_by_id)
+    assert warm.catalog == cold.catalog
+
+
+def test_content_hash_tracks_data_changes(tmp_path: Path) -> None:
+    data_root = tmp_path / "data"
+    shutil.copytree(PROJECT_ROOT / "data", data_root)
+    original = load_data_bundle(data_root, use_cache=False)
+    assert original.content_hash == get_data_bundle().content_hash
+
+    economies_path = data_root / "economies.json"
+    economies_path.write_text(economies_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    changed = load_data_bundle(data_root, use_cache=False)
+    assert changed.content_hash != original.content_hash
+
+
+def test_invalid_data_is_rejected(tmp_path: Path) -> None:
+    data_root = tmp_path / "data"
+    shutil.copytree(PROJECT_ROOT / "data", data_root)
+    (data_root / "hulls.json").write_text('{"version": "x", "hulls": [{"hull_id": "broken"}]}', encoding="utf-8")
+    with pytest.raises(ValueError, match="hulls.json"):
+        load_data_bundle(data_root, cache_dir=tmp_path / "cache")
+    assert not list((tmp_path / "cache").glob("*.pickle"))
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path: Path) -> None:
+    bundle = load_data_bundle(cache_dir=tmp_path)
+    cache_path = data_bundle._cache_path(tmp_path, bundle.content_hash)
+    cache_path.write_bytes(b"not a pickle")
+    reloaded = load_data_bundle(cache_dir=tmp_path)
+    assert reloaded.content_hash == bundle.content_hash
+    assert list(reloaded.hulls_by_id) == list(bundle.hulls_by_id)
+
+
+def test_cache_is_not_served_after_compiler_code_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bundle = load_data_bundle(cache_dir=tmp_path)
+    stale_path = data_bundle._cache_path(tmp_path, bundle.content_hash)
+    monkeypatch.setattr(data_bundle, "_compiler_fingerprint", lambda: "changed")
+    assert data_bundle._read_cache(stale_path, bundle.content_hash) is None
+    assert data_bundle._cache_path(tmp_path, bundle.content_hash) != stale_path
+    reloaded = load_data_bundle(cache_dir=tmp_path)
+    assert reloaded.catalog == bundle.catalog
+    assert len(list(tmp_path.glob("data_bundle-*.pickle"))) == 2
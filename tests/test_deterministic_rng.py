@@ -0,0 +1,109 @@
+import hashlib
+import pickle
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from deterministic_rng import (  # noqa: E402
+    DeterministicRng,
+    KeyedRandom,
+    key64,
+    polynomial_seed,
+    sha256_prefix_int,
+    sha256_seed,
+    sha256_u01,
+)
+from game_engine import GameEngine  # noqa: E402
+
+
+def _legacy_polynomial(base: int, *parts: str) -> int:
+    value = base
+    for part in parts:
+        for char in str(part):
+            value = (value * 31 + ord(char)) % (2**32)
+    return value
+
+
+def test_compat_derivations_match_legacy_hashing() -> None:
+    for parts in [(12345, "SYS-001", 7, "spawn_gate"), (0, "SYS-042", 10, "spawn_select", "event", 3), ()]:
+        packed = "|".join(str(part) for part in parts).encode("utf-8")
+        assert sha256_seed(*parts) == int(hashlib.sha256(packed).hexdigest(), 16)
+    assert sha256_seed(1) != sha256_seed(1.0) != sha256_seed(True)
+
+    for token in ["12345|SYS-001|ENC-3|npc_salvage_count", repr((12345, "SYS-001", "crew_pool")), ""]:
+        digest = hashlib.sha256(token.encode("ascii"))
+        assert sha256_prefix_int(token) == int(digest.hexdigest()[:16], 16)
+        assert sha256_u01(token) == int.from_bytes(digest.digest()[:8], "big") / (2**64)
+
+    for base, parts in [(12345, ("SYS-001", "GOOD-ore")), (-7, ("a", "", "bc")), (2**40, ()), (2**40, ("", ""))]:
+        assert polynomial_seed(base, *parts) == _legacy_polynomial(base, *parts)
+    token = "12345:SYS-001:14:border:inspection"
+    assert polynomial_seed(0, 12345, ":", "SYS-001", ":", 14, ":", "border", ":", "inspection") == _legacy_polynomial(
+        0, token
+    )
+
+
+def test_compat_mode_reproduces_random_streams() -> None:
+    rng = DeterministicRng()
+    parts = (12345, "SYS-001", 9, "spawn_select", "situation", 2)
+    legacy = random.Random(int(hashlib.sha256("12345|SYS-001|9|spawn_select|situation|2".encode()).hexdigest(), 16))
+    assert rng.u01(*parts) == random.Random(sha256_seed(*parts)).random()
+    stream = rng.stream(*parts)
+    assert [stream.random() for _ in range(5)] == [legacy.random() for _ in range(5)]
+
+
+def test_fast_mode_streams_are_keyed_and_reproducible() -> None:
+    rng = DeterministicRng("fast")
+    assert rng.u01(1, "a") == rng.u01(1, "a") == rng.stream(1, "a").random()
+    assert rng.u01(1, "a") != rng.u01(1, "b")
+    values = [rng.u01(index) for index in range(4000)]
+    assert all(0.0 <= value < 1.0 for value in values)
+    assert abs(sum(values) / len(values) - 0.5) < 0.02
+
+    stream = KeyedRandom(key64("shuffle"))
+    first = [stream.randint(1, 6) for _ in range(50)]
+    assert set(first) == {1, 2, 3, 4, 5, 6}
+    restored = pickle.loads(pickle.dumps(stream))
+    assert restored.random() == stream.random()
+    items = list(range(20))
+    KeyedRandom(key64("shuffle")).shuffle(items)
+    assert sorted(items) == list(range(20)) and items != list(range(20))
+    assert KeyedRandom(key64("bits")).getrandbits(130) < 2**130
+    with pytest.raises(ValueError, match="rng_mode"):
+        DeterministicRng("mersenne")
+
+
+def test_engine_rng_mode() -> None:
+    config = {"system_count": 6, "sector_cache": False, "event_frequency_percent": 60, "world_state_events": "off"}
+    commands = [{"type": "wait", "days": 10}] * 6
+
+    def run(mode: str):
+        engine = GameEngine(world_seed=12345, config={**config, "rng_mode": mode})
+        for command in commands:
+            engine.execute(command)
+        world_state = engine.time_context.world_state_engine
+        assert world_state.rng.mode == mode
+        return world_state.active_situations, world_state.active_events, world_state.cooldown_until_day_by_system
+
+    assert run("fast") == run("fast")
+    assert run("fast") != run("compat")
+    with pytest.raises(ValueError, match="rng_mode"):
+        GameEngine(world_seed=12345, config={**config, "rng_mode": "mersenne"})
+
+
+@pytest.mark.parametrize("mode", ["compat", "fast"])
+def test_daily_keys_batch_like_single_rolls(mode: str) -> None:
+    rng = DeterministicRng(mode)
+    systems = [f"SYS-{index:03d}" for index in range(50)]
+    for day in (1, 2, 365):
+        expected = [rng.day_key(12345, system_id, day, "spawn_gate").u01() for system_id in systems]
+        assert rng.day_u01_many(12345, systems, day, "spawn_gate") == expected
+    if mode == "compat":
+        # Compat daily keys are the historical four-part keys.
+        assert rng.day_key(12345, "SYS-001", 9, "spawn_gate").u01() == rng.u01(12345, "SYS-001", 9, "spawn_gate")
@@ -0,0 +1,143 @@
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from economy_data import CATEGORIES, PROFILE_IDS, RESOURCE_PROFILES  # noqa: E402
+from economy_engine import AVAILABILITY_MODIFIERS, EconomyEngine, TradeAction  # noqa: E402
+from world_generator import Sector, System  # noqa: E402
+
+
+class _CollectLogger:
+    def __init__(self) -> None:
+        self.entries: list[tuple[int, str, str]] = []
+
+    def log(self, turn: int, action: str, state_change: str) -> None:
+        self.entries.append((turn, action, state_change))
+
+
+def _sector(count: int) -> Sector:
+    return Sector(
+        systems=[
+            System(
+                system_id=f"SYS-{index:03d}",
+                name=f"System {index}",
+                position=(index, 0),
+                population=3,
+                government_id="anarchic",
+                destinations=[],
+                attributes={"profile_id": PROFILE_IDS[index % len(PROFILE_IDS)]},
+                neighbors=[],
+            )
+            for index in range(count)
+        ]
+    )
+
+
+def _legacy_state(pressure: int, threshold: int) -> str:
+    if pressure <= -threshold:
+        return "SCARCE"
+    if pressure <= -threshold / 2:
+        return "LOW"
+    if pressure >= threshold:
+        return "SURPLUS"
+    if pressure >= threshold / 2:
+        return "ABUNDANT"
+    return "STABLE"
+
+
+class _LegacyEconomy:
+    """The per-cell dictionary update EconomyEngine used before it was array-backed."""
+
+    def __init__(self, sector: Sector, logger: _CollectLogger) -> None:
+        self.sector = sector
+        self.logger = logger
+        self.availability = {s.system_id: {c.category_id: "STABLE" for c in CATEGORIES} for s in sector.systems}
+        self.pressure = {s.system_id: {c.category_id: 0 for c in CATEGORIES} for s in sector.systems}
+        self.causes = {s.system_id: {c.category_id: "production" for c in CATEGORIES} for s in sector.systems}
+
+    def price(self, system_id: str, category_id: str) -> float:
+        base = next(c for c in CATEGORIES if c.category_id == category_id).base_price
+        return base * AVAILABILITY_MODIFIERS[self.availability[system_id][category_id]]
+
+    def advance_turn(self, turn: int, trade: TradeAction | None) -> None:
+        changes = []
+        for system in self.sector.systems:
+            profile = RESOURCE_PROFILES[system.attributes["profile_id"]]
+            for category in CATEGORIES:
+                system_id, category_id = system.system_id, category.category_id
+                production = profile.production[category_id]
+                consumption = profile.consumption[category_id]
+                pressure_change = production - consumption
+                traded = trade is not None and (trade.system_id, trade.category_id) == (system_id, category_id)
+                if traded:
+                    pressure_change += trade.delta
+                self.pressure[system_id][category_id] += pressure_change
+                old_state = self.availability[system_id][category_id]
+                old_price = self.price(system_id, category_id)
+                new_state = _legacy_state(self.pressure[system_id][category_id], max(production, consumption) * 2)
+                if new_state != old_state:
+                    if traded:
+                        self.causes[system_id][category_id] = trade.cause
+                    else:
+                        self.causes[system_id][category_id] = "net_positive" if pressure_change > 0 else "net_negative"
+                    self.availability[system_id][category_id] = new_state
+                    changes.append((system_id, category_id, old_state, new_state, old_price))
+        for system_id, category_id, old_state, new_state, old_price in changes:
+            self.logger.log(
+                turn=turn,
+                action="economy_update",
+                state_change=(
+                    f"system_id={system_id} category_id={category_id} "
+                    f"availability {old_state}->{new_state} "
+                    f"price {old_price:.2f}->{self.price(system_id, category_id):.2f} "
+                    f"cause={self.causes[system_id][category_id]}"
+                ),
+            )
+
+
+def test_array_backed_economy_matches_legacy_update() -> None:
+    sector = _sector(16)
+    legacy_log, engine_log = _CollectLogger(), _CollectLogger()
+    legacy = _LegacyEconomy(sector, legacy_log)
+    engine = EconomyEngine(sector=sector, logger=engine_log)
+    rng = random.Random(7)
+    for turn in range(1, 121):
+        trade = None
+        if rng.random() < 0.7:
+            system = rng.choice(sector.systems)
+            delta = rng.choice([-9, -4, -1, 1, 4, 9])
+            cause = "player_sell" if delta > 0 else "player_buy"
+            trade = TradeAction(system.system_id, rng.choice(CATEGORIES).category_id, delta, cause)
+        legacy.advance_turn(turn, trade)
+        engine.advance_turn(turn=turn, trade_action=trade)
+
+    assert engine_log.entries == legacy_log.entries
+    assert len(engine_log.entries) > 50
+    for system in sector.systems:
+        for category in CATEGORIES:
+            cell = (system.system_id, category.category_id)
+            assert engine.availability(*cell) == legacy.availability[cell[0]][cell[1]]
+            assert engine.pressure(*cell) == legacy.pressure[cell[0]][cell[1]]
+            assert engine.price(*cell) == legacy.price(*cell)
+            assert engine.all_prices()[cell[0]][cell[1]] == engine.price(*cell)
+
+
+def test_quiet_ticks_do_not_log() -> None:
+    logger = _CollectLogger()
+    engine = EconomyEngine(sector=_sector(8), logger=logger)
+    for turn in range(1, 40):
+        engine.advance_turn(turn=turn)
+    # Every imbalanced cell has settled at SCARCE or SURPLUS; balanced cells never moved.
+    assert logger.entries and max(entry[0] for entry in logger.entries) < 10
+    engine.advance_turn(turn=40, trade_action=TradeAction("SYS-000", "FOOD", 1, "player_sell"))
+    assert logger.entries[-1][0] < 10
+    assert engine.pressure("SYS-000", "FOOD") == 2 * 40 + 1
+    assert {engine.availability("SYS-000", category.category_id) for category in CATEGORIES} <= {
+        "SCARCE",
+        "STABLE",
+        "SURPLUS",
+    }
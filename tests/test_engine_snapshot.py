@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from engine_snapshot import SNAPSHOT_MAGIC  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from time_engine import get_current_turn  # noqa: E402
+
+
+def _script(engine: GameEngine) -> list[dict]:
+    system = engine.sector.systems[1]
+    destination_id = system.destinations[0].destination_id if system.destinations else None
+    return [
+        {"type": "wait", "days": 1},
+        {
+            "type": "travel_to_destination",
+            "target_system_id": system.system_id,
+            "target_destination_id": destination_id,
+        },
+        {"type": "wait", "days": 2},
+    ]
+
+
+def test_restore_replays_identically() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 8})
+    engine.execute({"type": "wait", "days": 3})
+    blob = engine.snapshot()
+    assert blob.startswith(SNAPSHOT_MAGIC)
+
+    commands = _script(engine)
+    expected = [engine.execute(command) for command in commands]
+
+    restored = GameEngine(world_seed=999, config={"system_count": 5})
+    restored.restore(blob)
+    assert int(get_current_turn(restored.time_context)) == 3
+    assert restored.time_engine.context is restored.time_context
+    assert [restored.execute(command) for command in commands] == expected
+
+
+def test_fork_is_independent_of_parent() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 8})
+    engine.execute({"type": "wait", "days": 1})
+    parent_blob = engine.snapshot()
+    credits_before = engine.player_state.credits
+
+    fork = engine.fork()
+    fork.player_state.credits += 1000
+    fork.sector.systems.reverse()
+    for command in _script(fork):
+        fork.execute(command)
+
+    assert int(get_current_turn(engine.time_context)) == 1
+    assert int(get_current_turn(fork.time_context)) > 1
+    assert engine.player_state.credits == credits_before
+    assert engine.snapshot() == parent_blob
+    assert fork.data_bundle is engine.data_bundle
+
+
+def test_fork_matches_parent_results() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 8})
+    commands = _script(engine)
+    fork = engine.fork()
+    assert [fork.execute(command) for command in commands] == [engine.execute(command) for command in commands]
+
+
+def test_restore_rejects_invalid_blobs() -> None:
+    engine = GameEngine(world_seed=12345)
+    blob = engine.snapshot()
+    with pytest.raises(ValueError, match="Not an engine snapshot"):
+        engine.restore(b"XXXX" + blob[4:])
+    with pytest.raises(ValueError, match="format version"):
+        engine.restore(blob[:4] + b"\x00\x63" + blob[6:])
+    with pytest.raises(ValueError, match="corrupt"):
+        engine.restore(blob[:-8])
+    assert int(get_current_turn(engine.time_context)) == 0
@@ -0,0 +1,126 @@
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from event_bus import (  # noqa: E402
+    DEBUG,
+    INFO,
+    WARNING,
+    EventBus,
+    JsonlFileSink,
+    RingBufferSink,
+    TraceEvent,
+)
+from game_engine import GameEngine  # noqa: E402
+from time_engine import TimeEngineEvent  # noqa: E402
+from world_state_engine import (  # noqa: E402
+    ActiveSituation,
+    SituationAdded,
+    SpawnGateChecked,
+    SpawnGateClosed,
+    WorldStateEngine,
+)
+
+
+def test_level_filter_is_checked_before_events_are_built() -> None:
+    bus = EventBus()
+    assert not bus.enabled
+    assert not bus.accepts(WARNING)
+
+    warnings = RingBufferSink()
+    unsubscribe = bus.subscribe(warnings, level="warning")
+    assert bus.accepts(WARNING) and not bus.accepts(INFO)
+
+    everything = RingBufferSink(capacity=2)
+    bus.subscribe(everything, level=DEBUG)
+    for index in range(3):
+        bus.publish(TraceEvent.of(DEBUG, "Trace", index=index))
+    bus.publish(TraceEvent.of(WARNING, "Ignored", reason="test"))
+    assert [event.render() for event in everything.events()] == ["Trace: index=2", "Ignored: reason=test"]
+    assert [event.topic for event in warnings.events()] == ["Ignored"]
+
+    unsubscribe()
+    unsubscribe()
+    bus.clear()
+    assert not bus.accepts(WARNING)
+    with pytest.raises(ValueError):
+        bus.subscribe(warnings, level="loud")
+
+
+def test_kind_filter_and_jsonl_sink(tmp_path: Path) -> None:
+    path = tmp_path / "events" / "world.jsonl"
+    sink = JsonlFileSink(path)
+    bus = EventBus()
+    bus.subscribe(sink, kinds=[SituationAdded])
+    engine = WorldStateEngine(event_bus=bus)
+    engine.add_situation(ActiveSituation("SIT-1", "SYS-001", "system", None, 3))
+    bus.publish(TraceEvent.of(INFO, "Not written", flag={"b", "a"}))
+    restored = pickle.loads(pickle.dumps(sink))
+    sink.close()
+
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert rows == [
+        {"kind": "situation_added", "level": "info", "situation_id": "SIT-1", "system_id": "SYS-001", "scope": "system"}
+    ]
+    assert restored.path == path
+    assert TraceEvent.of(INFO, "Flags", flag={"b", "a"}).to_dict()["values"] == {"flag": ["a", "b"]}
+
+
+def test_default_bus_prints_legacy_lines(capsys) -> None:
+    engine = WorldStateEngine()
+    engine.add_situation(ActiveSituation("SIT-1", "SYS-001", "system", None, 3))
+    assert capsys.readouterr().out == "Situation added: SIT-1 system=SYS-001 scope=system\n"
+    assert TimeEngineEvent("galaxy_tick", (("day", 4),)).render() == "[time_engine] action=galaxy_tick change=day=4"
+
+
+def test_spawn_gate_publishes_typed_events_with_legacy_text() -> None:
+    sink = RingBufferSink()
+    bus = EventBus()
+    bus.subscribe(sink, level=DEBUG)
+    engine = WorldStateEngine(event_bus=bus)
+    engine.cooldown_until_day_by_system["SYS-001"] = 5
+    assert engine.evaluate_spawn_gate(7, "SYS-001", [], 3, 100) is False
+    assert engine.evaluate_spawn_gate(7, "SYS-001", [], 6, 0) is False
+    assert sink.events() == [
+        SpawnGateChecked("SYS-001", 3, 5, True),
+        SpawnGateChecked("SYS-001", 6, 5, False),
+        SpawnGateClosed("SYS-001", 6, 5, sink.events()[-1].spawn_gate_roll),
+    ]
+    assert [event.render() for event in sink.events()][:2] == [
+        "Spawn gate cooldown check: system_id=SYS-001 current_day=3 cooldown_until=5 skipped=true reason=cooldown_active",
+        "Spawn gate cooldown check: system_id=SYS-001 current_day=6 cooldown_until=5 skipped=false reason=cooldown_clear",
+    ]
+    assert sink.events()[-1].to_dict()["kind"] == "spawn_gate_closed"
+
+
+def test_disabled_engine_is_silent_and_simulates_identically(capsys) -> None:
+    config = {"system_count": 6, "sector_cache": False, "event_frequency_percent": 60}
+    loud = GameEngine(world_seed=12345, config=config)
+    quiet = GameEngine(world_seed=12345, config={**config, "world_state_events": "off"})
+    buffered = RingBufferSink(capacity=10_000)
+    quiet.event_bus.subscribe(buffered, level=INFO)
+    capsys.readouterr()
+
+    commands = [{"type": "wait", "days": 10}] * 8
+    assert [loud.execute(command) for command in commands] == [quiet.execute(command) for command in commands]
+    printed = capsys.readouterr().out
+    assert printed
+    quiet.event_bus.clear()
+    fork = loud.fork()
+    fork.execute({"type": "wait", "days": 10})
+    quiet.execute({"type": "wait", "days": 10})
+    assert capsys.readouterr().out == ""
+
+    rendered = [event.render() for event in buffered.events()]
+    assert rendered and set(rendered) <= set(printed.splitlines())
+    assert any(isinstance(event, TimeEngineEvent) for event in buffered.events())
+    assert quiet.time_context.world_state_engine.event_bus is quiet.event_bus
+    with pytest.raises(ValueError, match="world_state_events"):
+        GameEngine(world_seed=12345, config={**config, "world_state_events": "loud"})
@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine, _BatchLookups  # noqa: E402
+from time_engine import get_current_turn  # noqa: E402
+
+
+COMPACT_KEYS = ("ok", "error", "command_type", "turn_before", "turn_after", "hard_stop", "hard_stop_reason")
+
+
+def _fueled_engine() -> GameEngine:
+    engine = GameEngine(world_seed=12345, config={"system_count": 8})
+    ship = engine.fleet_by_id[engine.player_state.active_ship_id]
+    ship.fuel_capacity = 1000
+    ship.current_fuel = 1000
+    return engine
+
+
+def _commands(engine: GameEngine) -> list[dict]:
+    system = engine.sector.systems[1]
+    destination_id = system.destinations[0].destination_id if system.destinations else None
+    read_side = [
+        {"type": "get_player_profile"},
+        {"type": "get_system_profile"},
+        {"type": "get_destination_profile"},
+        {"type": "list_destination_actions"},
+    ]
+    return [
+        *read_side,
+        {"type": "wait", "days": 2},
+        *read_side,
+        {
+            "type": "travel_to_destination",
+            "target_system_id": system.system_id,
+            "target_destination_id": destination_id,
+        },
+        *read_side,
+        {"type": "not_a_command"},
+    ]
+
+
+def test_batch_matches_single_command_loop() -> None:
+    engine = _fueled_engine()
+    batch_engine = engine.fork()
+    commands = _commands(engine)
+
+    full = [engine.execute(command) for command in commands]
+    compact = batch_engine.execute_batch(commands, stop_on_hard_stop=False)
+
+    assert len(compact) == len(commands)
+    for expected, actual in zip(full, compact):
+        assert {key: expected[key] for key in COMPACT_KEYS} == {key: actual[key] for key in COMPACT_KEYS}
+        assert actual["event_count"] == len(expected["events"])
+        assert "events" not in actual
+    assert batch_engine.player_state.current_system_id == engine.player_state.current_system_id
+    assert batch_engine.player_state.credits == engine.player_state.credits
+    assert batch_engine._batch_lookups is None
+
+
+def test_batch_stops_after_game_over() -> None:
+    engine = GameEngine(world_seed=12345)
+    engine.player_state.run_ended = True
+    engine.player_state.run_end_reason = "bankruptcy"
+    results = engine.execute_batch([{"type": "wait", "days": 1}, {"type": "wait", "days": 1}])
+    assert len(results) == 1
+    assert results[0]["error"] == "game_over"
+    assert results[0]["game_over_reason"] == "bankruptcy"
+    assert int(get_current_turn(engine.time_context)) == 0
+
+
+def test_batch_lookups_follow_travel() -> None:
+    engine = _fueled_engine()
+    target = engine.sector.systems[1]
+    results = engine.execute_batch(
+        [
+            {"type": "get_system_profile"},
+            {"type": "travel_to_destination", "target_system_id": target.system_id},
+            {"type": "get_system_profile"},
+        ],
+        stop_on_hard_stop=False,
+    )
+    assert results[1]["ok"] is True
+    assert engine.player_state.current_system_id == target.system_id
+    assert results[2]["ok"] is True
+
+
+def test_batch_assembly_cache_shares_read_only_results() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 8})
+    hull_id = engine._active_ship().model_id
+    engine._batch_lookups = _BatchLookups()
+    try:
+        first = engine._assemble_ship(hull_id, [], {"weapon": 0, "defense": 0, "engine": 0})
+        # Equal inputs in fresh containers, with the degradation keys in another order, hit the same entry.
+        again = engine._assemble_ship(hull_id, [], {"engine": 0, "defense": 0, "weapon": 0})
+        worn = engine._assemble_ship(hull_id, [], {"weapon": 1, "defense": 0, "engine": 0})
+        assert again is first
+        assert worn is not first and len(engine._batch_lookups.assembled_ships) == 2
+        with pytest.raises(TypeError):
+            first["hull_max"] = 0
+        with pytest.raises(TypeError):
+            first["bands"]["effective"]["weapon"] = 99
+        with pytest.raises(ValueError):
+            engine._assemble_ship(hull_id, [{"module_id": 7}], {"weapon": 0, "defense": 0, "engine": 0})
+    finally:
+        engine._batch_lookups = None
+    uncached = engine._assemble_ship(hull_id, [], {"weapon": 0, "defense": 0, "engine": 0})
+    assert uncached["bands"]["effective"] == dict(first["bands"]["effective"])
@@ -229,7 +229,7 @@ def test_location_entry_and_return_do_not_advance_time_or_fuel() -> None:
 
     assert engine.player_state.current_location_id == destination.destination_id
     assert int(ship.current_fuel) == fuel_before
-    assert int(get_current_turn()) == int(turn_before)
+    assert int(get_current_turn(engine.time_context)) == int(turn_before)
 
 
 def test_list_location_actions_requires_being_in_location() -> None:
@@ -370,7 +370,7 @@ def test_enter_location_and_return_are_engine_commands() -> None:
     returned = engine.execute({"type": "return_to_destination"})
     assert returned["ok"] is True
     assert engine.player_state.current_location_id == destination.destination_id
-    assert int(get_current_turn()) == int(turn_before)
+    assert int(get_current_turn(engine.time_context)) == int(turn_before)
     assert int(ship.current_fuel) == fuel_before
 
 
@@ -468,7 +468,7 @@ def test_voluntary_customs_cannot_double_trigger_without_allow_repeat() -> None:
 
 def test_profiles_do_not_advance_time() -> None:
     engine = GameEngine(world_seed=12345)
-    turn_before = int(get_current_turn())
+    turn_before = int(get_current_turn(engine.time_context))
     commands = [
         ("get_player_profile", "player_profile"),
         ("get_system_profile", "system_profile"),
@@ -480,13 +480,13 @@ def test_profiles_do_not_advance_time() -> None:
         assert result["turn_before"] == turn_before
         assert result["turn_after"] == turn_before
         assert _extract_stage_detail(result, stage) is not None
-    assert int(get_current_turn()) == turn_before
+    assert int(get_current_turn(engine.time_context)) == turn_before
 
 
 def test_profiles_do_not_mutate_state() -> None:
     engine = GameEngine(world_seed=12345)
     ship = engine.fleet_by_id[engine.player_state.active_ship_id]
-    turn_before = int(get_current_turn())
+    turn_before = int(get_current_turn(engine.time_context))
     player_before = engine.player_state.to_dict()
     ship_before = {
         "current_fuel": int(ship.current_fuel),
@@ -508,7 +508,7 @@ def test_profiles_do_not_mutate_state() -> None:
     }
     assert player_after == player_before
     assert ship_after == ship_before
-    assert int(get_current_turn()) == turn_before
+    assert int(get_current_turn(engine.time_context)) == turn_before
 
 
 def test_profiles_are_deterministic() -> None:
@@ -532,3 +532,15 @@ def _extract_stage_detail(result: dict, stage: str) -> dict | None:
             if isinstance(detail, dict):
                 return detail
     return None
+
+
+def test_engines_keep_independent_clocks() -> None:
+    first = GameEngine(world_seed=12345)
+    first.execute({"type": "wait", "days": 2})
+    second = GameEngine(world_seed=12345)
+    assert int(get_current_turn(second.time_context)) == 0
+    assert int(get_current_turn(first.time_context)) == 2
+    assert first._world_state_engine() is not second._world_state_engine()
+    result = first.execute({"type": "wait", "days": 1})
+    assert result["turn_after"] == 3
+    assert int(get_current_turn(second.time_context)) == 0
@@ -0,0 +1,118 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from sector_cache import load_or_generate_sector  # noqa: E402
+from world_generator import LazySystem, System, WorldGenerator  # noqa: E402
+
+
+def _generator(system_count: int = 12) -> WorldGenerator:
+    bundle = get_data_bundle()
+    registry = GovernmentRegistry.from_payload(bundle.document("governments.json"))
+    return WorldGenerator(
+        seed=2024,
+        system_count=system_count,
+        government_ids=registry.government_ids(),
+        catalog=bundle.catalog,
+    )
+
+
+def _expanded(sector) -> int:
+    return sum(not isinstance(system, LazySystem) for system in sector.systems)
+
+
+def test_lazy_systems_expand_to_eager_records() -> None:
+    eager = _generator().generate()
+    lazy = _generator().generate(lazy=True)
+    assert _expanded(lazy) == 0
+    for eager_system, lazy_system in zip(eager.systems, lazy.systems):
+        assert (lazy_system.system_id, lazy_system.name, lazy_system.population) == (
+            eager_system.system_id,
+            eager_system.name,
+            eager_system.population,
+        )
+        assert (lazy_system.x, lazy_system.y, lazy_system.neighbors) == (
+            eager_system.x,
+            eager_system.y,
+            eager_system.neighbors,
+        )
+    assert _expanded(lazy) == 0
+
+    # Expanding out of order must not depend on which systems were generated before.
+    target = lazy.systems[7]
+    assert target.destinations == eager.systems[7].destinations
+    assert type(target) is System
+    assert _expanded(lazy) == 1
+    assert lazy == eager
+    assert _expanded(lazy) == len(lazy.systems)
+
+
+def test_index_lookups_do_not_expand_systems() -> None:
+    lazy = _generator().generate(lazy=True)
+    for system in lazy.systems:
+        assert lazy.get_system(system.system_id) is system
+    assert lazy.get_destination("SYS-999-DST-01") is None
+    assert _expanded(lazy) == 0
+
+    destination = lazy.systems[3].destinations[1]
+    assert lazy.get_destination(destination.destination_id) is destination
+    assert lazy.system_for_destination(destination.destination_id) is lazy.systems[3]
+    assert _expanded(lazy) == 1
+
+
+def test_destination_lookup_expands_its_owning_system() -> None:
+    eager = _generator().generate()
+    lazy = _generator().generate(lazy=True)
+    destination = eager.systems[5].destinations[0]
+    location = eager.systems[8].destinations[0].locations[0]
+
+    assert lazy.get_destination(destination.destination_id) == destination
+    assert lazy.system_for_destination(destination.destination_id) is lazy.systems[5]
+    assert lazy.get_location(location.location_id) == location
+    assert _expanded(lazy) == 2
+    assert lazy.get_destination(f"{destination.destination_id[:-2]}99") is None
+    assert _expanded(lazy) == 2
+
+
+def test_lazy_sector_cache_round_trip(tmp_path: Path) -> None:
+    bundle = get_data_bundle()
+    kwargs = {
+        "seed": 2024,
+        "system_count": 12,
+        "government_ids": GovernmentRegistry.from_payload(bundle.document("governments.json")).government_ids(),
+        "bundle": bundle,
+        "cache_dir": tmp_path,
+    }
+    load_or_generate_sector(**kwargs, lazy=True)
+    load_or_generate_sector(**kwargs)
+    assert len(list(tmp_path.glob("sector-*.bin"))) == 2
+    warm = load_or_generate_sector(**kwargs, lazy=True)
+    assert _expanded(warm) == 0
+    assert warm.systems[0]._source.catalog is bundle.catalog
+    assert warm == load_or_generate_sector(**kwargs)
+
+
+def test_lazy_engine_expands_only_what_it_touches() -> None:
+    config = {"system_count": 40, "sector_cache": False}
+    lazy = GameEngine(world_seed=12345, config={**config, "lazy_sector": True})
+    eager = GameEngine(world_seed=12345, config=config)
+    assert _expanded(lazy.sector) == 1
+
+    target = lazy.sector.get_system(lazy.player_state.current_system_id).neighbors[0]
+    commands = [
+        {"type": "get_system_profile"},
+        {"type": "wait", "days": 2},
+        {"type": "plan_route", "target_system_id": target},
+    ]
+    assert [lazy.execute(command) for command in commands] == [eager.execute(command) for command in commands]
+    assert _expanded(lazy.sector) < 5
+
+    restored = GameEngine.from_snapshot(lazy.snapshot())
+    assert _expanded(restored.sector) == _expanded(lazy.sector)
+    assert restored.sector == eager.sector
@@ -0,0 +1,87 @@
+import pickle
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_catalog import VARIANT_MEMO_SIZE, DataCatalog, Good  # noqa: E402
+from market import Market, MarketCategory, MarketGood  # noqa: E402
+
+
+def _catalog() -> DataCatalog:
+    goods = [
+        Good(sku="rations", name="Rations", category="FOOD", base_price=100, tags=[], possible_tag="luxury"),
+        Good(sku="fine_rations", name="Fine Rations", category="FOOD", base_price=150, tags=[], possible_tag=None),
+        Good(sku="rifles", name="Rifles", category="WEAPONS", base_price=300, tags=["weaponized"], possible_tag="stolen"),
+    ]
+    return DataCatalog(tags={}, goods=goods, economies={})
+
+
+def _good(sku: str, category: str = "FOOD") -> MarketGood:
+    return MarketGood(sku=sku, name=sku.title(), category=category, base_price=100, tags=())
+
+
+def test_catalog_resolves_variant_skus() -> None:
+    catalog = _catalog()
+    assert catalog.good_by_sku("rifles").base_price == 300
+    assert catalog.possible_variant_tags() == {"luxury", "stolen"}
+    assert catalog.resolve_variant_sku("rations") == ("rations", ())
+    assert catalog.resolve_variant_sku("luxury_rations") == ("rations", ("luxury",))
+    # Any known variant tag may be stripped, from either end, and the longest catalog SKU wins.
+    assert catalog.resolve_variant_sku("stolen_luxury_rations") == ("rations", ("stolen", "luxury"))
+    assert catalog.resolve_variant_sku("rifles_stolen") == ("rifles", ("stolen",))
+    assert catalog.resolve_variant_sku("luxury_fine_rations") == ("fine_rations", ("luxury",))
+    assert catalog.resolve_variant_sku("bogus_rations") == (None, ())
+    try:
+        catalog.good_by_sku("bogus")
+    except KeyError as exc:
+        assert "Unknown SKU: bogus" in str(exc)
+    else:
+        raise AssertionError("expected KeyError")
+
+
+def test_variant_lookups_of_unlisted_skus_stay_bounded() -> None:
+    catalog = _catalog()
+    index = catalog._index()
+    precompiled = dict(index.variants)
+    for number in range(VARIANT_MEMO_SIZE + 500):
+        assert catalog.resolve_variant_sku(f"bogus{number}_rations") == (None, ())
+    assert catalog.resolve_variant_sku("stolen_luxury_rations") == ("rations", ("stolen", "luxury"))
+    assert catalog.resolve_variant_sku("stolen_luxury_rations") == ("rations", ("stolen", "luxury"))
+    assert index.variants == precompiled
+    info = index.resolve_unlisted.cache_info()
+    assert info.currsize == VARIANT_MEMO_SIZE and info.hits == 1
+
+
+def test_market_indexes_listed_goods() -> None:
+    catalog = _catalog()
+    market = Market(
+        categories={
+            "FOOD": MarketCategory(
+                produced=(_good("rations"),),
+                consumed=(_good("luxury_rations"), _good("fine_rations")),
+                neutral=(),
+            ),
+            "WEAPONS": MarketCategory(produced=(), consumed=(), neutral=(_good("stolen_rifles", "WEAPONS"),)),
+        },
+        primary_economy="trade",
+        secondary_economies=(),
+    )
+    good, role = market.good_entry("luxury_rations")
+    assert (good.sku, role) == ("luxury_rations", "consumed")
+    assert market.good_entry("stolen_rifles")[1] == "neutral"
+    assert market.good_entry("rifles") is None
+    assert market.base_sku_index(catalog) == {
+        ("FOOD", "rations"): ("luxury_rations", "rations"),
+        ("FOOD", "fine_rations"): ("fine_rations",),
+        ("WEAPONS", "rifles"): ("stolen_rifles",),
+    }
+
+    # Indexes are rebuilt on demand and never written into pickles or compared.
+    restored = pickle.loads(pickle.dumps(market))
+    assert "_market_sku_index" not in restored.__dict__
+    assert restored == market
+    assert restored.good_entry("rations")[1] == "produced"
+    assert "_catalog_index" not in pickle.loads(pickle.dumps(catalog)).__dict__
@@ -0,0 +1,115 @@
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+from market_observations import MarketObservation, MarketObservationStore  # noqa: E402
+from player_state import PlayerState  # noqa: E402
+from time_engine import get_current_turn  # noqa: E402
+
+
+def _rows(**prices: int) -> list[dict]:
+    return [{"sku_id": sku, "unit_price": price} for sku, price in prices.items()]
+
+
+def test_store_tracks_best_known_prices() -> None:
+    store = MarketObservationStore(max_age_turns=10)
+    store.record("DST-A", "sell", _rows(ore=30, food=12), turn=1)
+    store.record("DST-B", "sell", _rows(ore=45), turn=2)
+    store.record("DST-C", "buy", _rows(ore=20, bogus=0), turn=2)
+    store.record("DST-D", "buy", _rows(ore=18), turn=3)
+    assert len(store) == 5
+    assert store.best_sell("ore", current_turn=3) == MarketObservation("ore", "DST-B", "sell", 45, 2)
+    assert store.best_buy("ore", current_turn=3).destination_id == "DST-D"
+    assert store.best_sell("gems", current_turn=3) is None
+
+    # A newer look at DST-B supersedes its old price rather than adding a second one.
+    store.record("DST-B", "sell", _rows(ore=25), turn=4)
+    assert store.best_sell("ore", current_turn=4) == MarketObservation("ore", "DST-A", "sell", 30, 1)
+    assert store.quote("DST-B", "ore", "sell", current_turn=4).unit_price == 25
+
+    # DST-A's price from turn 1 is too old by turn 12 and gets evicted on the way.
+    assert store.best_sell("ore", current_turn=12).destination_id == "DST-B"
+    assert store.quote("DST-A", "ore", "sell", current_turn=12) is None
+    assert store.observations(current_turn=12) == {
+        "DST-B": {"ore": {"sell": 25}},
+        "DST-C": {"ore": {"buy": 20}},
+        "DST-D": {"ore": {"buy": 18}},
+    }
+    assert store.evict_stale(current_turn=100) == 3
+    assert len(store) == 0 and store.best_buy("ore", current_turn=100) is None
+    with pytest.raises(ValueError):
+        store.record("DST-A", "steal", _rows(ore=1), turn=1)
+
+
+def test_store_rebuilds_heaps_after_many_updates() -> None:
+    store = MarketObservationStore()
+    store.best_buy("ore", current_turn=0)
+    for turn in range(200):
+        store.record("DST-A", "buy", _rows(ore=500 - turn), turn=turn)
+        store.record("DST-B", "buy", _rows(ore=300 + turn), turn=turn)
+        assert store.best_buy("ore", current_turn=turn).unit_price == min(500 - turn, 300 + turn)
+    assert len(store._heaps[("buy", "ore")]) <= 2 * 2 + 16
+
+
+def test_store_serializes_compactly() -> None:
+    store = MarketObservationStore(max_age_turns=7)
+    store.record("DST-A", "buy", _rows(ore=20, food=9), turn=3)
+    store.record("DST-B", "sell", _rows(ore=33), turn=4)
+    store.best_sell("ore", current_turn=4)
+    payload = store.to_dict()
+    assert payload == {
+        "max_age_turns": 7,
+        "buy": {"DST-A": {"food": [9, 3], "ore": [20, 3]}},
+        "sell": {"DST-B": {"ore": [33, 4]}},
+    }
+    restored = MarketObservationStore.from_dict(json.loads(json.dumps(payload)))
+    assert restored == store
+    assert restored.best_sell("ore", current_turn=4) == store.best_sell("ore", current_turn=4)
+    assert pickle.loads(pickle.dumps(store))._heaps == {}
+
+    player = PlayerState(market_observations=store)
+    assert PlayerState.from_dict(player.to_dict()).market_observations == store
+    assert len(PlayerState.from_dict({}).market_observations) == 0
+
+
+def _engine_at_market() -> GameEngine:
+    engine = GameEngine(world_seed=12345, config={"system_count": 10, "sector_cache": False})
+    for system in engine.sector.systems:
+        for destination in sorted(system.destinations, key=lambda row: row.destination_id):
+            for location in list(getattr(destination, "locations", []) or []):
+                if getattr(location, "location_type", None) == "market" and destination.market is not None:
+                    engine.player_state.current_system_id = system.system_id
+                    engine.player_state.current_destination_id = destination.destination_id
+                    engine.player_state.current_location_id = destination.destination_id
+                    result = engine.execute({"type": "enter_location", "location_id": location.location_id})
+                    assert result["ok"] is True
+                    return engine
+    raise AssertionError("No market location available for test")
+
+
+def test_market_lists_feed_player_observations() -> None:
+    engine = _engine_at_market()
+    destination_id = engine.player_state.current_destination_id
+    result = engine.execute({"type": "market_buy_list"})
+    rows = next(event["detail"]["rows"] for event in result["events"] if event["stage"] == "market_buy_list")
+    store = engine.player_state.market_observations
+    assert len(store) == len(rows) > 0
+    turn = int(get_current_turn(engine.time_context))
+    for row in rows:
+        quote = store.quote(destination_id, row["sku_id"], "buy", current_turn=turn)
+        assert quote.unit_price == row["unit_price"]
+
+    routes = engine.execute({"type": "find_trade_routes"})
+    assert routes["ok"] is True
+    detail = next(event["detail"] for event in routes["events"] if event["stage"] == "trade_routes")
+    assert detail["observation_source"] == "player"
+    assert detail["observed_destinations"] == 1
+    assert GameEngine.from_snapshot(engine.snapshot()).player_state.market_observations == store
@@ -0,0 +1,137 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+from market_quote_table import MarketQuoteKey, MarketQuoteTable  # noqa: E402
+
+
+def _engine_at_market() -> GameEngine:
+    engine = GameEngine(world_seed=12345, config={"system_count": 10, "sector_cache": False})
+    engine.player_state.credits = 50000
+    for system in engine.sector.systems:
+        for destination in sorted(system.destinations, key=lambda row: row.destination_id):
+            for location in list(getattr(destination, "locations", []) or []):
+                if getattr(location, "location_type", None) == "market" and destination.market is not None:
+                    engine.player_state.current_system_id = system.system_id
+                    engine.player_state.current_destination_id = destination.destination_id
+                    engine.player_state.current_location_id = destination.destination_id
+                    result = engine.execute({"type": "enter_location", "location_id": location.location_id})
+                    assert result["ok"] is True
+                    return engine
+    raise AssertionError("No market location available for test")
+
+
+def _count_quotes(engine: GameEngine, monkeypatch) -> list[str]:
+    calls: list[str] = []
+    original = engine._market_price_quote
+
+    def counting(**kwargs):
+        calls.append(kwargs["sku"])
+        return original(**kwargs)
+
+    monkeypatch.setattr(engine, "_market_price_quote", counting)
+    return calls
+
+
+def _uncached_buy_rows(engine: GameEngine) -> list[dict]:
+    destination = engine._current_destination()
+    system = engine._current_system()
+    government = engine.government_registry.get_government(system.government_id)
+    skus = sorted(
+        {
+            good.sku
+            for category in destination.market.categories.values()
+            for good in list(category.produced) + list(category.consumed) + list(category.neutral)
+        }
+    )
+    rows = []
+    for sku in skus:
+        quote = engine._market_price_quote(destination=destination, government=government, sku=sku, action="buy")
+        if quote is not None:
+            rows.append((sku, quote["unit_price"], quote["legality"], quote["risk_tier"]))
+    return rows
+
+
+def test_quote_table_computes_each_sku_once() -> None:
+    table = MarketQuoteTable(MarketQuoteKey("DST-1", "buy", "anarchic", 3, 0, "SHIP-1", 0))
+    calls: list[str] = []
+
+    def compute(sku: str) -> dict | None:
+        calls.append(sku)
+        return None if sku == "missing" else {"unit_price": 10}
+
+    assert table.quote("grain", compute) == {"unit_price": 10}
+    assert table.quote("grain", compute) == {"unit_price": 10}
+    assert table.quote("missing", compute) is None
+    assert table.quote("missing", compute) is None
+    assert calls == ["grain", "missing"]
+    assert len(table) == 2
+
+
+def test_market_commands_share_one_table_per_turn(monkeypatch) -> None:
+    engine = _engine_at_market()
+    expected = _uncached_buy_rows(engine)
+    calls = _count_quotes(engine, monkeypatch)
+
+    buy_list = engine._market_price_rows(action="buy")
+    assert [(row["sku_id"], row["unit_price"], row["legality"], row["risk_tier"]) for row in buy_list] == expected
+    quoted = len(calls)
+    assert quoted > 0
+
+    assert engine._market_price_rows(action="buy") == buy_list
+    assert engine._market_row_by_sku(action="buy", sku_id=buy_list[0]["sku_id"]) == buy_list[0]
+    assert len(calls) == quoted
+
+    # Rows are copies; callers cannot corrupt the cached listing.
+    engine._market_price_rows(action="buy")[0]["unit_price"] = -1
+    assert engine._market_price_rows(action="buy") == buy_list
+
+    result = engine.execute({"type": "market_buy", "sku_id": buy_list[0]["sku_id"], "quantity": 1})
+    assert result["ok"] is True
+    assert len(calls) == quoted
+
+    # A new day means a new table.
+    location_id = engine.player_state.current_location_id
+    assert engine.execute({"type": "return_to_destination"})["ok"] is True
+    assert engine.execute({"type": "wait", "days": 1})["ok"] is True
+    assert engine.execute({"type": "enter_location", "location_id": location_id})["ok"] is True
+    engine._market_price_rows(action="buy")
+    assert len(calls) == 2 * quoted
+
+
+def test_table_is_rebuilt_when_modifiers_or_crew_change(monkeypatch) -> None:
+    engine = _engine_at_market()
+    calls = _count_quotes(engine, monkeypatch)
+    engine._market_price_rows(action="buy")
+    quoted = len(calls)
+
+    world_state_engine = engine._world_state_engine()
+    if world_state_engine is not None:
+        world_state_engine.invalidate_modifier_cache()
+        engine._market_price_rows(action="buy")
+        assert len(calls) == 2 * quoted
+
+    table, _, _ = engine._market_quote_table(action="buy")
+    assert engine._market_quote_table(action="buy")[0] is table
+    ship = engine._active_ship()
+    ship.remove_crew("NPC-NOT-ABOARD")
+    rebuilt, _, _ = engine._market_quote_table(action="buy")
+    assert rebuilt is not table
+    assert rebuilt.key.crew_version == table.key.crew_version + 1
+    assert rebuilt.key.turn == table.key.turn
+
+
+def test_buy_lookup_only_returns_listed_goods(monkeypatch) -> None:
+    engine = _engine_at_market()
+    calls = _count_quotes(engine, monkeypatch)
+    listed = sorted(engine._current_destination().market._sku_index())[0]
+
+    row = engine._market_row_by_sku(action="buy", sku_id=listed)
+    assert row is not None and row["sku_id"] == listed
+    assert calls == [listed]
+    assert engine._market_row_by_sku(action="buy", sku_id="not_a_listed_sku") is None
+    assert calls == [listed]
@@ -181,9 +181,7 @@ def test_situations_modifiers_can_push_price_above_base() -> None:
             "source_id": "E-SCARCITY",
         },
     ]
-    import time_engine as time_engine_module
-
-    time_engine_module._world_state_engine = ws
+    engine.time_context.world_state_engine = ws
     quote = _sell_quote(engine, destination, "fresh_produce")
     assert quote is not None
     assert int(quote["unit_price"]) > 120
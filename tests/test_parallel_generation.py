@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+import world_generator  # noqa: E402
+from data_bundle import get_data_bundle  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from world_generator import WorldGenerator  # noqa: E402
+
+
+def _generator(seed: int, system_count: int, logger=None) -> WorldGenerator:
+    bundle = get_data_bundle()
+    registry = GovernmentRegistry.from_payload(bundle.document("governments.json"))
+    return WorldGenerator(
+        seed=seed,
+        system_count=system_count,
+        government_ids=registry.government_ids(),
+        catalog=bundle.catalog,
+        logger=logger,
+    )
+
+
+def test_worker_pool_matches_serial_generation() -> None:
+    for seed, system_count, workers in ((12345, 9, 2), (7, 25, 3)):
+        serial = _generator(seed, system_count).generate()
+        parallel = _generator(seed, system_count).generate(workers=workers)
+        assert parallel == serial
+        assert [system.system_id for system in parallel.systems] == [system.system_id for system in serial.systems]
+        for system in parallel.systems:
+            assert system.attributes["destinations"] is system.destinations
+
+
+def test_logged_generation_stays_serial(monkeypatch) -> None:
+    class _Recorder:
+        def __init__(self) -> None:
+            self.lines: list[str] = []
+
+        def log(self, turn: int, action: str, state_change: str) -> None:
+            self.lines.append(state_change)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("a logged generator must not use the process pool")
+
+    monkeypatch.setattr(world_generator, "_parallel_contents", _fail)
+    serial_logger, pooled_logger = _Recorder(), _Recorder()
+    serial = _generator(3, 6, serial_logger).generate()
+    pooled = _generator(3, 6, pooled_logger).generate(workers=4)
+    assert pooled == serial
+    assert pooled_logger.lines == serial_logger.lines
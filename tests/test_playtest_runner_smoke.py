@@ -8,8 +8,8 @@ sys.path.insert(0, str(SRC_ROOT))
 from playtest_runner import run_playtest  # noqa: E402
 
 
-def test_playtest_runner_writes_transcript_and_events() -> None:
-    summary = run_playtest(seed=12345, turns=5, bias="B", output_dir="tests/output")
+def test_playtest_runner_writes_transcript_and_events(tmp_path: Path) -> None:
+    summary = run_playtest(seed=12345, turns=5, bias="B", output_dir=str(tmp_path))
     transcript_path = Path(summary["transcript_path"])
     events_path = Path(summary["events_path"])
     assert transcript_path.exists()
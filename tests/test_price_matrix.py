@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+import market_pricing  # noqa: E402
+import price_matrix  # noqa: E402
+from crew_modifiers import CrewModifiers  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from government_law_engine import LegalityStatus, RiskTier  # noqa: E402
+from price_matrix import LEGALITY_STATES, RISK_TIERS, compute_price_matrix  # noqa: E402
+
+
+def _modifier(target_type: str, target_id: str | None, modifier_type: str, value: int) -> dict:
+    return {
+        "domain": "goods",
+        "target_type": target_type,
+        "target_id": target_id,
+        "modifier_type": modifier_type,
+        "modifier_value": value,
+        "source_type": "event",
+        "source_id": "E-TEST",
+    }
+
+
+def _engine() -> GameEngine:
+    engine = GameEngine(world_seed=12345, config={"system_count": 12, "sector_cache": False})
+    world_state_engine = engine._world_state_engine()
+    systems = engine.sector.systems
+    for index, system in enumerate(systems[:6]):
+        world_state_engine.register_system(system.system_id)
+        world_state_engine.active_modifiers_by_system[system.system_id] = [
+            _modifier("category", "FOOD", "demand_bias_percent", 15 - 10 * index),
+            _modifier("tag", "luxury", "price_bias_percent", 20 - 9 * index),
+            _modifier("ALL", None, "availability_delta", index % 3 - 1),
+        ]
+    world_state_engine.invalidate_modifier_cache()
+    return engine
+
+
+def _assert_matches_scalar(engine: GameEngine, action: str) -> int:
+    matrix = compute_price_matrix(engine, action)
+    tradeable = 0
+    for destination_id, system_id in zip(matrix.destination_ids, matrix.system_ids):
+        engine.player_state.current_system_id = system_id
+        engine.player_state.current_destination_id = destination_id
+        system = engine.sector.get_system(system_id)
+        destination = next(row for row in system.destinations if row.destination_id == destination_id)
+        government = engine.government_registry.get_government(system.government_id)
+        for sku in matrix.skus:
+            quote = engine._market_price_quote(destination=destination, government=government, sku=sku, action=action)
+            cell = matrix.index(destination_id, sku)
+            if quote is None:
+                assert matrix.price(destination_id, sku) is None, (destination_id, sku)
+                continue
+            tradeable += 1
+            assert matrix.price(destination_id, sku) == quote["unit_price"], (destination_id, sku)
+            assert LEGALITY_STATES[matrix.legality[cell]].value == quote["legality"]
+            assert RISK_TIERS[matrix.risk[cell]].value == quote["risk_tier"]
+    return tradeable
+
+
+@pytest.mark.parametrize("action", ["buy", "sell"])
+def test_price_matrix_matches_scalar_quotes(action: str) -> None:
+    engine = _engine()
+    assert _assert_matches_scalar(engine, action) > 500
+
+
+def test_price_matrix_applies_crew_multipliers(monkeypatch) -> None:
+    engine = _engine()
+    crew = CrewModifiers()
+    crew.buy_multiplier = 0.93
+    crew.sell_multiplier = 1.07
+    monkeypatch.setattr(market_pricing, "compute_crew_modifiers", lambda ship: crew)
+    monkeypatch.setattr(price_matrix, "compute_crew_modifiers", lambda ship: crew)
+    _assert_matches_scalar(engine, "buy")
+    _assert_matches_scalar(engine, "sell")
+
+
+def test_price_matrix_masks_and_lookups() -> None:
+    engine = _engine()
+    matrix = compute_price_matrix(engine, "buy")
+    rows, columns = matrix.shape
+    assert len(matrix.prices) == len(matrix.tradeable) == rows * columns
+
+    legal = matrix.legality_mask(LegalityStatus.LEGAL)
+    restricted = matrix.legality_mask("RESTRICTED")
+    illegal = matrix.legality_mask(LegalityStatus.ILLEGAL)
+    assert [a + b + c for a, b, c in zip(legal, restricted, illegal)] == list(matrix.tradeable)
+    assert sum(sum(matrix.risk_mask(tier)) for tier in RiskTier) == sum(matrix.tradeable)
+
+    destination_id = matrix.destination_ids[0]
+    row = matrix.row(destination_id)
+    assert row and all(matrix.price(destination_id, sku) == price for sku, price in row.items())
+    with pytest.raises(ValueError):
+        matrix.price("DST-NOPE", matrix.skus[0])
+    with pytest.raises(ValueError):
+        compute_price_matrix(engine, "steal")
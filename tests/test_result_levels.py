@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+
+
+COMMANDS = [
+    {"type": "get_player_profile"},
+    {"type": "wait", "days": 2},
+    {"type": "get_system_profile"},
+    {"type": "list_destination_actions"},
+]
+
+
+def test_levels_trim_result_and_defer_events() -> None:
+    full_engine = GameEngine(world_seed=12345)
+    minimal_engine = GameEngine(world_seed=12345, config={"result_level": "minimal"})
+    standard_engine = GameEngine(world_seed=12345, config={"result_level": "standard"})
+    for command in COMMANDS:
+        full = full_engine.execute(command)
+        minimal = minimal_engine.execute(command)
+        standard = standard_engine.execute(command)
+
+        assert set(minimal) == {
+            "ok", "error", "command_type", "turn_before", "turn_after", "hard_stop", "hard_stop_reason", "player",
+        }
+        assert set(standard) == set(full) - {"events"}
+        assert {key: full[key] for key in minimal} == minimal
+        assert {key: full[key] for key in standard} == standard
+        assert minimal_engine.last_events() == full["events"]
+        assert full_engine.last_events() == full["events"]
+
+
+def test_per_command_result_level_overrides_engine_default() -> None:
+    engine = GameEngine(world_seed=12345)
+    minimal = engine.execute({"type": "wait", "days": 1, "result_level": "minimal"})
+    assert minimal["ok"] is True
+    assert "events" not in minimal
+    assert engine.last_events()
+    assert "events" in engine.execute({"type": "wait", "days": 1})
+
+    invalid = engine.execute({"type": "wait", "days": 1, "result_level": "verbose"})
+    assert invalid["ok"] is False
+    assert invalid["error"] == "invalid_result_level:verbose"
+    assert invalid["turn_after"] == invalid["turn_before"]
+
+
+def test_invalid_engine_result_level_is_rejected() -> None:
+    with pytest.raises(ValueError, match="result_level"):
+        GameEngine(world_seed=12345, config={"result_level": "verbose"})
@@ -0,0 +1,222 @@
+import heapq
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from route_planner import RoutePlanner  # noqa: E402
+from world_generator import Destination, Galaxy, Location, System, WorldGenerator  # noqa: E402
+
+
+def _system(system_id: str, x: float, neighbors: list[str], *, datanet: bool = False) -> System:
+    destination_id = f"{system_id}-D1"
+    locations = [Location(f"{destination_id}-L1", destination_id, "datanet", True)] if datanet else []
+    destination = Destination(destination_id, system_id, "planet", "Test", 1, None, [], locations, None)
+    return System(
+        system_id=system_id,
+        name=system_id,
+        position=(0, 0),
+        population=1,
+        government_id="gov",
+        destinations=[destination],
+        attributes={},
+        neighbors=neighbors,
+        x=x,
+        y=0.0,
+    )
+
+
+def _line_galaxy() -> Galaxy:
+    # SYS-A -8ly- SYS-B -8ly- SYS-C -8ly- SYS-D, with datanet refuelling at B and C.
+    return Galaxy(
+        systems=[
+            _system("SYS-A", 0.0, ["SYS-B"]),
+            _system("SYS-B", 8.0, ["SYS-A", "SYS-C"], datanet=True),
+            _system("SYS-C", 16.0, ["SYS-B", "SYS-D"], datanet=True),
+            _system("SYS-D", 24.0, ["SYS-C"]),
+        ]
+    )
+
+
+def _generated_sector(system_count: int = 40):
+    bundle = get_data_bundle()
+    registry = GovernmentRegistry.from_payload(bundle.document("governments.json"))
+    return WorldGenerator(
+        seed=12345,
+        system_count=system_count,
+        government_ids=registry.government_ids(),
+        catalog=bundle.catalog,
+    ).generate()
+
+
+def _reference(planner: RoutePlanner, systems, origin: str, target: str, fuel: int, capacity: int, allow_refuel: bool):
+    """Plain Dijkstra over every (system, fuel) state, ordered by (days, refuel stops)."""
+    by_id = {system.system_id: system for system in systems}
+    best = {(origin, fuel): (0, 0)}
+    frontier = [(0, 0, origin, fuel)]
+    while frontier:
+        days, stops, system_id, on_board = heapq.heappop(frontier)
+        if best[(system_id, on_board)] != (days, stops):
+            continue
+        if system_id == target:
+            return days, stops
+        moves = []
+        if allow_refuel and planner.refuel_destination_id(system_id) is not None and on_board < capacity:
+            moves.append((days, stops + 1, system_id, capacity))
+        for neighbor_id in by_id[system_id].neighbors:
+            cost = max(1, math.ceil(planner.distance_ly(system_id, neighbor_id)))
+            if cost <= on_board:
+                moves.append((days + cost, stops, neighbor_id, on_board - cost))
+        for move in moves:
+            state = (move[2], move[3])
+            if state not in best or move[:2] < best[state]:
+                best[state] = move[:2]
+                heapq.heappush(frontier, move)
+    return None
+
+
+def _fuel_free_days(planner: RoutePlanner, systems, origin: str, capacity: int) -> dict[str, int]:
+    """Plain Dijkstra over hops that fit a ``capacity`` tank."""
+    by_id = {system.system_id: system for system in systems}
+    best = {origin: 0}
+    frontier = [(0, origin)]
+    while frontier:
+        days, system_id = heapq.heappop(frontier)
+        if best[system_id] != days:
+            continue
+        for neighbor_id in by_id[system_id].neighbors:
+            cost = max(1, math.ceil(planner.distance_ly(system_id, neighbor_id)))
+            if cost <= capacity and days + cost < best.get(neighbor_id, math.inf):
+                best[neighbor_id] = days + cost
+                heapq.heappush(frontier, (days + cost, neighbor_id))
+    return best
+
+
+def _assert_flyable(planner: RoutePlanner, plan, fuel: int, capacity: int) -> None:
+    on_board = fuel
+    for leg in plan.legs:
+        if leg.refuel_destination_id is not None:
+            assert planner.refuel_destination_id(leg.from_system_id) == leg.refuel_destination_id
+            assert leg.refuel_units == capacity - on_board
+            on_board = capacity
+        else:
+            assert leg.refuel_units == 0
+        assert leg.fuel_cost == leg.days == max(1, math.ceil(leg.distance_ly))
+        assert leg.distance_ly <= on_board
+        on_board -= leg.fuel_cost
+    assert on_board == plan.fuel_remaining
+    assert sum(leg.days for leg in plan.legs) == plan.total_days
+    assert plan.refuel_units == sum(leg.refuel_units for leg in plan.legs)
+
+
+def test_plan_refuels_at_datanet_destinations() -> None:
+    sector = _line_galaxy()
+    planner = RoutePlanner(sector.systems)
+    plan = planner.plan("SYS-A", "SYS-D", fuel=10, fuel_capacity=10)
+    assert plan is not None
+    assert [(leg.from_system_id, leg.to_system_id) for leg in plan.legs] == [
+        ("SYS-A", "SYS-B"),
+        ("SYS-B", "SYS-C"),
+        ("SYS-C", "SYS-D"),
+    ]
+    assert [leg.refuel_destination_id for leg in plan.legs] == [None, "SYS-B-D1", "SYS-C-D1"]
+    assert (plan.total_days, plan.total_fuel, plan.refuel_stops, plan.fuel_remaining) == (24, 24, 2, 2)
+    assert [leg.refuel_units for leg in plan.legs] == [0, 8, 8] and plan.refuel_units == 16
+    _assert_flyable(planner, plan, 10, 10)
+
+    assert planner.plan("SYS-A", "SYS-D", fuel=10, fuel_capacity=10, allow_refuel=False) is None
+    assert planner.plan("SYS-A", "SYS-D", fuel=5, fuel_capacity=7) is None
+    assert planner.min_days("SYS-D", "SYS-A", fuel_capacity=10) == 24
+    assert planner.min_days("SYS-D", "SYS-A", fuel_capacity=7) is None
+    assert planner.plan("SYS-B", "SYS-B", fuel=0, fuel_capacity=10).legs == ()
+    with pytest.raises(ValueError, match="Unknown system_id"):
+        planner.plan("SYS-A", "SYS-Z", fuel=10, fuel_capacity=10)
+
+
+def test_plans_match_state_space_dijkstra() -> None:
+    sector = _generated_sector()
+    planner = RoutePlanner(sector.systems)
+    ids = sorted(system.system_id for system in sector.systems)
+    checked = 0
+    for capacity in (18, 22, 30):
+        for allow_refuel in (True, False):
+            for origin in ids[::7]:
+                for target in ids[3::5]:
+                    fuel = capacity // 2 if allow_refuel else capacity
+                    plan = planner.plan(origin, target, fuel=fuel, fuel_capacity=capacity, allow_refuel=allow_refuel)
+                    expected = _reference(planner, sector.systems, origin, target, fuel, capacity, allow_refuel)
+                    if expected is None:
+                        assert plan is None
+                        continue
+                    assert (plan.total_days, plan.refuel_stops) == expected
+                    _assert_flyable(planner, plan, fuel, capacity)
+                    checked += 1
+    assert checked > 20
+
+
+def test_min_days_match_fuel_free_dijkstra() -> None:
+    sector = _generated_sector()
+    planner = RoutePlanner(sector.systems, landmark_count=4, fuel_capacities=(20,))
+    ids = sorted(system.system_id for system in sector.systems)
+    for capacity in (12, 20):
+        for origin in ids[::5]:
+            for target in ids[2::3]:
+                expected = _fuel_free_days(planner, sector.systems, origin, capacity).get(target)
+                assert planner.min_days(origin, target, fuel_capacity=capacity) == expected
+                assert planner.reachable(origin, target, fuel_capacity=capacity) is (expected is not None)
+
+
+def test_distances_from_match_engine_warp_distance() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 12})
+    origin = engine.sector.systems[0]
+    distances = engine.route_planner().distances_from(origin.system_id)
+    assert list(distances) == sorted(system.system_id for system in engine.sector.systems)
+    for system in engine.sector.systems:
+        assert distances[system.system_id] == engine._warp_distance_ly(origin=origin, target=system)
+    assert engine.route_planner() is engine.route_planner()
+    assert "_route_planner" not in GameEngine.from_snapshot(engine.snapshot()).__dict__
+
+
+def test_distance_rows_are_read_only_and_bounded() -> None:
+    planner = RoutePlanner(_line_galaxy().systems, distance_memo_size=2)
+    row = planner.distances_from("SYS-A")
+    with pytest.raises(TypeError):
+        row["SYS-B"] = 0.0  # type: ignore[index]
+    assert planner.distances_from("SYS-A") is row
+    planner.distances_from("SYS-B")
+    planner.distances_from("SYS-C")
+    assert planner.distances_from("SYS-A") is not row
+    assert planner.distances_from("SYS-A") == row
+
+
+def test_plan_route_command_reports_legs() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 12})
+    origin_id = engine.player_state.current_system_id
+    target_id = max(
+        engine.route_planner().distances_from(origin_id).items(),
+        key=lambda row: (row[1], row[0]),
+    )[0]
+    result = engine.execute({"type": "plan_route", "target_system_id": target_id})
+    assert result["ok"] is True
+    detail = next(event["detail"] for event in result["events"] if event["stage"] == "route_plan")
+    ship = engine._active_ship()
+    assert detail["origin_system_id"] == origin_id
+    assert detail["fuel_current"] == ship.current_fuel
+    expected = engine.route_planner().plan(
+        origin_id, target_id, fuel=ship.current_fuel, fuel_capacity=ship.fuel_capacity
+    )
+    assert detail["reachable"] is (expected is not None)
+    if expected is not None:
+        assert detail["total_days"] == expected.total_days
+        assert [leg["to_system_id"] for leg in detail["legs"]][-1] == target_id
+
+    missing = engine.execute({"type": "plan_route", "target_system_id": "SYS-MISSING"})
+    assert missing["ok"] is False
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+import sector_cache  # noqa: E402
+from data_bundle import get_data_bundle  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from sector_cache import load_or_generate_sector, sector_cache_key  # noqa: E402
+from world_generator import WorldGenerator  # noqa: E402
+
+
+def _government_ids() -> list[str]:
+    return GovernmentRegistry.from_payload(get_data_bundle().document("governments.json")).government_ids()
+
+
+def _load(tmp_path: Path, seed: int = 12345, system_count: int = 8):
+    return load_or_generate_sector(
+        seed=seed,
+        system_count=system_count,
+        government_ids=_government_ids(),
+        bundle=get_data_bundle(),
+        cache_dir=tmp_path,
+    )
+
+
+def test_cached_sector_matches_fresh_generation(tmp_path: Path) -> None:
+    cold = _load(tmp_path)
+    assert len(list(tmp_path.glob("sector-*.bin"))) == 1
+    warm = _load(tmp_path)
+    assert warm is not cold
+    assert warm == cold
+    fresh = WorldGenerator(
+        seed=12345,
+        system_count=8,
+        government_ids=_government_ids(),
+        catalog=get_data_bundle().catalog,
+    ).generate()
+    assert warm == fresh
+
+
+def test_cache_hit_does_not_run_generator(tmp_path: Path, monkeypatch) -> None:
+    expected = _load(tmp_path)
+
+    def _fail(self):
+        raise AssertionError("generator should not run on a cache hit")
+
+    monkeypatch.setattr(sector_cache.WorldGenerator, "generate", _fail)
+    assert _load(tmp_path) == expected
+
+
+def test_cache_key_covers_every_generation_input(monkeypatch) -> None:
+    base = {"seed": 1, "system_count": 5, "government_ids": ["a", "b"], "bundle_hash": "h"}
+    key = sector_cache_key(**base)
+    assert sector_cache_key(**base) == key
+    assert sector_cache_key(**{**base, "seed": 2}) != key
+    assert sector_cache_key(**{**base, "system_count": 6}) != key
+    assert sector_cache_key(**{**base, "government_ids": ["a"]}) != key
+    assert sector_cache_key(**{**base, "bundle_hash": "other"}) != key
+    monkeypatch.setattr(sector_cache, "WORLD_GENERATOR_VERSION", sector_cache.WORLD_GENERATOR_VERSION + 1)
+    assert sector_cache_key(**base) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(sector_cache, "_generator_fingerprint", lambda: "edited generator")
+    assert sector_cache_key(**base) != key
+
+
+def test_generator_sources_exist() -> None:
+    # A renamed module would silently drop out of the cache key.
+    for name in sector_cache.GENERATOR_SOURCES:
+        assert (SRC_ROOT / name).is_file(), name
+
+
+def test_corrupt_cache_entry_is_regenerated(tmp_path: Path) -> None:
+    expected = _load(tmp_path)
+    (entry,) = tmp_path.glob("sector-*.bin")
+    entry.write_bytes(entry.read_bytes()[:40])
+    assert _load(tmp_path) == expected
+    assert sector_cache.decode_sector(entry.read_bytes()) == expected
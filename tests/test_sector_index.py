@@ -0,0 +1,75 @@
+import pickle
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from world_generator import WorldGenerator  # noqa: E402
+from world_state_engine import _replace_system_in_sector  # noqa: E402
+
+
+def _sector(system_count: int = 6):
+    bundle = get_data_bundle()
+    registry = GovernmentRegistry.from_payload(bundle.document("governments.json"))
+    return WorldGenerator(
+        seed=12345,
+        system_count=system_count,
+        government_ids=registry.government_ids(),
+        catalog=bundle.catalog,
+    ).generate()
+
+
+def test_lookups_match_linear_scans() -> None:
+    sector = _sector()
+    for system in sector.systems:
+        assert sector.get_system(system.system_id) is system
+        for destination in system.destinations:
+            assert sector.get_destination(destination.destination_id) is destination
+            assert sector.system_for_destination(destination.destination_id) is system
+            for location in destination.locations:
+                assert sector.get_location(location.location_id) is location
+                assert sector.destination_for_location(location.location_id) is destination
+    assert sector.get_system("SYS-MISSING") is None
+    assert sector.get_destination("DST-MISSING") is None
+    assert sector.get_location("LOC-MISSING") is None
+    assert sector.system_for_destination("DST-MISSING") is None
+
+
+def test_replace_system_updates_index_incrementally() -> None:
+    sector = _sector()
+    original = sector.systems[1]
+    kept, dropped = original.destinations[0], original.destinations[-1]
+    assert kept is not dropped
+    updated = replace(original, population=original.population + 1, destinations=[kept])
+    _replace_system_in_sector(sector, updated)
+
+    assert sector.systems[1] is updated
+    assert sector.get_system(original.system_id) is updated
+    assert sector.system_for_destination(kept.destination_id) is updated
+    assert sector.get_destination(dropped.destination_id) is None
+    for location in dropped.locations:
+        assert sector.get_location(location.location_id) is None
+
+
+def test_direct_list_edits_are_picked_up() -> None:
+    sector = _sector()
+    moved = sector.systems.pop(0)
+    sector.systems.append(moved)
+    assert sector.get_system(moved.system_id) is moved
+    destination = moved.destinations[0]
+    assert sector.system_for_destination(destination.destination_id) is moved
+
+
+def test_index_is_not_pickled() -> None:
+    sector = _sector()
+    sector.get_system(sector.systems[0].system_id)
+    assert "_index" in sector.__dict__
+    restored = pickle.loads(pickle.dumps(sector))
+    assert "_index" not in restored.__dict__
+    assert restored == sector
+    assert restored.get_system(sector.systems[-1].system_id) is restored.systems[-1]
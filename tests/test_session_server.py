@@ -0,0 +1,173 @@
+import asyncio
+import base64
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+import engine_snapshot  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from session_server import SessionServer  # noqa: E402
+
+
+async def _with_server(scenario, **server_kwargs):
+    server = SessionServer(workers=2, **server_kwargs)
+    listener = await server.start_tcp("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def call(request, *, lines: int = 1):
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(lines)]
+        return responses[0] if lines == 1 else responses
+
+    try:
+        return await scenario(call, server)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+
+
+def test_session_lifecycle_and_streamed_steps() -> None:
+    async def scenario(call, server):
+        created = await call({"id": 1, "op": "create", "seed": 12345})
+        assert created["ok"] is True and created["id"] == 1
+        session_id = created["session_id"]
+
+        step = await call({"id": 2, "op": "step", "session_id": session_id, "command": {"type": "wait", "days": 1}})
+        assert step["ok"] is True
+        assert step["result"]["turn_after"] == 1
+
+        streamed = await call(
+            {
+                "id": 3,
+                "op": "step",
+                "session_id": session_id,
+                "commands": [{"type": "wait", "days": 1}, {"type": "get_player_profile", "result_level": "minimal"}],
+            },
+            lines=2,
+        )
+        assert [row["index"] for row in streamed] == [0, 1]
+        assert [row["final"] for row in streamed] == [False, True]
+        assert all(row["id"] == 3 for row in streamed)
+        assert "events" not in streamed[1]["result"]
+
+        snapshot = await call({"id": 4, "op": "snapshot", "session_id": session_id})
+        restored = await call({"id": 5, "op": "create", "snapshot": snapshot["snapshot"]})
+        assert restored["ok"] is True
+        clone_step = await call(
+            {"id": 6, "op": "step", "session_id": restored["session_id"], "command": {"type": "wait", "days": 1}}
+        )
+        assert clone_step["result"]["turn_before"] == 2
+
+        listing = await call({"id": 7, "op": "list"})
+        assert listing["session_ids"] == sorted([session_id, restored["session_id"]])
+        destroyed = await call({"id": 8, "op": "destroy", "session_id": session_id})
+        assert destroyed["destroyed"] is True
+        assert server.session_count == 1
+
+    asyncio.run(_with_server(scenario))
+
+
+def test_request_errors_do_not_close_connection() -> None:
+    async def scenario(call, server):
+        assert (await call({"id": 1, "op": "bogus"}))["error"] == "unknown_op:bogus"
+        missing = await call({"id": 2, "op": "step", "session_id": "S999999", "command": {"type": "wait"}})
+        assert missing == {"id": 2, "ok": False, "error": "unknown_session"}
+        assert (await call({"id": 3, "op": "create", "seed": "x"}))["ok"] is False
+        assert (await call({"id": 4, "op": "create", "snapshot": "not base64!"}))["ok"] is False
+        assert (await call({"id": 5, "op": "create", "seed": 1}))["ok"] is True
+        assert (await call({"id": 6, "op": "create", "seed": 2}))["error"] == "session_limit_reached"
+        assert (await call({"id": 7, "op": "ping"}))["pong"] is True
+
+    asyncio.run(_with_server(scenario, max_sessions=1))
+
+
+def test_bad_config_values_get_an_error_reply() -> None:
+    async def scenario(call, server):
+        for request_id, system_count in enumerate((None, "five", 2.5, True), start=1):
+            reply = await call({"id": request_id, "op": "create", "seed": 1, "config": {"system_count": system_count}})
+            assert reply == {"id": request_id, "ok": False, "error": "config.system_count must be an integer."}
+        assert (await call({"id": 5, "op": "create", "seed": 1, "config": {"lazy_sector": 1}}))["ok"] is False
+        assert server.session_count == 0
+        assert (await call({"id": 6, "op": "ping"}))["pong"] is True
+
+    asyncio.run(_with_server(scenario))
+
+
+def test_unexpected_errors_still_get_a_reply(monkeypatch) -> None:
+    def broken_engine(*args, **kwargs):
+        raise TypeError("boom")
+
+    monkeypatch.setattr("session_server.GameEngine", broken_engine)
+
+    async def scenario(call, server):
+        reply = await call({"id": 1, "op": "create", "seed": 1})
+        assert reply == {"id": 1, "ok": False, "error": "internal_error:TypeError"}
+        assert (await call({"id": 2, "op": "ping"}))["pong"] is True
+
+    asyncio.run(_with_server(scenario))
+
+
+def test_invalid_json_line_is_reported() -> None:
+    async def scenario(call, server):
+        server_reply = []
+
+        async def send(payload):
+            server_reply.append(payload)
+
+        await server.handle_line(b"{not json\n", send)
+        assert server_reply == [{"id": None, "ok": False, "error": "invalid_json"}]
+
+    asyncio.run(_with_server(scenario))
+
+
+def test_create_refuses_snapshots_this_server_did_not_sign(monkeypatch) -> None:
+    async def scenario(call, server):
+        created = await call({"id": 1, "op": "create", "seed": 12345})
+        signed = (await call({"id": 2, "op": "snapshot", "session_id": created["session_id"]}))["snapshot"]
+        raw = base64.b64decode(signed)
+        tampered = raw[:-1] + bytes([raw[-1] ^ 1])
+        other = SessionServer(workers=1)
+        try:
+            foreign = other._snapshot_tag(raw[32:]) + raw[32:]
+        finally:
+            await other.close()
+        unsigned = GameEngine(world_seed=12345).snapshot()
+
+        unpickled = []
+        real_loads = engine_snapshot.pickle.loads
+        monkeypatch.setattr(engine_snapshot.pickle, "loads", lambda data: unpickled.append(1) or real_loads(data))
+        for index, blob in enumerate((unsigned, tampered, foreign, raw[:10])):
+            refused = await call({"id": 10 + index, "op": "create", "snapshot": base64.b64encode(blob).decode("ascii")})
+            assert refused["error"] == "snapshot_signature_invalid"
+        assert unpickled == []
+        assert server.session_count == 1
+
+        restored = await call({"id": 20, "op": "create", "snapshot": signed})
+        assert restored["ok"] is True and unpickled == [1]
+
+    asyncio.run(_with_server(scenario))
+
+
+def test_snapshots_verify_across_servers_sharing_a_key() -> None:
+    key = b"k" * 32
+    first = SessionServer(workers=1, snapshot_key=key)
+    second = SessionServer(workers=1, snapshot_key=key)
+    blob = b"engine-bytes"
+    try:
+        assert second._verified_snapshot(first._snapshot_tag(blob) + blob) == blob
+    finally:
+        asyncio.run(first.close())
+        asyncio.run(second.close())
+    try:
+        SessionServer(workers=1, snapshot_key=b"short")
+    except ValueError as exc:
+        assert "snapshot_key" in str(exc)
+    else:
+        raise AssertionError("expected ValueError")
@@ -0,0 +1,146 @@
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from event_bus import INFO, EventBus, RingBufferSink  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from mission_entity import MissionEntity, MissionState  # noqa: E402
+from time_engine import TimeContext, TimeEngineEvent, skip_time  # noqa: E402
+
+
+def _engine(scope: str, frequency: int, events: str = "off") -> GameEngine:
+    config = {
+        "system_count": 8,
+        "sector_cache": False,
+        "event_frequency_percent": frequency,
+        "world_state_events": events,
+        "world_state_scope": scope,
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = GameEngine(world_seed=12345, config=config)
+    engine.player_state.credits = 900
+    engine.player_state.insurance_policies.append({"premium_per_turn": 3})
+    # Undeliverable missions, so only their deadlines (or the lack of one) decide how they end.
+    for index, days_remaining in enumerate((5, 40, 41, None)):
+        mission = MissionEntity(
+            mission_id=f"MIS-{index}",
+            mission_type="delivery",
+            mission_tier=1,
+            mission_state=MissionState.ACTIVE,
+            system_id="SYS-001",
+            target={"target_type": "destination", "target_id": "LOC-NONE", "system_id": "SYS-001"},
+            source={"source_type": "bar", "source_id": "LOC-BAR"},
+            origin={"system_id": "SYS-001", "destination_id": "LOC-BAR"},
+            distance_ly=0,
+            reward_profile_id="mission_delivery",
+            objectives=[
+                {
+                    "objective_id": "OBJ-1",
+                    "objective_type": "deliver_cargo",
+                    "status": "pending",
+                    "parameters": {"goods": [{"good_id": "GOOD-001", "quantity": 1}]},
+                }
+            ],
+        )
+        mission.persistent_state["days_remaining"] = days_remaining
+        engine._mission_manager.missions[mission.mission_id] = mission
+        engine.player_state.active_missions.append(mission.mission_id)
+    return engine
+
+
+def _state(engine: GameEngine):
+    world_state = engine.time_context.world_state_engine
+    missions = {
+        mission_id: (mission.mission_state, mission.outcome, dict(mission.persistent_state))
+        for mission_id, mission in engine._mission_manager.missions.items()
+    }
+    return (
+        engine.time_context.current_turn,
+        engine.player_state.credits,
+        engine.player_state.bankruptcy_warning_turn,
+        list(engine.player_state.active_missions),
+        missions,
+        world_state.active_situations,
+        world_state.active_events,
+        world_state.cooldown_until_day_by_system,
+        world_state.scheduled_events,
+        world_state.scheduled_situations,
+        world_state.pending_structural_mutations,
+        [(system.system_id, system.population, system.government_id) for system in engine.sector.systems],
+    )
+
+
+@pytest.mark.parametrize("scope,frequency,days", [("local", 8, 600), ("local", 60, 300), ("galaxy", 60, 200)])
+def test_skip_time_matches_one_day_waits(scope: str, frequency: int, days: int) -> None:
+    stepped = _engine(scope, frequency)
+    for _ in range(days):
+        assert stepped.execute({"type": "wait", "days": 1})["ok"]
+    skipped = _engine(scope, frequency)
+    result = skipped.execute({"type": "skip_time", "days": days})
+
+    assert result["ok"] and result["turn_after"] == days
+    assert _state(skipped) == _state(stepped)
+    # Premiums came out every day and the deadline missions expired along the way.
+    assert skipped.player_state.credits == max(0, 900 - 3 * days)
+    assert skipped.player_state.bankruptcy_warning_turn == (300 if days >= 300 else None)
+    assert skipped.player_state.active_missions == ["MIS-3"]
+
+
+def test_skip_time_validation() -> None:
+    engine = _engine("local", 8)
+    for days in (0, -3, 2.5, "10", 10**9):
+        result = engine.execute({"type": "skip_time", "days": days})
+        assert not result["ok"]
+    assert engine.time_context.current_turn == 0
+
+    context = TimeContext()
+    context.player_action_context = True
+    with pytest.raises(ValueError):
+        skip_time(0, "test", context)
+    context.player_action_context = False
+    with pytest.raises(RuntimeError):
+        skip_time(5, "test", context)
+
+
+def test_skip_time_summarizes_coalesced_days_for_info_subscribers() -> None:
+    context = TimeContext(event_bus=EventBus())
+    context.player_action_context = True
+    sink = RingBufferSink()
+    context.event_bus.subscribe(sink, level=INFO)
+    result = skip_time(25, "test", context)
+
+    assert result.days_completed == 25 and context.current_turn == 25
+    actions = [
+        (event.action, dict(event.values)) for event in sink.events() if isinstance(event, TimeEngineEvent)
+    ]
+    assert [action for action, _ in actions] == [
+        "time_skip_requested",
+        "time_advance_day_completed",
+        "time_skip_days_coalesced",
+    ]
+    assert actions[-1][1] == {"start_turn": 1, "days": 24, "turn": 25}
+
+
+def test_skip_time_coalesces_under_the_default_stdout_events() -> None:
+    days = 600
+    stepped = _engine("local", 8)
+    for _ in range(days):
+        assert stepped.execute({"type": "wait", "days": 1})["ok"]
+    skipped = _engine("local", 8, events="stdout")
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = skipped.execute({"type": "skip_time", "days": days})
+
+    assert result["ok"] and result["turn_after"] == days
+    assert _state(skipped) == _state(stepped)
+    lines = output.getvalue().splitlines()
+    completed = sum("action=time_advance_day_completed" in line for line in lines)
+    assert any("action=time_skip_days_coalesced" in line for line in lines)
+    assert completed < days // 4
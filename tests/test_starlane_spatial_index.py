@@ -0,0 +1,113 @@
+import math
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from spatial_index import PointGrid  # noqa: E402
+from world_generator import System, WorldGenerator  # noqa: E402
+
+
+def _systems(coords, first_index: int = 1) -> list[System]:
+    return [
+        System(
+            system_id=f"SYS-{first_index + index:03d}",
+            name="Test",
+            position=(index, 0),
+            population=1,
+            government_id="gov",
+            destinations=[],
+            attributes={},
+            neighbors=[],
+            x=float(x),
+            y=float(y),
+        )
+        for index, (x, y) in enumerate(coords)
+    ]
+
+
+def _generator(seed: int = 12345, system_count: int = 1) -> WorldGenerator:
+    return WorldGenerator(
+        seed=seed,
+        system_count=system_count,
+        government_ids=["gov"],
+        catalog=get_data_bundle().catalog,
+    )
+
+
+def _all_pairs_neighbors(systems: list[System]) -> dict[str, list[str]]:
+    """Reference: the original all-pairs Kruskal MST plus k=2 nearest extra edges."""
+    by_id = {system.system_id: system for system in systems}
+    ids = sorted(by_id)
+
+    def distance(a_id: str, b_id: str) -> float:
+        dx = by_id[b_id].x - by_id[a_id].x
+        dy = by_id[b_id].y - by_id[a_id].y
+        return math.sqrt(dx * dx + dy * dy)
+
+    edges = sorted((distance(a, b), a, b) for i, a in enumerate(ids) for b in ids[i + 1 :])
+    parent = {sid: sid for sid in ids}
+
+    def find(x: str) -> str:
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    neighbors = {sid: set() for sid in ids}
+    for _, a, b in edges:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+            neighbors[a].add(b)
+            neighbors[b].add(a)
+    for a in ids:
+        candidates = sorted((distance(a, b), b) for b in ids if b != a and b not in neighbors[a])
+        for _, b in candidates[:2]:
+            neighbors[a].add(b)
+            neighbors[b].add(a)
+    return {sid: sorted(values) for sid, values in neighbors.items()}
+
+
+def _assert_matches_reference(systems: list[System]) -> None:
+    built = _generator()._build_starlane_graph(systems)
+    assert {system.system_id: system.neighbors for system in built} == _all_pairs_neighbors(systems)
+
+
+def test_generated_coordinates_match_all_pairs_reference() -> None:
+    for seed, system_count in ((12345, 5), (7, 40), (2024, 250)):
+        generator = _generator(seed, system_count)
+        systems = generator._assign_spatial_coordinates(_systems([(0, 0)] * system_count))
+        _assert_matches_reference(systems)
+
+
+def test_distance_ties_break_by_id_like_reference() -> None:
+    lattice = [(index % 12, index // 12) for index in range(144)]
+    _assert_matches_reference(_systems(lattice))
+    # Ids cross SYS-999 -> SYS-1000, where string order differs from numeric order.
+    _assert_matches_reference(_systems(lattice[:60], first_index=970))
+    _assert_matches_reference(_systems([(index, 0) for index in range(50)]))
+
+
+def test_clustered_and_outlier_layouts_match_reference() -> None:
+    rng = random.Random(3)
+    clusters = [(rng.choice([0, 100, 1000]) + rng.random(), rng.random()) for _ in range(150)]
+    _assert_matches_reference(_systems(clusters))
+    heavy_tail = [(rng.gauss(0, 1) ** 3, rng.gauss(0, 1) ** 3) for _ in range(150)]
+    _assert_matches_reference(_systems(heavy_tail))
+
+
+def test_point_grid_nearest_orders_by_distance_then_id() -> None:
+    rng = random.Random(11)
+    points = {f"P{index:03d}": (float(rng.randint(0, 9)), float(rng.randint(0, 9))) for index in range(80)}
+    grid = PointGrid(points)
+    for point_id, (x, y) in points.items():
+        expected = sorted(
+            (math.sqrt((ox - x) * (ox - x) + (oy - y) * (oy - y)), other_id)
+            for other_id, (ox, oy) in points.items()
+            if other_id != point_id
+        )
+        assert list(grid.nearest(point_id)) == expected
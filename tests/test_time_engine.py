@@ -8,6 +8,15 @@ SRC_ROOT = PROJECT_ROOT / "src"
 sys.path.insert(0, str(SRC_ROOT))
 
 import time_engine as te
+from data_catalog import load_data_catalog
+from economy_engine import ECONOMY_TICK, EconomyEngine, TradeAction
+from event_bus import EventBus
+from government_law_engine import GovernmentLawEngine
+from government_registry import GovernmentRegistry
+from player_state import PlayerState
+from tick_scheduler import CADENCE_ON_DEMAND, CADENCE_WEEKLY, TickScheduler
+from turn_loop import MoveAction, TurnLoop
+from world_generator import Sector, System
 
 _DEFAULT_GALAXY_TICK = te.galaxy_tick
 _DEFAULT_SYSTEM_TICK = te.system_tick
@@ -183,11 +192,12 @@ class _StubWorldStateEngine:
 
 def test_advance_day_invokes_spawn_gate_once() -> None:
     stub = _StubWorldStateEngine()
-    te._world_state_engine = stub
-    te._world_state_seed = 42
-    te._world_state_sector = _StubSector({"SYS-1": ["SYS-2"], "SYS-2": ["SYS-1"]})
-    te._world_state_player = _StubPlayer("SYS-1")
-    te._world_state_event_frequency_percent = 8
+    context = te.default_time_context()
+    context.world_state_engine = stub
+    context.world_state_seed = 42
+    context.world_state_sector = _StubSector({"SYS-1": ["SYS-2"], "SYS-2": ["SYS-1"]})
+    context.world_state_player = _StubPlayer("SYS-1")
+    context.world_state_event_frequency_percent = 8
 
     te._set_player_action_context(True)
     try:
@@ -200,11 +210,12 @@ def test_advance_day_invokes_spawn_gate_once() -> None:
 
 def test_scheduled_events_execute_when_due_in_daily_advance() -> None:
     stub = _StubWorldStateEngine()
-    te._world_state_engine = stub
-    te._world_state_seed = 7
-    te._world_state_sector = _StubSector({"SYS-1": ["SYS-2"], "SYS-2": ["SYS-1"]})
-    te._world_state_player = _StubPlayer("SYS-1")
-    te._world_state_event_frequency_percent = 8
+    context = te.default_time_context()
+    context.world_state_engine = stub
+    context.world_state_seed = 7
+    context.world_state_sector = _StubSector({"SYS-1": ["SYS-2"], "SYS-2": ["SYS-1"]})
+    context.world_state_player = _StubPlayer("SYS-1")
+    context.world_state_event_frequency_percent = 8
 
     te._set_player_action_context(True)
     try:
@@ -218,11 +229,12 @@ def test_scheduled_events_execute_when_due_in_daily_advance() -> None:
 
 def test_expired_events_removed_after_duration_in_daily_lifecycle() -> None:
     stub = _StubWorldStateEngine()
-    te._world_state_engine = stub
-    te._world_state_seed = 9
-    te._world_state_sector = _StubSector({"SYS-1": []})
-    te._world_state_player = _StubPlayer("SYS-1")
-    te._world_state_event_frequency_percent = 8
+    context = te.default_time_context()
+    context.world_state_engine = stub
+    context.world_state_seed = 9
+    context.world_state_sector = _StubSector({"SYS-1": []})
+    context.world_state_player = _StubPlayer("SYS-1")
+    context.world_state_event_frequency_percent = 8
 
     te._set_player_action_context(True)
     try:
@@ -231,4 +243,196 @@ def test_expired_events_removed_after_duration_in_daily_lifecycle() -> None:
         te._set_player_action_context(False)
 
     assert stub.expired_removed is True
-    assert stub.order == ["scheduled", "spawn", "propagation", "decrement", "resolve"]
\ No newline at end of file
+    assert stub.order == ["scheduled", "spawn", "propagation", "decrement", "resolve"]
+
+def test_time_contexts_are_isolated() -> None:
+    first = te.TimeContext()
+    second = te.TimeContext()
+    te._set_player_action_context(True, first)
+    try:
+        te.advance_time(3, "test", context=first)
+    finally:
+        te._set_player_action_context(False, first)
+    te._set_hard_stop_state(player_dead=True, context=second)
+
+    assert te.get_current_turn(first) == 3
+    assert te.get_current_turn(second) == 0
+    assert te.get_current_turn() == 0
+    assert te._check_hard_stop(first) is None
+    assert te._check_hard_stop(second) == "player_death"
+    assert te._check_hard_stop() is None
+
+
+class _Recorder:
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+        self.busy = True
+
+    def run(self, day: int, context) -> None:
+        self.calls.append(f"{self.name}:{day}")
+
+    def has_work(self, context) -> bool:
+        return self.busy
+
+
+def test_tick_scheduler_runs_by_cadence_and_priority() -> None:
+    calls: list[str] = []
+    engine = te.TimeEngine(context=te.TimeContext(event_bus=EventBus()))
+    daily, weekly, on_demand = (_Recorder(name, calls) for name in ("daily", "weekly", "on_demand"))
+    engine.register_tick("weekly", weekly.run, cadence=CADENCE_WEEKLY, priority=-1)
+    engine.register_tick("daily", daily.run, priority=-2, has_work=daily.has_work)
+    engine.register_tick("on_demand", on_demand.run, cadence=CADENCE_ON_DEMAND, priority=-3)
+
+    context = engine.context
+    te._set_player_action_context(True, context)
+    try:
+        te.advance_time(6, "test", context)
+        context.tick_scheduler.request("on_demand")
+        daily.busy = False
+        te.advance_time(2, "test", context)
+    finally:
+        te._set_player_action_context(False, context)
+
+    assert calls == [f"daily:{day}" for day in range(1, 7)] + ["on_demand:7", "weekly:7"]
+    timings = {timing.name: timing for timing in engine.tick_timings()}
+    assert [timing.name for timing in engine.tick_timings()][:3] == ["on_demand", "daily", "weekly"]
+    assert (timings["daily"].calls, timings["daily"].skips) == (6, 2)
+    assert (timings["weekly"].calls, timings["on_demand"].calls) == (1, 1)
+    # Nobody listens to the stock stage ticks, so they are skipped rather than called.
+    assert (timings["galaxy_tick"].calls, timings["galaxy_tick"].skips) == (0, 8)
+    last_day = engine.last_day_timings()
+    assert last_day is not None and last_day.day == 8 and [name for name, _ in last_day.handlers] == []
+    assert all(timing.seconds >= 0.0 for timing in engine.tick_timings())
+
+    with pytest.raises(ValueError):
+        engine.register_tick("monthly", daily.run, cadence="monthly")
+    with pytest.raises(ValueError):
+        engine.context.tick_scheduler.request("missing")
+    scheduler = TickScheduler()
+    scheduler.register("weekly", weekly.run, cadence=CADENCE_WEEKLY)
+    assert scheduler.next_due_day(8, 20) == 14
+    assert scheduler.next_due_day(7, 20) == 7
+    scheduler.unregister("weekly")
+    assert "weekly" not in scheduler and scheduler.next_due_day(8, 20) == 21
+
+
+def test_hard_stop_from_a_late_tick_keeps_the_day() -> None:
+    lifecycle_days: list[tuple[int, int]] = []
+    context = te.TimeContext(event_bus=EventBus())
+    engine = te.TimeEngine(context=context)
+
+    def world_state(day: int, ctx) -> None:
+        lifecycle_days.append((day, ctx.current_turn))
+
+    def late(day: int, ctx) -> None:
+        if day == 2:
+            te._set_hard_stop_state(player_dead=True, context=ctx)
+
+    engine.register_tick(te.WORLD_STATE_TICK, world_state, priority=te.WORLD_STATE_TICK_PRIORITY)
+    engine.register_tick("late", late, priority=200)
+
+    te._set_player_action_context(True, context)
+    try:
+        first = te.advance_time(3, "test", context)
+        te._set_hard_stop_state(context=context)
+        second = te.advance_time(2, "test", context)
+    finally:
+        te._set_player_action_context(False, context)
+
+    assert (first.days_completed, first.current_turn, first.hard_stop_reason) == (2, 2, "player_death")
+    assert (second.days_completed, second.current_turn) == (2, 4)
+    # Each day's lifecycle runs once, after the turn is committed.
+    assert lifecycle_days == [(1, 1), (2, 2), (3, 3), (4, 4)]
+
+
+def test_economy_advances_as_a_daily_tick() -> None:
+    systems = [
+        System(
+            system_id=system_id,
+            name=system_id,
+            position=(index, 0),
+            population=3,
+            government_id="anarchic",
+            destinations=[],
+            attributes={"profile_id": "AGRICULTURAL"},
+            neighbors=[],
+        )
+        for index, system_id in enumerate(("SYS-A", "SYS-B"))
+    ]
+    sector = Sector(systems=systems)
+    logger = _CollectLogger()
+    ticked = EconomyEngine(sector=sector, logger=logger)
+    stepped = EconomyEngine(sector=sector, logger=_CollectLogger())
+    engine = te.TimeEngine(context=te.TimeContext(event_bus=EventBus()))
+    engine.register_tick(ECONOMY_TICK, ticked.run_tick, priority=200)
+
+    trade = TradeAction(system_id="SYS-A", category_id="FOOD", delta=-1, cause="player_buy")
+    ticked.queue_trade(trade)
+    for turn in range(1, 6):
+        engine.advance()
+        stepped.advance_turn(turn=turn, trade_action=trade if turn == 1 else None)
+
+    assert ticked.all_prices() == stepped.all_prices()
+    for system in systems:
+        assert ticked.pressure(system.system_id, "FOOD") == stepped.pressure(system.system_id, "FOOD")
+    assert {entry[0] for entry in logger.entries} <= set(range(1, 6))
+    assert [timing.calls for timing in engine.tick_timings() if timing.name == ECONOMY_TICK] == [5]
+
+
+def test_turn_loops_on_context_less_engines_keep_their_economy_ticks() -> None:
+    systems = [
+        System(
+            system_id=system_id,
+            name=system_id,
+            position=(index, 0),
+            population=3,
+            government_id="anarchic",
+            destinations=[],
+            attributes={"government_id": "anarchic", "profile_id": "AGRICULTURAL"},
+            neighbors=[],
+        )
+        for index, system_id in enumerate(("SYS-A", "SYS-B"))
+    ]
+    sector = Sector(systems=systems)
+    registry = GovernmentRegistry.from_file(PROJECT_ROOT / "data" / "governments.json")
+    catalog = load_data_catalog()
+
+    def build() -> tuple[te.TimeEngine, TurnLoop]:
+        engine = te.TimeEngine()
+        loop = TurnLoop(
+            time_engine=engine,
+            sector=sector,
+            player_state=PlayerState(current_system_id="SYS-A"),
+            logger=_CollectLogger(),
+            economy_engine=EconomyEngine(sector=sector, logger=_CollectLogger()),
+            law_engine=GovernmentLawEngine(registry=registry, logger=_CollectLogger(), seed=1),
+            catalog=catalog,
+            government_registry=registry,
+            world_seed=1,
+        )
+        return engine, loop
+
+    first_engine, first = build()
+    second_engine, second = build()
+    for _ in range(3):
+        first.execute_move(MoveAction(target_system_id="SYS-B"))
+    second.execute_move(MoveAction(target_system_id="SYS-B"))
+
+    def economy_calls(engine: te.TimeEngine) -> list[int]:
+        return [timing.calls for timing in engine.tick_timings() if timing.name == ECONOMY_TICK]
+
+    assert (first_engine.current_turn, economy_calls(first_engine)) == (3, [3])
+    assert (second_engine.current_turn, economy_calls(second_engine)) == (1, [1])
+    default = te.default_time_context()
+    assert ECONOMY_TICK not in default.tick_scheduler and default.current_turn == 0
+    assert first_engine.own_context() is first_engine.context
+
+
+class _CollectLogger:
+    def __init__(self) -> None:
+        self.entries: list[tuple[int, str, str]] = []
+
+    def log(self, turn: int, action: str, state_change: str) -> None:
+        self.entries.append((turn, action, state_change))
+
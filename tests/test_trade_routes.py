@@ -0,0 +1,158 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+from government_law_engine import RiskTier  # noqa: E402
+from interaction_resolvers import FUEL_PRICE_PER_UNIT  # noqa: E402
+from price_matrix import compute_price_matrix  # noqa: E402
+from route_planner import RoutePlanner  # noqa: E402
+from trade_routes import TradeRouteFinder  # noqa: E402
+from world_generator import Destination, Location, System  # noqa: E402
+
+
+def _system(system_id: str, x: float, neighbors: list[str], *, datanet: bool = False) -> System:
+    destination_id = f"{system_id}-D1"
+    locations = [Location(f"{destination_id}-L1", destination_id, "datanet", True)] if datanet else []
+    destination = Destination(destination_id, system_id, "planet", "Test", 1, None, [], locations, None)
+    return System(
+        system_id=system_id,
+        name=system_id,
+        position=(0, 0),
+        population=1,
+        government_id="gov",
+        destinations=[destination],
+        attributes={},
+        neighbors=neighbors,
+        x=x,
+        y=0.0,
+    )
+
+
+def _finder(observations: dict, *, illegal: set[tuple[str, str, str]] = frozenset()) -> TradeRouteFinder:
+    # SYS-A -8ly- SYS-B (datanet), and SYS-E with no lanes at all.
+    systems = [
+        _system("SYS-A", 0.0, ["SYS-B"]),
+        _system("SYS-B", 8.0, ["SYS-A"], datanet=True),
+        _system("SYS-E", 50.0, []),
+    ]
+    return TradeRouteFinder(
+        observations,
+        system_of=lambda destination_id: destination_id.rsplit("-", 1)[0],
+        planner=RoutePlanner(systems),
+        policy=lambda destination_id, sku, action: (
+            ("ILLEGAL", "High") if (destination_id, sku, action) in illegal else ("LEGAL", "None")
+        ),
+        allowed=lambda legality, risk_tier: legality != "ILLEGAL",
+        risk_order=[tier.value for tier in RiskTier],
+    )
+
+
+OBSERVATIONS = {
+    "SYS-A-D1": {"ore": {"buy": 10}, "food": {"sell": 60}},
+    "SYS-B-D1": {"ore": {"sell": 30}, "food": {"buy": 20}},
+    # Pays far more, but nothing can fly there.
+    "SYS-E-D1": {"ore": {"sell": 1000}, "food": {"sell": 1000}},
+}
+
+
+def test_finder_prefers_profitable_loop() -> None:
+    routes = _finder(OBSERVATIONS).find(
+        origin_destination_id="SYS-A-D1", fuel=10, fuel_capacity=10, credits=1000, cargo_space=5
+    )
+    best = routes[0]
+    assert best.loop is True
+    assert [(leg.buy_destination_id, leg.sell_destination_id, leg.sku_id) for leg in best.legs] == [
+        ("SYS-A-D1", "SYS-B-D1", "ore"),
+        ("SYS-B-D1", "SYS-A-D1", "food"),
+    ]
+    # The way back only works after topping up at SYS-B's datanet: 8 units bought, paid out of that leg.
+    assert [(leg.refuel_stops, leg.refuel_cost) for leg in best.legs] == [(0, 0), (1, 8 * FUEL_PRICE_PER_UNIT)]
+    assert [leg.profit for leg in best.legs] == [100, 200 - 8 * FUEL_PRICE_PER_UNIT]
+    assert (best.total_profit, best.total_days, best.positioning_days) == (260, 16, 0)
+    assert best.credits_after == 1260
+    assert [route.profit_per_day for route in routes] == sorted((route.profit_per_day for route in routes), reverse=True)
+    assert all(leg.sell_destination_id != "SYS-E-D1" for route in routes for leg in route.legs)
+
+    # Without a cargo limit credits size the purchase, less the fuel that leg will need.
+    unlimited = _finder(OBSERVATIONS).find(
+        origin_destination_id="SYS-A-D1", fuel=10, fuel_capacity=10, credits=100, cargo_space=None
+    )[0]
+    assert [leg.quantity for leg in unlimited.legs] == [10, (300 - 40) // 20]
+    assert (unlimited.total_profit, unlimited.credits_after) == (680, 780)
+
+    stranded = _finder(OBSERVATIONS).find(
+        origin_destination_id="SYS-A-D1", fuel=10, fuel_capacity=10, credits=1000, cargo_space=5, allow_refuel=False
+    )
+    assert all(len(route.legs) == 1 for route in stranded)
+
+
+def test_finder_pays_for_fuel_bought_while_positioning() -> None:
+    observations = {"SYS-A-D1": {"ore": {"buy": 10}}, "SYS-A-D2": {"ore": {"sell": 30}}}
+    routes = _finder(observations).find(
+        origin_destination_id="SYS-B-D1", fuel=2, fuel_capacity=10, credits=1000, cargo_space=5
+    )
+    assert len(routes) == 1
+    route = routes[0]
+    assert (route.positioning_days, route.positioning_refuel_stops, route.positioning_refuel_cost) == (8, 1, 40)
+    assert [(leg.sell_destination_id, leg.profit, leg.travel_days) for leg in route.legs] == [("SYS-A-D2", 100, 1)]
+    assert (route.total_profit, route.total_days, route.credits_after) == (60, 9, 1060)
+    # The fuel is paid before anything is bought, and a plan must be able to pay for it.
+    for credits in (30, 45):
+        assert _finder(observations).find(
+            origin_destination_id="SYS-B-D1", fuel=2, fuel_capacity=10, credits=credits, cargo_space=5
+        ) == []
+
+
+def test_finder_skips_disallowed_trades() -> None:
+    routes = _finder(OBSERVATIONS, illegal={("SYS-B-D1", "food", "buy")}).find(
+        origin_destination_id="SYS-A-D1", fuel=10, fuel_capacity=10, credits=1000, cargo_space=5
+    )
+    assert [[leg.sku_id for leg in route.legs] for route in routes] == [["ore"]]
+    assert routes[0].legs[0].legality == "LEGAL"
+    # Without credits for a single unit nothing is planned.
+    assert _finder(OBSERVATIONS).find(
+        origin_destination_id="SYS-A-D1", fuel=10, fuel_capacity=10, credits=5, cargo_space=5
+    ) == []
+
+
+def _observations(engine: GameEngine) -> dict:
+    buy = compute_price_matrix(engine, "buy")
+    sell = compute_price_matrix(engine, "sell")
+    observations: dict = {}
+    for destination_id in buy.destination_ids:
+        rows = observations.setdefault(destination_id, {})
+        for sku, price in buy.row(destination_id).items():
+            rows.setdefault(sku, {})["buy"] = price
+        for sku, price in sell.row(destination_id).items():
+            rows.setdefault(sku, {})["sell"] = price
+    return observations
+
+
+def test_find_trade_routes_command_reports_routes() -> None:
+    engine = GameEngine(world_seed=12345, config={"system_count": 12})
+    engine.player_state.credits = 5000
+    observations = _observations(engine)
+    result = engine.execute({"type": "find_trade_routes", "observations": observations, "top_k": 3})
+    assert result["ok"] is True
+    detail = next(event["detail"] for event in result["events"] if event["stage"] == "trade_routes")
+    assert detail["origin_destination_id"] == engine.player_state.current_destination_id
+    assert detail["observed_destinations"] == len(observations)
+    routes = detail["routes"]
+    assert 0 < len(routes) <= 3
+    for route in routes:
+        leg_profits = sum(leg["profit"] for leg in route["legs"])
+        assert route["total_profit"] == leg_profits - route["positioning_refuel_cost"] > 0
+        for leg in route["legs"]:
+            assert leg["buy_price"] == observations[leg["buy_destination_id"]][leg["sku_id"]]["buy"]
+            assert leg["sell_price"] == observations[leg["sell_destination_id"]][leg["sku_id"]]["sell"]
+            assert 0 < leg["quantity"] <= detail["cargo_space"]
+            assert leg["refuel_cost"] % FUEL_PRICE_PER_UNIT == 0
+            assert leg["legality"] != "ILLEGAL"
+
+    for bad in ({"top_k": 0}, {"max_legs": 9}, {"max_risk_tier": "Bogus"}, {"allow_illegal": "yes"}, {"observations": []}):
+        rejected = engine.execute({"type": "find_trade_routes", **bad})
+        assert rejected["ok"] is False
@@ -18,6 +18,8 @@ from world_state_engine import (  # noqa: E402
     ScheduledSituation,
     WorldStateEngine,
 )
+from deterministic_rng import DeterministicRng  # noqa: E402
+from event_bus import EventBus, RingBufferSink  # noqa: E402
 from interaction_resolvers import destination_actions  # noqa: E402
 from npc_entity import NPCEntity, NPCPersistenceTier  # noqa: E402
 from npc_registry import NPCRegistry  # noqa: E402
@@ -71,15 +73,28 @@ def _build_sector_with_destination(
     return Galaxy(systems=[system])
 
 
+class _ScriptedSpawnRng(DeterministicRng):
+    """Daily spawn rolls (gate, type, severity) come from ``rolls``; selection streams stay real."""
+
+    def __init__(self, rolls) -> None:
+        super().__init__()
+        self._rolls = iter(rolls)
+
+    def day_u01(self, world_seed: int, scope_id: str, day: int, channel: str) -> float:
+        return next(self._rolls)
+
+    def day_u01_many(self, world_seed: int, scope_ids: list[str], day: int, channel: str) -> list[float]:
+        return [next(self._rolls) for _ in scope_ids]
+
+
 def _force_spawn_rolls(
-    monkeypatch,
+    engine: WorldStateEngine,
     *,
     gate_roll: float,
     type_roll: float,
     severity_roll: float,
 ) -> None:
-    sequence = iter([gate_roll, type_roll, severity_roll])
-    monkeypatch.setattr(wse, "_rng_u01", lambda _seed: next(sequence))
+    engine.rng = _ScriptedSpawnRng([gate_roll, type_roll, severity_roll])
 
 
 def test_register_system_initializes_containers() -> None:
@@ -334,7 +349,7 @@ def test_no_spawn_when_probability_roll_fails(tmp_path: Path) -> None:
     assert engine.get_active_events("SYS-0") == []
 
 
-def test_only_one_spawn_per_day_globally(monkeypatch, tmp_path: Path) -> None:
+def test_only_one_spawn_per_day_globally(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -375,7 +390,7 @@ def test_only_one_spawn_per_day_globally(monkeypatch, tmp_path: Path) -> None:
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.00,
         severity_roll=0.10,
@@ -391,7 +406,7 @@ def test_only_one_spawn_per_day_globally(monkeypatch, tmp_path: Path) -> None:
     assert total == 1
 
 
-def test_70_30_split_is_deterministically_respected(monkeypatch, tmp_path: Path) -> None:
+def test_70_30_split_is_deterministically_respected(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -433,7 +448,7 @@ def test_70_30_split_is_deterministically_respected(monkeypatch, tmp_path: Path)
     situation_engine.load_situation_catalog(situations_path)
     situation_engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        situation_engine,
         gate_roll=0.00,
         type_roll=0.00,
         severity_roll=0.10,
@@ -452,7 +467,7 @@ def test_70_30_split_is_deterministically_respected(monkeypatch, tmp_path: Path)
     event_engine.load_situation_catalog(situations_path)
     event_engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        event_engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.10,
@@ -595,9 +610,7 @@ def test_no_random_spawning_if_catalogs_empty(tmp_path: Path) -> None:
     assert engine.get_active_events("SYS-0") == []
 
 
-def test_event_spawn_triggers_situations_up_to_cap_with_deterministic_durations(
-    monkeypatch, tmp_path: Path
-) -> None:
+def test_event_spawn_triggers_situations_up_to_cap_with_deterministic_durations(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -663,7 +676,7 @@ def test_event_spawn_triggers_situations_up_to_cap_with_deterministic_durations(
         engine.add_situation(ActiveSituation("EXISTING-1", "SYS-0", "system", None, 5))
         engine.add_situation(ActiveSituation("EXISTING-2", "SYS-0", "system", None, 5))
         _force_spawn_rolls(
-            monkeypatch,
+            engine,
             gate_roll=0.00,
             type_roll=0.90,
             severity_roll=0.10,
@@ -687,7 +700,7 @@ def test_event_spawn_triggers_situations_up_to_cap_with_deterministic_durations(
     engine.add_situation(ActiveSituation("EXISTING-1", "SYS-0", "system", None, 5))
     engine.add_situation(ActiveSituation("EXISTING-2", "SYS-0", "system", None, 5))
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.10,
@@ -705,7 +718,7 @@ def test_event_spawn_triggers_situations_up_to_cap_with_deterministic_durations(
     assert 2 <= first[2][1] <= 4
 
 
-def test_event_schedules_follow_up_events_in_stable_order(monkeypatch, tmp_path: Path) -> None:
+def test_event_schedules_follow_up_events_in_stable_order(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(json.dumps({"situations": []}), encoding="utf-8")
@@ -739,7 +752,7 @@ def test_event_schedules_follow_up_events_in_stable_order(monkeypatch, tmp_path:
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.10,
@@ -757,7 +770,7 @@ def test_event_schedules_follow_up_events_in_stable_order(monkeypatch, tmp_path:
     ]
 
 
-def test_system_flags_apply_add_then_remove_deterministically(monkeypatch, tmp_path: Path) -> None:
+def test_system_flags_apply_add_then_remove_deterministically(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(json.dumps({"situations": []}), encoding="utf-8")
@@ -788,7 +801,7 @@ def test_system_flags_apply_add_then_remove_deterministically(monkeypatch, tmp_p
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.10,
@@ -803,7 +816,7 @@ def test_system_flags_apply_add_then_remove_deterministically(monkeypatch, tmp_p
     assert engine.get_system_flags("SYS-0") == ["beta"]
 
 
-def test_modifiers_registry_tracks_active_and_removes_on_expiry(monkeypatch, tmp_path: Path) -> None:
+def test_modifiers_registry_tracks_active_and_removes_on_expiry(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -856,7 +869,7 @@ def test_modifiers_registry_tracks_active_and_removes_on_expiry(monkeypatch, tmp
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.10,
@@ -883,7 +896,7 @@ def test_modifiers_registry_tracks_active_and_removes_on_expiry(monkeypatch, tmp
     assert engine.get_active_modifiers("SYS-0") == []
 
 
-def test_pending_structural_mutations_are_recorded_not_applied(monkeypatch, tmp_path: Path) -> None:
+def test_pending_structural_mutations_are_recorded_not_applied(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(json.dumps({"situations": []}), encoding="utf-8")
@@ -918,7 +931,7 @@ def test_pending_structural_mutations_are_recorded_not_applied(monkeypatch, tmp_
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.90,
@@ -1540,7 +1553,7 @@ def test_apply_event_effects_raises_when_event_missing() -> None:
         )
 
 
-def test_scheduled_events_execute_on_due_day_only(monkeypatch, tmp_path: Path) -> None:
+def test_scheduled_events_execute_on_due_day_only(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(json.dumps({"situations": []}), encoding="utf-8")
@@ -1585,7 +1598,7 @@ def test_scheduled_events_execute_on_due_day_only(monkeypatch, tmp_path: Path) -
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.90,
         severity_roll=0.10,
@@ -1637,7 +1650,7 @@ def test_scheduled_event_execution_order_is_stable(tmp_path: Path) -> None:
     assert _run_once() == ["E-2", "E-1", "E-3"]
 
 
-def test_scheduled_events_do_not_consume_spawn_gate(monkeypatch, tmp_path: Path) -> None:
+def test_scheduled_events_do_not_consume_spawn_gate(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -1687,7 +1700,7 @@ def test_scheduled_events_do_not_consume_spawn_gate(monkeypatch, tmp_path: Path)
     engine.load_event_catalog(events_path)
     engine.schedule_event(ScheduledEvent(event_id="E-SCHEDULED", system_id="SYS-0", trigger_day=30))
     _force_spawn_rolls(
-        monkeypatch,
+        engine,
         gate_roll=0.00,
         type_roll=0.00,
         severity_roll=0.99,
@@ -1883,7 +1896,7 @@ def test_spawn_gate_cooldown_behavior_is_deterministic_under_repeated_runs(monke
     assert _run_once() == _run_once()
 
 
-def test_spawn_pipeline_can_select_each_severity_tier_deterministically(monkeypatch, tmp_path: Path) -> None:
+def test_spawn_pipeline_can_select_each_severity_tier_deterministically(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -1920,7 +1933,7 @@ def test_spawn_pipeline_can_select_each_severity_tier_deterministically(monkeypa
         engine.load_situation_catalog(situations_path)
         engine.load_event_catalog(events_path)
         sequence = iter([0.00, 0.00, severity_roll])  # gate pass, type=situation, tier roll
-        monkeypatch.setattr(wse, "_rng_u01", lambda _seed: next(sequence))
+        engine.rng = _ScriptedSpawnRng(sequence)
         engine.evaluate_spawn_gate(
             world_seed=123,
             current_system_id="SYS-0",
@@ -1933,9 +1946,7 @@ def test_spawn_pipeline_can_select_each_severity_tier_deterministically(monkeypa
         assert rows[0].situation_id == expected_situation_id
 
 
-def test_spawn_pipeline_fails_without_candidates_for_selected_type_and_tier(
-    monkeypatch, tmp_path: Path
-) -> None:
+def test_spawn_pipeline_fails_without_candidates_for_selected_type_and_tier(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -1984,7 +1995,7 @@ def test_spawn_pipeline_fails_without_candidates_for_selected_type_and_tier(
     engine.load_situation_catalog(situations_path)
     engine.load_event_catalog(events_path)
     sequence = iter([0.00, 0.90, 0.90])  # pass gate, event type, tier 4
-    monkeypatch.setattr(wse, "_rng_u01", lambda _seed: next(sequence))
+    engine.rng = _ScriptedSpawnRng(sequence)
     engine.evaluate_spawn_gate(
         world_seed=7,
         current_system_id="SYS-0",
@@ -1997,7 +2008,7 @@ def test_spawn_pipeline_fails_without_candidates_for_selected_type_and_tier(
     assert engine.cooldown_until_day_by_system["SYS-0"] is None
 
 
-def test_spawn_pipeline_sets_cooldown_only_when_instance_is_created(monkeypatch, tmp_path: Path) -> None:
+def test_spawn_pipeline_sets_cooldown_only_when_instance_is_created(tmp_path: Path) -> None:
     situations_path = tmp_path / "situations.json"
     events_path = tmp_path / "events.json"
     situations_path.write_text(
@@ -2025,7 +2036,7 @@ def test_spawn_pipeline_sets_cooldown_only_when_instance_is_created(monkeypatch,
     engine.load_event_catalog(events_path)
 
     seq_fail = iter([0.00, 0.00, 0.95])  # tier 5 -> no candidate
-    monkeypatch.setattr(wse, "_rng_u01", lambda _seed: next(seq_fail))
+    engine.rng = _ScriptedSpawnRng(seq_fail)
     engine.evaluate_spawn_gate(
         world_seed=9,
         current_system_id="SYS-0",
@@ -2036,7 +2047,7 @@ def test_spawn_pipeline_sets_cooldown_only_when_instance_is_created(monkeypatch,
     assert engine.cooldown_until_day_by_system["SYS-0"] is None
 
     seq_pass = iter([0.00, 0.00, 0.10])  # tier 1 -> has candidate
-    monkeypatch.setattr(wse, "_rng_u01", lambda _seed: next(seq_pass))
+    engine.rng = _ScriptedSpawnRng(seq_pass)
     engine.evaluate_spawn_gate(
         world_seed=9,
         current_system_id="SYS-0",
@@ -2625,6 +2636,64 @@ def test_resolver_output_ordering_is_deterministic() -> None:
     assert list(resolved["resolved"]["A-1"].keys()) == ["availability_delta", "demand_bias_percent"]
 
 
+def _brute_force_resolve(aggregated, entity) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    tags = set(entity["tags"])
+    for (target_type, target_id, modifier_type), value in aggregated.items():
+        if (
+            target_type == "ALL"
+            or (target_type == "category" and target_id == entity["category_id"])
+            or (target_type == "tag" and target_id in tags)
+            or (target_type in ("id", "destination_id") and target_id == entity["entity_id"])
+        ):
+            totals[modifier_type] = totals.get(modifier_type, 0) + value
+    return totals
+
+
+def test_indexed_resolver_matches_brute_force_and_tracks_modifier_version() -> None:
+    engine = WorldStateEngine()
+    rng = random.Random(7)
+    target_types = ["ALL", "category", "tag", "id", "destination_id", "sku"]
+    rows = []
+    for index in range(60):
+        target_type = rng.choice(target_types)
+        rows.append(
+            {
+                "domain": rng.choice(["goods", "travel"]),
+                "target_type": target_type,
+                "target_id": None if target_type == "ALL" else rng.choice(["A", "B", "C", "E-1", "E-2"]),
+                "modifier_type": rng.choice(["price_bias_percent", "demand_bias_percent", "availability_delta"]),
+                "modifier_value": rng.randint(-3, 3),
+            }
+        )
+    version = engine.modifier_version
+    engine._add_modifier_entries("SYS-1", "event", "E-X", rows)
+    assert engine.modifier_version == version + 1
+    entities = [
+        {"entity_id": f"E-{index}", "category_id": rng.choice(["A", "B", None]), "tags": rng.sample(["A", "B", "C"], 2)}
+        for index in range(1, 4)
+    ]
+    for domain in ("goods", "travel"):
+        aggregated = engine.get_aggregated_modifier_map("SYS-1", domain)
+        resolved = engine.resolve_modifiers_for_entities("SYS-1", domain, entities)["resolved"]
+        for entity in entities:
+            expected = {
+                modifier_type: wse._apply_modifier_cap(domain, modifier_type, value, WorldStateEngine._MODIFIER_CAPS)
+                for modifier_type, value in _brute_force_resolve(aggregated, entity).items()
+            }
+            assert resolved[entity["entity_id"]] == {key: value for key, value in sorted(expected.items()) if value}
+
+    cached = engine.get_aggregated_modifier_map("SYS-1", "goods")
+    cached[("ALL", None, "price_bias_percent")] = 99
+    assert engine.get_aggregated_modifier_map("SYS-1", "goods") != cached
+    engine._remove_modifier_entries("SYS-1", "event", "E-X")
+    assert engine.modifier_version == version + 2
+    assert engine.get_aggregated_modifier_map("SYS-1", "goods") == {}
+    # Lists assigned directly (as tests and tools do) are picked up without an explicit invalidation.
+    engine.active_modifiers_by_system["SYS-1"] = [dict(rows[0], domain="goods", target_type="ALL", modifier_value=2)]
+    assert list(engine.get_aggregated_modifier_map("SYS-1", "goods").values()) == [2]
+
+
 def test_drain_structural_mutations_empty_returns_empty_list() -> None:
     engine = WorldStateEngine()
     assert engine.drain_structural_mutations() == []
@@ -2683,3 +2752,112 @@ def test_drain_structural_mutations_does_not_change_rng_state() -> None:
     _ = engine.drain_structural_mutations()
     state_after = rng.getstate()
     assert state_before == state_after
+
+
+def test_schedule_queue_runs_due_rows_in_legacy_order_and_keeps_pending_views() -> None:
+    def effects(scheduled_events: list[dict]) -> dict:
+        return {
+            "create_situations": [],
+            "scheduled_events": scheduled_events,
+            "system_flag_add": [],
+            "system_flag_remove": [],
+            "modifiers": [],
+        }
+
+    def build() -> WorldStateEngine:
+        engine = WorldStateEngine(event_bus=EventBus())
+        engine.load_situation_catalog(payload={"situations": []})
+        engine.load_event_catalog(
+            payload={
+                "events": [
+                    {"event_id": "E-CHAIN", "duration_days": {"min": 1, "max": 1},
+                     "effects": effects([{"event_id": "E-LEAF", "delay_days": 2}])},
+                    {"event_id": "E-LEAF", "duration_days": {"min": 1, "max": 1}, "effects": effects([])},
+                ]
+            }
+        )
+        return engine
+
+    rows = [
+        ScheduledEvent("E-LEAF", "SYS-2", 5),
+        ScheduledEvent("E-LEAF", "SYS-1", 7),
+        ScheduledSituation("S-UNKNOWN", "SYS-1", 5),
+        ScheduledEvent("E-CHAIN", "SYS-1", 5),
+        ScheduledEvent("E-LEAF", "SYS-1", 3),
+        ScheduledEvent("E-LEAF", "SYS-1", 5, insertion_index=99),
+    ]
+    batched = build()
+    batched.schedule_many([type(row)(**vars(row)) for row in rows])
+    one_by_one = build()
+    for row in rows:
+        if isinstance(row, ScheduledEvent):
+            one_by_one.schedule_event(type(row)(**vars(row)))
+        else:
+            one_by_one.schedule_situation(type(row)(**vars(row)))
+    assert batched == one_by_one
+    assert [row.insertion_index for row in batched.scheduled_events] == [0, 1, 3, 4, 99]
+
+    for engine in (batched, one_by_one):
+        for day in range(4, 9):
+            engine.process_scheduled_events(world_seed=7, current_day=day)
+    assert batched == one_by_one
+
+    # Due rows run by (system_id, insertion_index); the chained E-LEAF scheduled while day 5
+    # ran is dropped and the row that missed day 3 stays pending, as with the list schedule.
+    day_five = [
+        (system_id, event.event_id)
+        for system_id in ("SYS-1", "SYS-2")
+        for event in batched.get_active_events(system_id)
+        if event.trigger_day == 5
+    ]
+    assert day_five == [("SYS-1", "E-CHAIN"), ("SYS-1", "E-LEAF"), ("SYS-2", "E-LEAF")]
+    assert [(row.system_id, row.trigger_day) for row in batched.scheduled_events] == [("SYS-1", 3)]
+    assert batched.scheduled_situations == []
+    with pytest.raises(ValueError, match="Cannot schedule"):
+        batched.schedule_many([ActiveEvent("E-LEAF", None, "SYS-1", 1)])
+
+
+@pytest.mark.parametrize("rng_mode", ["compat", "fast"])
+def test_batched_spawn_gates_match_per_system_gates(rng_mode: str) -> None:
+    system_ids = [f"SYS-{index:03d}" for index in range(40)]
+
+    def build(event_bus: EventBus) -> WorldStateEngine:
+        engine = WorldStateEngine(event_bus=event_bus, rng=DeterministicRng(rng_mode))
+        engine.load_situation_catalog()
+        engine.load_event_catalog()
+        return engine
+
+    per_system = build(EventBus())
+    batched = build(EventBus())
+    traced_bus = EventBus()
+    traced_bus.subscribe(RingBufferSink(capacity=10))
+    traced = build(traced_bus)
+    opened = []
+    for day in range(1, 41):
+        expected = sum(per_system.evaluate_spawn_gate(11, system_id, [], day, 40) for system_id in system_ids)
+        opened.append(batched.evaluate_spawn_gates(11, list(reversed(system_ids)), day, 40))
+        assert traced.evaluate_spawn_gates(11, system_ids, day, 40) == expected == opened[-1]
+        for engine in (per_system, batched, traced):
+            engine.decrement_durations()
+            engine.resolve_expired()
+    assert batched == per_system == traced
+    assert batched.cooldown_until_day_by_system == per_system.cooldown_until_day_by_system
+    assert 0 < sum(opened) < 40 * 40
+    # A fresh but equal list each day keeps the arrays; a different system set rebuilds them.
+    gates = batched._spawn_gates
+    batched.evaluate_spawn_gates(11, list(reversed(system_ids)), 41, 40)
+    assert batched._spawn_gates is gates
+    batched.evaluate_spawn_gates(11, system_ids[:10], 42, 40)
+    assert batched._spawn_gates.system_ids == tuple(system_ids[:10])
+
+
+def test_batched_spawn_gates_draw_from_the_engine_rng() -> None:
+    engine = WorldStateEngine(event_bus=EventBus())
+    engine.load_situation_catalog()
+    engine.load_event_catalog()
+    engine.rng = _ScriptedSpawnRng([0.99, 0.00, 0.99, 0.00, 0.10])
+    # Gate rolls are drawn in one batch (A, B, C); only SYS-B's opens, then its type and tier rolls follow.
+    assert engine.evaluate_spawn_gates(3, ["SYS-B", "SYS-A", "SYS-C"], 1, 50) == 1
+    assert engine.get_active_situations("SYS-A") == []
+    assert len(engine.get_active_situations("SYS-B")) == 1
+    assert engine.cooldown_until_day_by_system["SYS-B"] == 6
@@ -18,10 +18,16 @@ class _PlayerStub:
     npc_registry: Any = None
 
 
-def _run_world_state_horizon(seed: int, days: int) -> tuple[list[dict[str, Any]], dict[str, list[int]]]:
+def _run_world_state_horizon(
+    seed: int,
+    days: int,
+    *,
+    system_count: int = 4,
+    world_state_scope: str = te.WORLD_STATE_SCOPE_LOCAL,
+) -> tuple[list[dict[str, Any]], dict[str, list[int]]]:
     te._reset_time_state_for_test()
     registry = GovernmentRegistry.from_file(PROJECT_ROOT / "data" / "governments.json")
-    sector = WorldGenerator(seed=seed, system_count=4, government_ids=registry.government_ids()).generate()
+    sector = WorldGenerator(seed=seed, system_count=system_count, government_ids=registry.government_ids()).generate()
     player = _PlayerStub(current_system_id=sector.systems[0].system_id)
     time_engine = te.TimeEngine(
         logger=None,
@@ -29,8 +35,9 @@ def _run_world_state_horizon(seed: int, days: int) -> tuple[list[dict[str, Any]]
         sector=sector,
         player_state=player,
         event_frequency_percent=8,
+        world_state_scope=world_state_scope,
     )
-    engine = te._world_state_engine
+    engine = time_engine.context.world_state_engine
     assert engine is not None
 
     initial_destination_ids = {
@@ -141,3 +148,32 @@ def test_long_horizon_deterministic_world_state() -> None:
                 f"Structural limiter violation system_id={system_id} "
                 f"days={days_list[index - 1]}->{days_list[index]}"
             )
+
+
+def test_galaxy_scope_ticks_systems_away_from_the_player() -> None:
+    seed = 12345
+    snapshots_a, structural_days_a = _run_world_state_horizon(
+        seed=seed, days=120, system_count=12, world_state_scope=te.WORLD_STATE_SCOPE_GALAXY
+    )
+    snapshots_b, structural_days_b = _run_world_state_horizon(
+        seed=seed, days=120, system_count=12, world_state_scope=te.WORLD_STATE_SCOPE_GALAXY
+    )
+    assert snapshots_a == snapshots_b
+    assert structural_days_a == structural_days_b
+
+    local_snapshots, _ = _run_world_state_horizon(seed=seed, days=120, system_count=12)
+    touched = {
+        row["system_id"]
+        for snapshot in snapshots_a
+        for row in snapshot["systems"]
+        if row["cooldown_until_day"] is not None
+    }
+    touched_locally = {
+        row["system_id"]
+        for snapshot in local_snapshots
+        for row in snapshot["systems"]
+        if row["cooldown_until_day"] is not None
+    }
+    # Locally only the player's system rolls its gate.
+    assert len(touched_locally) <= 1
+    assert len(touched) > 6
@@ -0,0 +1,87 @@
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from deterministic_rng import (  # noqa: E402
+    DeterministicRng,
+    clear_key_memos,
+    polynomial_seed,
+    sha256_prefix_int,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure deterministic rolls per second, legacy recipes versus deterministic_rng."
+    )
+    parser.add_argument("--rolls", type=int, default=100_000)
+    parser.add_argument("--keys", type=int, default=1_000, help="Distinct keys in the repeated-key runs.")
+    args = parser.parse_args()
+
+    compat = DeterministicRng()
+    fast = DeterministicRng("fast")
+    # Unique keys: every roll is a new day, as in the spawn gate. Repeated: a bounded key set, as in market pricing.
+    unique = [(12345, f"SYS-{index % 97:03d}", index, "spawn_gate") for index in range(args.rolls)]
+    slots = [index % args.keys for index in range(args.rolls)]
+    repeated = [(12345, f"SYS-{slot % 97:03d}", slot, "spawn_gate") for slot in slots]
+    tokens = [f"12345|SYS-{slot % 97:03d}|ENC-{slot}|npc_salvage_count" for slot in slots]
+    law_parts = [(12345, ":", f"SYS-{slot % 97:03d}", ":", slot, ":", "border", ":", "inspection") for slot in slots]
+
+    rows = [
+        ("u01 legacy", "unique", lambda: [_legacy_u01(*parts) for parts in unique]),
+        ("u01 compat", "unique", lambda: [compat.u01(*parts) for parts in unique]),
+        ("u01 fast", "unique", lambda: [fast.u01(*parts) for parts in unique]),
+        ("u01 legacy", "repeated", lambda: [_legacy_u01(*parts) for parts in repeated]),
+        ("u01 compat", "repeated", lambda: [compat.u01(*parts) for parts in repeated]),
+        ("u01 fast", "repeated", lambda: [fast.u01(*parts) for parts in repeated]),
+        ("stream x3 legacy", "repeated", lambda: [_draw3(random.Random(_legacy_seed(*parts))) for parts in repeated]),
+        ("stream x3 compat", "repeated", lambda: [_draw3(compat.stream(*parts)) for parts in repeated]),
+        ("stream x3 fast", "repeated", lambda: [_draw3(fast.stream(*parts)) for parts in repeated]),
+        ("sha256[:16] legacy", "repeated", lambda: [_legacy_prefix(token) for token in tokens]),
+        ("sha256[:16] memo", "repeated", lambda: [sha256_prefix_int(token) for token in tokens]),
+        ("poly31 legacy", "repeated", lambda: [_legacy_polynomial("".join(str(p) for p in parts)) for parts in law_parts]),
+        ("poly31 memo", "repeated", lambda: [polynomial_seed(0, *parts) for parts in law_parts]),
+    ]
+    print(f"rolls={args.rolls} repeated_keys={args.keys}")
+    print(f"{'recipe':>20} {'keys':>9} {'rolls_per_s':>12}")
+    for name, keys, run in rows:
+        clear_key_memos()
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+        print(f"{name:>20} {keys:>9} {args.rolls / seconds:>12,.0f}")
+
+
+def _legacy_seed(*parts) -> int:
+    packed = "|".join(str(part) for part in parts).encode("utf-8")
+    return int(hashlib.sha256(packed).hexdigest(), 16)
+
+
+def _legacy_u01(*parts) -> float:
+    return random.Random(_legacy_seed(*parts)).random()
+
+
+def _legacy_prefix(token: str) -> int:
+    return int(hashlib.sha256(token.encode("ascii")).hexdigest()[:16], 16)
+
+
+def _legacy_polynomial(token: str) -> int:
+    value = 0
+    for char in token:
+        value = (value * 31 + ord(char)) % (2**32)
+    return value
+
+
+def _draw3(rng: random.Random) -> float:
+    return rng.random() + rng.random() + rng.random()
+
+
+if __name__ == "__main__":
+    main()
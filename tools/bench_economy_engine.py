@@ -0,0 +1,73 @@
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from economy_data import CATEGORIES, PROFILE_IDS  # noqa: E402
+from economy_engine import EconomyEngine, TradeAction  # noqa: E402
+from world_generator import Sector, System  # noqa: E402
+
+
+class _CountingLogger:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def log(self, turn: int, action: str, state_change: str) -> None:
+        self.count += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time EconomyEngine ticks on a large sector, one trade per tick.")
+    parser.add_argument("--systems", type=int, default=10_000)
+    parser.add_argument("--ticks", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+
+    sector = Sector(
+        systems=[
+            System(
+                system_id=f"SYS-{index:05d}",
+                name=f"System {index}",
+                position=(index, 0),
+                population=3,
+                government_id="anarchic",
+                destinations=[],
+                attributes={"profile_id": PROFILE_IDS[index % len(PROFILE_IDS)]},
+                neighbors=[],
+            )
+            for index in range(args.systems)
+        ]
+    )
+    logger = _CountingLogger()
+    start = time.perf_counter()
+    engine = EconomyEngine(sector=sector, logger=logger)
+    build_seconds = time.perf_counter() - start
+
+    rng = random.Random(args.seed)
+    trades = [
+        TradeAction(rng.choice(sector.systems).system_id, rng.choice(CATEGORIES).category_id, rng.choice([-1, 1]), "bench")
+        for _ in range(args.ticks)
+    ]
+    tick_seconds = []
+    for turn, trade in enumerate(trades, start=1):
+        start = time.perf_counter()
+        engine.advance_turn(turn=turn, trade_action=trade)
+        tick_seconds.append(time.perf_counter() - start)
+
+    ordered = sorted(tick_seconds)
+    print(f"systems={args.systems} cells={args.systems * len(CATEGORIES)} ticks={args.ticks}")
+    print(f"build {build_seconds * 1e3:.1f} ms")
+    print(
+        f"tick median {ordered[len(ordered) // 2] * 1e3:.3f} ms, max {ordered[-1] * 1e3:.2f} ms, "
+        f"total {sum(tick_seconds) * 1e3:.1f} ms"
+    )
+    print(f"economy_update entries logged: {logger.count}")
+
+
+if __name__ == "__main__":
+    main()
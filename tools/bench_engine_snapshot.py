@@ -0,0 +1,45 @@
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure engine snapshot size and fork latency by galaxy size.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 25, 50, 100, 200])
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'systems':>8} {'snapshot_bytes':>15} {'snapshot_ms':>12} {'restore_ms':>11} {'fork_ms':>8}")
+    for system_count in args.sizes:
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = GameEngine(world_seed=args.seed, config={"system_count": system_count})
+            engine.execute({"type": "wait", "days": 1})
+        blob = engine.snapshot()
+        snapshot_ms = _median_ms(engine.snapshot, args.repeats)
+        restore_ms = _median_ms(lambda: engine.restore(blob), args.repeats)
+        fork_ms = _median_ms(engine.fork, args.repeats)
+        print(f"{system_count:>8} {len(blob):>15} {snapshot_ms:>12.2f} {restore_ms:>11.2f} {fork_ms:>8.2f}")
+
+
+def _median_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    main()
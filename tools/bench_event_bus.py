@@ -0,0 +1,60 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from event_bus import RingBufferSink  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time a long wait-only simulation with world-state diagnostics printed, buffered and disabled."
+    )
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=8)
+    parser.add_argument("--days", type=int, default=10_000)
+    parser.add_argument("--event-frequency", type=int, default=8, help="Spawn gate chance per day, in percent.")
+    args = parser.parse_args()
+
+    print(f"systems={args.systems} days={args.days} event_frequency_percent={args.event_frequency}")
+    print(f"{'mode':>8} {'seconds':>8} {'us_per_day':>11} {'speedup':>8}")
+    baseline = None
+    for mode in ("stdout", "ring", "off"):
+        seconds = _simulate(args, mode)
+        baseline = baseline or seconds
+        print(f"{mode:>8} {seconds:>8.2f} {seconds / args.days * 1e6:>11.1f} {baseline / seconds:>8.2f}")
+
+
+def _simulate(args: argparse.Namespace, mode: str) -> float:
+    # stdout: the legacy print diagnostics. ring: events kept in memory, never formatted.
+    # off: no subscribers, so the guarded call sites build nothing.
+    config = {
+        "system_count": args.systems,
+        "event_frequency_percent": args.event_frequency,
+        "world_state_events": "stdout" if mode == "stdout" else "off",
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = GameEngine(world_seed=args.seed, config=config)
+    if mode == "ring":
+        engine.event_bus.subscribe(RingBufferSink())
+    # Printing goes to the null device so terminal speed does not dominate.
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        remaining = args.days
+        while remaining > 0:
+            days = min(10, remaining)
+            engine.execute({"type": "wait", "days": days})
+            remaining -= days
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+
+
+BOT_TURN = [
+    {"type": "get_player_profile"},
+    {"type": "get_system_profile"},
+    {"type": "get_destination_profile"},
+    {"type": "list_destination_actions"},
+    {"type": "get_market_profile"},
+    {"type": "wait", "days": 1},
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare execute() loop throughput with execute_batch().")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    commands = BOT_TURN * args.turns
+    with contextlib.redirect_stdout(io.StringIO()):
+        base = GameEngine(world_seed=args.seed, config={"system_count": args.systems})
+        loop_engine = base.fork()
+        batch_engine = base.fork()
+
+        start = time.perf_counter()
+        for command in commands:
+            loop_engine.execute(command)
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_engine.execute_batch(commands, stop_on_hard_stop=False)
+        batch_seconds = time.perf_counter() - start
+
+    print(f"commands: {len(commands)} systems: {args.systems}")
+    print(f"execute loop:  {loop_seconds * 1000:9.1f} ms  {len(commands) / loop_seconds:9.0f} cmd/s")
+    print(f"execute_batch: {batch_seconds * 1000:9.1f} ms  {len(commands) / batch_seconds:9.0f} cmd/s")
+    print(f"speedup: {loop_seconds / batch_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
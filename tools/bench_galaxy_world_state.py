@@ -0,0 +1,64 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+
+TARGET_SECONDS = 60.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time a wait-only run with world-state ticking every system (world_state_scope=galaxy)."
+    )
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=3650)
+    parser.add_argument("--event-frequency", type=int, default=8, help="Spawn gate chance per day, in percent.")
+    parser.add_argument("--rng-mode", choices=["compat", "fast"], default="fast")
+    parser.add_argument("--scope", choices=["local", "galaxy"], default="galaxy")
+    args = parser.parse_args()
+
+    config = {
+        "system_count": args.systems,
+        "sector_cache": False,
+        "event_frequency_percent": args.event_frequency,
+        "world_state_events": "off",
+        "world_state_scope": args.scope,
+        "rng_mode": args.rng_mode,
+    }
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = GameEngine(world_seed=args.seed, config=config)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        remaining = args.days
+        while remaining > 0:
+            days = min(10, remaining)
+            engine.execute({"type": "wait", "days": days})
+            remaining -= days
+    seconds = time.perf_counter() - start
+
+    world_state = engine.time_context.world_state_engine
+    touched = sum(1 for until in world_state.cooldown_until_day_by_system.values() if until is not None)
+    print(
+        f"systems={args.systems} days={args.days} scope={args.scope} rng_mode={args.rng_mode} "
+        f"event_frequency_percent={args.event_frequency}"
+    )
+    print(f"build {build_seconds:.2f}s  simulate {seconds:.2f}s  ({seconds / args.days * 1e3:.2f} ms/day)")
+    print(f"systems that spawned at least once: {touched}")
+    verdict = "within" if seconds <= TARGET_SECONDS else "over"
+    print(f"{verdict} the {TARGET_SECONDS:.0f}s target")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import contextlib
+import gc
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from world_generator import LazySystem  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare engine startup time and memory for eager and lazy sectors.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--eager-limit", type=int, default=1000, help="Skip eager runs above this many systems.")
+    args = parser.parse_args()
+
+    # The data bundle is process-wide; load it before timing so only sector work is measured.
+    get_data_bundle()
+    print(f"{'systems':>8} {'mode':>6} {'startup_ms':>11} {'resident_kib':>13} {'expanded':>9}")
+    for system_count in args.sizes:
+        for lazy in (False, True):
+            if not lazy and system_count > args.eager_limit:
+                continue
+            config = {"system_count": system_count, "lazy_sector": lazy, "sector_cache": False}
+            gc.collect()
+            start = time.perf_counter()
+            engine = _build(args.seed, config)
+            startup_ms = (time.perf_counter() - start) * 1000.0
+            expanded = sum(not isinstance(system, LazySystem) for system in engine.sector.systems)
+            del engine
+            gc.collect()
+            tracemalloc.start()
+            engine = _build(args.seed, config)
+            resident_kib = tracemalloc.get_traced_memory()[0] / 1024.0
+            tracemalloc.stop()
+            del engine
+            mode = "lazy" if lazy else "eager"
+            print(f"{system_count:>8} {mode:>6} {startup_ms:>11.1f} {resident_kib:>13.0f} {expanded:>9}")
+
+
+def _build(seed: int, config: dict) -> GameEngine:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return GameEngine(world_seed=seed, config=config)
+
+
+if __name__ == "__main__":
+    main()
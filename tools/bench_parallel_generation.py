@@ -0,0 +1,46 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from world_generator import WorldGenerator  # noqa: E402
+
+
+def main() -> None:
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    parser = argparse.ArgumentParser(description="Measure world generation time by process-pool size.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, cpus}))
+    args = parser.parse_args()
+
+    bundle = get_data_bundle()
+    government_ids = GovernmentRegistry.from_payload(bundle.document("governments.json")).government_ids()
+    print(f"systems={args.systems} usable_cpus={cpus}")
+    print(f"{'workers':>8} {'generate_ms':>12} {'speedup':>8} {'identical':>10}")
+    baseline_ms = None
+    baseline = None
+    for workers in args.workers:
+        generator = WorldGenerator(
+            seed=args.seed,
+            system_count=args.systems,
+            government_ids=government_ids,
+            catalog=bundle.catalog,
+        )
+        start = time.perf_counter()
+        sector = generator.generate(workers=workers)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if baseline is None:
+            baseline_ms, baseline = elapsed_ms, sector
+        print(f"{workers:>8} {elapsed_ms:>12.1f} {baseline_ms / elapsed_ms:>7.2f}x {str(sector == baseline):>10}")
+
+
+if __name__ == "__main__":
+    main()
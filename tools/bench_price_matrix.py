@@ -0,0 +1,60 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+from price_matrix import compute_price_matrix  # noqa: E402
+
+
+def _scalar_prices(engine: GameEngine, action: str, destination_ids, system_ids, skus) -> list[int | None]:
+    prices: list[int | None] = []
+    for destination_id, system_id in zip(destination_ids, system_ids):
+        engine.player_state.current_system_id = system_id
+        engine.player_state.current_destination_id = destination_id
+        system = engine.sector.get_system(system_id)
+        destination = next(row for row in system.destinations if row.destination_id == destination_id)
+        government = engine.government_registry.get_government(system.government_id)
+        for sku in skus:
+            quote = engine._market_price_quote(destination=destination, government=government, sku=sku, action=action)
+            prices.append(None if quote is None else quote["unit_price"])
+    return prices
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time compute_price_matrix against per-cell scalar market quotes.")
+    parser.add_argument("--systems", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--action", choices=["buy", "sell"], default="buy")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = GameEngine(world_seed=args.seed, config={"system_count": args.systems, "sector_cache": False})
+    # Expand every system up front so neither path pays for world generation.
+    for system in engine.sector.systems:
+        system.destinations
+
+    start = time.perf_counter()
+    matrix = compute_price_matrix(engine, args.action)
+    matrix_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = _scalar_prices(engine, args.action, matrix.destination_ids, matrix.system_ids, matrix.skus)
+    scalar_seconds = time.perf_counter() - start
+
+    vector = [int(price) if tradeable else None for price, tradeable in zip(matrix.prices, matrix.tradeable)]
+    rows, columns = matrix.shape
+    print(f"systems={args.systems} destinations={rows} skus={columns} cells={rows * columns} action={args.action}")
+    print(f"scalar quotes   {scalar_seconds * 1e3:9.1f} ms")
+    print(f"price matrix    {matrix_seconds * 1e3:9.1f} ms  ({scalar_seconds / matrix_seconds:.1f}x)")
+    print(f"tradeable cells {sum(matrix.tradeable)}; identical to scalar: {vector == scalar}")
+
+
+if __name__ == "__main__":
+    main()
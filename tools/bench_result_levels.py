@@ -0,0 +1,71 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import RESULT_LEVELS, GameEngine  # noqa: E402
+
+
+BOT_TURN = [
+    {"type": "get_player_profile"},
+    {"type": "get_system_profile"},
+    {"type": "get_destination_profile"},
+    {"type": "list_destination_actions"},
+    {"type": "get_market_profile"},
+    {"type": "wait", "days": 1},
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-command allocation and latency for each result_level.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=100)
+    args = parser.parse_args()
+
+    commands = BOT_TURN * args.turns
+    with contextlib.redirect_stdout(io.StringIO()):
+        base = GameEngine(world_seed=args.seed, config={"system_count": args.systems})
+
+    print(f"commands: {len(commands)} systems: {args.systems}")
+    print(f"{'level':>9} {'peak_kib/cmd':>13} {'retained_kib/cmd':>17} {'us/cmd':>8}")
+    for level in RESULT_LEVELS:
+        engine = base.fork()
+        engine.result_level = level
+        peak_total = 0
+        retained_total = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.start()
+            for command in commands:
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                result = engine.execute(command)
+                after, peak = tracemalloc.get_traced_memory()
+                peak_total += peak - before
+                retained_total += max(0, after - before)
+                del result
+            tracemalloc.stop()
+
+            timed = base.fork()
+            timed.result_level = level
+            start = time.perf_counter()
+            for command in commands:
+                timed.execute(command)
+            elapsed = time.perf_counter() - start
+
+        count = len(commands)
+        print(
+            f"{level:>9} {peak_total / count / 1024:>13.1f} {retained_total / count / 1024:>17.1f}"
+            f" {elapsed / count * 1e6:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import gc
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from government_registry import GovernmentRegistry  # noqa: E402
+from route_planner import RoutePlanner  # noqa: E402
+from sector_cache import load_or_generate_sector  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure RoutePlanner query latency on a generated galaxy.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--fuel-capacity", type=int, default=25)
+    args = parser.parse_args()
+
+    bundle = get_data_bundle()
+    registry = GovernmentRegistry.from_payload(bundle.document("governments.json"))
+    sector = load_or_generate_sector(
+        seed=args.seed,
+        system_count=args.systems,
+        government_ids=registry.government_ids(),
+        bundle=bundle,
+    )
+    # Settle the collector after loading the sector so its pass is not billed to the planner.
+    gc.collect()
+    start = time.perf_counter()
+    planner = RoutePlanner(sector.systems, fuel_capacities=(args.fuel_capacity,))
+    build_ms = (time.perf_counter() - start) * 1000.0
+
+    rng = random.Random(args.seed)
+    ids = sorted(system.system_id for system in sector.systems)
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(args.queries)]
+    capacity = args.fuel_capacity
+
+    # cold: first query per pair; the landmark table was built with the planner.
+    # tables: new fuel levels over the same pairs, so only the search itself runs.
+    # memo: the same queries again, answered from the plan memo.
+    cold = _time_queries(planner, pairs, lambda _: capacity, capacity)
+    tables = _time_queries(planner, pairs, lambda index: 1 + index % (capacity - 1), capacity)
+    memo = _time_queries(planner, pairs, lambda _: capacity, capacity)
+    reachable = sum(
+        planner.plan(origin, target, fuel=capacity, fuel_capacity=capacity) is not None for origin, target in pairs
+    )
+
+    print(f"systems={len(ids)} queries={len(pairs)} reachable={reachable} build_ms={build_ms:.1f}")
+    print(f"{'phase':>8} {'median_us':>10} {'p95_us':>8} {'max_us':>8}")
+    for name, samples in (("cold", cold), ("tables", tables), ("memo", memo)):
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"{name:>8} {statistics.median(ordered):>10.1f} {p95:>8.1f} {ordered[-1]:>8.1f}")
+
+
+def _time_queries(planner: RoutePlanner, pairs, fuel_for, capacity: int) -> list[float]:
+    samples = []
+    for index, (origin, target) in enumerate(pairs):
+        fuel = fuel_for(index)
+        start = time.perf_counter()
+        planner.plan(origin, target, fuel=fuel, fuel_capacity=capacity)
+        samples.append((time.perf_counter() - start) * 1_000_000.0)
+    return samples
+
+
+if __name__ == "__main__":
+    main()
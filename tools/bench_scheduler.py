@@ -0,0 +1,96 @@
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from event_bus import EventBus  # noqa: E402
+from world_state_engine import ScheduledEvent, ScheduledSituation, WorldStateEngine  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time a daily schedule pass over many pending rows, list scan versus ScheduleQueue."
+    )
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=10_000)
+    parser.add_argument("--systems", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+
+    rows = _rows(args)
+    print(f"entries={args.entries} days={args.days} systems={args.systems}")
+
+    start = time.perf_counter()
+    legacy_order = _legacy_pass(rows, args.days)
+    legacy_seconds = time.perf_counter() - start
+
+    engine = WorldStateEngine(event_bus=EventBus())
+    # Nothing is in the catalogs; time only the queue, with the same due order as the list scan.
+    queue_order: list[tuple[str, str, int]] = []
+    start = time.perf_counter()
+    engine.schedule_many(_clone(rows))
+    schedule_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for day in range(args.days):
+        queue_order.extend(_key(row) for row in engine._situation_schedule.pop_due(day))
+        queue_order.extend(_key(row) for row in engine._event_schedule.pop_due(day))
+    queue_seconds = time.perf_counter() - start
+
+    if queue_order != legacy_order:
+        raise SystemExit("ScheduleQueue order differs from the list scan.")
+    print(f"{'list scan':>16} {legacy_seconds:>9.3f}s")
+    print(f"{'schedule_many':>16} {schedule_seconds:>9.3f}s")
+    print(f"{'queue pop_due':>16} {queue_seconds:>9.3f}s  ({legacy_seconds / max(queue_seconds, 1e-9):.0f}x)")
+
+
+def _rows(args: argparse.Namespace) -> list:
+    rng = random.Random(args.seed)
+    rows = []
+    for index in range(args.entries):
+        system_id = f"SYS-{rng.randrange(args.systems):04d}"
+        trigger_day = rng.randrange(args.days)
+        if index % 5 == 0:
+            rows.append(ScheduledSituation("S-BENCH", system_id, trigger_day, insertion_index=index))
+        else:
+            rows.append(ScheduledEvent("E-BENCH", system_id, trigger_day, insertion_index=index))
+    return rows
+
+
+def _clone(rows: list) -> list:
+    return [type(row)(**vars(row)) for row in rows]
+
+
+def _key(row) -> tuple[str, str, int]:
+    return (type(row).__name__, row.system_id, row.insertion_index)
+
+
+def _legacy_pass(rows: list, days: int) -> list[tuple[str, str, int]]:
+    # The pre-queue process_scheduled_events: partition both lists every day, sort what is due.
+    situations = [row for row in rows if isinstance(row, ScheduledSituation)]
+    events = [row for row in rows if isinstance(row, ScheduledEvent)]
+    order: list[tuple[str, str, int]] = []
+    for day in range(days):
+        for kind in ("situations", "events"):
+            pending_rows = situations if kind == "situations" else events
+            due = []
+            pending = []
+            for row in pending_rows:
+                if row.trigger_day == day:
+                    due.append(row)
+                else:
+                    pending.append(row)
+            order.extend(_key(row) for row in sorted(due, key=lambda row: (row.system_id, row.insertion_index)))
+            if kind == "situations":
+                situations = pending
+            else:
+                events = pending
+    return order
+
+
+if __name__ == "__main__":
+    main()
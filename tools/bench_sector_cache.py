@@ -0,0 +1,70 @@
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import CACHE_DIR_ENV, get_data_bundle  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure engine construction with a cold and a warm sector cache.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 100, 1000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    # The data bundle is process-wide; load it before timing so only sector work is measured.
+    get_data_bundle()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ[CACHE_DIR_ENV] = cache_dir
+        print(f"{'systems':>8} {'uncached_ms':>12} {'cold_ms':>9} {'warm_ms':>9} {'speedup':>8} {'entry_bytes':>12}")
+        for system_count in args.sizes:
+            config = {"system_count": system_count}
+            uncached_ms = _median_ms(lambda: _build(args.seed, {**config, "sector_cache": False}), args.repeats)
+            cold_ms = _median_ms(lambda: _build_cold(args.seed, config, Path(cache_dir)), args.repeats)
+            _build(args.seed, config)
+            warm_ms = _median_ms(lambda: _build(args.seed, config), args.repeats)
+            entry_bytes = sum(path.stat().st_size for path in Path(cache_dir).glob("sector-*.bin"))
+            print(
+                f"{system_count:>8} {uncached_ms:>12.1f} {cold_ms:>9.1f} {warm_ms:>9.1f}"
+                f" {uncached_ms / warm_ms:>7.1f}x {entry_bytes:>12}"
+            )
+            _clear(Path(cache_dir))
+
+
+def _build(seed: int, config: dict) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        GameEngine(world_seed=seed, config=config)
+
+
+def _build_cold(seed: int, config: dict, cache_dir: Path) -> None:
+    _clear(cache_dir)
+    _build(seed, config)
+
+
+def _clear(cache_dir: Path) -> None:
+    for path in cache_dir.glob("sector-*.bin"):
+        path.unlink()
+
+
+def _median_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Load generator for emojispace-server.
+
+Starts a server subprocess on a free port (or connects to --port), then for each
+concurrency level opens one connection per session, drives a bot-style command
+loop and reports p50/p99 step latency and aggregate commands per second.
+Session creation happens before the timed window.
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SERVER_SCRIPT = PROJECT_ROOT / "cli" / "emojispace_server.py"
+
+BOT_TURN = [
+    {"type": "get_player_profile", "result_level": "minimal"},
+    {"type": "get_system_profile", "result_level": "minimal"},
+    {"type": "list_destination_actions", "result_level": "minimal"},
+    {"type": "wait", "days": 1, "result_level": "minimal"},
+]
+
+
+class _Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "_Client":
+        reader, writer = await asyncio.open_connection(host, port, limit=64 * 1024 * 1024)
+        return cls(reader, writer)
+
+    async def call(self, request: dict) -> dict:
+        self._next_id += 1
+        request = {"id": self._next_id, **request}
+        self._writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        response = json.loads(await self._reader.readline())
+        if not response.get("ok"):
+            raise RuntimeError(f"{request.get('op')} failed: {response.get('error')}")
+        return response
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def _open_session(host: str, port: int, seed: int, systems: int) -> tuple[_Client, str]:
+    client = await _Client.connect(host, port)
+    created = await client.call({"op": "create", "seed": seed, "config": {"system_count": systems}})
+    return client, created["session_id"]
+
+
+async def _drive_session(client: _Client, session_id: str, steps: int, latencies: list[float]) -> None:
+    for index in range(steps):
+        command = BOT_TURN[index % len(BOT_TURN)]
+        start = time.perf_counter()
+        await client.call({"op": "step", "session_id": session_id, "command": command})
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run_level(host: str, port: int, concurrency: int, systems: int, steps: int) -> tuple[list[float], float]:
+    sessions = await asyncio.gather(
+        *(_open_session(host, port, 1000 + index, systems) for index in range(concurrency))
+    )
+    latencies: list[float] = []
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(_drive_session(client, session_id, steps, latencies) for client, session_id in sessions))
+        elapsed = time.perf_counter() - start
+    finally:
+        for client, session_id in sessions:
+            await client.call({"op": "destroy", "session_id": session_id})
+            await client.close()
+    return latencies, elapsed
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _start_server(workers: int) -> tuple[subprocess.Popen, int]:
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT), "--port", "0", "--workers", str(workers)],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stderr.readline() if process.stderr is not None else ""
+    if "listening on" not in line:
+        process.kill()
+        raise RuntimeError(f"server failed to start: {line.strip()}")
+    return process, int(line.rsplit(":", 1)[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure emojispace-server latency and throughput.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Use a running server instead of spawning one")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads for a spawned server")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--steps", type=int, default=40, help="Commands per session")
+    parser.add_argument("--systems", type=int, default=5)
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        process, port = _start_server(args.workers)
+    try:
+        print(f"{'sessions':>8} {'commands':>9} {'p50_ms':>8} {'p99_ms':>8} {'cmd/s':>9}")
+        for concurrency in args.levels:
+            latencies, elapsed = asyncio.run(_run_level(args.host, port, concurrency, args.systems, args.steps))
+            print(
+                f"{concurrency:>8} {len(latencies):>9} {_percentile(latencies, 0.50) * 1000:>8.2f}"
+                f" {_percentile(latencies, 0.99) * 1000:>8.2f} {len(latencies) / elapsed:>9.0f}"
+            )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time a long wait as one-day wait commands versus a single skip_time command."
+    )
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--systems", type=int, default=20)
+    parser.add_argument("--days", type=int, default=3000)
+    parser.add_argument("--event-frequency", type=int, default=8, help="Spawn gate chance per day, in percent.")
+    parser.add_argument("--scope", choices=["local", "galaxy"], default="local")
+    parser.add_argument("--premium", type=int, default=3, help="Insurance premium charged per day.")
+    args = parser.parse_args()
+
+    config = {
+        "system_count": args.systems,
+        "sector_cache": False,
+        "event_frequency_percent": args.event_frequency,
+        "world_state_events": "off",
+        "world_state_scope": args.scope,
+    }
+
+    def build() -> GameEngine:
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = GameEngine(world_seed=args.seed, config=config)
+        engine.player_state.insurance_policies.append({"premium_per_turn": args.premium})
+        return engine
+
+    stepped = build()
+    start = time.perf_counter()
+    for _ in range(args.days):
+        stepped.execute({"type": "wait", "days": 1})
+    stepped_seconds = time.perf_counter() - start
+
+    skipped = build()
+    start = time.perf_counter()
+    result = skipped.execute({"type": "skip_time", "days": args.days})
+    skipped_seconds = time.perf_counter() - start
+
+    same = (
+        stepped.time_context.current_turn == skipped.time_context.current_turn
+        and stepped.player_state.credits == skipped.player_state.credits
+        and stepped.player_state.bankruptcy_warning_turn == skipped.player_state.bankruptcy_warning_turn
+        and stepped.time_context.world_state_engine.active_situations
+        == skipped.time_context.world_state_engine.active_situations
+        and stepped.time_context.world_state_engine.cooldown_until_day_by_system
+        == skipped.time_context.world_state_engine.cooldown_until_day_by_system
+    )
+    print(
+        f"systems={args.systems} days={args.days} scope={args.scope} "
+        f"event_frequency_percent={args.event_frequency} ok={result['ok']}"
+    )
+    print(f"{'wait x1':>10} {stepped_seconds:>8.3f}s")
+    print(f"{'skip_time':>10} {skipped_seconds:>8.3f}s  ({stepped_seconds / skipped_seconds:.1f}x)")
+    print(f"same final state: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from data_bundle import get_data_bundle  # noqa: E402
+from world_generator import System, WorldGenerator  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure starlane graph construction time by galaxy size.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000, 50000])
+    args = parser.parse_args()
+
+    catalog = get_data_bundle().catalog
+    print(f"{'systems':>8} {'coords_ms':>10} {'starlanes_ms':>13} {'us/system':>10} {'mean_degree':>12}")
+    for system_count in args.sizes:
+        generator = WorldGenerator(seed=args.seed, system_count=system_count, government_ids=["bench"], catalog=catalog)
+        # Bare systems: destinations and markets do not affect the graph and would dominate the run.
+        systems = [
+            System(
+                system_id=f"SYS-{index + 1:03d}",
+                name="Bench",
+                position=(index, 0),
+                population=1,
+                government_id="bench",
+                destinations=[],
+                attributes={},
+                neighbors=[],
+            )
+            for index in range(system_count)
+        ]
+        start = time.perf_counter()
+        systems = generator._assign_spatial_coordinates(systems)
+        coords_ms = (time.perf_counter() - start) * 1000.0
+        start = time.perf_counter()
+        systems = generator._build_starlane_graph(systems)
+        graph_ms = (time.perf_counter() - start) * 1000.0
+        mean_degree = sum(len(system.neighbors) for system in systems) / max(1, len(systems))
+        print(
+            f"{system_count:>8} {coords_ms:>10.1f} {graph_ms:>13.1f}"
+            f" {graph_ms * 1000.0 / max(1, system_count):>10.1f} {mean_degree:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_ROOT))
+
+from game_engine import GameEngine  # noqa: E402
+from price_matrix import compute_price_matrix  # noqa: E402
+
+
+def _observations(engine: GameEngine) -> dict[str, dict[str, dict[str, int]]]:
+    buy = compute_price_matrix(engine, "buy")
+    sell = compute_price_matrix(engine, "sell")
+    observations: dict[str, dict[str, dict[str, int]]] = {}
+    for destination_id in buy.destination_ids:
+        rows = observations.setdefault(destination_id, {})
+        for sku, price in buy.row(destination_id).items():
+            rows.setdefault(sku, {})["buy"] = price
+        for sku, price in sell.row(destination_id).items():
+            rows.setdefault(sku, {})["sell"] = price
+    return observations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time find_trade_routes over every market in a generated galaxy.")
+    parser.add_argument("--systems", type=int, default=45)
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--credits", type=int, default=5000)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--max-legs", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = GameEngine(world_seed=args.seed, config={"system_count": args.systems, "sector_cache": False})
+    engine.player_state.credits = args.credits
+    observations = _observations(engine)
+    command = {
+        "type": "find_trade_routes",
+        "observations": observations,
+        "top_k": args.top_k,
+        "max_legs": args.max_legs,
+    }
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        result = engine.execute(command)
+        timings.append(time.perf_counter() - start)
+    if not result["ok"]:
+        raise SystemExit(f"find_trade_routes failed: {result.get('error')}")
+    detail = next(event["detail"] for event in result["events"] if event["stage"] == "trade_routes")
+
+    quotes = sum(len(rows) for rows in observations.values())
+    print(f"systems={args.systems} destinations={len(observations)} observed_skus={quotes} max_legs={args.max_legs}")
+    print(f"find_trade_routes  best {min(timings) * 1e3:8.1f} ms  first {timings[0] * 1e3:8.1f} ms")
+    for route in detail["routes"]:
+        path = " -> ".join([route["start_destination_id"]] + [leg["sell_destination_id"] for leg in route["legs"]])
+        skus = ", ".join(leg["sku_id"] for leg in route["legs"])
+        loop = " (loop)" if route["loop"] else ""
+        print(
+            f"  {route['profit_per_day']:9.1f}/day  profit {route['total_profit']:6d} in {route['total_days']:3d} days"
+            f"  {path}{loop}  [{skus}]"
+        )
+
+
+if __name__ == "__main__":
+    main()